@@ -20,6 +20,7 @@ from app.channels.rag_query import query_with_channel_context
 from app.channels.response_builder import build_metadata, build_sources
 from app.channels.runtime import RAGServiceProtocol
 from app.channels.security import ErrorFactory
+from app.utils.request_trace import trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -100,7 +101,8 @@ class ChannelGateway:
                     continue
 
                 try:
-                    result = await hook.execute(message)
+                    with trace_span(f"hook.pre.{hook.name}"):
+                        result = await hook.execute(message)
                     hooks_executed.append(hook.name)
 
                     if result is not None:
@@ -163,7 +165,8 @@ class ChannelGateway:
                     continue
 
                 try:
-                    result = await post_hook.execute(message, outgoing)
+                    with trace_span(f"hook.post.{post_hook.name}"):
+                        result = await post_hook.execute(message, outgoing)
                     hooks_executed.append(post_hook.name)
                     outgoing.metadata.hooks_executed.append(post_hook.name)
 
@@ -18,6 +18,7 @@ from app.channels.policy import (
     apply_autosend_policy,
     is_autosend_enabled,
 )
+from app.utils.request_trace import request_trace, trace_span
 
 logger = logging.getLogger(__name__)
 _MISSING = object()
@@ -49,10 +50,23 @@ class InboundMessageOrchestrator:
 
     async def process_incoming(self, incoming: Any) -> bool:
         canonical = CanonicalInboundEvent.from_incoming(self.channel_id, incoming)
-        incoming = await self._prepare_incoming(
-            incoming,
-            thread_id=canonical.thread_id,
-        )
+        with request_trace(
+            "channel.inbound",
+            channel_id=self.channel_id,
+            event_id=canonical.event_id,
+        ) as trace:
+            sent = await self._process_canonical(canonical, incoming)
+            trace.set(sent=sent)
+            return sent
+
+    async def _process_canonical(
+        self, canonical: CanonicalInboundEvent, incoming: Any
+    ) -> bool:
+        with trace_span("channel.prepare"):
+            incoming = await self._prepare_incoming(
+                incoming,
+                thread_id=canonical.thread_id,
+            )
         classification = getattr(incoming, "classification", None)
         if classification is not None and not bool(
             getattr(classification, "should_process", True)
@@ -100,7 +114,13 @@ class InboundMessageOrchestrator:
                 )
 
                 async def _on_release(queued_incoming: Any) -> Any:
-                    response = await self.channel.handle_incoming(queued_incoming)
+                    # Released later by the arbitration queue: its own trace
+                    with request_trace(
+                        "channel.arbitration_release",
+                        channel_id=self.channel_id,
+                        event_id=canonical.event_id,
+                    ):
+                        response = await self.channel.handle_incoming(queued_incoming)
                     autosend_enabled = is_autosend_enabled(
                         self.autoresponse_policy_service,
                         self.channel_id,
@@ -125,13 +145,15 @@ class InboundMessageOrchestrator:
                 else:
                     sent = bool(enqueue_result)
             else:
-                response = await self.channel.handle_incoming(incoming)
+                with trace_span("channel.handle_incoming"):
+                    response = await self.channel.handle_incoming(incoming)
                 autosend_enabled = is_autosend_enabled(
                     self.autoresponse_policy_service,
                     self.channel_id,
                 )
                 response = apply_autosend_policy(response, autosend_enabled)
-                sent = bool(await self.dispatcher.dispatch(incoming, response))
+                with trace_span("channel.dispatch"):
+                    sent = bool(await self.dispatcher.dispatch(incoming, response))
             await self._update_thread_state(canonical, incoming=incoming)
             return sent
         except Exception:
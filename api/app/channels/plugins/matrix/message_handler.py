@@ -363,6 +363,7 @@ class MatrixMessageHandler:
             return
         try:
             from app.channels.trust_monitor.events import TrustEvent
+            from app.channels.trust_monitor.evidence_writer import submit_trust_event
             from app.channels.trust_monitor.models import TrustEventType
 
             reply_to_event_id = self._extract_reply_to_event_id(event)
@@ -377,7 +378,8 @@ class MatrixMessageHandler:
                 if timestamp_ms
                 else datetime.now(timezone.utc)
             )
-            service.ingest_event(
+            await submit_trust_event(
+                service,
                 TrustEvent(
                     channel_id=self.channel_id,
                     space_id=room_id,
@@ -392,7 +394,7 @@ class MatrixMessageHandler:
                     target_message_id=reply_to_event_id
                     or str(getattr(event, "event_id", "") or ""),
                     metadata={"body_length": len(self._extract_event_text(event))},
-                )
+                ),
             )
         except Exception:
             logger.debug(
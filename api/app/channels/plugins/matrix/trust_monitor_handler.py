@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import asyncio
 from datetime import UTC, datetime
 from typing import Any
 
 from app.channels.plugins.matrix.room_filter import normalize_room_ids
 from app.channels.trust_monitor.events import TrustEvent
+from app.channels.trust_monitor.evidence_writer import submit_trust_event
 from app.channels.trust_monitor.models import TrustEventType
 
 
@@ -67,8 +67,8 @@ class MatrixTrustMonitorHandler:
             if timestamp
             else datetime.now(UTC)
         )
-        await asyncio.to_thread(
-            self.trust_monitor_service.ingest_event,
+        await submit_trust_event(
+            self.trust_monitor_service,
             TrustEvent(
                 channel_id="matrix",
                 space_id=room_id,
@@ -98,8 +98,8 @@ class MatrixTrustMonitorHandler:
                     if ts
                     else datetime.now(UTC)
                 )
-                await asyncio.to_thread(
-                    self.trust_monitor_service.ingest_event,
+                await submit_trust_event(
+                    self.trust_monitor_service,
                     TrustEvent(
                         channel_id="matrix",
                         space_id=room_id,
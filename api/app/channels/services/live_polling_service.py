@@ -8,6 +8,7 @@ import logging
 from contextlib import suppress
 from typing import Any
 
+from app.channels.events import CanonicalInboundEvent
 from app.channels.inbound_orchestrator import InboundMessageOrchestrator
 from app.channels.policy import (
     is_autosend_enabled,
@@ -20,7 +21,14 @@ _MISSING = object()
 
 
 class LivePollingService:
-    """Poll channel conversations and dispatch responses."""
+    """Poll channel conversations and dispatch responses.
+
+    Messages from one poll batch are grouped into per-thread lanes. Lanes run
+    concurrently (bounded by ``max_concurrency``) while messages inside a lane
+    are processed strictly in poll order. ``run_once`` only returns once the
+    whole batch is drained, so slow answers back-pressure the poll cadence
+    instead of piling up unbounded work.
+    """
 
     def __init__(
         self,
@@ -31,6 +39,7 @@ class LivePollingService:
         poll_interval_seconds: float = 3.0,
         restart_delay_seconds: float = 3.0,
         orchestrator: InboundMessageOrchestrator | None = None,
+        max_concurrency: int = 4,
     ) -> None:
         self.channel = channel
         self.autoresponse_policy_service = autoresponse_policy_service
@@ -38,6 +47,7 @@ class LivePollingService:
         self.channel_id = str(channel_id or getattr(channel, "channel_id", "")).strip()
         self.poll_interval_seconds = poll_interval_seconds
         self.restart_delay_seconds = restart_delay_seconds
+        self.max_concurrency = max(1, int(max_concurrency))
         self._task: asyncio.Task[None] | None = None
         self._running = False
         self.dispatcher = ChannelResponseDispatcher(
@@ -102,11 +112,68 @@ class LivePollingService:
             self.channel_id,
         )
 
+        lanes = self._group_by_thread(messages)
+        if len(lanes) <= 1 or self.max_concurrency <= 1:
+            for lane in lanes:
+                processed += await self._drain_lane(lane, None)
+            return processed
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(self._drain_lane(lane, semaphore) for lane in lanes)
+        )
+        return processed + sum(results)
+
+    def _group_by_thread(self, messages: list[Any]) -> list[list[Any]]:
+        """Split a poll batch into per-thread lanes, preserving arrival order."""
+        lanes: dict[str, list[Any]] = {}
         for incoming in messages:
-            if await self.orchestrator.process_incoming(incoming):
+            lanes.setdefault(self._thread_key(incoming), []).append(incoming)
+        return list(lanes.values())
+
+    def _thread_key(self, incoming: Any) -> str:
+        try:
+            return CanonicalInboundEvent.from_incoming(
+                self.channel_id, incoming
+            ).thread_id
+        except Exception:
+            logger.debug(
+                "Failed to derive thread key for channel=%s; using message id",
+                self.channel_id,
+                exc_info=True,
+            )
+            return f"message:{getattr(incoming, 'message_id', id(incoming))}"
+
+    async def _drain_lane(
+        self,
+        lane: list[Any],
+        semaphore: asyncio.Semaphore | None,
+    ) -> int:
+        processed = 0
+        for incoming in lane:
+            if semaphore is None:
+                handled = await self._process_one(incoming)
+            else:
+                # Acquire per message so long lanes cannot starve other threads.
+                async with semaphore:
+                    handled = await self._process_one(incoming)
+            if handled:
                 processed += 1
         return processed
 
+    async def _process_one(self, incoming: Any) -> bool:
+        try:
+            return bool(await self.orchestrator.process_incoming(incoming))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception(
+                "Failed to process inbound message channel=%s message=%s",
+                self.channel_id,
+                getattr(incoming, "message_id", "unknown"),
+            )
+            return False
+
     @staticmethod
     def _resolve_coordination_store(channel: Any) -> Any | None:
         runtime = getattr(channel, "runtime", None)
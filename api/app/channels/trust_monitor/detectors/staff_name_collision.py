@@ -1,19 +1,17 @@
 from __future__ import annotations
 
-import re
-import unicodedata
 from datetime import UTC
 
 from app.channels.staff import StaffResolver
 from app.channels.trust_monitor.detectors.base import DetectorResult
 from app.channels.trust_monitor.events import TrustEvent
 from app.channels.trust_monitor.models import TrustAlertSurface, TrustEventType
+from app.channels.trust_monitor.name_index import (
+    StaffNameIndex,
+    normalize_display_name,
+)
 
-
-def normalize_display_name(value: str) -> str:
-    normalized = unicodedata.normalize("NFKC", value or "").strip().lower()
-    collapsed = re.sub(r"\s+", " ", normalized)
-    return "".join(character for character in collapsed if character.isalnum())
+__all__ = ["StaffNameCollisionDetector", "normalize_display_name"]
 
 
 class StaffNameCollisionDetector:
@@ -21,11 +19,7 @@ class StaffNameCollisionDetector:
 
     def __init__(self, staff_resolver: StaffResolver) -> None:
         self.staff_resolver = staff_resolver
-        self._trusted_aliases = {
-            normalize_display_name(name)
-            for name in staff_resolver.get_display_names()
-            if normalize_display_name(name)
-        }
+        self._name_index = StaffNameIndex(staff_resolver.get_display_names())
 
     def evaluate(self, event: TrustEvent, *, actor_key: str) -> DetectorResult | None:
         if event.event_type not in {
@@ -35,17 +29,20 @@ class StaffNameCollisionDetector:
             return None
         if self.staff_resolver.is_staff(event.actor_id):
             return None
-        normalized = normalize_display_name(event.actor_display_name)
-        if not normalized or normalized not in self._trusted_aliases:
+        match = self._name_index.match(event.actor_display_name)
+        if match is None:
             return None
         return DetectorResult(
             detector_key=self.detector_key,
             suspect_actor_id=event.actor_id,
             suspect_actor_key=actor_key,
             suspect_display_name=event.actor_display_name,
-            score=0.99,
+            score=match.score,
             evidence_summary={
                 "matched_alias": event.actor_display_name,
+                "matched_staff_name": match.staff_name,
+                "match_kind": match.kind,
+                "edit_distance": match.distance,
                 "trusted_aliases": sorted(self.staff_resolver.get_display_names()),
                 "event_type": event.event_type.value,
             },
@@ -5,7 +5,7 @@ import sqlite3
 from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from threading import Lock
+from threading import Lock, local
 from typing import Any, Generator
 
 from app.channels.trust_monitor.events import TrustEvent
@@ -32,6 +32,7 @@ class TrustMonitorStore:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = Lock()
+        self._active = local()
         self._initialize()
 
     @contextmanager
@@ -40,6 +41,11 @@ class TrustMonitorStore:
         *,
         commit: bool = True,
     ) -> Generator[sqlite3.Connection, None, None]:
+        active = getattr(self._active, "conn", None)
+        if active is not None:
+            # Inside transaction(): share its connection, commit happens there
+            yield active
+            return
         with self._lock:
             conn = sqlite3.connect(
                 str(self.db_path), check_same_thread=False, timeout=30.0
@@ -53,6 +59,43 @@ class TrustMonitorStore:
             finally:
                 conn.close()
 
+    @contextmanager
+    def transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        """Group store calls made by this thread into a single commit.
+
+        Store methods called inside the block reuse its connection, so
+        reads within the block see the block's own writes while other
+        threads wait on the store lock and only ever read committed data.
+        Nested blocks join the outer transaction.
+        """
+        if getattr(self._active, "conn", None) is not None:
+            yield self._active.conn
+            return
+        with self.connection(commit=False) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._active.conn = conn
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+            finally:
+                self._active.conn = None
+
+    @contextmanager
+    def savepoint(self, conn: sqlite3.Connection) -> Generator[None, None, None]:
+        """Roll back only the enclosed statements if the block fails."""
+        conn.execute("SAVEPOINT trust_event")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK TO SAVEPOINT trust_event")
+            conn.execute("RELEASE SAVEPOINT trust_event")
+            raise
+        conn.execute("RELEASE SAVEPOINT trust_event")
+
     def _initialize(self) -> None:
         schema = """
         CREATE TABLE IF NOT EXISTS trust_actor_profiles (
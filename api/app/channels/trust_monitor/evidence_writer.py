@@ -0,0 +1,138 @@
+"""Buffered, batched ingestion of trust-monitor events.
+
+Channel handlers see bursts of member and receipt events (join floods, spam
+waves). Ingesting each event on its own costs a connection and a commit per
+event. ``TrustEvidenceWriter`` queues events and hands them to
+``TrustMonitorService.record_events`` in batches, one transaction per batch,
+and publishes the resulting alerts back on the event loop.
+A batch is flushed when it reaches ``max_batch_size`` events or
+``flush_interval_seconds`` after its first event, whichever comes first.
+The queue is bounded: when it is full, ``submit`` waits, which slows the
+producing handler down instead of growing memory without limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from app.channels.trust_monitor.events import TrustEvent
+
+if TYPE_CHECKING:
+    from app.channels.trust_monitor.service import TrustMonitorService
+
+logger = logging.getLogger(__name__)
+
+
+class TrustEvidenceWriter:
+    """Background writer that groups trust events into transactions."""
+
+    def __init__(
+        self,
+        service: TrustMonitorService,
+        *,
+        max_batch_size: int = 200,
+        flush_interval_seconds: float = 0.25,
+        max_queue_size: int = 5000,
+    ) -> None:
+        self.service = service
+        self.max_batch_size = max(1, max_batch_size)
+        self.flush_interval_seconds = max(0.0, flush_interval_seconds)
+        self._queue: asyncio.Queue[TrustEvent] = asyncio.Queue(
+            maxsize=max(1, max_queue_size)
+        )
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name="trust-evidence-writer")
+        logger.info(
+            "Trust evidence writer started (batch=%d, interval=%.2fs, queue=%d)",
+            self.max_batch_size,
+            self.flush_interval_seconds,
+            self._queue.maxsize,
+        )
+
+    async def submit(self, event: TrustEvent) -> None:
+        """Queue an event; waits while the queue is full."""
+        await self._queue.put(event)
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been written."""
+        await self._queue.join()
+
+    async def stop(self, timeout_seconds: float = 10.0) -> None:
+        """Write queued events, then stop the background task."""
+        if self._task is None:
+            return
+        if self.running:
+            try:
+                await asyncio.wait_for(self.flush(), timeout=timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Trust evidence writer stopped with %d unwritten event(s)",
+                    self.pending,
+                )
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Trust evidence writer stopped")
+
+    async def _next_batch(self) -> list[TrustEvent]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval_seconds
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                _results, alerts = await asyncio.to_thread(
+                    self.service.record_events, batch
+                )
+                # Publish on the loop: the staff-room notifier schedules a task
+                self.service.publish_findings(alerts)
+            except Exception:
+                logger.exception(
+                    "Failed writing batch of %d trust event(s)", len(batch)
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+async def submit_trust_event(service: Any, event: TrustEvent) -> None:
+    """Hand an event to the service's writer, or ingest it off the loop."""
+    writer = getattr(service, "evidence_writer", None)
+    if isinstance(writer, TrustEvidenceWriter) and writer.running:
+        await writer.submit(event)
+        return
+    _results, alerts = await asyncio.to_thread(service.record_events, [event])
+    service.publish_findings(alerts)
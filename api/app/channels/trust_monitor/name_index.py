@@ -0,0 +1,303 @@
+"""Look-alike aware index of staff display names.
+
+Impersonators rarely copy a staff name byte for byte. They swap letters for
+homoglyphs (Cyrillic "а", digit "0"), insert punctuation or invisible
+characters, make a one-letter typo or decorate the name ("alice_support").
+The index folds every name to a confusable skeleton and answers, per
+observed display name:
+
+- exact: same normalized name (``normalize_display_name``)
+- confusable: same skeleton after homoglyph folding
+- edit_distance: skeleton within a length-dependent edit distance, found
+  with a BK-tree so a lookup visits only a fraction of the staff names
+- contains: the skeleton of a longer staff name appears inside the observed
+  skeleton, found through a trigram posting index
+
+Lookups never scan the full staff list, so complete room member lists can
+be screened in one pass.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+MATCH_EXACT = "exact"
+MATCH_CONFUSABLE = "confusable"
+MATCH_EDIT_DISTANCE = "edit_distance"
+MATCH_CONTAINS = "contains"
+
+_MATCH_SCORES = {
+    MATCH_EXACT: 0.99,
+    MATCH_CONFUSABLE: 0.95,
+    MATCH_CONTAINS: 0.7,
+}
+# Edit-distance matches lose confidence with every edit
+_EDIT_DISTANCE_SCORES = {1: 0.85, 2: 0.75}
+
+# Shorter skeletons only match exactly or as confusables; a single edit on a
+# four-letter name produces too many innocent collisions.
+_MIN_LENGTH_FOR_ONE_EDIT = 5
+_MIN_LENGTH_FOR_TWO_EDITS = 9
+_MIN_CONTAINS_LENGTH = 5
+_NGRAM = 3
+
+# Applied before case folding: only the uppercase form is a look-alike
+_UPPERCASE_CONFUSABLES = str.maketrans({"I": "l"})
+
+# Applied after case folding and accent stripping (a subset of Unicode
+# confusables.txt covering Latin look-alikes seen in display names)
+_CONFUSABLES = str.maketrans(
+    {
+        # Cyrillic
+        "а": "a",
+        "в": "b",
+        "е": "e",
+        "һ": "h",
+        "н": "h",
+        "і": "l",
+        "ј": "j",
+        "к": "k",
+        "м": "m",
+        "о": "o",
+        "р": "p",
+        "ԛ": "q",
+        "с": "c",
+        "ѕ": "s",
+        "т": "t",
+        "у": "y",
+        "ԝ": "w",
+        "х": "x",
+        "ԁ": "d",
+        # Greek
+        "α": "a",
+        "β": "b",
+        "ε": "e",
+        "η": "n",
+        "ι": "l",
+        "κ": "k",
+        "ν": "v",
+        "ο": "o",
+        "ρ": "p",
+        "τ": "t",
+        "υ": "u",
+        "χ": "x",
+        "γ": "y",
+        "ζ": "z",
+        # Latin variants; "i" shares "l" with "1", "I" and "|" because any of
+        # them stands in for the others in most fonts
+        "i": "l",
+        "ı": "l",
+        "ɑ": "a",
+        "ɡ": "g",
+        "ǀ": "l",
+        # Digits and symbols
+        "0": "o",
+        "1": "l",
+        "3": "e",
+        "4": "a",
+        "5": "s",
+        "7": "t",
+        "8": "b",
+        "$": "s",
+        "@": "a",
+        "|": "l",
+        "!": "l",
+    }
+)
+
+# Letter pairs that render like a single letter
+_MULTI_CHAR_CONFUSABLES = (("rn", "m"), ("vv", "w"), ("cl", "d"))
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_display_name(value: str) -> str:
+    normalized = unicodedata.normalize("NFKC", value or "").strip().lower()
+    collapsed = _WHITESPACE_RE.sub(" ", normalized)
+    return "".join(character for character in collapsed if character.isalnum())
+
+
+def confusable_skeleton(value: str) -> str:
+    """Fold a display name to the form shared by its look-alikes.
+
+    NFKC folds compatibility forms (fullwidth, mathematical letters), accents
+    are stripped, homoglyphs and digit substitutions are mapped to Latin
+    letters, and everything that is not a letter or digit (punctuation,
+    spaces, zero-width characters) is dropped.
+    """
+    text = unicodedata.normalize("NFKC", value or "")
+    text = text.translate(_UPPERCASE_CONFUSABLES).casefold()
+    text = unicodedata.normalize("NFD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = text.translate(_CONFUSABLES)
+    text = "".join(ch for ch in text if ch.isalnum())
+    for sequence, replacement in _MULTI_CHAR_CONFUSABLES:
+        text = text.replace(sequence, replacement)
+    return text
+
+
+def levenshtein(left: str, right: str) -> int:
+    if left == right:
+        return 0
+    if len(left) < len(right):
+        left, right = right, left
+    previous = list(range(len(right) + 1))
+    for i, left_char in enumerate(left, start=1):
+        current = [i]
+        for j, right_char in enumerate(right, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (left_char != right_char),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def allowed_edit_distance(skeleton: str) -> int:
+    if len(skeleton) >= _MIN_LENGTH_FOR_TWO_EDITS:
+        return 2
+    if len(skeleton) >= _MIN_LENGTH_FOR_ONE_EDIT:
+        return 1
+    return 0
+
+
+def _ngrams(value: str) -> set[str]:
+    return {value[i : i + _NGRAM] for i in range(len(value) - _NGRAM + 1)}
+
+
+class _BKTree:
+    """Burkhard-Keller tree over skeletons with Levenshtein distance."""
+
+    def __init__(self) -> None:
+        self._root: tuple[str, dict[int, tuple]] | None = None
+
+    def add(self, value: str) -> None:
+        if self._root is None:
+            self._root = (value, {})
+            return
+        node = self._root
+        while True:
+            distance = levenshtein(value, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (value, {})
+                return
+            node = child
+
+    def search(self, value: str, radius: int) -> list[tuple[int, str]]:
+        """All stored values within ``radius`` edits, nearest first."""
+        if self._root is None:
+            return []
+        found: list[tuple[int, str]] = []
+        pending = [self._root]
+        while pending:
+            node_value, children = pending.pop()
+            distance = levenshtein(value, node_value)
+            if distance <= radius:
+                found.append((distance, node_value))
+            # Triangle inequality: only children in this band can match
+            for edge, child in children.items():
+                if distance - radius <= edge <= distance + radius:
+                    pending.append(child)
+        return sorted(found)
+
+
+@dataclass(frozen=True)
+class StaffNameMatch:
+    """Best match of an observed display name against the staff names."""
+
+    staff_name: str
+    kind: str
+    score: float
+    distance: int = 0
+
+
+class StaffNameIndex:
+    """Precomputed skeleton, BK-tree and trigram index of staff names."""
+
+    def __init__(self, staff_names: Iterable[str]) -> None:
+        self._by_normalized: dict[str, str] = {}
+        self._by_skeleton: dict[str, str] = {}
+        self._tree = _BKTree()
+        self._ngram_postings: dict[str, set[str]] = defaultdict(set)
+        self._ngram_counts: dict[str, int] = {}
+
+        for name in sorted({str(n).strip() for n in staff_names if str(n).strip()}):
+            normalized = normalize_display_name(name)
+            skeleton = confusable_skeleton(name)
+            if normalized:
+                self._by_normalized.setdefault(normalized, name)
+            if not skeleton or skeleton in self._by_skeleton:
+                continue
+            self._by_skeleton[skeleton] = name
+            self._tree.add(skeleton)
+            if len(skeleton) >= _MIN_CONTAINS_LENGTH:
+                grams = _ngrams(skeleton)
+                self._ngram_counts[skeleton] = len(grams)
+                for gram in grams:
+                    self._ngram_postings[gram].add(skeleton)
+
+    def __len__(self) -> int:
+        return len(self._by_skeleton)
+
+    def match(self, display_name: str) -> StaffNameMatch | None:
+        """Return the strongest staff-name match for ``display_name``."""
+        normalized = normalize_display_name(display_name)
+        if normalized in self._by_normalized:
+            return StaffNameMatch(
+                staff_name=self._by_normalized[normalized],
+                kind=MATCH_EXACT,
+                score=_MATCH_SCORES[MATCH_EXACT],
+            )
+
+        skeleton = confusable_skeleton(display_name)
+        if not skeleton:
+            return None
+        if skeleton in self._by_skeleton:
+            return StaffNameMatch(
+                staff_name=self._by_skeleton[skeleton],
+                kind=MATCH_CONFUSABLE,
+                score=_MATCH_SCORES[MATCH_CONFUSABLE],
+            )
+
+        for distance, staff_skeleton in self._tree.search(
+            skeleton, max(_EDIT_DISTANCE_SCORES)
+        ):
+            if distance <= allowed_edit_distance(staff_skeleton):
+                return StaffNameMatch(
+                    staff_name=self._by_skeleton[staff_skeleton],
+                    kind=MATCH_EDIT_DISTANCE,
+                    score=_EDIT_DISTANCE_SCORES[distance],
+                    distance=distance,
+                )
+
+        contained = self._longest_contained(skeleton)
+        if contained is not None:
+            return StaffNameMatch(
+                staff_name=self._by_skeleton[contained],
+                kind=MATCH_CONTAINS,
+                score=_MATCH_SCORES[MATCH_CONTAINS],
+            )
+        return None
+
+    def _longest_contained(self, skeleton: str) -> str | None:
+        hits: dict[str, int] = defaultdict(int)
+        for gram in _ngrams(skeleton):
+            for staff_skeleton in self._ngram_postings.get(gram, ()):
+                hits[staff_skeleton] += 1
+        candidates = [
+            staff_skeleton
+            for staff_skeleton, count in hits.items()
+            if count == self._ngram_counts[staff_skeleton]
+            and staff_skeleton in skeleton
+        ]
+        return max(candidates, key=len, default=None)
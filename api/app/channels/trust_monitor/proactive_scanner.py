@@ -1,8 +1,15 @@
 """Proactive impersonation scanner for Matrix.
 
 Periodically searches the Matrix user directory and public room directory
-for potential impersonation of Bisq staff. Creates trust findings when
-suspicious accounts or rooms are discovered.
+and screens the member lists of monitored rooms for potential impersonation
+of Bisq staff. Display names are checked against a look-alike aware
+``StaffNameIndex``. Creates trust findings when suspicious accounts or rooms
+are discovered.
+
+Homeserver requests run concurrently under a shared concurrency and request
+rate limit. Member lists are diffed against a per-room snapshot of member
+state event ids, so each cycle only evaluates members who joined or changed
+their profile since the previous scan.
 
 Findings are forwarded via the `on_finding` callback, which routes them
 to the admin UI (always) and the staff room (when the operator policy
@@ -13,16 +20,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
+from urllib.parse import quote
 
 import aiohttp
 from app.channels.staff import StaffResolver
 from app.channels.trust_monitor.detectors.base import DetectorResult
-from app.channels.trust_monitor.detectors.staff_name_collision import (
-    normalize_display_name,
-)
 from app.channels.trust_monitor.models import TrustAlertSurface
+from app.channels.trust_monitor.name_index import StaffNameIndex, StaffNameMatch
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +49,45 @@ _BISQ_ROOM_KEYWORDS = [
 _SUSPICIOUS_ROOM_TERMS = ["bisq support", "bisq help", "bisq easy"]
 
 
+class _RequestPacer:
+    """Bounds concurrent homeserver requests and spaces out their starts."""
+
+    def __init__(self, max_concurrency: int, requests_per_second: float) -> None:
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+        try:
+            async with self._lock:
+                now = time.monotonic()
+                delay = self._next_start - now
+                self._next_start = max(now, self._next_start) + self._interval
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._semaphore.release()
+
+
+@dataclass
+class RoomMemberSnapshot:
+    """Joined members of a room as of the last scan.
+
+    ``member_events`` maps user ids to the event id of their current
+    ``m.room.member`` state event. Joins and display name or avatar changes
+    produce a new state event, so a differing id marks a member to screen.
+    """
+
+    member_events: dict[str, str] = field(default_factory=dict)
+    scanned_at: datetime | None = None
+
+
 class ProactiveImpersonationScanner:
     """Periodic scanner for Matrix impersonation attempts."""
 
@@ -58,6 +106,8 @@ class ProactiveImpersonationScanner:
         matrix_client: Any | None = None,
         scan_interval_seconds: int = 900,
         on_finding: Any | None = None,
+        max_concurrency: int = 4,
+        requests_per_second: float = 5.0,
     ) -> None:
         self.homeserver_url = homeserver_url.rstrip("/")
         self.access_token = access_token
@@ -72,6 +122,9 @@ class ProactiveImpersonationScanner:
         self._running = False
         self._reported_user_ids: set[str] = set()
         self._reported_room_ids: set[str] = set()
+        self._name_index = StaffNameIndex(staff_resolver.get_display_names())
+        self._pacer = _RequestPacer(max_concurrency, requests_per_second)
+        self._room_snapshots: dict[str, RoomMemberSnapshot] = {}
 
     async def start(self) -> None:
         if self._running:
@@ -116,12 +169,13 @@ class ProactiveImpersonationScanner:
         timeout = aiohttp.ClientTimeout(total=15)
 
         async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
-            user_findings, room_findings = await asyncio.gather(
+            user_findings, member_findings, room_findings = await asyncio.gather(
                 self._scan_user_directory(session),
+                self._scan_room_members(session),
                 self._scan_public_rooms(session),
             )
 
-        for finding in user_findings + room_findings:
+        for finding in user_findings + member_findings + room_findings:
             if self.on_finding is not None:
                 try:
                     self.on_finding(finding)
@@ -135,90 +189,229 @@ class ProactiveImpersonationScanner:
     async def _scan_user_directory(
         self, session: aiohttp.ClientSession
     ) -> list[DetectorResult]:
-        """Search Matrix user directory for display names matching staff."""
+        """Search Matrix user directory for display names resembling staff.
+
+        The directory search is only a candidate source: every result of
+        every staff-name search is collected first and then screened once
+        against the name index, so look-alikes returned for one staff name
+        are attributed to the staff member they actually resemble.
+        """
         staff_names = self.staff_resolver.get_display_names()
         if not staff_names:
             return []
 
-        findings: list[DetectorResult] = []
-
-        per_request_timeout = aiohttp.ClientTimeout(total=10)
+        candidates: dict[str, tuple[str, str]] = {}
+        searches = await asyncio.gather(
+            *(self._search_user_directory(session, name) for name in staff_names)
+        )
+        for results in searches:
+            for user in results:
+                user_id = str(user.get("user_id", "")).strip()
+                display_name = str(user.get("display_name", "")).strip()
+                suspect_avatar = str(user.get("avatar_url", "") or "").strip()
+                if user_id and display_name:
+                    candidates.setdefault(user_id, (display_name, suspect_avatar))
+
+        findings = await self._screen_members(
+            session,
+            ((uid, dn, avatar) for uid, (dn, avatar) in candidates.items()),
+            detection_method="user_directory_search",
+        )
+        if findings:
+            logger.info(
+                "Proactive user scan found %d potential impersonator(s)",
+                len(findings),
+            )
+        return findings
 
-        for name in staff_names:
-            normalized_staff = normalize_display_name(name)
-            try:
+    async def _search_user_directory(
+        self, session: aiohttp.ClientSession, name: str
+    ) -> list[dict[str, Any]]:
+        try:
+            async with self._pacer:
                 resp = await session.post(
                     f"{self.homeserver_url}/_matrix/client/v3/user_directory/search",
                     json={"search_term": name, "limit": 20},
-                    timeout=per_request_timeout,
+                    timeout=aiohttp.ClientTimeout(total=10),
                 )
                 if resp.status != 200:
-                    continue
-
+                    return []
                 data = await resp.json()
+            return list(data.get("results", []))
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            logger.debug(
+                "User directory search timed out or failed for '%s'",
+                name,
+                exc_info=True,
+            )
+        except Exception:
+            logger.debug("User directory search error for '%s'", name, exc_info=True)
+        return []
 
-                # Fetch real staff avatar for comparison
-                staff_avatar_url = await self._get_avatar_url(session, name)
-
-                for user in data.get("results", []):
-                    user_id = str(user.get("user_id", "")).strip()
-                    display_name = str(user.get("display_name", "")).strip()
-                    suspect_avatar = str(user.get("avatar_url", "") or "").strip()
+    # ------------------------------------------------------------------
+    # Monitored room member scanning
+    # ------------------------------------------------------------------
 
-                    if not user_id or not display_name:
-                        continue
-                    if user_id.lower() in self.trusted_staff_ids:
-                        continue
-                    if user_id in self._reported_user_ids:
-                        continue
-                    if normalize_display_name(display_name) != normalized_staff:
-                        continue
+    async def _scan_room_members(
+        self, session: aiohttp.ClientSession
+    ) -> list[DetectorResult]:
+        """Screen new and changed members of every monitored room.
 
-                    logger.warning(
-                        "Proactive scan: potential impersonator '%s' (%s) "
-                        "matches staff name '%s'",
-                        display_name,
-                        user_id,
-                        name,
-                    )
-                    self._reported_user_ids.add(user_id)
-                    findings.append(
-                        DetectorResult(
-                            detector_key=self.DETECTOR_KEY_USER,
-                            suspect_actor_id=user_id,
-                            suspect_actor_key=user_id,
-                            suspect_display_name=display_name,
-                            score=0.95,
-                            evidence_summary={
-                                "matched_staff_name": name,
-                                "user_id": user_id,
-                                "display_name": display_name,
-                                "detection_method": "user_directory_search",
-                                "suspect_avatar_url": suspect_avatar or None,
-                                "staff_avatar_url": staff_avatar_url or None,
-                            },
-                            alert_surface=TrustAlertSurface.BOTH,
-                            occurred_at=datetime.now(UTC),
-                        )
-                    )
-            except (aiohttp.ClientError, asyncio.TimeoutError):
-                logger.debug(
-                    "User directory search timed out or failed for '%s'",
-                    name,
-                    exc_info=True,
-                )
-            except Exception:
-                logger.debug(
-                    "User directory search error for '%s'", name, exc_info=True
-                )
+        Member lists are fetched concurrently. The first scan of a room
+        screens everyone; later scans only screen members whose member
+        state event changed since the stored snapshot.
+        """
+        if not self.monitored_room_ids or not len(self._name_index):
+            return []
 
+        per_room = await asyncio.gather(
+            *(
+                self._scan_room(session, room_id)
+                for room_id in sorted(self.monitored_room_ids)
+            )
+        )
+        findings = [finding for room_findings in per_room for finding in room_findings]
         if findings:
             logger.info(
-                "Proactive user scan found %d potential impersonator(s)",
+                "Proactive member scan found %d potential impersonator(s)",
                 len(findings),
             )
         return findings
 
+    async def _scan_room(
+        self, session: aiohttp.ClientSession, room_id: str
+    ) -> list[DetectorResult]:
+        try:
+            async with self._pacer:
+                resp = await session.get(
+                    f"{self.homeserver_url}/_matrix/client/v3/rooms/"
+                    f"{quote(room_id, safe='')}/members",
+                    params={"membership": "join"},
+                    timeout=aiohttp.ClientTimeout(total=10),
+                )
+                if resp.status != 200:
+                    return []
+                data = await resp.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            logger.debug(
+                "Member list fetch timed out or failed for '%s'",
+                room_id,
+                exc_info=True,
+            )
+            return []
+        except Exception:
+            logger.debug("Member list fetch error for '%s'", room_id, exc_info=True)
+            return []
+
+        previous = self._room_snapshots.get(room_id)
+        known = previous.member_events if previous is not None else {}
+        current: dict[str, str] = {}
+        changed: list[tuple[str, str, str]] = []
+        for event in data.get("chunk", []):
+            content = event.get("content") or {}
+            user_id = str(event.get("state_key", "")).strip()
+            if not user_id or content.get("membership") != "join":
+                continue
+            display_name = str(content.get("displayname") or "").strip()
+            avatar_url = str(content.get("avatar_url") or "").strip()
+            # Servers always send event ids; the profile is only a fallback key
+            event_id = str(event.get("event_id") or f"{display_name}|{avatar_url}")
+            current[user_id] = event_id
+            if known.get(user_id) != event_id:
+                changed.append((user_id, display_name, avatar_url))
+
+        self._room_snapshots[room_id] = RoomMemberSnapshot(
+            member_events=current, scanned_at=datetime.now(UTC)
+        )
+        logger.debug(
+            "Room %s: %d member(s), %d new or changed",
+            room_id,
+            len(current),
+            len(changed),
+        )
+        if not changed:
+            return []
+        return await self._screen_members(
+            session,
+            changed,
+            detection_method="room_member_scan",
+            extra_evidence={"room_id": room_id},
+        )
+
+    def _match_members(
+        self, members: Iterable[tuple[str, str, str]]
+    ) -> list[tuple[str, str, str, StaffNameMatch]]:
+        """Match ``(user_id, display_name, avatar_url)`` tuples in one pass."""
+        matched: list[tuple[str, str, str, StaffNameMatch]] = []
+        for user_id, display_name, avatar_url in members:
+            if not user_id or not display_name:
+                continue
+            if user_id.lower() in self.trusted_staff_ids:
+                continue
+            if user_id in self._reported_user_ids:
+                continue
+            match = self._name_index.match(display_name)
+            if match is not None:
+                matched.append((user_id, display_name, avatar_url, match))
+        return matched
+
+    async def _screen_members(
+        self,
+        session: aiohttp.ClientSession,
+        members: Iterable[tuple[str, str, str]],
+        *,
+        detection_method: str,
+        extra_evidence: dict[str, Any] | None = None,
+    ) -> list[DetectorResult]:
+        findings: list[DetectorResult] = []
+        staff_avatars: dict[str, str | None] = {}
+
+        for user_id, display_name, suspect_avatar, match in self._match_members(
+            members
+        ):
+            if match.staff_name not in staff_avatars:
+                # Fetch real staff avatar for comparison
+                staff_avatars[match.staff_name] = await self._get_avatar_url(
+                    session, match.staff_name
+                )
+            # Re-checked after the await: concurrent room scans can match
+            # the same account
+            if user_id in self._reported_user_ids:
+                continue
+
+            logger.warning(
+                "Proactive scan: potential impersonator '%s' (%s) "
+                "matches staff name '%s' (%s)",
+                display_name,
+                user_id,
+                match.staff_name,
+                match.kind,
+            )
+            self._reported_user_ids.add(user_id)
+            findings.append(
+                DetectorResult(
+                    detector_key=self.DETECTOR_KEY_USER,
+                    suspect_actor_id=user_id,
+                    suspect_actor_key=user_id,
+                    suspect_display_name=display_name,
+                    score=min(0.95, match.score),
+                    evidence_summary={
+                        "matched_staff_name": match.staff_name,
+                        "match_kind": match.kind,
+                        "edit_distance": match.distance,
+                        "user_id": user_id,
+                        "display_name": display_name,
+                        "detection_method": detection_method,
+                        "suspect_avatar_url": suspect_avatar or None,
+                        "staff_avatar_url": staff_avatars[match.staff_name] or None,
+                        **(extra_evidence or {}),
+                    },
+                    alert_surface=TrustAlertSurface.BOTH,
+                    occurred_at=datetime.now(UTC),
+                )
+            )
+        return findings
+
     # ------------------------------------------------------------------
     # Public room directory scanning
     # ------------------------------------------------------------------
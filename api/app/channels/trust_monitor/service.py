@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+import logging
 import secrets
+from collections.abc import Sequence
 from datetime import datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from app.channels.staff import StaffResolver
 from app.channels.trust_monitor.detectors.silent_early_observer import (
@@ -24,6 +26,7 @@ from app.channels.trust_monitor.models import (
     TrustFindingList,
     TrustFindingStatus,
     TrustMonitorOpsSnapshot,
+    TrustPolicy,
     utc_now,
 )
 from app.channels.trust_monitor.publisher import TrustAlertPublisher
@@ -34,6 +37,11 @@ from app.metrics.operator_metrics import (
 )
 from app.services.trust_monitor_policy_service import TrustMonitorPolicyService
 
+if TYPE_CHECKING:
+    from app.channels.trust_monitor.evidence_writer import TrustEvidenceWriter
+
+logger = logging.getLogger(__name__)
+
 
 class TrustMonitorService:
     def __init__(
@@ -56,6 +64,8 @@ class TrustMonitorService:
             staff_resolver=staff_resolver,
         )
         self._actor_secret = self._resolve_actor_secret(settings)
+        # Set at startup; channel handlers queue events through it when running
+        self.evidence_writer: TrustEvidenceWriter | None = None
 
     @staticmethod
     def _resolve_actor_secret(settings: Any) -> bytes:
@@ -82,13 +92,71 @@ class TrustMonitorService:
 
     def ingest_event(self, event: TrustEvent) -> TrustFinding | None:
         policy = self.policy_service.get_policy()
+        with self.store.transaction():
+            finding, notify = self._ingest(event, policy)
+        if notify and finding is not None:
+            self._publish(finding)
+        return finding
+
+    def ingest_events(self, events: Sequence[TrustEvent]) -> list[TrustFinding | None]:
+        """Ingest a batch of events and publish the resulting alerts."""
+        results, alerts = self.record_events(events)
+        self.publish_findings(alerts)
+        return results
+
+    def record_events(
+        self, events: Sequence[TrustEvent]
+    ) -> tuple[list[TrustFinding | None], list[TrustFinding]]:
+        """Ingest a batch of events in one store transaction, without publishing.
+
+        Each event runs in its own savepoint, so a failing event is rolled
+        back and logged without discarding the rest of the batch. Returns
+        the per-event findings and the findings to publish; callers running
+        this in a worker thread publish them on the event loop, where the
+        staff-room notifier can be scheduled.
+        """
+        policy = self.policy_service.get_policy()
+        outcomes: list[tuple[TrustFinding | None, bool]] = []
+        with self.store.transaction() as conn:
+            for event in events:
+                try:
+                    with self.store.savepoint(conn):
+                        outcomes.append(self._ingest(event, policy))
+                except Exception:
+                    logger.exception(
+                        "Failed ingesting trust event channel=%s type=%s",
+                        event.channel_id,
+                        event.event_type.value,
+                    )
+                    outcomes.append((None, False))
+        alerts = [
+            finding for finding, notify in outcomes if notify and finding is not None
+        ]
+        return [finding for finding, _notify in outcomes], alerts
+
+    def publish_findings(self, findings: Sequence[TrustFinding]) -> None:
+        for finding in findings:
+            self._publish(finding)
+
+    def _publish(self, finding: TrustFinding) -> None:
+        self.publisher.publish(finding)
+        record_trust_finding(
+            detector=finding.detector_key,
+            action="notified",
+            surface=finding.alert_surface.value,
+        )
+
+    def _ingest(
+        self, event: TrustEvent, policy: TrustPolicy
+    ) -> tuple[TrustFinding | None, bool]:
+        """Store one event and evaluate detectors; returns (finding, notify)."""
         if not policy.enabled:
             record_trust_event(
                 channel=event.channel_id,
                 event_type=event.event_type.value,
                 result="policy_disabled",
             )
-            return None
+            return None, False
         if event.channel_id == "matrix":
             monitored_rooms = set(policy.matrix_public_room_ids)
             if event.space_id not in monitored_rooms:
@@ -101,7 +169,7 @@ class TrustMonitorService:
                         else "out_of_scope"
                     ),
                 )
-                return None
+                return None, False
         actor_key = self.actor_key(event.channel_id, event.actor_id)
         target_actor_key = (
             self.actor_key(event.channel_id, event.target_actor_id)
@@ -131,7 +199,7 @@ class TrustMonitorService:
                 event_type=event.event_type.value,
                 result="duplicate",
             )
-            return None
+            return None, False
         record_trust_event(
             channel=event.channel_id,
             event_type=event.event_type.value,
@@ -148,7 +216,7 @@ class TrustMonitorService:
                 policy=policy,
             )
         if candidate is None:
-            return None
+            return None, False
         candidate.alert_surface = policy.alert_surface
         existing = self.store.find_existing_finding(
             detector_key=candidate.detector_key,
@@ -159,12 +227,12 @@ class TrustMonitorService:
         if existing is not None:
             now = candidate.occurred_at
             if existing.benign_until is not None and existing.benign_until > now:
-                return existing
+                return existing, False
             if (
                 existing.suppressed_until is not None
                 and existing.suppressed_until > now
             ):
-                return existing
+                return existing, False
             notify = not (
                 existing.last_notified_at is not None
                 and (now - existing.last_notified_at) < timedelta(hours=12)
@@ -189,14 +257,7 @@ class TrustMonitorService:
             action="upserted" if existing is not None else "created",
             surface=finding.alert_surface.value,
         )
-        if notify:
-            self.publisher.publish(finding)
-            record_trust_finding(
-                detector=finding.detector_key,
-                action="notified",
-                surface=finding.alert_surface.value,
-            )
-        return finding
+        return finding, notify
 
     def list_findings(
         self,
@@ -129,6 +129,15 @@ class Settings(BaseSettings):
     BISQ2_STAFF_NOTIFICATION_TARGET: str = ""  # Bisq2 channel ID for staff notices
     BISQ2_CHATOPS_ENABLED: bool = False
     BISQ2_CHATOPS_CHANNEL_IDS: str | list[str] = ""
+    CHANNEL_POLL_MAX_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description=(
+            "Max inbound messages processed concurrently per polling channel; "
+            "messages within one thread stay strictly ordered"
+        ),
+    )
 
     # Matrix sync lane (training ingestion)
     MATRIX_SYNC_ENABLED: bool = False
@@ -163,6 +172,11 @@ class Settings(BaseSettings):
     TRUST_MONITOR_AGGREGATE_TTL_DAYS: int = 30
     TRUST_MONITOR_FINDING_TTL_DAYS: int = 30
     TRUST_MONITOR_ACTOR_KEY_SECRET: str = ""
+    TRUST_MONITOR_PROACTIVE_SCAN_CONCURRENCY: int = 4
+    TRUST_MONITOR_PROACTIVE_SCAN_REQUESTS_PER_SECOND: float = 5.0
+    TRUST_MONITOR_EVIDENCE_BATCH_SIZE: int = 200
+    TRUST_MONITOR_EVIDENCE_FLUSH_SECONDS: float = 0.25
+    TRUST_MONITOR_EVIDENCE_QUEUE_SIZE: int = 5000
 
     # Tor hidden service settings
     TOR_HIDDEN_SERVICE: str = ""  # .onion address if Tor hidden service is configured
@@ -195,6 +209,39 @@ class Settings(BaseSettings):
     MAX_CONTEXT_LENGTH: int = 15000  # Maximum length of context to include in prompt
     MAX_SAMPLE_LOG_LENGTH: int = 200  # Maximum length to log in samples
 
+    # Slow-query log: requests at or above the threshold are stored with their
+    # per-stage trace waterfall in DATA_DIR/slow_queries.db
+    SLOW_QUERY_LOG_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = Field(
+        default=8000.0,
+        ge=0,
+        description="Requests taking at least this many milliseconds are written to the slow-query log",
+    )
+    SLOW_QUERY_LOG_MAX_ENTRIES: int = Field(
+        default=500,
+        ge=1,
+        le=100000,
+        description="Number of most recent slow requests kept in the slow-query log",
+    )
+
+    # Startup warm-up: when enabled the app accepts traffic right away and builds
+    # or verifies the index, loads the NLI/ColBERT models and warms caches in
+    # tracked background tasks (see /health/ready). Queries get the degraded
+    # "warming up" response until the index is ready.
+    STARTUP_BACKGROUND_WARMUP: bool = True
+    STARTUP_WARMUP_RETRIES: int = Field(
+        default=5,
+        ge=0,
+        le=20,
+        description="Retries for a failed background index warm-up before /health fails",
+    )
+    STARTUP_WARMUP_RETRY_DELAY_SECONDS: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=300.0,
+        description="Delay before the first warm-up retry, doubled per retry",
+    )
+
     # Retrieval Backend Configuration
     # Qdrant is the only supported backend.
     RETRIEVER_BACKEND: str = "qdrant"
@@ -204,6 +251,37 @@ class Settings(BaseSettings):
     QDRANT_PORT: int = 6333
     QDRANT_COLLECTION: str = "bisq_docs"
     QDRANT_GRPC_PORT: int = 6334  # Optional gRPC port for performance
+    QDRANT_SEARCH_TIMEOUT_SECONDS: int = Field(
+        default=10,
+        ge=1,
+        le=120,
+        description="Request timeout of the retrieval Qdrant client",
+    )
+
+    # Local fallback vector index (numpy snapshot of the Qdrant collection,
+    # searched in-process when Qdrant is slow or unavailable)
+    ENABLE_LOCAL_FALLBACK_INDEX: bool = True
+    LOCAL_FALLBACK_INDEX_DTYPE: str = "float32"  # "float32" or "int8" (4x smaller)
+    RETRIEVER_LATENCY_BUDGET_SECONDS: float = Field(
+        default=3.0,
+        ge=0.1,
+        le=60.0,
+        description="Max seconds to wait for Qdrant before answering from the local index",
+    )
+    RETRIEVER_FALLBACK_RESET_SECONDS: int = Field(
+        default=60,
+        ge=0,
+        le=3600,
+        description="Seconds between attempts to switch back to Qdrant after a fallback",
+    )
+    LOCAL_INDEX_FAST_PATH_MAX_CHUNKS: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Serve retrieval from the local index first when the corpus has at most "
+            "this many chunks (0 disables the fast path)"
+        ),
+    )
 
     # ColBERT Reranking Settings
     COLBERT_MODEL: str = "colbert-ir/colbertv2.0"
@@ -216,6 +294,41 @@ class Settings(BaseSettings):
     QUERY_REWRITE_TIMEOUT_SECONDS: float = 2.0
     QUERY_REWRITE_MAX_HISTORY_TURNS: int = 4
 
+    # Semantic answer cache: auto-sent answers reused for paraphrased questions
+    ENABLE_SEMANTIC_ANSWER_CACHE: bool = True
+    SEMANTIC_ANSWER_CACHE_THRESHOLD: float = Field(
+        default=0.95,
+        ge=0.5,
+        le=1.0,
+        description="Minimum question embedding cosine similarity for a cache hit",
+    )
+    SEMANTIC_ANSWER_CACHE_MAX_ENTRIES: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum cached answers (least recently used are evicted)",
+    )
+    SEMANTIC_ANSWER_CACHE_TTL_SECONDS: int = Field(
+        default=86400,
+        ge=0,
+        description="Lifetime of a cached answer in seconds (0 = until invalidated)",
+    )
+
+    # Start retrieval on the user's question while translation/version detection
+    # run; the result is used only if the final query and version match
+    ENABLE_SPECULATIVE_RETRIEVAL: bool = True
+
+    # Concurrent identical questions share one pipeline run (single-flight)
+    ENABLE_QUERY_COALESCING: bool = True
+    QUERY_COALESCING_SIMILARITY_THRESHOLD: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Also join in-flight questions at least this embedding-similar "
+            "(0 = exact normalized matches only)"
+        ),
+    )
+
     # Hybrid Search Weights (must sum to 1.0)
     # Optimized via RAGAS evaluation: 0.6/0.4 shows +6% faithfulness improvement
     HYBRID_SEMANTIC_WEIGHT: float = Field(
@@ -254,6 +367,19 @@ class Settings(BaseSettings):
             )
         return v
 
+    @field_validator("LOCAL_FALLBACK_INDEX_DTYPE")
+    @classmethod
+    def validate_local_fallback_index_dtype(cls, v: str) -> str:
+        """Validate LOCAL_FALLBACK_INDEX_DTYPE is a supported storage dtype."""
+        v = (v or "").strip().lower()
+        allowed = {"float32", "int8"}
+        if v not in allowed:
+            raise ValueError(
+                "LOCAL_FALLBACK_INDEX_DTYPE must be one of "
+                f"{', '.join(sorted(allowed))}, got '{v}'"
+            )
+        return v
+
     @model_validator(mode="after")
     def validate_hybrid_weights_sum(self) -> "Settings":
         """Ensure HYBRID_SEMANTIC_WEIGHT + HYBRID_KEYWORD_WEIGHT == 1.0."""
@@ -326,6 +452,21 @@ class Settings(BaseSettings):
         default=0.0,
         description="LLM temperature for extraction (deterministic)",
     )
+    LLM_EXTRACTION_CHUNK_TOKEN_BUDGET: int = Field(
+        default=8000,
+        ge=500,
+        le=200000,
+        description=(
+            "Estimated transcript tokens per FAQ extraction call; larger batches "
+            "are split on thread boundaries"
+        ),
+    )
+    LLM_EXTRACTION_MAX_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum concurrent LLM calls when extracting a chunked batch",
+    )
 
     # LLM Extraction Filtering Settings (Question Extraction Optimization)
     LLM_EXTRACTION_MIN_CONFIDENCE: float = Field(
@@ -358,7 +499,10 @@ class Settings(BaseSettings):
         default=0.5,
         ge=0.1,
         le=5.0,
-        description="Maximum seconds for regex pattern matching",
+        description=(
+            "Deprecated: pre-filter patterns are validated against catastrophic "
+            "backtracking at load time instead of being timed out"
+        ),
     )
     MAX_MESSAGE_LENGTH: int = Field(
         default=10000,
@@ -404,8 +548,10 @@ class Settings(BaseSettings):
 
     # Multilingual detection/translation policy settings
     MULTILINGUAL_LID_BACKEND: str = Field(
+        # Detector thresholds are calibrated against langdetect; "ngram" is an
+        # opt-in faster backend until they are re-tuned for its scores.
         default="langdetect",
-        description="Primary local language ID backend (langdetect or none)",
+        description="Primary local language ID backend (langdetect, ngram or none)",
     )
     MULTILINGUAL_LID_CONFIDENCE_THRESHOLD: float = Field(
         default=0.80,
@@ -441,13 +587,17 @@ class Settings(BaseSettings):
         le=1.0,
         description="Confidence threshold to skip translation when detected language is English",
     )
+    MULTILINGUAL_SEGMENT_MEMORY_ENABLED: bool = Field(
+        default=True,
+        description="Cache response translations per sentence/markdown block and only translate unseen segments",
+    )
 
     @field_validator("MULTILINGUAL_LID_BACKEND")
     @classmethod
     def validate_lid_backend(cls, v: str) -> str:
         """Validate MULTILINGUAL_LID_BACKEND is a supported value."""
         v = (v or "").strip().lower()
-        allowed = {"langdetect", "none"}
+        allowed = {"ngram", "langdetect", "none"}
         if v not in allowed:
             raise ValueError(
                 "MULTILINGUAL_LID_BACKEND must be one of "
@@ -468,6 +618,48 @@ class Settings(BaseSettings):
         default=False,
         description="Enable automatic training pipeline for staff answer ingestion",
     )
+    AUTO_TRAINING_MAX_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum extracted FAQs whose RAG answers are generated concurrently",
+    )
+    AUTO_TRAINING_JUDGE_BATCH_SIZE: int = Field(
+        default=4,
+        ge=1,
+        le=10,
+        description="Answer pairs scored per LLM-as-judge call when comparing in batch",
+    )
+    AUTO_TRAINING_EMBEDDING_CACHE_SIZE: int = Field(
+        default=5000,
+        ge=1,
+        description="Answer embeddings kept in memory by the comparison engine (LRU)",
+    )
+    AUTO_TRAINING_EMBEDDING_CACHE_PERSIST: bool = Field(
+        default=True,
+        description="Persist answer comparison embeddings in DATA_DIR across restarts",
+    )
+    AUTO_TRAINING_EMBEDDING_CACHE_MAX_ROWS: int = Field(
+        default=100_000,
+        ge=1,
+        description="Persisted answer embeddings kept on disk; oldest rows are pruned",
+    )
+    KNOWLEDGE_TOPIC_EMBEDDING_CLUSTERING_ENABLED: bool = Field(
+        default=True,
+        description="Group knowledge update review items by question embedding similarity instead of keyword topics",
+    )
+    KNOWLEDGE_TOPIC_CLUSTER_SIMILARITY: float = Field(
+        default=0.85,
+        ge=0.5,
+        le=1.0,
+        description="Minimum cosine similarity between a candidate question and its knowledge topic cluster centroid",
+    )
+    LEARNING_REVIEW_HALF_LIFE_DAYS: float = Field(
+        default=90.0,
+        gt=0,
+        le=3650,
+        description="Age in days at which an admin review weighs half as much in learned routing thresholds",
+    )
     # Trusted staff Matrix IDs for auto-training (full Matrix IDs like @user:matrix.org)
     # SECURITY: Always use full Matrix IDs to prevent impersonation from other homeservers
     # NOTE: No default - must be explicitly configured via TRUSTED_STAFF_IDS env var
@@ -1171,12 +1363,21 @@ class Settings(BaseSettings):
             "TRUST_MONITOR_EVIDENCE_TTL_DAYS": self.TRUST_MONITOR_EVIDENCE_TTL_DAYS,
             "TRUST_MONITOR_AGGREGATE_TTL_DAYS": self.TRUST_MONITOR_AGGREGATE_TTL_DAYS,
             "TRUST_MONITOR_FINDING_TTL_DAYS": self.TRUST_MONITOR_FINDING_TTL_DAYS,
+            "TRUST_MONITOR_PROACTIVE_SCAN_CONCURRENCY": self.TRUST_MONITOR_PROACTIVE_SCAN_CONCURRENCY,
+            "TRUST_MONITOR_EVIDENCE_BATCH_SIZE": self.TRUST_MONITOR_EVIDENCE_BATCH_SIZE,
+            "TRUST_MONITOR_EVIDENCE_QUEUE_SIZE": self.TRUST_MONITOR_EVIDENCE_QUEUE_SIZE,
         }
         for name, value in integer_fields.items():
             if value < 1:
                 raise ValueError(f"{name} must be >= 1")
         if self.TRUST_MONITOR_READ_TO_REPLY_RATIO_THRESHOLD <= 0:
             raise ValueError("TRUST_MONITOR_READ_TO_REPLY_RATIO_THRESHOLD must be > 0")
+        if self.TRUST_MONITOR_EVIDENCE_FLUSH_SECONDS < 0:
+            raise ValueError("TRUST_MONITOR_EVIDENCE_FLUSH_SECONDS must be >= 0")
+        if self.TRUST_MONITOR_PROACTIVE_SCAN_REQUESTS_PER_SECOND <= 0:
+            raise ValueError(
+                "TRUST_MONITOR_PROACTIVE_SCAN_REQUESTS_PER_SECOND must be > 0"
+            )
         return self
 
     @model_validator(mode="after")
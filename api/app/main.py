@@ -3,6 +3,7 @@ FastAPI application for the Bisq Support Assistant.
 This module sets up the API server with routes, middleware, and error handling.
 """
 
+import asyncio
 import ipaddress
 import logging
 import os
@@ -43,12 +44,14 @@ from app.services.channel_autoresponse_policy_service import (
 )
 from app.services.faq_service import FAQService
 from app.services.feedback_service import FeedbackService
+from app.services.knowledge_updates.embedding_clusters import EmbeddingTopicClusterer
 from app.services.mcp.mcp_http_server import router as mcp_router
 from app.services.mcp.mcp_http_server import set_bisq_service
 from app.services.public_faq_service import PublicFAQService
 from app.services.rag.embeddings_provider import OpenAIEmbeddingsProvider
 from app.services.rag.learning_engine import LearningEngine
 from app.services.simplified_rag_service import SimplifiedRAGService
+from app.services.startup_warmup import StartupWarmup
 from app.services.tor_monitoring_service import TorMonitoringService
 from app.services.training.comparison_engine import AnswerComparisonEngine
 from app.services.training.unified_pipeline_service import UnifiedPipelineService
@@ -140,6 +143,18 @@ async def lifespan(app: FastAPI):
         db_path=os.path.join(settings.DATA_DIR, "feedback.db")
     )
 
+    app.state.slow_query_log = None
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        from app.services.slow_query_log import SlowQueryLog
+        from app.utils.request_trace import set_trace_sink
+
+        app.state.slow_query_log = SlowQueryLog(
+            db_path=os.path.join(settings.DATA_DIR, "slow_queries.db"),
+            threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+            max_entries=settings.SLOW_QUERY_LOG_MAX_ENTRIES,
+        )
+        set_trace_sink(app.state.slow_query_log)
+
     app.state.channel_autoresponse_policy_service = ChannelAutoResponsePolicyService(
         db_path=os.path.join(settings.DATA_DIR, "feedback.db"),
     )
@@ -169,6 +184,17 @@ async def lifespan(app: FastAPI):
             ),
         )
         app.state.trust_monitor_service.apply_retention()
+
+        from app.channels.trust_monitor.evidence_writer import TrustEvidenceWriter
+
+        evidence_writer = TrustEvidenceWriter(
+            app.state.trust_monitor_service,
+            max_batch_size=settings.TRUST_MONITOR_EVIDENCE_BATCH_SIZE,
+            flush_interval_seconds=settings.TRUST_MONITOR_EVIDENCE_FLUSH_SECONDS,
+            max_queue_size=settings.TRUST_MONITOR_EVIDENCE_QUEUE_SIZE,
+        )
+        evidence_writer.start()
+        app.state.trust_monitor_service.evidence_writer = evidence_writer
     except Exception:
         app.state.trust_monitor_service = None
         logger.exception("Trust monitor initialization failed")
@@ -179,6 +205,17 @@ async def lifespan(app: FastAPI):
     logger.info("Initializing PublicFAQService...")
     public_faq_service = PublicFAQService(faq_service=faq_service)
 
+    # Expensive preparation runs as tracked warm-up components (/health/ready).
+    # In background mode the app starts serving before they finish.
+    background_warmup = settings.STARTUP_BACKGROUND_WARMUP
+    warmup = StartupWarmup()
+    app.state.startup_warmup = warmup
+    warmup.start(
+        "faq_cache",
+        lambda: asyncio.to_thread(public_faq_service.warm_cache),
+        required=False,
+    )
+
     # Initialize Bisq2MCPService for live data integration
     logger.info("Initializing Bisq2MCPService...")
     bisq_mcp_service = Bisq2MCPService(settings=settings)
@@ -216,16 +253,37 @@ async def lifespan(app: FastAPI):
         wiki_service=wiki_service,
         faq_service=faq_service,
         bisq_mcp_service=bisq_mcp_service,
+        defer_model_loading=background_warmup,
     )
 
-    # Set up the RAG service (loads data, builds vector store)
-    await rag_service.setup()
+    # Set up the RAG service (loads data, verifies or builds the vector store)
+    async def _warm_up_rag_index() -> None:
+        if not await rag_service.setup(offload_blocking=background_warmup):
+            raise RuntimeError("No documents loaded")
+
+    if background_warmup:
+        # Transient failures (Qdrant still starting, embedding API hiccups)
+        # must not leave the index, and channel polling behind it, down.
+        warmup.start(
+            "rag_index",
+            _warm_up_rag_index,
+            retries=settings.STARTUP_WARMUP_RETRIES,
+            retry_delay=settings.STARTUP_WARMUP_RETRY_DELAY_SECONDS,
+        )
+        warmup.start(
+            "nli_model",
+            lambda: asyncio.to_thread(rag_service.load_nli_model),
+            required=False,
+        )
+    else:
+        await warmup.run("rag_index", rag_service.setup)
 
     # Wire multilingual translation service to the initialized RAG runtime.
     # This enables the English-pivot flow (translate in -> retrieve/generate -> translate out).
     try:
         if rag_service.llm is None:
-            raise RuntimeError("RAG LLM is not initialized")
+            # Cheap client setup; the index build may still be running
+            rag_service.initialize_llm()
 
         translation_service = TranslationService(
             llm_provider=rag_service.llm,
@@ -237,6 +295,7 @@ async def lifespan(app: FastAPI):
             lid_mixed_margin_threshold=settings.MULTILINGUAL_LID_MIXED_MARGIN_THRESHOLD,
             lid_mixed_secondary_min=settings.MULTILINGUAL_LID_MIXED_SECONDARY_MIN,
             lid_enable_llm_tiebreaker=settings.MULTILINGUAL_LID_ENABLE_LLM_TIEBREAKER,
+            segment_memory_enabled=settings.MULTILINGUAL_SEGMENT_MEMORY_ENABLED,
         )
         rag_service.translation_service = translation_service
         app.state.translation_service = translation_service
@@ -260,17 +319,27 @@ async def lifespan(app: FastAPI):
     )
     logger.info("Shared ingress context service initialized")
 
-    # Eager load ColBERT reranker if enabled and using Qdrant backend
+    # Load ColBERT reranker if enabled and using Qdrant backend
     if settings.RETRIEVER_BACKEND == "qdrant" and settings.ENABLE_COLBERT_RERANK:
-        logger.info("Eager loading ColBERT reranker model...")
-        try:
-            if rag_service.colbert_reranker:
-                rag_service.colbert_reranker.load_model()
-                logger.info("ColBERT reranker model loaded successfully")
-            else:
-                logger.warning("ColBERT reranker not initialized, skipping eager load")
-        except Exception as e:
-            logger.warning(f"ColBERT eager loading failed (will load lazily): {e}")
+        if background_warmup:
+            warmup.start(
+                "colbert_model",
+                lambda: asyncio.to_thread(rag_service.warm_up_colbert),
+                required=False,
+                after=("rag_index",),
+            )
+        else:
+            logger.info("Eager loading ColBERT reranker model...")
+            try:
+                if rag_service.colbert_reranker:
+                    rag_service.colbert_reranker.load_model()
+                    logger.info("ColBERT reranker model loaded successfully")
+                else:
+                    logger.warning(
+                        "ColBERT reranker not initialized, skipping eager load"
+                    )
+            except Exception as e:
+                logger.warning(f"ColBERT eager loading failed (will load lazily): {e}")
 
     # Assign services to app state
     app.state.feedback_service = feedback_service
@@ -281,7 +350,9 @@ async def lifespan(app: FastAPI):
 
     # Create LearningEngine early so it can be wired to EscalationService
     # State will be loaded later when unified_db_path is available
-    learning_engine = LearningEngine()
+    learning_engine = LearningEngine(
+        review_half_life_days=settings.LEARNING_REVIEW_HALF_LIFE_DAYS
+    )
     app.state.learning_engine = learning_engine
 
     # Embeddings are a startup requirement because AnswerComparisonEngine depends on them.
@@ -520,10 +591,26 @@ async def lifespan(app: FastAPI):
             autoresponse_policy_service=app.state.channel_autoresponse_policy_service,
             escalation_service=getattr(app.state, "escalation_service", None),
             channel_id=channel_id,
+            max_concurrency=settings.CHANNEL_POLL_MAX_CONCURRENCY,
         )
-        await polling_service.start()
         app.state.channel_polling_services[channel_id] = polling_service
 
+    async def _start_channel_polling() -> None:
+        for polling_service in app.state.channel_polling_services.values():
+            await polling_service.start()
+
+    if background_warmup and app.state.channel_polling_services:
+        # Polled conversations wait for the index instead of getting the
+        # "warming up" reply; they are picked up on the first poll.
+        warmup.start(
+            "channel_polling",
+            _start_channel_polling,
+            required=False,
+            after=("rag_index",),
+        )
+    else:
+        await _start_channel_polling()
+
     # Backward-compatible app.state aliases consumed by existing routes/tests.
     app.state.bisq2_live_chat_service = app.state.channel_polling_services.get("bisq2")
     app.state.matrix_channel = bootstrap_result.registry.get("matrix")
@@ -572,6 +659,10 @@ async def lifespan(app: FastAPI):
                 monitored_room_ids=set(sync_rooms),
                 matrix_client=matrix_client,
                 on_finding=_handle_proactive_finding,
+                max_concurrency=settings.TRUST_MONITOR_PROACTIVE_SCAN_CONCURRENCY,
+                requests_per_second=(
+                    settings.TRUST_MONITOR_PROACTIVE_SCAN_REQUESTS_PER_SECOND
+                ),
             )
             await scanner.start()
             app.state.proactive_scanner = scanner
@@ -602,9 +693,26 @@ async def lifespan(app: FastAPI):
         ai_client=ai_client,
         embeddings_model=embeddings_model,
         judge_model="openai:gpt-4o-mini",
+        judge_batch_size=settings.AUTO_TRAINING_JUDGE_BATCH_SIZE,
+        embedding_cache_size=settings.AUTO_TRAINING_EMBEDDING_CACHE_SIZE,
+        embedding_cache_path=(
+            os.path.join(settings.DATA_DIR, "comparison_embeddings.db")
+            if settings.AUTO_TRAINING_EMBEDDING_CACHE_PERSIST
+            else None
+        ),
+        embedding_cache_max_rows=settings.AUTO_TRAINING_EMBEDDING_CACHE_MAX_ROWS,
     )
     logger.info("AnswerComparisonEngine initialized")
 
+    # Knowledge update review items are grouped by question embeddings; the
+    # clusterer keeps its clusters between requests and updates incrementally.
+    app.state.knowledge_topic_clusterer = None
+    if settings.KNOWLEDGE_TOPIC_EMBEDDING_CLUSTERING_ENABLED:
+        app.state.knowledge_topic_clusterer = EmbeddingTopicClusterer(
+            embeddings_model.embed_documents,
+            similarity_threshold=settings.KNOWLEDGE_TOPIC_CLUSTER_SIMILARITY,
+        )
+
     # Initialize Unified Pipeline Service for unified FAQ training.
     # unified_training.db is the single source of truth for candidate review,
     # calibration, and learning state. Legacy candidate DB files are not used.
@@ -657,6 +765,13 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Application shutdown...")
 
+    await app.state.startup_warmup.shutdown()
+
+    if app.state.slow_query_log is not None:
+        from app.utils.request_trace import set_trace_sink
+
+        set_trace_sink(None)
+
     # Save LearningEngine state before shutdown (P5: wrapped in try-catch)
     if hasattr(app.state, "learning_engine") and app.state.learning_engine:
         try:
@@ -711,6 +826,12 @@ async def lifespan(app: FastAPI):
         for error in stop_errors:
             logger.error("Channel shutdown error: %s", error)
 
+    # Write trust events queued by the stopped channels
+    trust_monitor_service = getattr(app.state, "trust_monitor_service", None)
+    evidence_writer = getattr(trust_monitor_service, "evidence_writer", None)
+    if evidence_writer is not None:
+        await evidence_writer.stop()
+
     # Close Matrix alert service
     if hasattr(app.state, "matrix_alert_service") and app.state.matrix_alert_service:
         logger.info("Closing Matrix alert service...")
@@ -5,12 +5,22 @@ Ensures API responses are never cached by browsers or proxies to prevent
 stale data issues after deployments.
 """
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+# no-store: Don't store in cache at all
+# no-cache: Revalidate with server before using cached response
+# must-revalidate: Once stale, must revalidate before using
+# private: Only browser can cache, not shared/proxy caches
+# Pragma/Expires: HTTP/1.0 compatibility
+NO_CACHE_HEADERS = {
+    "Cache-Control": "no-store, no-cache, must-revalidate, private",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
 
-class CacheControlMiddleware(BaseHTTPMiddleware):
+
+class CacheControlMiddleware:
     """
     Middleware to add Cache-Control headers to API responses.
 
@@ -21,6 +31,10 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
     - Cache-Control: no-store, no-cache, must-revalidate, private
     - Pragma: no-cache (for HTTP/1.0 compatibility)
     - Expires: 0 (for HTTP/1.0 compatibility)
+
+    Implemented as pure ASGI middleware: headers are rewritten on the
+    ``http.response.start`` message and body chunks pass through untouched,
+    so streaming responses (SSE) flush immediately.
     """
 
     def __init__(self, app: ASGIApp):
@@ -30,18 +44,11 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
         Args:
             app: The ASGI application to wrap
         """
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Process the request and add cache control headers to the response.
-
-        Args:
-            request: The incoming HTTP request
-            call_next: The next middleware or route handler
-
-        Returns:
-            Response with cache control headers added
+        Add cache control headers to every HTTP response.
 
         Note:
             Currently applies no-cache headers to ALL API responses.
@@ -49,20 +56,15 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
             consider implementing path-based or method-based conditional
             header application in future iterations.
         """
-        # Call the next middleware or route handler
-        response = await call_next(request)
-
-        # Add cache control headers to prevent caching
-        # no-store: Don't store in cache at all
-        # no-cache: Revalidate with server before using cached response
-        # must-revalidate: Once stale, must revalidate before using
-        # private: Only browser can cache, not shared/proxy caches
-        response.headers["Cache-Control"] = (
-            "no-store, no-cache, must-revalidate, private"
-        )
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # HTTP/1.0 compatibility headers
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in NO_CACHE_HEADERS.items():
+                    headers[name] = value
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
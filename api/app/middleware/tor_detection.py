@@ -8,18 +8,16 @@ it records metrics for monitoring Tor traffic.
 
 import logging
 import time
-from typing import Callable
 
 from app.core.config import get_settings
 from app.metrics.tor_metrics import record_tor_request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class TorDetectionMiddleware(BaseHTTPMiddleware):
+class TorDetectionMiddleware:
     """
     Middleware to detect and track requests received via Tor .onion address.
 
@@ -28,10 +26,13 @@ class TorDetectionMiddleware(BaseHTTPMiddleware):
     2. Detects if the request came through a .onion address
     3. Records metrics for .onion traffic (request count, duration, status)
     4. Passes the request through to the application
+
+    Implemented as pure ASGI middleware; metrics are recorded when the
+    response starts, without wrapping or buffering the body.
     """
 
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
+        self.app = app
         settings = get_settings()
         # Normalize TOR_HIDDEN_SERVICE by stripping any port suffix
         # This ensures self.onion_address contains only the domain
@@ -53,57 +54,58 @@ class TorDetectionMiddleware(BaseHTTPMiddleware):
                 "Tor detection middleware initialized (no .onion address configured)"
             )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def _is_onion_request(self, scope: Scope) -> bool:
+        if not self.onion_address:
+            return False
+        host_header = Headers(scope=scope).get("host", "").lower()
+        # Handle both "domain.onion" and "domain.onion:port" formats
+        return host_header == self.onion_address or host_header.startswith(
+            f"{self.onion_address}:"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process each request and track .onion traffic.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in the chain
-
-        Returns:
-            Response from the application
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http" or not self._is_onion_request(scope):
+            await self.app(scope, receive, send)
+            return
+
         # Record start time for duration tracking
         start_time = time.perf_counter()
 
-        # Check if this request came via .onion
-        host_header = request.headers.get("host", "").lower()
-        is_onion_request = False
+        async def send_and_record(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._record(scope, message["status"], start_time)
+            await send(message)
 
-        if self.onion_address and host_header:
-            # Check if the host header matches our .onion address
-            # Handle both "domain.onion" and "domain.onion:port" formats
-            is_onion_request = (
-                host_header == self.onion_address
-                or host_header.startswith(f"{self.onion_address}:")
+        await self.app(scope, receive, send_and_record)
+
+    def _record(self, scope: Scope, status: int, start_time: float) -> None:
+        duration = time.perf_counter() - start_time
+        method = scope["method"]
+        path = scope["path"]
+
+        # Record the metrics with error handling to prevent request failures
+        try:
+            record_tor_request(
+                method=method, endpoint=path, status=status, duration=duration
             )
+            logger.debug(
+                f"Tor request tracked: {method} {path} -> {status} ({duration:.3f}s)"
+            )
+
+            # Notify the monitoring service that we received an .onion request
+            # This updates the tor_connection_status metric
+            app = scope.get("app")
+            state = getattr(app, "state", None)
+            if hasattr(state, "tor_monitoring_service"):
+                state.tor_monitoring_service.record_onion_request()
 
-        # Process the request
-        response = await call_next(request)
-
-        # If this was a .onion request, record metrics
-        if is_onion_request:
-            duration = time.perf_counter() - start_time
-            method = request.method
-            path = request.url.path
-            status = response.status_code
-
-            # Record the metrics with error handling to prevent request failures
-            try:
-                record_tor_request(
-                    method=method, endpoint=path, status=status, duration=duration
-                )
-                logger.debug(
-                    f"Tor request tracked: {method} {path} -> {status} ({duration:.3f}s)"
-                )
-
-                # Notify the monitoring service that we received an .onion request
-                # This updates the tor_connection_status metric
-                if hasattr(request.app.state, "tor_monitoring_service"):
-                    request.app.state.tor_monitoring_service.record_onion_request()
-
-            except Exception as e:
-                logger.error(f"Failed to record Tor metrics: {e}", exc_info=True)
-
-        return response
+        except Exception as e:
+            logger.error(f"Failed to record Tor metrics: {e}", exc_info=True)
@@ -5,7 +5,7 @@ This package organizes admin routes by domain:
 - auth: Authentication (login, logout)
 - feedback: Feedback management (8 endpoints)
 - faqs: FAQ CRUD operations (4 endpoints)
-- analytics: Dashboard and metrics (2 endpoints)
+- analytics: Dashboard, metrics and slow-query log (3 endpoints)
 - vectorstore: Vector store management (2 endpoints)
 - training: Auto-training pipeline management (9 endpoints)
 - escalations: Escalation learning pipeline (7 endpoints)
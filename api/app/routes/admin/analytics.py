@@ -11,9 +11,10 @@ from app.core.security import verify_admin_access
 from app.models.feedback import DashboardOverviewResponse
 from app.services.dashboard_service import DashboardService
 from app.services.feedback_service import FeedbackService
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import Response
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, generate_latest
+from starlette.concurrency import run_in_threadpool
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -161,3 +162,35 @@ async def get_dashboard_overview(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             error_code="DASHBOARD_FETCH_FAILED",
         ) from e
+
+
+@router.get("/slow-queries")
+async def list_slow_queries(
+    request: Request,
+    limit: int = Query(default=50, ge=1, le=500),
+    min_duration_ms: float | None = Query(default=None, ge=0),
+):
+    """List the most recent slow requests with their per-stage waterfall.
+
+    Requests whose end-to-end duration reached SLOW_QUERY_THRESHOLD_MS are
+    recorded with every traced stage (translation, version detection,
+    retrieval searches, generation, NLI, routing, channel dispatch) as
+    offsets and durations in milliseconds.
+
+    Authentication required via API key.
+    """
+    slow_query_log = getattr(request.app.state, "slow_query_log", None)
+    if slow_query_log is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Slow-query log is disabled",
+        )
+    entries = await run_in_threadpool(
+        slow_query_log.list_entries,
+        limit=limit,
+        min_duration_ms=min_duration_ms,
+    )
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "items": entries,
+    }
@@ -137,6 +137,7 @@ def get_knowledge_update_service(request: Request) -> KnowledgeUpdateService:
     return KnowledgeUpdateService(
         settings=settings,
         db_path=pipeline_service.repository.db_path,
+        topic_clusterer=getattr(request.app.state, "knowledge_topic_clusterer", None),
     )
 
 
@@ -172,10 +173,14 @@ async def _get_knowledge_review_items(
     candidates = []
     async for candidate in _iter_pending_candidates(pipeline_service):
         candidates.append(candidate)
-    return build_knowledge_review_items(
-        candidates,
-        service.is_candidate_reviewable,
-        cluster_key=service.review_cluster_key,
+    return await run_in_threadpool(
+        lambda: build_knowledge_review_items(
+            candidates,
+            service.is_candidate_reviewable,
+            cluster_key=service.review_cluster_key,
+            topic_clusterer=service.topic_clusterer,
+            partition_key=service.review_partition_key,
+        )
     )
 
 
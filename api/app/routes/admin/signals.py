@@ -111,7 +111,11 @@ def _get_knowledge_update_review_item_count(
     if settings is None or repository is None or db_path is None:
         return 0
 
-    service = KnowledgeUpdateService(settings=settings, db_path=db_path)
+    service = KnowledgeUpdateService(
+        settings=settings,
+        db_path=db_path,
+        topic_clusterer=getattr(request.app.state, "knowledge_topic_clusterer", None),
+    )
     candidates = []
     offset = 0
     while True:
@@ -133,6 +137,8 @@ def _get_knowledge_update_review_item_count(
             candidates,
             service.is_candidate_reviewable,
             cluster_key=service.review_cluster_key,
+            topic_clusterer=service.topic_clusterer,
+            partition_key=service.review_partition_key,
         )
     )
 
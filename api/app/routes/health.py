@@ -3,6 +3,7 @@ import time
 
 import psutil  # type: ignore[import-untyped]
 from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
 
 router = APIRouter()
 
@@ -15,16 +16,23 @@ async def health_check(request: Request):
 
     Returns "initializing" status until RAG service is fully loaded.
     This prevents deployment validation from testing endpoints before they're ready.
+    Returns 503 "unhealthy" once a required warm-up component failed for good,
+    so the container is restarted instead of serving without an index.
     """
     # System metrics
     cpu_percent = psutil.cpu_percent()
     memory = psutil.virtual_memory()
     disk = psutil.disk_usage("/")
 
-    # Check if RAG service is initialized and ready
+    # Check if RAG service is initialized and its index warm-up finished
     rag_service_status = "initializing"
+    warmup = getattr(request.app.state, "startup_warmup", None)
     if hasattr(request.app.state, "rag_service") and request.app.state.rag_service:
-        rag_service_status = "healthy"
+        if warmup is None or warmup.is_ready("rag_index"):
+            rag_service_status = "healthy"
+    warmup_failed = warmup is not None and warmup.failed
+    if warmup_failed and rag_service_status != "healthy":
+        rag_service_status = "failed"
 
     bisq_status = {"status": "unknown"}
     bisq_service = getattr(request.app.state, "bisq_mcp_service", None)
@@ -36,14 +44,19 @@ async def health_check(request: Request):
             bisq_status = {"status": "unhealthy"}
 
     # Overall status depends on RAG readiness
-    overall_status = "healthy" if rag_service_status == "healthy" else "initializing"
+    if warmup_failed:
+        overall_status = "unhealthy"
+    elif rag_service_status == "healthy":
+        overall_status = "healthy"
+    else:
+        overall_status = "initializing"
 
     # Build metadata (for cache invalidation monitoring)
     # BUILD_ID is injected via Docker build arg from git commit hash
     # Format: build-{git-hash} (e.g., build-a3f2c1b)
     build_id = os.getenv("BUILD_ID", "unknown")
 
-    return {
+    content = {
         "status": overall_status,
         "timestamp": int(time.time()),
         "build_id": build_id,
@@ -54,14 +67,27 @@ async def health_check(request: Request):
         },
         "services": {"rag": rag_service_status, "bisq2_api": bisq_status},
     }
+    if warmup_failed:
+        return JSONResponse(status_code=503, content=content)
+    return content
 
 
 @router.get("/health/ready")
-async def readiness_check():
+async def readiness_check(request: Request):
     """
     Readiness probe that checks if the service is ready to handle requests.
+
+    Reports every startup warm-up component (index, models, caches). Returns
+    503 until the required components are ready; optional components that
+    are still loading or failed only make the status "degraded".
     """
-    return {"status": "ready"}
+    warmup = getattr(request.app.state, "startup_warmup", None)
+    if warmup is None:
+        return {"status": "ready", "ready": True, "components": {}}
+
+    snapshot = warmup.snapshot()
+    status_code = 200 if snapshot["ready"] else 503
+    return JSONResponse(status_code=status_code, content=snapshot)
 
 
 @router.get("/health/live")
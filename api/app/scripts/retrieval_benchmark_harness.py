@@ -20,6 +20,11 @@ Compare two benchmark summaries:
       --baseline /data/evaluation/benchmarks/qdrant_baseline.summary.json \
       --candidate /data/evaluation/benchmarks/qdrant_current.summary.json \
       --output /data/evaluation/benchmarks/qdrant_compare.json
+
+Offline retrieval benchmark (no API, LLM or network; in-memory Qdrant with
+deterministic hash embeddings):
+    python -m app.scripts.retrieval_benchmark_harness offline \
+      --output /data/evaluation/benchmarks/offline_retrieval.json
 """
 
 import argparse
@@ -764,6 +769,276 @@ def compare_benchmarks(args: argparse.Namespace) -> int:
     return 0
 
 
+OFFLINE_STAGES = ("embed_query", "dense", "sparse", "hybrid", "document_retriever")
+OFFLINE_RETRIEVAL_MODES = ("dense", "sparse", "hybrid", "document_retriever")
+_PROTOCOL_TO_VERSION = {"multisig_v1": "Bisq 1", "bisq_easy": "Bisq 2"}
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return float(ordered[lower])
+    return float(
+        ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+    )
+
+
+def _latency_summary(values_ms: list[float]) -> dict[str, Any]:
+    return {
+        "count": len(values_ms),
+        "mean_ms": round(_safe_mean(values_ms), 3),
+        "p50_ms": round(_percentile(values_ms, 0.5), 3),
+        "p95_ms": round(_percentile(values_ms, 0.95), 3),
+        "max_ms": round(max(values_ms), 3) if values_ms else 0.0,
+    }
+
+
+def _load_offline_queries(
+    samples_path: str | None, documents: list[Any], max_queries: int | None
+) -> list[dict[str, Any]]:
+    """Return labelled queries as {question, relevant_titles, detected_version}.
+
+    Without a samples file every corpus page becomes a known-item query: its
+    title is the question and the page itself is the only relevant result.
+    Sample files use the evaluation sample format with ``relevant_titles`` at
+    the top level or in ``metadata``; unlabelled samples are skipped.
+    """
+    queries: list[dict[str, Any]] = []
+    if samples_path:
+        with open(samples_path) as f:
+            samples = json.load(f)
+        for sample in samples:
+            metadata = sample.get("metadata") or {}
+            relevant = sample.get("relevant_titles") or metadata.get("relevant_titles")
+            if not sample.get("question") or not relevant:
+                continue
+            queries.append(
+                {
+                    "question": str(sample["question"]),
+                    "relevant_titles": sorted({str(t) for t in relevant}),
+                    "detected_version": _PROTOCOL_TO_VERSION.get(
+                        str(metadata.get("protocol") or ""), "Unknown"
+                    ),
+                }
+            )
+        if not queries:
+            raise ValueError(f"No samples with relevant_titles found in {samples_path}")
+    else:
+        protocols: dict[str, str] = {}
+        for doc in documents:
+            title = str(doc.metadata.get("title") or "").strip()
+            if title and title not in protocols:
+                protocols[title] = str(doc.metadata.get("protocol") or "")
+        for title in sorted(protocols):
+            queries.append(
+                {
+                    "question": title,
+                    "relevant_titles": [title],
+                    "detected_version": _PROTOCOL_TO_VERSION.get(
+                        protocols[title], "Unknown"
+                    ),
+                }
+            )
+
+    if max_queries is not None:
+        queries = queries[:max_queries]
+    return queries
+
+
+def _score_ranking(
+    titles: list[str], relevant_titles: list[str], k: int
+) -> tuple[float, float]:
+    """Return (recall@k, reciprocal rank) over the first k distinct titles."""
+    ranked: list[str] = []
+    for title in titles:
+        if title not in ranked:
+            ranked.append(title)
+        if len(ranked) == k:
+            break
+    relevant = set(relevant_titles)
+    hits = relevant.intersection(ranked)
+    reciprocal_rank = next(
+        (1.0 / rank for rank, title in enumerate(ranked, start=1) if title in relevant),
+        0.0,
+    )
+    return len(hits) / len(relevant), reciprocal_rank
+
+
+def _build_offline_pipeline(
+    args: argparse.Namespace, data_dir: str
+) -> tuple[Any, Any, list[Any], dict[str, float]]:
+    """Index the sample corpus into in-memory Qdrant with hash embeddings.
+
+    Returns:
+        (document_retriever, hybrid_retriever, documents, build_timings_ms)
+    """
+    from app.core.config import get_settings
+    from app.services.rag.document_processor import DocumentProcessor
+    from app.services.rag.document_retriever import DocumentRetriever
+    from app.services.rag.hash_embeddings import HashEmbeddings
+    from app.services.rag.qdrant_hybrid_retriever import QdrantHybridRetriever
+    from app.services.rag.qdrant_index_manager import QdrantIndexManager
+    from app.services.wiki_service import WikiService
+    from qdrant_client import QdrantClient
+
+    base_settings = get_settings()
+    wiki_dir = args.wiki_dir or base_settings.WIKI_DIR_PATH
+    # Index metadata and the BM25 vocabulary are written to DATA_DIR, so point
+    # it at a scratch directory to leave the real index state untouched.
+    settings = base_settings.model_copy(
+        update={"DATA_DIR": data_dir, "ENABLE_LOCAL_FALLBACK_INDEX": False}
+    )
+    timings: dict[str, float] = {}
+
+    started = time.perf_counter()
+    documents = WikiService(settings=settings).load_wiki_data(wiki_dir)
+    timings["load_corpus_ms"] = (time.perf_counter() - started) * 1000
+    if not documents:
+        raise ValueError(f"No wiki documents found in {wiki_dir}")
+
+    started = time.perf_counter()
+    chunks = DocumentProcessor(
+        chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap
+    ).split_documents(documents)
+    timings["split_ms"] = (time.perf_counter() - started) * 1000
+
+    client = QdrantClient(location=":memory:")
+    embeddings = HashEmbeddings(dimensions=args.dimensions)
+    started = time.perf_counter()
+    QdrantIndexManager(settings=settings, client=client).rebuild_index(
+        chunks, embeddings=embeddings, force=True
+    )
+    timings["index_build_ms"] = (time.perf_counter() - started) * 1000
+
+    hybrid = QdrantHybridRetriever(
+        settings=settings, client=client, embeddings=embeddings
+    )
+    return DocumentRetriever(retriever=hybrid), hybrid, chunks, timings
+
+
+def run_offline_benchmark(args: argparse.Namespace) -> int:
+    """Benchmark retrieval in-process against a deterministic local index."""
+    import logging
+    import tempfile
+
+    # Per-query retrieval logging would dominate both the output and the timings
+    logging.getLogger("app").setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        document_retriever, hybrid, chunks, build_timings = _build_offline_pipeline(
+            args, data_dir
+        )
+        queries = _load_offline_queries(args.samples, chunks, args.max_queries)
+        settings = hybrid.settings
+        k = args.k
+
+        def _titles(docs: list[Any]) -> list[str]:
+            out = []
+            for doc in docs:
+                metadata = getattr(doc, "metadata", None) or {}
+                out.append(str(metadata.get("title") or ""))
+            return out
+
+        stages: dict[str, Any] = {
+            "embed_query": lambda q: hybrid._get_query_embedding(q["question"]),
+            "dense": lambda q: _titles(
+                hybrid.retrieve_hybrid(
+                    q["question"], k=k, semantic_weight=1.0, keyword_weight=0.0
+                )
+            ),
+            "sparse": lambda q: _titles(
+                hybrid.retrieve_hybrid(
+                    q["question"], k=k, semantic_weight=0.0, keyword_weight=1.0
+                )
+            ),
+            "hybrid": lambda q: _titles(
+                hybrid.retrieve_hybrid(
+                    q["question"],
+                    k=k,
+                    semantic_weight=settings.HYBRID_SEMANTIC_WEIGHT,
+                    keyword_weight=settings.HYBRID_KEYWORD_WEIGHT,
+                )
+            ),
+            "document_retriever": lambda q: _titles(
+                document_retriever.retrieve_with_scores(
+                    q["question"], detected_version=q["detected_version"]
+                )[0]
+            ),
+        }
+
+        latencies: dict[str, list[float]] = {stage: [] for stage in OFFLINE_STAGES}
+        recalls: dict[str, list[float]] = defaultdict(list)
+        reciprocal_ranks: dict[str, list[float]] = defaultdict(list)
+        for repeat in range(args.repeats):
+            for query in queries:
+                for stage in OFFLINE_STAGES:
+                    started = time.perf_counter()
+                    result = stages[stage](query)
+                    latencies[stage].append((time.perf_counter() - started) * 1000)
+                    # Rankings are deterministic, so score the first pass only
+                    if repeat == 0 and stage in OFFLINE_RETRIEVAL_MODES:
+                        recall, rr = _score_ranking(result, query["relevant_titles"], k)
+                        recalls[stage].append(recall)
+                        reciprocal_ranks[stage].append(rr)
+
+    summary = {
+        "generated_at": _now_iso(),
+        "mode": "offline",
+        "config": {
+            "wiki_dir": args.wiki_dir,
+            "samples": args.samples,
+            "k": k,
+            "repeats": args.repeats,
+            "max_queries": args.max_queries,
+            "dimensions": args.dimensions,
+            "chunk_size": args.chunk_size,
+            "chunk_overlap": args.chunk_overlap,
+            "semantic_weight": settings.HYBRID_SEMANTIC_WEIGHT,
+            "keyword_weight": settings.HYBRID_KEYWORD_WEIGHT,
+        },
+        "corpus": {"chunks": len(chunks), "queries": len(queries)},
+        "build": {name: round(value, 3) for name, value in build_timings.items()},
+        "stages": {
+            stage: _latency_summary(latencies[stage]) for stage in OFFLINE_STAGES
+        },
+        "retrieval": {
+            mode: {
+                f"recall_at_{k}": round(_safe_mean(recalls[mode]), 4),
+                "mrr": round(_safe_mean(reciprocal_ranks[mode]), 4),
+            }
+            for mode in OFFLINE_RETRIEVAL_MODES
+        },
+        "git": _collect_git_info(),
+    }
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"Saved offline benchmark: {output_path}")
+
+    print(
+        f"corpus: {len(chunks)} chunks, {len(queries)} queries, "
+        f"index build {build_timings['index_build_ms']:.1f}ms"
+    )
+    for stage in OFFLINE_STAGES:
+        row = summary["stages"][stage]
+        line = f"{stage}: p50={row['p50_ms']:.2f}ms p95={row['p95_ms']:.2f}ms"
+        if stage in summary["retrieval"]:
+            metrics = summary["retrieval"][stage]
+            line += (
+                f" recall@{k}={metrics[f'recall_at_{k}']:.4f} mrr={metrics['mrr']:.4f}"
+            )
+        print(line)
+    return 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Retrieval benchmark harness")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -883,6 +1158,30 @@ def build_parser() -> argparse.ArgumentParser:
     compare_parser.add_argument("--max-slice-drop", type=float, default=0.05)
     compare_parser.add_argument("--max-latency-increase-pct", type=float, default=20.0)
 
+    offline_parser = subparsers.add_parser(
+        "offline",
+        help="Benchmark retrieval in-process against a local deterministic index",
+    )
+    offline_parser.add_argument(
+        "--wiki-dir",
+        type=str,
+        default=None,
+        help="Directory with processed_wiki.jsonl (default: settings WIKI_DIR_PATH).",
+    )
+    offline_parser.add_argument(
+        "--samples",
+        type=str,
+        default=None,
+        help="Optional sample JSON with relevant_titles labels. Defaults to known-item queries built from corpus titles.",
+    )
+    offline_parser.add_argument("--output", type=str, default=None)
+    offline_parser.add_argument("--k", type=int, default=5)
+    offline_parser.add_argument("--repeats", type=int, default=3)
+    offline_parser.add_argument("--max-queries", type=int, default=None)
+    offline_parser.add_argument("--dimensions", type=int, default=256)
+    offline_parser.add_argument("--chunk-size", type=int, default=2000)
+    offline_parser.add_argument("--chunk-overlap", type=int, default=500)
+
     return parser
 
 
@@ -901,6 +1200,8 @@ def main() -> int:
             return create_lock(args)
         if args.command == "compare":
             return compare_benchmarks(args)
+        if args.command == "offline":
+            return run_offline_benchmark(args)
     except (ValueError, RuntimeError) as e:
         print(f"Error: {e}")
         return 2
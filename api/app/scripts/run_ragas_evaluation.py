@@ -8,6 +8,11 @@ RAGAS evaluation metrics for comparison with baseline results.
 Usage:
     python -m api.app.scripts.run_ragas_evaluation [--backend qdrant] [--samples N]
 
+Re-evaluate only samples whose question, index generation, prompt version or
+model changed since the last run:
+    python -m api.app.scripts.run_ragas_evaluation \
+        --cache-file api/data/evaluation/cache/ragas_eval_cache.json --incremental
+
 Requires:
     - ragas>=0.2 (handles both new class-based API and older functional API)
     - datasets>=2.21.0
@@ -16,6 +21,7 @@ Requires:
 
 import argparse
 import asyncio
+import hashlib
 import json
 import logging
 import os
@@ -42,6 +48,10 @@ DEFAULT_SAMPLES_PATH = (
 DEFAULT_OUTPUT_PATH = "api/data/evaluation/new_scores.json"
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
 DEFAULT_BYPASS_HOOKS = ["escalation"]
+DEFAULT_CONCURRENCY = 4
+CACHE_SCHEMA_VERSION = 1
+# Oldest cache entries beyond this are dropped on save
+MAX_CACHE_ENTRIES = 5000
 
 
 async def query_rag_system(
@@ -469,6 +479,182 @@ def _load_evaluation_samples(samples_path: str) -> list[dict[str, Any]]:
     return samples
 
 
+def _sha256(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _resolve_index_generation() -> str:
+    """Fingerprint the last Qdrant index build from its metadata file.
+
+    The API rewrites ``qdrant_index_metadata.json`` after every successful
+    rebuild, so its content changes exactly when the indexed knowledge base
+    does. Returns "unknown" when the file is not reachable from this process.
+    """
+    try:
+        from app.core.config import get_settings
+
+        metadata_path = Path(get_settings().DATA_DIR) / "qdrant_index_metadata.json"
+        return _sha256(json.loads(metadata_path.read_text(encoding="utf-8")))[:16]
+    except Exception:
+        return "unknown"
+
+
+def _resolve_prompt_version() -> str:
+    """Fingerprint the prompt sources that shape generated answers."""
+    app_dir = Path(__file__).resolve().parent.parent
+    paths = sorted((app_dir / "prompts").glob("*.py")) + sorted(
+        (app_dir / "prompts").glob("*.md")
+    )
+    paths.append(app_dir / "services" / "rag" / "prompt_manager.py")
+    digest = hashlib.sha256()
+    for path in paths:
+        if path.exists():
+            digest.update(path.name.encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _resolve_model() -> str:
+    return os.getenv("OPENAI_MODEL") or "unknown"
+
+
+class EvaluationCache:
+    """Per-sample answers and metric scores from earlier evaluation runs.
+
+    Answers are keyed by the query inputs together with the index generation,
+    prompt version and model, so any change to the knowledge base, prompts or
+    model invalidates them. Scores are stored on the answer entry keyed by the
+    ground truth, since the metrics also depend on the reference answer.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        index_generation: str,
+        prompt_version: str,
+        model: str,
+    ):
+        self.path = Path(path)
+        self.index_generation = index_generation
+        self.prompt_version = prompt_version
+        self.model = model
+        self.entries: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") == CACHE_SCHEMA_VERSION:
+                    self.entries = dict(data.get("entries") or {})
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable evaluation cache {path}: {e}")
+
+    def query_key(
+        self,
+        question_with_context: str,
+        chat_history: Any,
+        bypass_hooks: list[str] | None,
+    ) -> str:
+        return _sha256(
+            {
+                "question": question_with_context,
+                "chat_history": chat_history or [],
+                "bypass_hooks": sorted(bypass_hooks or []),
+                "index_generation": self.index_generation,
+                "prompt_version": self.prompt_version,
+                "model": self.model,
+            }
+        )
+
+    @staticmethod
+    def score_key(ground_truth: str) -> str:
+        return _sha256(ground_truth)[:16]
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        return self.entries.get(key)
+
+    def put_answer(self, key: str, result: dict[str, Any]) -> None:
+        self.entries[key] = {
+            "question": result["question"],
+            "answer": result["answer"],
+            "contexts": result["contexts"],
+            "response_time": result["response_time"],
+            "index_generation": self.index_generation,
+            "prompt_version": self.prompt_version,
+            "model": self.model,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "scores": {},
+        }
+
+    def cached_scores(
+        self, key: str, ground_truth: str, metric_names: list[str]
+    ) -> dict[str, float | None] | None:
+        entry = self.entries.get(key)
+        scores = ((entry or {}).get("scores") or {}).get(self.score_key(ground_truth))
+        if not scores or any(m not in scores for m in metric_names):
+            return None
+        return {m: scores[m] for m in metric_names}
+
+    def put_scores(
+        self, key: str, ground_truth: str, scores: dict[str, float | None]
+    ) -> None:
+        entry = self.entries.get(key)
+        if entry is None or not scores:
+            return
+        entry.setdefault("scores", {}).setdefault(self.score_key(ground_truth), {})
+        entry["scores"][self.score_key(ground_truth)].update(scores)
+
+    def save(self) -> None:
+        if len(self.entries) > MAX_CACHE_ENTRIES:
+            newest = sorted(
+                self.entries.items(),
+                key=lambda item: str(item[1].get("created_at") or ""),
+                reverse=True,
+            )[:MAX_CACHE_ENTRIES]
+            self.entries = dict(newest)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": CACHE_SCHEMA_VERSION, "entries": self.entries}, f)
+        os.replace(tmp_path, self.path)
+
+
+def _question_with_protocol_context(sample: dict[str, Any]) -> str:
+    question = sample["question"]
+    metadata = sample.get("metadata", {})
+    # Add protocol context (unless sample opts out)
+    if metadata.get("skip_protocol_injection", False):
+        return question
+    protocol = metadata.get("protocol", "")
+    if protocol == "bisq_easy":
+        return f"{question} (I'm using Bisq Easy / Bisq 2)"
+    if protocol == "multisig_v1":
+        return f"{question} (I'm using Bisq 1)"
+    return question
+
+
+def _requested_metric_names(metric_names: list[str] | None) -> list[str]:
+    if metric_names is not None:
+        return [m.strip() for m in metric_names if m.strip()]
+    return ["context_precision", "context_recall", "faithfulness", "answer_relevancy"]
+
+
+def _mean_per_sample_metrics(
+    per_sample: list[dict[str, float | None]],
+    metric_names: list[str],
+    fallback: dict[str, float],
+) -> dict[str, float]:
+    metrics: dict[str, float] = {}
+    for name in metric_names:
+        values = [row[name] for row in per_sample if row.get(name) is not None]
+        metrics[name] = (
+            float(sum(values) / len(values))  # type: ignore[arg-type]
+            if values
+            else float(fallback.get(name, 0.0))
+        )
+    return metrics
+
+
 async def run_evaluation(
     samples_path: str,
     output_path: str,
@@ -482,6 +668,12 @@ async def run_evaluation(
     ragas_max_workers: int | None = None,
     ragas_batch_size: int | None = None,
     bypass_hooks: list[str] | None = None,
+    concurrency: int = 1,
+    cache_path: str | None = None,
+    incremental: bool = False,
+    index_generation: str | None = None,
+    prompt_version: str | None = None,
+    model: str | None = None,
 ) -> dict[str, Any]:
     """Run evaluation with specified backend.
 
@@ -490,6 +682,16 @@ async def run_evaluation(
         output_path: Path to save results
         backend: Retriever backend name (qdrant)
         max_samples: Optional limit on number of samples
+        concurrency: Maximum number of in-flight API queries
+        cache_path: Optional evaluation cache file; answers and per-sample
+            scores of this run are written to it
+        incremental: Reuse cached answers and scores for samples whose inputs
+            are unchanged and only query/score the rest (requires cache_path)
+        index_generation: Cache key override (default: fingerprint of the
+            Qdrant index metadata)
+        prompt_version: Cache key override (default: fingerprint of the
+            prompt sources)
+        model: Cache key override (default: OPENAI_MODEL)
 
     Returns:
         Evaluation results dict
@@ -502,6 +704,9 @@ async def run_evaluation(
             "Generate samples first with: python -m api.app.scripts.record_baseline_metrics"
         )
         sys.exit(1)
+    if incremental and not cache_path:
+        logger.error("Incremental evaluation requires a cache file (--cache-file).")
+        sys.exit(1)
 
     samples = _load_evaluation_samples(samples_path)
 
@@ -511,127 +716,191 @@ async def run_evaluation(
     logger.info(f"Loaded {len(samples)} samples for evaluation")
     logger.info(f"Backend: {backend}")
 
-    # Query RAG system for each sample
-    questions = []
-    ground_truths = []
-    answers = []
-    contexts = []
-    individual_results = []
-
-    async with httpx.AsyncClient() as client:
-        # Check if API is running
-        try:
-            health = await client.get(f"{API_BASE_URL}/health", timeout=10.0)
-            health.raise_for_status()
-            health_data = health.json()
-            logger.info(f"API health check passed: {health_data.get('status')}")
-
-            # Log retriever info if available
-            if "rag" in health_data:
-                rag_info = health_data["rag"]
-                logger.info(
-                    f"RAG retriever: {rag_info.get('retriever_backend', 'unknown')}"
-                )
-        except httpx.ConnectError as e:
-            logger.error(f"Cannot connect to API at {API_BASE_URL}: {e}")
-            logger.error("Start the API with: docker compose up api")
-            sys.exit(1)
-        except Exception as e:
-            logger.error(f"API error: {type(e).__name__}: {e}")
-            sys.exit(1)
-
-        for i, sample in enumerate(samples):
-            question = sample["question"]
-            ground_truth = sample["ground_truth"]
-
-            # Add protocol context (unless sample opts out)
-            skip_injection = sample.get("metadata", {}).get(
-                "skip_protocol_injection", False
+    cache = (
+        EvaluationCache(
+            cache_path,
+            index_generation=index_generation or _resolve_index_generation(),
+            prompt_version=prompt_version or _resolve_prompt_version(),
+            model=model or _resolve_model(),
+        )
+        if cache_path
+        else None
+    )
+    cache_keys: list[str | None] = []
+    individual_results: list[dict[str, Any] | None] = []
+    pending: list[int] = []
+    for i, sample in enumerate(samples):
+        key = (
+            cache.query_key(
+                _question_with_protocol_context(sample),
+                sample.get("chat_history"),
+                bypass_hooks,
             )
-            if skip_injection:
-                question_with_context = question
-            else:
-                protocol = sample.get("metadata", {}).get("protocol", "")
-                if protocol == "bisq_easy":
-                    question_with_context = f"{question} (I'm using Bisq Easy / Bisq 2)"
-                elif protocol == "multisig_v1":
-                    question_with_context = f"{question} (I'm using Bisq 1)"
-                else:
-                    question_with_context = question
-
-            # Include chat history if present (for query rewriter evaluation)
-            sample_chat_history = sample.get("chat_history")
+            if cache is not None
+            else None
+        )
+        cache_keys.append(key)
+        entry = cache.get(key) if cache is not None and incremental and key else None
+        if entry is None:
+            individual_results.append(None)
+            pending.append(i)
+            continue
+        individual_results.append(
+            {
+                "question": sample["question"],
+                "ground_truth": sample["ground_truth"],
+                "answer": entry["answer"],
+                "contexts": list(entry["contexts"]),
+                "metadata": sample.get("metadata", {}),
+                "response_time": entry["response_time"],
+                "error": None,
+                "cached": True,
+            }
+        )
 
-            logger.info(f"[{i+1}/{len(samples)}] Querying: {question[:60]}...")
+    if cache is not None:
+        logger.info(
+            f"Evaluation cache: {len(samples) - len(pending)} reused, "
+            f"{len(pending)} to query (index={cache.index_generation}, "
+            f"prompt={cache.prompt_version}, model={cache.model})"
+        )
 
-            start_time = time.time()
-            result = await query_rag_system(
-                client,
-                question_with_context,
-                chat_history=sample_chat_history,
-                bypass_hooks=bypass_hooks,
-            )
-            elapsed = time.time() - start_time
-
-            answer = result.get("answer", "")
-            sources = result.get("sources", [])
-
-            ctx = []
-            for src in sources:
-                if isinstance(src, dict):
-                    content = src.get("content", src.get("page_content", ""))
-                    if content:
-                        ctx.append(content)
-                elif isinstance(src, str):
-                    ctx.append(src)
-
-            questions.append(question)
-            ground_truths.append(ground_truth)
-            answers.append(answer)
-            contexts.append(ctx if ctx else [""])
-
-            individual_results.append(
-                {
+    if pending:
+        async with httpx.AsyncClient() as client:
+            # Check if API is running
+            try:
+                health = await client.get(f"{API_BASE_URL}/health", timeout=10.0)
+                health.raise_for_status()
+                health_data = health.json()
+                logger.info(f"API health check passed: {health_data.get('status')}")
+
+                # Log retriever info if available
+                if "rag" in health_data:
+                    rag_info = health_data["rag"]
+                    logger.info(
+                        f"RAG retriever: {rag_info.get('retriever_backend', 'unknown')}"
+                    )
+            except httpx.ConnectError as e:
+                logger.error(f"Cannot connect to API at {API_BASE_URL}: {e}")
+                logger.error("Start the API with: docker compose up api")
+                sys.exit(1)
+            except Exception as e:
+                logger.error(f"API error: {type(e).__name__}: {e}")
+                sys.exit(1)
+
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+
+            async def _evaluate_sample(i: int) -> None:
+                sample = samples[i]
+                question = sample["question"]
+                async with semaphore:
+                    logger.info(f"[{i+1}/{len(samples)}] Querying: {question[:60]}...")
+                    start_time = time.time()
+                    result = await query_rag_system(
+                        client,
+                        _question_with_protocol_context(sample),
+                        # Include chat history if present (for query rewriter evaluation)
+                        chat_history=sample.get("chat_history"),
+                        bypass_hooks=bypass_hooks,
+                    )
+                    elapsed = time.time() - start_time
+                    # Pace each worker so the API is not flooded
+                    await asyncio.sleep(0.5)
+
+                ctx = []
+                for src in result.get("sources", []):
+                    if isinstance(src, dict):
+                        content = src.get("content", src.get("page_content", ""))
+                        if content:
+                            ctx.append(content)
+                    elif isinstance(src, str):
+                        ctx.append(src)
+
+                individual_results[i] = {
                     "question": question,
-                    "ground_truth": ground_truth,
-                    "answer": answer,
+                    "ground_truth": sample["ground_truth"],
+                    "answer": result.get("answer", ""),
                     "contexts": ctx,
                     "metadata": sample.get("metadata", {}),
                     "response_time": elapsed,
                     "error": result.get("error"),
+                    "cached": False,
                 }
-            )
+                key = cache_keys[i]
+                if cache is not None and key and not result.get("error"):
+                    cache.put_answer(key, individual_results[i])  # type: ignore[arg-type]
 
-            await asyncio.sleep(0.5)
+            await asyncio.gather(*(_evaluate_sample(i) for i in pending))
+
+    results_list: list[dict[str, Any]] = [r for r in individual_results if r]
+    questions = [r["question"] for r in results_list]
+    ground_truths = [r["ground_truth"] for r in results_list]
+    answers = [r["answer"] for r in results_list]
+    contexts = [r["contexts"] if r["contexts"] else [""] for r in results_list]
 
     # Compute metrics
     per_sample_metrics: list[dict[str, float | None]] = [
         {} for _ in range(len(samples))
     ]
+    scored = 0
     if simple_metrics:
         metrics = compute_simple_metrics(questions, ground_truths, answers, contexts)
     else:
-        metrics, per_sample_metrics = compute_ragas_metrics_detailed(
-            questions,
-            ground_truths,
-            answers,
-            contexts,
-            metric_names=metric_names,
-            ragas_timeout=ragas_timeout,
-            ragas_max_retries=ragas_max_retries,
-            ragas_max_wait=ragas_max_wait,
-            ragas_max_workers=ragas_max_workers,
-            ragas_batch_size=ragas_batch_size,
-        )
+        requested = _requested_metric_names(metric_names)
+        to_score: list[int] = []
+        for i, r in enumerate(results_list):
+            key = cache_keys[i]
+            cached_scores = (
+                cache.cached_scores(key, r["ground_truth"], requested)
+                if cache is not None and incremental and r["cached"] and key
+                else None
+            )
+            if cached_scores is None:
+                to_score.append(i)
+            else:
+                per_sample_metrics[i] = cached_scores
+
+        subset_metrics: dict[str, Any] = {}
+        if to_score:
+            subset_metrics, subset_per_sample = compute_ragas_metrics_detailed(
+                [questions[i] for i in to_score],
+                [ground_truths[i] for i in to_score],
+                [answers[i] for i in to_score],
+                [contexts[i] for i in to_score],
+                metric_names=metric_names,
+                ragas_timeout=ragas_timeout,
+                ragas_max_retries=ragas_max_retries,
+                ragas_max_wait=ragas_max_wait,
+                ragas_max_workers=ragas_max_workers,
+                ragas_batch_size=ragas_batch_size,
+            )
+            scored = len(to_score)
+            for i, row in zip(to_score, subset_per_sample, strict=False):
+                per_sample_metrics[i] = row
+                key = cache_keys[i]
+                if cache is not None and key and not results_list[i]["error"]:
+                    cache.put_scores(key, ground_truths[i], row)
+
+        if subset_metrics.get("_fallback_metrics"):
+            metrics = compute_simple_metrics(
+                questions, ground_truths, answers, contexts
+            )
+        elif len(to_score) == len(results_list):
+            metrics = subset_metrics
+        else:
+            metrics = _mean_per_sample_metrics(
+                per_sample_metrics, requested, subset_metrics
+            )
+
+    if cache is not None:
+        cache.save()
 
     # Attach per-sample scores (when available) so we can pinpoint regressions.
-    for i, r in enumerate(individual_results):
+    for i, r in enumerate(results_list):
         r["ragas"] = per_sample_metrics[i] if i < len(per_sample_metrics) else {}
 
     # Compute average response time
-    response_times = [
-        r["response_time"] for r in individual_results if r["response_time"]
-    ]
+    response_times = [r["response_time"] for r in results_list if r["response_time"]]
     avg_response_time = (
         sum(response_times) / len(response_times) if response_times else 0
     )
@@ -644,8 +913,18 @@ async def run_evaluation(
         "metrics": metrics,
         "per_sample_metrics_available": any(bool(x) for x in per_sample_metrics),
         "avg_response_time": avg_response_time,
-        "individual_results": individual_results,
+        "individual_results": results_list,
     }
+    if cache is not None:
+        results["cache"] = {
+            "path": str(cache.path),
+            "incremental": incremental,
+            "index_generation": cache.index_generation,
+            "prompt_version": cache.prompt_version,
+            "model": cache.model,
+            "queried_samples": len(pending),
+            "scored_samples": scored,
+        }
 
     # Save results
     output_dir = Path(output_path).parent
@@ -660,6 +939,8 @@ async def run_evaluation(
     print(f"EVALUATION RESULTS ({backend.upper()})")
     print("=" * 60)
     print(f"Samples evaluated: {len(samples)}")
+    if cache is not None:
+        print(f"Samples queried: {len(pending)} (rest reused from cache)")
     print(f"Avg response time: {avg_response_time:.2f}s")
     print()
     print("RAGAS Metrics:")
@@ -852,6 +1133,46 @@ def main():
         help="Comma-separated RAGAS metric names (default: all). "
         "Valid: context_precision, context_recall, faithfulness, answer_relevancy",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum number of concurrent API queries (default: {DEFAULT_CONCURRENCY}). "
+        "Use 1 for sequential runs when comparing response times.",
+    )
+    parser.add_argument(
+        "--cache-file",
+        type=str,
+        default=None,
+        help="Evaluation cache JSON. Answers and per-sample scores are stored keyed by "
+        "(question, index generation, prompt version, model).",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse cached answers/scores for unchanged samples and only query and "
+        "score the rest (requires --cache-file).",
+    )
+    parser.add_argument(
+        "--index-generation",
+        type=str,
+        default=None,
+        help="Cache key override for the index generation "
+        "(default: fingerprint of DATA_DIR/qdrant_index_metadata.json).",
+    )
+    parser.add_argument(
+        "--prompt-version",
+        type=str,
+        default=None,
+        help="Cache key override for the prompt version "
+        "(default: fingerprint of the prompt sources).",
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        default=None,
+        help="Cache key override for the answer model (default: OPENAI_MODEL).",
+    )
 
     args = parser.parse_args()
     API_BASE_URL = args.api_url
@@ -895,6 +1216,12 @@ def main():
             ragas_max_workers=args.ragas_max_workers,
             ragas_batch_size=args.ragas_batch_size,
             bypass_hooks=bypass_hooks,
+            concurrency=args.concurrency,
+            cache_path=args.cache_file,
+            incremental=args.incremental,
+            index_generation=args.index_generation,
+            prompt_version=args.prompt_version,
+            model=args.model,
         )
     )
 
@@ -0,0 +1,376 @@
+"""Incremental embedding-based topic clustering for knowledge updates.
+
+The regex/keyword topic keys in ``topic_clusters`` only group candidates
+that share trigger phrases, so paraphrased duplicates end up in separate
+review items. ``EmbeddingTopicClusterer`` groups candidate questions by
+cosine similarity instead and keeps its clusters between requests:
+
+- Question embeddings are cached by text; new candidates are embedded in
+  one batch call.
+- New candidates are assigned to existing centroids of their partition in a
+  single vectorized pass; the remainder seed new clusters among themselves.
+- Clusters are only re-examined when they change: a cluster that lost
+  members is split if some remaining member drifted below the threshold,
+  and clusters that gained members are merged with any centroid that moved
+  within the threshold.
+
+Partitions (protocol, target page, category) are never mixed, keeping the
+same-page guarantee of ``KnowledgeUpdateService.review_cluster_key``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+from app.services.knowledge_updates.topic_clusters import topic_cluster_key
+from app.services.training.unified_repository import UnifiedFAQCandidate
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.85
+DEFAULT_EMBEDDING_CACHE_SIZE = 10_000
+
+
+@dataclass
+class _Cluster:
+    cluster_id: int
+    partition: str
+    topic: str
+    vector_sum: np.ndarray
+    members: Set[int] = field(default_factory=set)
+
+    @property
+    def centroid(self) -> np.ndarray:
+        norm = float(np.linalg.norm(self.vector_sum))
+        return self.vector_sum / norm if norm > 0 else self.vector_sum
+
+
+@dataclass(frozen=True)
+class SemanticTopicGroup:
+    key: str
+    topic: str
+    candidates: List[UnifiedFAQCandidate]
+
+
+class EmbeddingTopicClusterer:
+    """Keeps semantic topic clusters of pending candidates up to date.
+
+    Args:
+        embed_documents: Batch embedding function (e.g.
+            ``OpenAIEmbeddingsProvider.embed_documents``)
+        similarity_threshold: Minimum cosine similarity between a question and
+            a cluster centroid (and between two merged centroids)
+        cache_size: Maximum number of cached question embeddings
+    """
+
+    def __init__(
+        self,
+        embed_documents: Callable[[List[str]], List[List[float]]],
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        cache_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
+    ):
+        self._embed_documents = embed_documents
+        self.similarity_threshold = similarity_threshold
+        self._cache_size = cache_size
+        self._embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._clusters: Dict[int, _Cluster] = {}
+        self._membership: Dict[int, int] = {}
+        # candidate id -> (partition, text hash, unit vector)
+        self._items: Dict[int, Tuple[str, str, np.ndarray]] = {}
+        self._next_cluster_id = 1
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def cluster(
+        self,
+        candidates: Sequence[UnifiedFAQCandidate],
+        partition_key: Callable[[UnifiedFAQCandidate], str],
+    ) -> List[SemanticTopicGroup]:
+        """Update clusters for the current candidate set and return the groups.
+
+        Candidates no longer in ``candidates`` leave their clusters; only new
+        or edited candidates are embedded and assigned. Groups list their
+        candidates in input order and are ordered by their first member.
+        """
+        current: Dict[int, Tuple[str, str, str]] = {}
+        for candidate in candidates:
+            text = _question_text(candidate)
+            current[candidate.id] = (partition_key(candidate), _text_hash(text), text)
+
+        with self._lock:
+            stale = [
+                candidate_id
+                for candidate_id, (partition, text_hash, _) in self._items.items()
+                if current.get(candidate_id, (None, None, None))[:2]
+                != (partition, text_hash)
+            ]
+            touched = self._detach(stale)
+            touched.update(self._split(touched))
+
+            pending = [
+                candidate_id
+                for candidate_id in current
+                if candidate_id not in self._membership
+            ]
+            if pending:
+                vectors = self._embed([current[cid][2] for cid in pending])
+                for candidate_id, vector in zip(pending, vectors):
+                    partition, text_hash, _ = current[candidate_id]
+                    self._items[candidate_id] = (partition, text_hash, vector)
+                topics = {
+                    candidate.id: _topic_label(candidate)
+                    for candidate in candidates
+                    if candidate.id not in self._membership
+                }
+                touched.update(
+                    self._assign_vectors(
+                        pending, [current[cid][0] for cid in pending], topics
+                    )
+                )
+            self._merge(touched)
+            return self._groups(candidates)
+
+    # ------------------------------------------------------------------
+    # Embeddings
+    # ------------------------------------------------------------------
+
+    def _embed(self, texts: List[str]) -> List[np.ndarray]:
+        """Unit vectors for ``texts``; only uncached texts hit the provider."""
+        hashes = [_text_hash(text) for text in texts]
+        vectors: Dict[str, np.ndarray] = {}
+        missing: Dict[str, str] = {}
+        for text_hash, text in zip(hashes, texts):
+            cached = self._embeddings.get(text_hash)
+            if cached is not None:
+                self._embeddings.move_to_end(text_hash)
+                vectors[text_hash] = cached
+            else:
+                missing.setdefault(text_hash, text)
+        if missing:
+            raw = self._embed_documents(list(missing.values()))
+            if len(raw) != len(missing):
+                raise ValueError(
+                    f"Embedding provider returned {len(raw)} vectors "
+                    f"for {len(missing)} texts"
+                )
+            matrix = np.asarray(raw, dtype=float)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = np.divide(
+                matrix, norms, out=np.zeros_like(matrix), where=norms > 0
+            )
+            for text_hash, vector in zip(missing, matrix):
+                vectors[text_hash] = vector
+                self._embeddings[text_hash] = vector
+            while len(self._embeddings) > self._cache_size:
+                self._embeddings.popitem(last=False)
+        return [vectors[text_hash] for text_hash in hashes]
+
+    # ------------------------------------------------------------------
+    # Cluster maintenance
+    # ------------------------------------------------------------------
+
+    def _detach(self, candidate_ids: List[int]) -> Set[int]:
+        """Forget candidates that left or changed; return the touched clusters."""
+        touched = self._remove_members(
+            [cid for cid in candidate_ids if cid in self._membership]
+        )
+        for candidate_id in candidate_ids:
+            del self._items[candidate_id]
+        return touched
+
+    def _split(self, cluster_ids: Set[int]) -> Set[int]:
+        """Evict members that drifted away from a shrunken cluster's centroid.
+
+        Evicted members are reassigned like new candidates; returns the ids
+        of clusters created or changed.
+        """
+        evicted: List[int] = []
+        for cluster_id in list(cluster_ids):
+            cluster = self._clusters.get(cluster_id)
+            if cluster is None or len(cluster.members) < 2:
+                continue
+            members = sorted(cluster.members)
+            matrix = np.stack([self._items[cid][2] for cid in members])
+            similarities = matrix @ cluster.centroid
+            for candidate_id, similarity in zip(members, similarities):
+                if similarity < self.similarity_threshold:
+                    evicted.append(candidate_id)
+        if not evicted:
+            return set()
+
+        topics = {cid: self._clusters[self._membership[cid]].topic for cid in evicted}
+        touched = self._remove_members(evicted)
+        touched.update(
+            self._assign_vectors(
+                evicted, [self._items[cid][0] for cid in evicted], topics
+            )
+        )
+        return touched
+
+    def _remove_members(self, candidate_ids: List[int]) -> Set[int]:
+        touched: Set[int] = set()
+        for candidate_id in candidate_ids:
+            cluster_id = self._membership.pop(candidate_id)
+            cluster = self._clusters[cluster_id]
+            cluster.members.discard(candidate_id)
+            cluster.vector_sum = cluster.vector_sum - self._items[candidate_id][2]
+            if cluster.members:
+                touched.add(cluster_id)
+            else:
+                del self._clusters[cluster_id]
+        return touched
+
+    def _assign_vectors(
+        self,
+        candidate_ids: List[int],
+        partitions: List[str],
+        topics: Dict[int, str],
+    ) -> Set[int]:
+        """Assign candidates to the nearest centroid of their partition.
+
+        Candidates without a centroid within the threshold are clustered among
+        themselves: each unassigned candidate seeds a cluster that takes every
+        later unassigned candidate within the threshold of it.
+        """
+        touched: Set[int] = set()
+        by_partition: Dict[str, List[int]] = {}
+        for candidate_id, partition in zip(candidate_ids, partitions):
+            by_partition.setdefault(partition, []).append(candidate_id)
+
+        for partition, ids in by_partition.items():
+            vectors = np.stack([self._items[cid][2] for cid in ids])
+            existing = [
+                cluster
+                for cluster in self._clusters.values()
+                if cluster.partition == partition
+            ]
+            unassigned = list(range(len(ids)))
+            if existing:
+                centroids = np.stack([cluster.centroid for cluster in existing])
+                similarities = vectors @ centroids.T
+                best = similarities.argmax(axis=1)
+                unassigned = []
+                for row, column in enumerate(best):
+                    if similarities[row, column] >= self.similarity_threshold:
+                        self._add_member(existing[column], ids[row])
+                        touched.add(existing[column].cluster_id)
+                    else:
+                        unassigned.append(row)
+
+            if not unassigned:
+                continue
+            rest = vectors[unassigned]
+            pairwise = rest @ rest.T
+            claimed = np.zeros(len(unassigned), dtype=bool)
+            for i, row in enumerate(unassigned):
+                if claimed[i]:
+                    continue
+                seed_id = ids[row]
+                cluster = self._new_cluster(partition, topics[seed_id])
+                members = np.nonzero(
+                    ~claimed & (pairwise[i] >= self.similarity_threshold)
+                )[0]
+                for j in members:
+                    claimed[j] = True
+                    self._add_member(cluster, ids[unassigned[j]])
+                if not claimed[i]:
+                    claimed[i] = True
+                    self._add_member(cluster, seed_id)
+                touched.add(cluster.cluster_id)
+        return touched
+
+    def _merge(self, cluster_ids: Set[int]) -> None:
+        """Merge changed clusters with any centroid of the same partition
+        that is now within the threshold."""
+        for cluster_id in sorted(cluster_ids):
+            cluster = self._clusters.get(cluster_id)
+            if cluster is None:
+                continue
+            others = [
+                other
+                for other in self._clusters.values()
+                if other.partition == cluster.partition
+                and other.cluster_id != cluster_id
+            ]
+            if not others:
+                continue
+            similarities = np.stack([other.centroid for other in others]) @ (
+                cluster.centroid
+            )
+            for other, similarity in zip(others, similarities):
+                if similarity < self.similarity_threshold:
+                    continue
+                # Keep the older cluster id so group keys stay stable
+                keep, drop = sorted((cluster, other), key=lambda c: c.cluster_id)
+                for member in list(drop.members):
+                    self._membership[member] = keep.cluster_id
+                keep.members.update(drop.members)
+                keep.vector_sum = keep.vector_sum + drop.vector_sum
+                del self._clusters[drop.cluster_id]
+                cluster = keep
+
+    def _new_cluster(self, partition: str, topic: str) -> _Cluster:
+        dimensions = len(next(iter(self._items.values()))[2])
+        cluster = _Cluster(
+            cluster_id=self._next_cluster_id,
+            partition=partition,
+            topic=topic,
+            vector_sum=np.zeros(dimensions, dtype=float),
+        )
+        self._next_cluster_id += 1
+        self._clusters[cluster.cluster_id] = cluster
+        return cluster
+
+    def _add_member(self, cluster: _Cluster, candidate_id: int) -> None:
+        cluster.members.add(candidate_id)
+        cluster.vector_sum = cluster.vector_sum + self._items[candidate_id][2]
+        self._membership[candidate_id] = cluster.cluster_id
+
+    def _groups(
+        self, candidates: Sequence[UnifiedFAQCandidate]
+    ) -> List[SemanticTopicGroup]:
+        grouped: Dict[int, List[UnifiedFAQCandidate]] = {}
+        for candidate in candidates:
+            grouped.setdefault(self._membership[candidate.id], []).append(candidate)
+        groups = []
+        for cluster_id, members in grouped.items():
+            cluster = self._clusters[cluster_id]
+            groups.append(
+                SemanticTopicGroup(
+                    key=f"{cluster.partition}|semantic-{cluster_id}",
+                    topic=cluster.topic,
+                    candidates=members,
+                )
+            )
+        return groups
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "clusters": len(self._clusters),
+                "candidates": len(self._membership),
+                "cached_embeddings": len(self._embeddings),
+            }
+
+
+def _question_text(candidate: UnifiedFAQCandidate) -> str:
+    return " ".join(
+        str(candidate.edited_question_text or candidate.question_text or "").split()
+    )
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _topic_label(candidate: UnifiedFAQCandidate) -> str:
+    return topic_cluster_key(candidate).rsplit("|", 1)[-1] or "general"
@@ -0,0 +1,125 @@
+"""Inverted token index over LLM Wiki pages for target page matching.
+
+Routing a knowledge update compares the candidate's tokens with the id,
+title and opening body text of every LLM Wiki page. The index tokenizes each
+page once, keeps a token -> pages posting list and is updated in place when
+a page is written, so a match only scores pages that share at least one
+token with the candidate.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
+
+if TYPE_CHECKING:
+    from app.services.knowledge_updates.llm_wiki_update_service import (
+        LLMWikiPageRecord,
+    )
+
+# Leading body characters that take part in target matching
+MATCH_BODY_CHARS = 1200
+
+
+@dataclass(frozen=True)
+class IndexedPage:
+    page: "LLMWikiPageRecord"
+    page_tokens: FrozenSet[str]
+    title_tokens: FrozenSet[str]
+
+
+class LLMWikiPageIndex:
+    """Pages keyed by path with posting lists over their match tokens.
+
+    Args:
+        pages: Initial pages
+        tokenize: Token set used for matching (shared with query tokenization)
+    """
+
+    def __init__(
+        self,
+        pages: Iterable["LLMWikiPageRecord"],
+        tokenize: Callable[[str], Set[str]],
+    ):
+        self._tokenize = tokenize
+        self._entries: Dict[Path, IndexedPage] = {}
+        self._postings: Dict[str, Set[Path]] = {}
+        self._names: Dict[str, Set[Path]] = {}
+        self._sorted_pages: Optional[List["LLMWikiPageRecord"]] = None
+        for page in pages:
+            self.upsert(page)
+
+    @property
+    def pages(self) -> List["LLMWikiPageRecord"]:
+        """All pages ordered by path."""
+        if self._sorted_pages is None:
+            self._sorted_pages = [
+                self._entries[path].page for path in sorted(self._entries)
+            ]
+        return self._sorted_pages
+
+    def upsert(self, page: "LLMWikiPageRecord") -> None:
+        """Add a page or replace the page stored at the same path."""
+        self.remove(page.path)
+        title_tokens = frozenset(self._tokenize(f"{page.page_id} {page.title}"))
+        page_tokens = frozenset(
+            self._tokenize(
+                f"{page.page_id} {page.title} {page.body[:MATCH_BODY_CHARS]}"
+            )
+        )
+        self._entries[page.path] = IndexedPage(page, page_tokens, title_tokens)
+        for token in page_tokens:
+            self._postings.setdefault(token, set()).add(page.path)
+        for name in {page.page_id, page.title}:
+            self._names.setdefault(name, set()).add(page.path)
+        self._sorted_pages = None
+
+    def remove(self, path: Path) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+        for token in entry.page_tokens:
+            paths = self._postings.get(token)
+            if paths is not None:
+                paths.discard(path)
+                if not paths:
+                    del self._postings[token]
+        for name in {entry.page.page_id, entry.page.title}:
+            paths = self._names.get(name)
+            if paths is not None:
+                paths.discard(path)
+                if not paths:
+                    del self._names[name]
+        self._sorted_pages = None
+
+    def get_by_id(self, page_id: str) -> Optional["LLMWikiPageRecord"]:
+        """First page (by path) with this page id."""
+        for path in sorted(self._names.get(page_id, ())):
+            page = self._entries[path].page
+            if page.page_id == page_id:
+                return page
+        return None
+
+    def named(self, names: Iterable[str]) -> List["LLMWikiPageRecord"]:
+        """Pages whose id or title is one of ``names``, ordered by path."""
+        paths: Set[Path] = set()
+        for name in names:
+            paths.update(self._names.get(name, ()))
+        return [self._entries[path].page for path in sorted(paths)]
+
+    def sharing_tokens(self, tokens: Iterable[str]) -> List[IndexedPage]:
+        """Pages sharing at least one token with ``tokens``, ordered by path."""
+        paths: Set[Path] = set()
+        for token in tokens:
+            paths.update(self._postings.get(token, ()))
+        return [self._entries[path] for path in sorted(paths)]
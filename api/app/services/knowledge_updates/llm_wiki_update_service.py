@@ -21,6 +21,8 @@ from urllib.parse import quote
 import yaml  # type: ignore[import-untyped]
 from app.core.config import Settings
 from app.services.faq.slug_manager import SlugManager
+from app.services.knowledge_updates.embedding_clusters import EmbeddingTopicClusterer
+from app.services.knowledge_updates.llm_wiki_page_index import LLMWikiPageIndex
 from app.services.knowledge_updates.topic_clusters import (
     KnowledgeTopicCluster,
     topic_cluster_key,
@@ -185,10 +187,17 @@ class KnowledgeUpdateProposal:
 class KnowledgeUpdateService:
     """Create, validate, and approve LLM Wiki knowledge update proposals."""
 
-    def __init__(self, *, settings: Settings, db_path: str):
+    def __init__(
+        self,
+        *,
+        settings: Settings,
+        db_path: str,
+        topic_clusterer: Optional[EmbeddingTopicClusterer] = None,
+    ):
         self.settings = settings
         self.db_path = db_path
-        self._pages_cache: Optional[List[LLMWikiPageRecord]] = None
+        self.topic_clusterer = topic_clusterer
+        self._page_index: Optional[LLMWikiPageIndex] = None
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self._init_database()
 
@@ -425,11 +434,15 @@ class KnowledgeUpdateService:
         member reviewed. The key therefore includes the inferred target page and
         category so only small, same-page edits collapse into one synthesis item.
         """
+        topic = topic_cluster_key(candidate).split("|", 1)[-1]
+        return f"{self.review_partition_key(candidate)}|{topic}"
+
+    def review_partition_key(self, candidate: UnifiedFAQCandidate) -> str:
+        """Return the protocol/target page/category scope a review cluster may span."""
         target = self._match_target_page(candidate, self._load_pages())
         target_id = target.page_id if target else self._new_page_id(candidate)
-        topic = topic_cluster_key(candidate).split("|", 1)[-1]
         category = _slugify(candidate.category or "uncategorized")
-        return f"{candidate.protocol or 'none'}|{target_id}|{category}|{topic}"
+        return f"{candidate.protocol or 'none'}|{target_id}|{category}"
 
     def update_operations(
         self,
@@ -589,7 +602,7 @@ class KnowledgeUpdateService:
         )
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text(final_markdown, encoding="utf-8")
-        self._pages_cache = None
+        self._reindex_page(output_path)
 
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -1204,27 +1217,36 @@ class KnowledgeUpdateService:
         )
 
     def _load_pages(self) -> List[LLMWikiPageRecord]:
-        if self._pages_cache is not None:
-            return self._pages_cache
+        return self._load_page_index().pages
+
+    def _load_page_index(self) -> LLMWikiPageIndex:
+        if self._page_index is not None:
+            return self._page_index
         root = Path(self.settings.LLM_WIKI_DIR_PATH)
-        if not root.exists():
-            self._pages_cache = []
-            return []
         pages = []
-        for path in sorted(root.rglob("*.md")):
-            page = _read_llm_wiki_page(path)
-            if page is None:
-                continue
-            pages.append(page)
-        self._pages_cache = pages
-        return pages
+        if root.exists():
+            for path in sorted(root.rglob("*.md")):
+                page = _read_llm_wiki_page(path)
+                if page is None:
+                    continue
+                pages.append(page)
+        self._page_index = LLMWikiPageIndex(pages, tokenize=_tokenize)
+        return self._page_index
+
+    def _reindex_page(self, path: Path) -> None:
+        """Refresh one written page in the loaded index instead of reloading all."""
+        if self._page_index is None:
+            return
+        page = _read_llm_wiki_page(path)
+        if page is None:
+            self._page_index.remove(path)
+        else:
+            self._page_index.upsert(page)
 
     def _load_page_by_id(self, page_id: Optional[str]) -> Optional[LLMWikiPageRecord]:
         if not page_id:
             return None
-        return next(
-            (page for page in self._load_pages() if page.page_id == page_id), None
-        )
+        return self._load_page_index().get_by_id(page_id)
 
     def _match_target_page(
         self,
@@ -1236,12 +1258,15 @@ class KnowledgeUpdateService:
         if candidate.protocol not in VALID_PROTOCOLS:
             return None
 
+        index = self._load_page_index()
+        if pages is not index.pages:
+            index = LLMWikiPageIndex(pages, tokenize=_tokenize)
+
         source_titles = self._generated_source_titles(candidate, source_type="llm_wiki")
-        for page in pages:
+        for page in index.named(source_titles):
             if page.status == "deprecated":
                 continue
-            if page.title in source_titles or page.page_id in source_titles:
-                return page
+            return page
 
         query = " ".join(
             filter(
@@ -1260,17 +1285,17 @@ class KnowledgeUpdateService:
 
         best_page: Optional[LLMWikiPageRecord] = None
         best_score = 0.0
-        for page in pages:
+        # Only pages sharing a token with the query can reach the coverage bar
+        for entry in index.sharing_tokens(query_tokens):
+            page = entry.page
             if page.status == "deprecated":
                 continue
             if page.protocol not in {candidate.protocol, "all"}:
                 continue
-            page_tokens = _tokenize(f"{page.page_id} {page.title} {page.body[:1200]}")
-            title_tokens = _tokenize(f"{page.page_id} {page.title}")
-            if not page_tokens:
-                continue
-            score = len(query_tokens & page_tokens) / max(len(query_tokens), 1)
-            title_overlap = len(query_tokens & title_tokens) / max(len(title_tokens), 1)
+            score = len(query_tokens & entry.page_tokens) / max(len(query_tokens), 1)
+            title_overlap = len(query_tokens & entry.title_tokens) / max(
+                len(entry.title_tokens), 1
+            )
             if (
                 score >= MIN_TARGET_PAGE_TOKEN_COVERAGE
                 and title_overlap >= MIN_TARGET_TITLE_TOKEN_OVERLAP
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import logging
 import re
 from collections import Counter, defaultdict
 from dataclasses import dataclass
-from typing import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Callable, Iterable, Sequence
 
 from app.services.training.unified_repository import UnifiedFAQCandidate
 
+if TYPE_CHECKING:
+    from app.services.knowledge_updates.embedding_clusters import (
+        EmbeddingTopicClusterer,
+    )
+
+logger = logging.getLogger(__name__)
+
 TOKEN_STOPWORDS = {
     "about",
     "after",
@@ -150,11 +158,29 @@ def build_knowledge_review_items(
     is_reviewable: Callable[[UnifiedFAQCandidate], bool],
     *,
     cluster_key: Callable[[UnifiedFAQCandidate], str] | None = None,
+    topic_clusterer: EmbeddingTopicClusterer | None = None,
+    partition_key: Callable[[UnifiedFAQCandidate], str] | None = None,
 ) -> list[KnowledgeReviewItem]:
-    """Collapse reviewable topic clusters into one admin queue item."""
+    """Collapse reviewable topic clusters into one admin queue item.
+
+    With a ``topic_clusterer`` and ``partition_key``, candidates are grouped by
+    question embedding similarity within each partition; otherwise (or if
+    embedding fails) by the ``cluster_key`` heuristic.
+    """
     ordered = [candidate for candidate in candidates if is_reviewable(candidate)]
     indexed = {candidate.id: index for index, candidate in enumerate(ordered)}
-    clusters = build_topic_clusters(ordered, key_func=cluster_key)
+    clusters: dict[str, list[UnifiedFAQCandidate]] | None = None
+    topics: dict[str, str] = {}
+    if topic_clusterer is not None and partition_key is not None:
+        try:
+            groups = topic_clusterer.cluster(ordered, partition_key)
+        except Exception as exc:
+            logger.warning(f"Embedding topic clustering failed, using keywords: {exc}")
+        else:
+            clusters = {group.key: list(group.candidates) for group in groups}
+            topics = {group.key: group.topic for group in groups}
+    if clusters is None:
+        clusters = build_topic_clusters(ordered, key_func=cluster_key)
     clustered_ids: set[int] = set()
     items: list[tuple[int, KnowledgeReviewItem]] = []
 
@@ -171,7 +197,7 @@ def build_knowledge_review_items(
         )
         cluster = KnowledgeTopicCluster(
             key=key,
-            topic=_topic_from_key(key),
+            topic=topics.get(key) or _topic_from_key(key),
             candidates=group,
         )
         items.append(
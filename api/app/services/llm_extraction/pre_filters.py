@@ -3,89 +3,203 @@
 Filters obvious noise before sending to LLM and normalizes message formatting
 for consistent processing. Includes security features to prevent ReDoS attacks.
 
-Platform Compatibility:
-    The regex timeout mechanism uses signal.SIGALRM which is Unix-only.
-    On Windows or other non-Unix platforms, the timeout protection will not work
-    and regexes will run without time limits. The module will still function
-    but without ReDoS protection.
+ReDoS Protection:
+    Exclusion patterns are validated when they are compiled: any pattern with
+    nested unbounded quantifiers (e.g. ``(a+)+``), the construct behind
+    catastrophic backtracking, is rejected. The remaining patterns are merged
+    into one alternation of named groups, so a message is classified in a
+    single pass over input that is truncated to a bounded length. Patterns
+    that would change meaning once merged (a top-level ``|`` under ``^``,
+    group references, named groups, global inline flags) are rejected too.
 
 Thread Safety:
-    The SIGALRM-based timeout is process-global and not thread-safe.
-    In multi-threaded environments, use this module only from the main thread
-    or consider alternative timeout mechanisms.
+    Matching uses no signals or other process-global state, so filtering is
+    safe from worker threads and the filter can be pickled into worker
+    processes for large batches.
 """
 
 import logging
 import re
-import signal
-from functools import wraps
-from typing import Any, Callable, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:  # Python 3.11+
+    import re._parser as sre_parse  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse
 
 from app.core.config import get_settings
 from app.metrics.llm_extraction_metrics import messages_filtered_total
 
 logger = logging.getLogger(__name__)
 
+_REPEAT_OPCODES = {
+    sre_parse.MAX_REPEAT,
+    sre_parse.MIN_REPEAT,
+    getattr(sre_parse, "POSSESSIVE_REPEAT", sre_parse.MAX_REPEAT),
+}
+_GROUP_REF_OPCODES = {sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS}
+
+
+def _max_unbounded_nesting(parsed: Any, depth: int = 0) -> int:
+    """Deepest nesting of unbounded quantifiers in a parsed regex."""
+    deepest = depth
+    if isinstance(parsed, (list, tuple, sre_parse.SubPattern)):
+        items = parsed.data if isinstance(parsed, sre_parse.SubPattern) else parsed
+        for item in items:
+            if (
+                isinstance(item, tuple)
+                and len(item) == 2
+                and item[0] in _REPEAT_OPCODES
+            ):
+                _, max_count, body = item[1]
+                inner = depth + (1 if max_count == sre_parse.MAXREPEAT else 0)
+                deepest = max(deepest, inner, _max_unbounded_nesting(body, inner))
+            else:
+                deepest = max(deepest, _max_unbounded_nesting(item, depth))
+    return deepest
 
-class RegexTimeout(Exception):
-    """Raised when regex execution exceeds timeout."""
-
-    pass
-
-
-def regex_with_timeout(timeout_seconds: float = 0.5) -> Callable:
-    """Decorator for regex operations with timeout protection.
-
-    Note:
-        This decorator uses signal.SIGALRM which is Unix-only and not thread-safe.
-        On non-Unix platforms, the function runs without timeout protection.
 
-    Args:
-        timeout_seconds: Maximum time allowed for regex execution
+def is_backtracking_safe(pattern: str) -> bool:
+    """Return False for patterns with nested unbounded quantifiers.
 
-    Returns:
-        Decorated function with timeout protection (Unix) or no-op wrapper (non-Unix)
+    Nested repetition such as ``(a+)+`` or ``(\\w*\\s?)*`` can backtrack
+    exponentially on a near-miss; patterns without it run in polynomial time.
+    """
+    try:
+        parsed = sre_parse.parse(pattern, re.IGNORECASE)
+    except re.error:
+        return False
+    return _max_unbounded_nesting(parsed) < 2
+
+
+def _references_groups(parsed: Any) -> bool:
+    """Whether a parsed regex contains a backreference or group conditional."""
+    if isinstance(parsed, (list, tuple, sre_parse.SubPattern)):
+        items = parsed.data if isinstance(parsed, sre_parse.SubPattern) else parsed
+        for item in items:
+            if (
+                isinstance(item, tuple)
+                and len(item) == 2
+                and item[0] in _GROUP_REF_OPCODES
+            ):
+                return True
+            if _references_groups(item):
+                return True
+    return False
+
+
+def is_combinable(pattern: str) -> bool:
+    """Return False for patterns that change meaning inside a merged alternation.
+
+    Each pattern is wrapped in a named group and routed by a leading ``^``,
+    so these are not allowed: a top-level ``|`` that leaves a ``^`` pattern
+    only partly anchored (``^a|b``; write ``^(?:a|b)``), group references
+    and named groups, whose numbers and names are shared once merged, and
+    global inline flags such as ``(?s)``, which must start the expression.
+    """
+    try:
+        parsed = sre_parse.parse(pattern, re.IGNORECASE)
+        # Global inline flags are an error anywhere but the start
+        sre_parse.parse(f"(?:{pattern})", re.IGNORECASE)
+    except re.error:
+        return False
+    if parsed.state.groupdict:
+        return False
+    # The parser hoists a common prefix out of a top-level branch, so a
+    # pattern is anchored as a whole only if it starts with AT_BEGINNING
+    anchored = parsed.data[:1] == [(sre_parse.AT, sre_parse.AT_BEGINNING)]
+    if pattern.startswith("^") and not anchored:
+        return False
+    return not _references_groups(parsed)
+
+
+class _CompiledPatternSet:
+    """Validated patterns merged into combined alternations.
+
+    ``^``-anchored patterns form one alternation tried at position 0; the
+    rest form one alternation for ``search``. Group ``p{i}`` maps to
+    ``reasons[i]``, in the order the patterns were given.
     """
 
-    def decorator(func: Callable) -> Callable:
-        # Check if platform supports SIGALRM
-        if not hasattr(signal, "SIGALRM"):
-            # Non-Unix platform - return function as-is without timeout
-            logger.warning(
-                "SIGALRM not available on this platform. "
-                "Regex timeout protection disabled."
-            )
-            return func
-
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            def handler(signum, frame):  # noqa: ARG001
-                raise RegexTimeout(f"Regex execution timeout after {timeout_seconds}s")
-
-            # Store old handler and set new one
-            old_handler = signal.signal(signal.SIGALRM, handler)
-            # Use setitimer for sub-second precision
-            signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+    def __init__(self, patterns: Sequence[Tuple[str, str]]):
+        anchored: List[str] = []
+        unanchored: List[str] = []
+        reasons: List[str] = []
+        self.unanchored_singles: Dict[int, re.Pattern] = {}
+        for pattern, reason in patterns:
             try:
-                return func(*args, **kwargs)
-            finally:
-                # Disable timer and restore handler
-                signal.setitimer(signal.ITIMER_REAL, 0)
-                signal.signal(signal.SIGALRM, old_handler)
-
-        return wrapper
-
-    return decorator
+                compiled = re.compile(pattern, re.IGNORECASE)
+            except re.error as e:
+                logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+                continue
+            if not is_backtracking_safe(pattern):
+                logger.warning(
+                    f"Rejected regex pattern '{pattern[:50]}': nested quantifiers "
+                    "can cause catastrophic backtracking"
+                )
+                continue
+            if not is_combinable(pattern):
+                logger.warning(
+                    f"Rejected regex pattern '{pattern[:50]}': partly anchored "
+                    "'|', group references, named groups and global inline "
+                    "flags cannot be combined with other patterns"
+                )
+                continue
+            index = len(reasons)
+            group = f"(?P<p{index}>{pattern})"
+            if pattern.startswith("^"):
+                anchored.append(group)
+            else:
+                unanchored.append(group)
+                self.unanchored_singles[index] = compiled
+            reasons.append(reason)
+
+        self.anchored = self._combine(anchored)
+        self.unanchored = self._combine(unanchored)
+        self.reasons: Tuple[str, ...] = tuple(reasons)
+
+    @staticmethod
+    def _combine(groups: List[str]) -> Optional[re.Pattern]:
+        return re.compile("|".join(groups), re.IGNORECASE) if groups else None
+
+    def first_match(self, text: str) -> int:
+        """Index of the first listed pattern matching ``text``, or -1."""
+        best = len(self.reasons)
+        if self.anchored is not None:
+            match = self.anchored.match(text)
+            if match:
+                best = _group_index(match)
+        if self.unanchored is not None:
+            match = self.unanchored.search(text)
+            if match:
+                index = _group_index(match)
+                # The leftmost match wins the alternation, so an earlier-listed
+                # unanchored pattern may still match further right.
+                for candidate, compiled in self.unanchored_singles.items():
+                    if candidate >= min(index, best):
+                        break
+                    if compiled.search(text):
+                        index = candidate
+                        break
+                best = min(best, index)
+        return best if best < len(self.reasons) else -1
+
+
+def _group_index(match: re.Match) -> int:
+    return int(match.lastgroup[1:]) if match.lastgroup else -1
+
+
+@lru_cache(maxsize=32)
+def _compile_pattern_set(patterns: Tuple[Tuple[str, str], ...]) -> _CompiledPatternSet:
+    return _CompiledPatternSet(patterns)
 
 
 class SafeRegexMatcher:
-    """Regex matcher with timeout and input limits.
+    """Single-pass matcher over a validated, combined pattern set.
 
-    Note:
-        The timeout mechanism uses SIGALRM which is process-global and not
-        thread-safe. This class should only be used from the main thread in
-        multi-threaded applications. On non-Unix platforms, timeout protection
-        is disabled.
+    Patterns are tried in list order: the reason returned is that of the first
+    pattern that matches, as if each were searched separately.
     """
 
     def __init__(
@@ -99,21 +213,15 @@ class SafeRegexMatcher:
         Args:
             patterns: List of (pattern, reason) tuples
             max_input_length: Maximum input length before truncation
-            timeout_seconds: Timeout per pattern match
+            timeout_seconds: Kept for backwards compatibility; patterns are
+                validated for safe matching instead of being timed out.
         """
         self.max_input_length = max_input_length
         self.timeout_seconds = timeout_seconds
-        self._compiled: List[Tuple[re.Pattern, str]] = []
-
-        for pattern, reason in patterns:
-            try:
-                compiled = re.compile(pattern, re.IGNORECASE)
-                self._compiled.append((compiled, reason))
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+        self._patterns = _compile_pattern_set(tuple(map(tuple, patterns)))
 
     def safe_match(self, text: str) -> Tuple[bool, str]:
-        """Match text against patterns with input truncation and timeout.
+        """Match text against patterns with input truncation.
 
         Args:
             text: Text to match against patterns
@@ -122,60 +230,32 @@ class SafeRegexMatcher:
             Tuple of (matched, reason) - reason is empty if no match
         """
         # Truncate input to prevent DoS
-        truncated = text[: self.max_input_length]
-
-        for pattern, reason in self._compiled:
-            try:
-                if self._match_with_timeout(pattern, truncated):
-                    return True, reason
-            except RegexTimeout:
-                logger.warning(f"Regex timeout for pattern: {pattern.pattern[:50]}...")
-                continue
-
-        return False, ""
+        index = self._patterns.first_match(text[: self.max_input_length])
+        if index < 0:
+            return False, ""
+        return True, self._patterns.reasons[index]
 
-    def _match_with_timeout(self, pattern: re.Pattern, text: str) -> bool:
-        """Execute regex match with timeout.
 
-        Uses instance-level timeout_seconds for timeout protection.
-
-        Args:
-            pattern: Compiled regex pattern
-            text: Text to match
-
-        Returns:
-            True if pattern matches text
-
-        Raises:
-            RegexTimeout: If regex execution exceeds timeout_seconds
-        """
-
-        # Apply timeout wrapper with instance timeout
-        @regex_with_timeout(self.timeout_seconds)
-        def do_match() -> bool:
-            return bool(pattern.search(text))
-
-        return do_match()
-
-
-def validate_message_input(message: Dict[str, Any]) -> Dict[str, Any]:
+def validate_message_input(
+    message: Dict[str, Any], max_length: Optional[int] = None
+) -> Dict[str, Any]:
     """Validate and sanitize message input.
 
     Args:
         message: Message dictionary with 'body' field
+        max_length: Length limit; defaults to settings.MAX_MESSAGE_LENGTH
 
     Returns:
         Sanitized message dictionary
     """
-    settings = get_settings()
+    if max_length is None:
+        max_length = get_settings().MAX_MESSAGE_LENGTH
     body = message.get("body", "")
 
     # Enforce length limit
-    if len(body) > settings.MAX_MESSAGE_LENGTH:
-        logger.warning(
-            f"Truncating message from {len(body)} to {settings.MAX_MESSAGE_LENGTH}"
-        )
-        body = body[: settings.MAX_MESSAGE_LENGTH]
+    if len(body) > max_length:
+        logger.warning(f"Truncating message from {len(body)} to {max_length}")
+        body = body[:max_length]
 
     # Remove null bytes
     body = body.replace("\x00", "")
@@ -231,6 +311,7 @@ class MessagePreFilter:
     def __init__(self):
         """Initialize pre-filter with compiled patterns."""
         settings = get_settings()
+        self.max_message_length = settings.MAX_MESSAGE_LENGTH
         self._matcher = SafeRegexMatcher(
             self.EXCLUDE_PATTERNS,
             max_input_length=settings.MAX_MESSAGE_LENGTH,
@@ -247,7 +328,7 @@ class MessagePreFilter:
             Tuple of (should_filter, reason)
         """
         # Validate and sanitize input first
-        message = validate_message_input(message)
+        message = validate_message_input(message, self.max_message_length)
         body = message.get("body", "").strip()
 
         # Empty messages
@@ -265,6 +346,14 @@ class MessagePreFilter:
 
         return False, ""
 
+    def classify_batch(self, messages: Sequence[Dict[str, Any]]) -> List[str]:
+        """Return the filter reason for each message ("" when it passes).
+
+        Pure CPU work without shared state, so chunks can be handed to worker
+        threads or (the filter is picklable) worker processes.
+        """
+        return [self.should_filter(message)[1] for message in messages]
+
     def filter_messages(
         self, messages: List[Dict[str, Any]]
     ) -> Tuple[List[Dict[str, Any]], List[Tuple[Dict[str, Any], str]]]:
@@ -276,12 +365,13 @@ class MessagePreFilter:
         Returns:
             Tuple of (passed_messages, filtered_messages_with_reasons)
         """
+        reasons = self.classify_batch(messages)
+
         passed = []
         filtered = []
 
-        for msg in messages:
-            should_filter, reason = self.should_filter(msg)
-            if should_filter:
+        for msg, reason in zip(messages, reasons):
+            if reason:
                 filtered.append((msg, reason))
                 # Record metric for filtered message
                 messages_filtered_total.labels(reason=reason).inc()
@@ -291,6 +381,10 @@ class MessagePreFilter:
         return passed, filtered
 
 
+# Validate and compile the built-in exclusion patterns once, at import time.
+_compile_pattern_set(tuple(MessagePreFilter.EXCLUDE_PATTERNS))
+
+
 class MessageNormalizer:
     """Normalize message text before LLM processing."""
 
@@ -410,6 +410,11 @@ class PublicFAQService:
         self._set_cache(cache_key, result, self.CATEGORIES_TTL)
         return result
 
+    def warm_cache(self) -> None:
+        """Populate the entries behind the public FAQ landing page."""
+        self.get_categories()
+        self.get_faqs_paginated()
+
     def search_faqs(
         self, query: str, limit: int = 10, category: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -0,0 +1,252 @@
+"""
+Semantic cache of complete RAG answers.
+
+Support traffic is dominated by paraphrases of a small set of questions
+("how do I restore my wallet", "wallet restore?"). The cache stores the
+finished response of an auto-sent answer together with the embedding of the
+canonical English question and serves it again for questions whose
+embedding is at least ``similarity_threshold`` cosine-similar.
+
+Entries are partitioned by scope (detected protocol, user language, source
+channel and prompt version), so an answer is only reused where the pipeline
+would have produced it under the same conditions. Every entry is stamped
+with the cache generation, which changes when the index is rebuilt or FAQs
+are edited; changing the generation drops all entries.
+"""
+
+import copy
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = " ?!.,;:"
+
+Scope = Tuple[Hashable, ...]
+
+
+def normalize_question(question: str) -> str:
+    """Exact-match key: case-folded, whitespace-collapsed, no trailing '?!.'."""
+    collapsed = _WHITESPACE_RE.sub(" ", str(question or "")).strip().casefold()
+    return collapsed.rstrip(_TRAILING_PUNCTUATION)
+
+
+@dataclass
+class CachedAnswer:
+    """A cached response and the question it answered."""
+
+    scope: Scope
+    question_key: str
+    embedding: np.ndarray
+    response: Dict[str, Any]
+    generation: Tuple[Any, ...]
+    created_at: float
+    hits: int = 0
+
+
+@dataclass
+class AnswerCacheHit:
+    """Cached response returned by ``lookup``."""
+
+    response: Dict[str, Any]
+    similarity: float
+    matched_question: str
+
+
+class SemanticAnswerCache:
+    """Bounded LRU cache of answers matched by question embedding similarity.
+
+    Thread-safe; lookups are a dict probe for repeated questions and one
+    matrix-vector product over the entries of a single scope otherwise.
+    """
+
+    def __init__(
+        self,
+        *,
+        similarity_threshold: float = 0.95,
+        max_entries: int = 1000,
+        ttl_seconds: float = 86400.0,
+    ) -> None:
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[Scope, str], CachedAnswer]" = OrderedDict()
+        # Per-scope stacked unit embeddings, rebuilt lazily after changes
+        self._matrices: Dict[Scope, Tuple[np.ndarray, list]] = {}
+        self._index_generation: Optional[str] = None
+        self._faq_version = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> Tuple[Any, ...]:
+        return (self._index_generation, self._faq_version)
+
+    @property
+    def active(self) -> bool:
+        """Whether an index generation has been set (the cache is usable)."""
+        return self._index_generation is not None
+
+    def set_index_generation(self, generation: Optional[str]) -> None:
+        """Record the current index generation; a change drops all entries."""
+        with self._lock:
+            if generation == self._index_generation:
+                return
+            self._index_generation = generation
+            self._clear_locked()
+        logger.info("Answer cache cleared for index generation %s", generation)
+
+    def invalidate(self, reason: str = "faq_update") -> None:
+        """Start a new FAQ version; drops all entries."""
+        with self._lock:
+            self._faq_version += 1
+            dropped = len(self._entries)
+            self._clear_locked()
+        logger.info(
+            "Answer cache invalidated (%s), dropped %d entries", reason, dropped
+        )
+
+    def _clear_locked(self) -> None:
+        self._entries.clear()
+        self._matrices.clear()
+
+    def _expired(self, entry: CachedAnswer, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - entry.created_at > self.ttl_seconds
+
+    def lookup_exact(self, scope: Scope, question: str) -> Optional[AnswerCacheHit]:
+        """Return the entry cached for the same normalized question, if any."""
+        key = (scope, normalize_question(question))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.generation != self.generation:
+                return None
+            if self._expired(entry, time.time()):
+                self._remove_locked(key)
+                return None
+            return self._hit_locked(key, entry, 1.0)
+
+    def lookup(
+        self, scope: Scope, question: str, embedding: Sequence[float]
+    ) -> Optional[AnswerCacheHit]:
+        """Return the most similar cached answer above the threshold."""
+        exact = self.lookup_exact(scope, question)
+        if exact is not None:
+            return exact
+        query = _unit_vector(embedding)
+        with self._lock:
+            if query is None or not self.active:
+                self.misses += 1
+                return None
+            matrix, keys = self._scope_matrix_locked(scope)
+            if not keys or matrix.shape[1] != query.shape[0]:
+                self.misses += 1
+                return None
+            similarities = matrix @ query
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            key = keys[best]
+            entry = self._entries.get(key)
+            if (
+                similarity < self.similarity_threshold
+                or entry is None
+                or entry.generation != self.generation
+            ):
+                self.misses += 1
+                return None
+            if self._expired(entry, time.time()):
+                self._remove_locked(key)
+                self.misses += 1
+                return None
+            return self._hit_locked(key, entry, similarity)
+
+    def store(
+        self,
+        scope: Scope,
+        question: str,
+        embedding: Sequence[float],
+        response: Dict[str, Any],
+    ) -> bool:
+        """Cache a response; returns False when the embedding is unusable."""
+        vector = _unit_vector(embedding)
+        if vector is None or not self.active:
+            return False
+        key = (scope, normalize_question(question))
+        with self._lock:
+            if key in self._entries:
+                self._remove_locked(key)
+            self._entries[key] = CachedAnswer(
+                scope=scope,
+                question_key=key[1],
+                embedding=vector,
+                response=copy.deepcopy(response),
+                generation=self.generation,
+                created_at=time.time(),
+            )
+            self._matrices.pop(scope, None)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+        return True
+
+    def _hit_locked(
+        self, key: Tuple[Scope, str], entry: CachedAnswer, similarity: float
+    ) -> AnswerCacheHit:
+        self._entries.move_to_end(key)
+        entry.hits += 1
+        self.hits += 1
+        return AnswerCacheHit(
+            response=copy.deepcopy(entry.response),
+            similarity=similarity,
+            matched_question=entry.question_key,
+        )
+
+    def _remove_locked(self, key: Tuple[Scope, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._matrices.pop(entry.scope, None)
+
+    def _scope_matrix_locked(self, scope: Scope) -> Tuple[np.ndarray, list]:
+        cached = self._matrices.get(scope)
+        if cached is None:
+            keys = [key for key, entry in self._entries.items() if entry.scope == scope]
+            if keys:
+                matrix = np.vstack([self._entries[key].embedding for key in keys])
+            else:
+                matrix = np.zeros((0, 0), dtype=np.float32)
+            cached = (matrix, keys)
+            self._matrices[scope] = cached
+        return cached
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "similarity_threshold": self.similarity_threshold,
+                "index_generation": self._index_generation,
+                "faq_version": self._faq_version,
+            }
+
+
+def _unit_vector(embedding: Sequence[float]) -> Optional[np.ndarray]:
+    try:
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+    except (TypeError, ValueError):
+        return None
+    norm = float(np.linalg.norm(vector))
+    if vector.size == 0 or not np.isfinite(norm) or norm == 0.0:
+        return None
+    return vector / norm
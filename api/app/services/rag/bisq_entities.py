@@ -1,10 +1,17 @@
 """Bisq domain entity mappings — single source of truth.
 
 Used by:
-- ProtocolDetector: keyword lists for version routing
+- ProtocolDetector / VersionDetector: keyword lists for version routing
+- DocumentRetriever: protocol classification of retrieval queries
 - QueryRewriter: heuristic entity substitution + LLM prompt generation
+
+All keyword tables are compiled once into ``BISQ_KEYWORD_MATCHER`` so the
+detectors share a single pass over the text instead of one substring scan
+per keyword.
 """
 
+from app.services.rag.keyword_matcher import KeywordMatcher
+
 # Maps informal term → canonical form (for heuristic substitution)
 BISQ1_ENTITY_MAP: dict[str, str] = {
     # Informal version references (mined from 44K Matrix messages)
@@ -44,15 +51,15 @@ BISQ2_ENTITY_MAP: dict[str, str] = {
     "chat based": "Bisq Easy chat-based trading",
 }
 
-# Strong keywords for ProtocolDetector (existing + expanded)
-BISQ1_STRONG_KEYWORDS: list[str] = [
-    # Original ProtocolDetector keywords
+# Original ProtocolDetector keywords (also used by the legacy VersionDetector)
+BISQ1_CORE_KEYWORDS: list[str] = [
     "dao",
     "bsq",
     "burningman",
     "burning man",
     "arbitration",
     "arbitrator",
+    # Note: "mediator" removed - mediators exist in both Bisq 1 and Bisq Easy (Bisq 2)
     "altcoin",
     "security deposit",
     "multisig",
@@ -60,6 +67,34 @@ BISQ1_STRONG_KEYWORDS: list[str] = [
     "delayed payout",
     "refund agent",
     "dao voting",
+]
+
+BISQ2_CORE_KEYWORDS: list[str] = [
+    "bisq easy",
+    "reputation",
+    "bonded roles",
+    "trade protocol",
+    "multiple identities",
+    "600 usd",
+    "$600",
+    "novice bitcoin",
+    "bisq 2",
+    "bisq2",
+    # Live data keywords (MCP tools are Bisq 2 features)
+    "current price",
+    "market price",
+    "live price",
+    "btc price",
+    "bitcoin price",
+    "offerbook",
+    "current offers",
+    "available offers",
+    "active offers",
+]
+
+# Strong keywords for ProtocolDetector (existing + expanded)
+BISQ1_STRONG_KEYWORDS: list[str] = [
+    *BISQ1_CORE_KEYWORDS,
     # From entity map
     *BISQ1_ENTITY_MAP.keys(),
     # Additional strong signals from Matrix data
@@ -94,32 +129,79 @@ BISQ1_STRONG_KEYWORDS: list[str] = [
 ]
 
 BISQ2_STRONG_KEYWORDS: list[str] = [
-    # Original ProtocolDetector keywords
+    *BISQ2_CORE_KEYWORDS,
+    # From entity map
+    *BISQ2_ENTITY_MAP.keys(),
+    # Additional strong signals
+    "2.0.",
+    "2.1.",
+]
+
+# Keywords that contradict an explicit mention of the other version
+BISQ1_DOMAIN_CONTEXT_KEYWORDS: tuple[str, ...] = (
+    "dao",
+    "bsq",
+    "arbitration",
+    "arbitrator",
+    "multisig",
+    "2-of-2",
+    "delayed payout",
+    "spv",
+    "signed account",
+    "account signing",
+    "account age witness",
+    "account info signed",
+    "account limits",
+    "deposit transaction",
+    "deposit txid",
+    "ctrl+o",
+    "ctrl + o",
+    "ctrl-o",
+)
+
+BISQ2_DOMAIN_CONTEXT_KEYWORDS: tuple[str, ...] = (
     "bisq easy",
-    "reputation",
+    "reputation score",
+    "reputation system",
     "bonded roles",
-    "trade protocol",
     "multiple identities",
     "600 usd",
     "$600",
-    "novice bitcoin",
-    "bisq 2",
-    "bisq2",
-    "current price",
-    "market price",
-    "live price",
-    "btc price",
-    "bitcoin price",
     "offerbook",
     "current offers",
     "available offers",
-    "active offers",
-    # From entity map
-    *BISQ2_ENTITY_MAP.keys(),
-    # Additional strong signals
-    "2.0.",
-    "2.1.",
-]
+)
+
+# Topic hints used to pick a context-aware clarifying question, in priority order
+CLARIFYING_TOPIC_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "trade": ("trade", "payment", "buy", "sell"),
+    "wallet": ("wallet", "bitcoin", "btc"),
+    "reputation": ("reputation", "profile"),
+    "dao": ("dao", "bsq", "voting"),
+    "mediation": ("mediator", "mediation", "dispute"),
+}
+
+# Number of leading core keywords that count as a version hint in chat history
+HISTORY_KEYWORD_COUNT = 5
+
+BISQ_KEYWORD_MATCHER = KeywordMatcher(
+    {
+        "bisq1_core": BISQ1_CORE_KEYWORDS,
+        "bisq2_core": BISQ2_CORE_KEYWORDS,
+        "bisq1_strong": BISQ1_STRONG_KEYWORDS,
+        "bisq2_strong": BISQ2_STRONG_KEYWORDS,
+        "bisq1_history": BISQ1_CORE_KEYWORDS[:HISTORY_KEYWORD_COUNT],
+        "bisq2_history": BISQ2_CORE_KEYWORDS[:HISTORY_KEYWORD_COUNT],
+        "bisq1_domain": BISQ1_DOMAIN_CONTEXT_KEYWORDS,
+        "bisq2_domain": BISQ2_DOMAIN_CONTEXT_KEYWORDS,
+        "bisq1_entity": BISQ1_ENTITY_MAP.keys(),
+        "bisq2_entity": BISQ2_ENTITY_MAP.keys(),
+        **{
+            f"clarify_{topic}": keywords
+            for topic, keywords in CLARIFYING_TOPIC_KEYWORDS.items()
+        },
+    }
+)
 
 
 def build_llm_entity_examples() -> str:
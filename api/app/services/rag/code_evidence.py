@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any
 
 from app.services.rag.interfaces import RetrievedDocument
 
@@ -41,6 +45,15 @@ _SENSITIVE_ASSIGNMENT_RE = re.compile(
     re.IGNORECASE,
 )
 _TOKEN_RE = re.compile(r"[a-z0-9_]{3,}", re.IGNORECASE)
+# Query terms only contain ``[a-z0-9_]``, so a substring hit in the scored
+# haystack always falls inside one maximal run of these characters.
+_HAYSTACK_RUN_RE = re.compile(r"[a-z0-9_]{3,}")
+_TERM_CACHE_MAX_ENTRIES = 4096
+_GRAM_SIZE = 3
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i : i + _GRAM_SIZE] for i in range(len(text) - _GRAM_SIZE + 1)}
 
 
 def _redact_sensitive_text(text: str) -> str:
@@ -254,11 +267,104 @@ class CodeEvidenceLoader:
         return records
 
 
+class _CodeEvidenceIndex:
+    """Inverted index over staff-only records keyed by haystack word runs.
+
+    ``postings`` maps every word run of a record's searchable text to the
+    positions of the records containing it, and ``runs_by_gram`` maps each
+    trigram to the runs containing it. A query term (3+ characters) is
+    resolved by intersecting the run sets of its trigrams and confirming
+    ``term in run`` on the few candidates, so scoring matches the original
+    ``term in haystack`` semantics without scanning the whole vocabulary.
+    Resolved terms are memoized in a bounded LRU.
+    """
+
+    def __init__(self, records: list[CodeEvidenceRecord]) -> None:
+        self.records = [
+            record for record in records if record.audience == STAFF_ONLY_AUDIENCE
+        ]
+        building: dict[str, set[int]] = {}
+        for position, record in enumerate(self.records):
+            for run in set(_HAYSTACK_RUN_RE.findall(_record_haystack(record))):
+                building.setdefault(run, set()).add(position)
+        self.postings = {run: frozenset(ids) for run, ids in building.items()}
+        runs_by_gram: dict[str, set[str]] = {}
+        for run in self.postings:
+            for gram in _grams(run):
+                runs_by_gram.setdefault(gram, set()).add(run)
+        self.runs_by_gram = {
+            gram: frozenset(runs) for gram, runs in runs_by_gram.items()
+        }
+        self._term_cache: OrderedDict[str, frozenset[int]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def lookup(self, term: str) -> frozenset[int]:
+        with self._cache_lock:
+            cached = self._term_cache.get(term)
+            if cached is not None:
+                self._term_cache.move_to_end(term)
+                return cached
+
+        result = frozenset(
+            position
+            for run in self._runs_containing(term)
+            for position in self.postings[run]
+        )
+        with self._cache_lock:
+            self._term_cache[term] = result
+            if len(self._term_cache) > _TERM_CACHE_MAX_ENTRIES:
+                self._term_cache.popitem(last=False)
+        return result
+
+    def _runs_containing(self, term: str) -> set[str]:
+        # Rarest trigram first keeps the intersection small
+        run_sets = sorted(
+            (self.runs_by_gram.get(gram, frozenset()) for gram in _grams(term)),
+            key=len,
+        )
+        if not run_sets or not run_sets[0]:
+            return set()
+        candidates = set(run_sets[0])
+        for runs in run_sets[1:]:
+            candidates &= runs
+            if not candidates:
+                return candidates
+        return {run for run in candidates if term in run}
+
+
+def _record_haystack(record: CodeEvidenceRecord) -> str:
+    return " ".join(
+        [
+            record.claim,
+            record.support_use,
+            record.symbol,
+            record.path,
+            record.protocol,
+        ]
+    ).lower()
+
+
 class StaffCodeEvidenceRetriever:
-    """Small staff-only retriever for the first code-knowledge slice."""
+    """Small staff-only retriever for the first code-knowledge slice.
+
+    The evidence file is parsed into an in-memory inverted index that is only
+    rebuilt when the file's stat signature changes. The signature itself is
+    re-checked at most every ``refresh_interval_seconds`` so the request path
+    stays free of disk I/O between checks.
+    """
 
-    def __init__(self, loader: CodeEvidenceLoader):
+    def __init__(
+        self,
+        loader: CodeEvidenceLoader,
+        *,
+        refresh_interval_seconds: float = 5.0,
+    ):
         self.loader = loader
+        self.refresh_interval_seconds = max(0.0, float(refresh_interval_seconds))
+        self._index: _CodeEvidenceIndex | None = None
+        self._signature: tuple[int, int, int] | None = None
+        self._checked_at: float | None = None
+        self._lock = threading.Lock()
 
     def retrieve(
         self,
@@ -269,39 +375,64 @@ class StaffCodeEvidenceRetriever:
         min_score: float = 0.3,
     ) -> list[RetrievedDocument]:
         query_terms = set(_TOKEN_RE.findall(str(query or "").lower()))
-        candidates = [
-            record
-            for record in self.loader.load()
-            if record.audience == STAFF_ONLY_AUDIENCE
-            and (protocol is None or record.protocol in {protocol, "all"})
-        ]
+        if not query_terms:
+            return []
+        index = self._get_index()
+        if not index.records:
+            return []
+
+        # Each matched term contributes an equal share of the score.
+        term_weight = 1.0 / len(query_terms)
+        scores: dict[int, float] = {}
+        for term in query_terms:
+            for position in index.lookup(term):
+                scores[position] = scores.get(position, 0.0) + term_weight
 
         scored = [
-            (record, self._score_record(record, query_terms)) for record in candidates
+            (position, score)
+            for position, score in scores.items()
+            if score >= min_score
+            and (
+                protocol is None
+                or index.records[position].protocol in {protocol, "all"}
+            )
         ]
-        scored = [(record, score) for record, score in scored if score >= min_score]
-        scored.sort(key=lambda item: item[1], reverse=True)
+        scored.sort(key=lambda item: (-item[1], item[0]))
         return [
-            record.to_retrieved_document(score=score)
-            for record, score in scored[: max(1, int(k))]
+            index.records[position].to_retrieved_document(score=score)
+            for position, score in scored[: max(1, int(k))]
         ]
 
-    def _score_record(
-        self,
-        record: CodeEvidenceRecord,
-        query_terms: Iterable[str],
-    ) -> float:
-        haystack = " ".join(
-            [
-                record.claim,
-                record.support_use,
-                record.symbol,
-                record.path,
-                record.protocol,
-            ]
-        ).lower()
-        terms = set(query_terms)
-        if not terms:
-            return 0.0
-        matches = sum(1 for term in terms if term in haystack)
-        return matches / len(terms)
+    def invalidate(self) -> None:
+        """Force the next query to re-check and rebuild the index."""
+        with self._lock:
+            self._index = None
+            self._signature = None
+            self._checked_at = None
+
+    def _get_index(self) -> _CodeEvidenceIndex:
+        now = time.monotonic()
+        index = self._index
+        if (
+            index is not None
+            and self._checked_at is not None
+            and now - self._checked_at < self.refresh_interval_seconds
+        ):
+            return index
+
+        with self._lock:
+            signature = self._file_signature()
+            if self._index is None or signature != self._signature:
+                # Record the signature taken before reading so a concurrent
+                # rewrite triggers another rebuild on the next check.
+                self._index = _CodeEvidenceIndex(self.loader.load())
+                self._signature = signature
+            self._checked_at = now
+            return self._index
+
+    def _file_signature(self) -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(self.loader.path)
+        except (AttributeError, OSError):
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
@@ -9,17 +9,53 @@ assessment, particularly effective for:
 - Technical documentation with specific terminology
 - Multi-faceted queries
 - Nuanced semantic matching
+
+Document token embeddings are precomputed at index time and cached by chunk
+content hash (in memory and under ``DATA_DIR/colbert_token_cache``), so a
+query only encodes the query text and scores all candidates with a single
+vectorized MaxSim over the cached matrices. Candidates outside the indexed
+corpus are encoded on demand into a separate, bounded LRU.
 """
 
+import hashlib
+import json
 import logging
+import shutil
 import threading
-from typing import List, Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
 
+import numpy as np
 from app.core.config import Settings
 from app.services.rag.interfaces import RerankerProtocol, RetrievedDocument
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_CACHE_DIRNAME = "colbert_token_cache"
+_ON_DEMAND_CACHE_MAX_ENTRIES = 2048
+
+
+class PrecomputedScoringUnsupported(RuntimeError):
+    """The loaded model cannot encode queries and documents separately."""
+
+
+def chunk_hash(content: str) -> str:
+    """Stable cache key for a chunk's token embeddings."""
+    return hashlib.sha1((content or "").encode("utf-8")).hexdigest()
+
+
+def _to_matrix(tensor: Any) -> np.ndarray:
+    """Convert a torch tensor (or array-like) to a 2-D float32 matrix."""
+    if hasattr(tensor, "detach"):
+        tensor = tensor.detach().cpu().float().numpy()
+    matrix = np.asarray(tensor, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise PrecomputedScoringUnsupported(
+            f"Expected 2-D token embeddings, got shape {matrix.shape}"
+        )
+    return matrix
+
 
 class ColBERTReranker(RerankerProtocol):
     """ColBERT-based reranker for improved document ranking.
@@ -32,6 +68,7 @@ class ColBERTReranker(RerankerProtocol):
     - Thread-safe model initialization
     - Configurable top_n output
     - Graceful fallback if model loading fails
+    - Precomputed per-chunk token embeddings with vectorized MaxSim scoring
 
     Attributes:
         settings: Application settings with ColBERT configuration
@@ -44,6 +81,7 @@ class ColBERTReranker(RerankerProtocol):
         settings: Settings,
         model_name: Optional[str] = None,
         top_n: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
     ):
         """Initialize the ColBERT reranker.
 
@@ -51,6 +89,9 @@ class ColBERTReranker(RerankerProtocol):
             settings: Application settings with ColBERT configuration
             model_name: Optional model name override (defaults to settings)
             top_n: Optional top_n override (defaults to settings)
+            cache_dir: Directory for persisted token embeddings (defaults to
+                DATA_DIR/colbert_token_cache; None disables persistence when
+                DATA_DIR is not configured)
         """
         self.settings = settings
         self.model_name = model_name or settings.COLBERT_MODEL
@@ -61,6 +102,23 @@ class ColBERTReranker(RerankerProtocol):
         self._load_attempted = False
         self._load_error: Optional[Exception] = None
 
+        if cache_dir is None:
+            data_dir = getattr(settings, "DATA_DIR", None)
+            if isinstance(data_dir, (str, Path)) and str(data_dir).strip():
+                cache_dir = Path(data_dir) / _TOKEN_CACHE_DIRNAME
+        self.cache_dir: Optional[Path] = Path(cache_dir) if cache_dir else None
+        # Token matrices of the indexed corpus (persisted)
+        self._token_cache: Dict[str, np.ndarray] = {}
+        # Candidates encoded at query time, e.g. live FAQ or wiki results
+        self._on_demand_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._on_demand_max_entries = _ON_DEMAND_CACHE_MAX_ENTRIES
+        self._cache_lock = threading.Lock()
+        self._cache_loaded = False
+        # Set to False once the checkpoint encoders prove unusable; rerank()
+        # then uses RAGatouille's in-memory rerank instead. Other failures
+        # only fall back for the request that hit them.
+        self._precomputed_supported = True
+
     def is_loaded(self) -> bool:
         """Check if the ColBERT model is loaded and ready.
 
@@ -161,6 +219,20 @@ class ColBERTReranker(RerankerProtocol):
             )
             return documents[:effective_top_n]
 
+        if self._precomputed_supported:
+            try:
+                return self._rerank_precomputed(query, documents, effective_top_n)
+            except (PrecomputedScoringUnsupported, AttributeError, TypeError) as e:
+                self._precomputed_supported = False
+                logger.warning(
+                    "ColBERT precomputed scoring unavailable, using in-memory "
+                    f"rerank instead: {e}"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"ColBERT precomputed scoring failed, using in-memory rerank: {e}"
+                )
+
         try:
             # Extract document texts for reranking
             doc_texts = [doc.content for doc in documents]
@@ -177,33 +249,30 @@ class ColBERTReranker(RerankerProtocol):
                 k=effective_top_n,
             )
 
+            # Positions by content, used only when results lack result_index.
+            positions_by_content: Dict[str, int] = {}
+            for position, doc in enumerate(documents):
+                positions_by_content.setdefault(doc.content, position)
+
             # Map reranked results back to RetrievedDocument objects
             reranked_docs = []
             for result in reranked_results:
-                # RAGatouille returns dict with 'content' and 'score'
+                # RAGatouille returns dict with 'content', 'score', 'result_index'
+                position = None
                 if isinstance(result, dict):
                     content = result.get("content", "")
                     score = result.get("score", 0.0)
+                    position = result.get("result_index")
                 else:
                     # Handle tuple format (content, score)
                     content, score = result if len(result) == 2 else (result[0], 0.0)
 
-                # Find matching original document
-                matching_doc = None
-                for doc in documents:
-                    if doc.content == content:
-                        matching_doc = doc
-                        break
+                if not isinstance(position, int) or not 0 <= position < len(documents):
+                    position = positions_by_content.get(content)
 
-                if matching_doc:
-                    # Create new doc with updated score
+                if position is not None:
                     reranked_docs.append(
-                        RetrievedDocument(
-                            content=matching_doc.content,
-                            metadata=matching_doc.metadata,
-                            score=float(score),
-                            id=matching_doc.id,
-                        )
+                        self._with_score(documents[position], float(score))
                     )
                 else:
                     # Document not found in original list (shouldn't happen)
@@ -226,6 +295,229 @@ class ColBERTReranker(RerankerProtocol):
             # Fallback: return original documents without reranking
             return documents[:effective_top_n]
 
+    @staticmethod
+    def _with_score(doc: RetrievedDocument, score: float) -> RetrievedDocument:
+        return RetrievedDocument(
+            content=doc.content,
+            metadata=doc.metadata,
+            score=score,
+            id=doc.id,
+        )
+
+    def _rerank_precomputed(
+        self,
+        query: str,
+        documents: List[RetrievedDocument],
+        top_n: int,
+    ) -> List[RetrievedDocument]:
+        """Score candidates with one vectorized MaxSim over cached token matrices."""
+        keys = [chunk_hash(doc.content) for doc in documents]
+        self._ensure_cache_loaded()
+        found = self._cached_matrices(keys)
+        missing = {
+            key: doc.content
+            for key, doc in zip(keys, documents, strict=True)
+            if key not in found
+        }
+        if missing:
+            # Candidates outside the precomputed corpus are encoded and kept
+            # in the bounded on-demand cache.
+            encoded = self._encode_documents(list(missing.values()))
+            found.update(self._store_on_demand(zip(missing.keys(), encoded)))
+
+        query_matrix = self._encode_query(query)
+        matrices = [found[key] for key in keys]
+        scores = self._maxsim_scores(query_matrix, matrices)
+
+        order = np.argsort(-scores, kind="stable")[:top_n]
+        reranked = [
+            self._with_score(documents[int(i)], float(scores[int(i)])) for i in order
+        ]
+        logger.info(
+            f"ColBERT reranking complete: {len(documents)} -> {len(reranked)} documents "
+            f"({len(missing)} encoded on demand)"
+        )
+        return reranked
+
+    @staticmethod
+    def _maxsim_scores(
+        query_matrix: np.ndarray, doc_matrices: List[np.ndarray]
+    ) -> np.ndarray:
+        """Late-interaction score: sum over query tokens of max doc-token similarity."""
+        lengths = np.array([m.shape[0] for m in doc_matrices], dtype=np.int64)
+        stacked = np.concatenate(doc_matrices, axis=0).astype(np.float32, copy=False)
+        similarities = stacked @ query_matrix.T  # (total_doc_tokens, query_tokens)
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        per_doc_max = np.maximum.reduceat(similarities, starts, axis=0)
+        return per_doc_max.sum(axis=1)
+
+    def _checkpoint(self) -> Any:
+        checkpoint = getattr(
+            getattr(self._model, "model", None), "inference_ckpt", None
+        )
+        if checkpoint is None:
+            raise PrecomputedScoringUnsupported(
+                "ColBERT inference checkpoint not available"
+            )
+        return checkpoint
+
+    def _encode_query(self, query: str) -> np.ndarray:
+        encoded = self._checkpoint().queryFromText([query])
+        return _to_matrix(encoded[0])
+
+    def _encode_documents(
+        self, texts: List[str], batch_size: int = 32
+    ) -> List[np.ndarray]:
+        if not texts:
+            return []
+        colbert = getattr(self._model, "model", None)
+        set_max_tokens = getattr(colbert, "_set_inference_max_tokens", None)
+        if callable(set_max_tokens):
+            # Match RAGatouille's rerank(): size doc_maxlen to the chunk lengths.
+            set_max_tokens(documents=texts, max_tokens="auto")
+        encoded = self._checkpoint().docFromText(
+            texts, bsize=batch_size, keep_dims=False, to_cpu=True
+        )
+        if isinstance(encoded, tuple):
+            encoded = encoded[0]
+        matrices = [_to_matrix(tensor) for tensor in encoded]
+        if len(matrices) != len(texts):
+            raise PrecomputedScoringUnsupported(
+                "ColBERT returned a different number of documents"
+            )
+        return matrices
+
+    def _store_embeddings(self, items: Iterable[Any]) -> None:
+        with self._cache_lock:
+            for key, matrix in items:
+                # float16 halves memory; scoring upcasts to float32.
+                self._token_cache[key] = matrix.astype(np.float16)
+                self._on_demand_cache.pop(key, None)
+
+    def _cached_matrices(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        with self._cache_lock:
+            for key in keys:
+                matrix = self._token_cache.get(key)
+                if matrix is None:
+                    matrix = self._on_demand_cache.get(key)
+                    if matrix is None:
+                        continue
+                    self._on_demand_cache.move_to_end(key)
+                found[key] = matrix
+        return found
+
+    def _store_on_demand(self, items: Iterable[Any]) -> Dict[str, np.ndarray]:
+        stored: Dict[str, np.ndarray] = {}
+        with self._cache_lock:
+            for key, matrix in items:
+                stored[key] = matrix.astype(np.float16)
+                self._on_demand_cache[key] = stored[key]
+                self._on_demand_cache.move_to_end(key)
+            while len(self._on_demand_cache) > self._on_demand_max_entries:
+                self._on_demand_cache.popitem(last=False)
+        return stored
+
+    def precompute_document_embeddings(
+        self, texts: Iterable[str], batch_size: int = 32
+    ) -> int:
+        """Encode and cache token embeddings for the indexed chunks.
+
+        Only chunks whose content hash is not cached yet are encoded. Cache
+        entries for chunks that are no longer indexed are dropped and the
+        cache is persisted to ``cache_dir``.
+
+        Args:
+            texts: Contents of all indexed chunks
+            batch_size: Encoding batch size
+
+        Returns:
+            Number of chunks newly encoded
+        """
+        if not self._ensure_model_loaded():
+            return 0
+        self._ensure_cache_loaded()
+
+        pending: Dict[str, str] = {}
+        live_keys = set()
+        for text in texts:
+            key = chunk_hash(text)
+            live_keys.add(key)
+            if key not in self._token_cache:
+                pending[key] = text
+
+        pending_items = list(pending.items())
+        for start in range(0, len(pending_items), batch_size):
+            batch = pending_items[start : start + batch_size]
+            matrices = self._encode_documents(
+                [text for _, text in batch], batch_size=batch_size
+            )
+            self._store_embeddings(
+                zip([key for key, _ in batch], matrices, strict=True)
+            )
+
+        with self._cache_lock:
+            for key in set(self._token_cache) - live_keys:
+                del self._token_cache[key]
+        self._save_cache()
+        logger.info(
+            f"ColBERT token embeddings ready for {len(live_keys)} chunks "
+            f"({len(pending_items)} newly encoded)"
+        )
+        return len(pending_items)
+
+    def _ensure_cache_loaded(self) -> None:
+        if self._cache_loaded:
+            return
+        with self._cache_lock:
+            if self._cache_loaded:
+                return
+            self._cache_loaded = True
+            if self.cache_dir is None or not (self.cache_dir / "keys.json").exists():
+                return
+            try:
+                keys = json.loads(
+                    (self.cache_dir / "keys.json").read_text(encoding="utf-8")
+                )
+                tokens = np.load(self.cache_dir / "tokens.npy", mmap_mode="r")
+                offsets = np.load(self.cache_dir / "offsets.npy")
+                for i, key in enumerate(keys):
+                    self._token_cache[key] = tokens[offsets[i] : offsets[i + 1]]
+                logger.info(
+                    f"Loaded ColBERT token embeddings for {len(keys)} chunks "
+                    f"from {self.cache_dir}"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to load ColBERT token cache: {e}")
+                self._token_cache.clear()
+
+    def _save_cache(self) -> None:
+        if self.cache_dir is None:
+            return
+        with self._cache_lock:
+            keys = list(self._token_cache)
+            matrices = [self._token_cache[key] for key in keys]
+        if not matrices:
+            return
+        try:
+            lengths = [m.shape[0] for m in matrices]
+            offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+            staging = self.cache_dir.with_name(self.cache_dir.name + ".tmp")
+            if staging.exists():
+                shutil.rmtree(staging)
+            staging.mkdir(parents=True)
+            np.save(
+                staging / "tokens.npy",
+                np.concatenate(matrices, axis=0).astype(np.float16),
+            )
+            np.save(staging / "offsets.npy", offsets)
+            (staging / "keys.json").write_text(json.dumps(keys), encoding="utf-8")
+            if self.cache_dir.exists():
+                shutil.rmtree(self.cache_dir)
+            staging.rename(self.cache_dir)
+        except Exception as e:
+            logger.warning(f"Failed to persist ColBERT token cache: {e}")
+
     def rerank_with_threshold(
         self,
         query: str,
@@ -268,4 +560,7 @@ class ColBERTReranker(RerankerProtocol):
             "enabled": self.settings.ENABLE_COLBERT_RERANK,
             "top_n": self.top_n,
             "load_error": str(self._load_error) if self._load_error else None,
+            "cached_chunks": len(self._token_cache),
+            "on_demand_cached_chunks": len(self._on_demand_cache),
+            "precomputed_scoring": self._precomputed_supported,
         }
@@ -5,6 +5,7 @@ import re
 from typing import List
 
 from app.services.rag.nli_validator import NLIValidator
+from app.utils.request_trace import trace_span
 from langchain_core.documents import Document
 
 logger = logging.getLogger(__name__)
@@ -47,7 +48,8 @@ class ConfidenceScorer:
 
         # 1. NLI Entailment Score (40%)
         combined_context = "\n".join([doc.page_content for doc in sources[:5]])
-        nli_score = await self.nli.validate_answer_async(combined_context, answer)
+        with trace_span("nli"):
+            nli_score = await self.nli.validate_answer_async(combined_context, answer)
 
         # 2. Source Quality Score (30%)
         source_scores = [doc.metadata.get("source_weight", 0.5) for doc in sources]
@@ -17,7 +17,7 @@ import logging
 import re
 from typing import Dict, List, Set, Tuple
 
-from app.services.rag.bisq_entities import BISQ1_STRONG_KEYWORDS, BISQ2_STRONG_KEYWORDS
+from app.services.rag.bisq_entities import BISQ_KEYWORD_MATCHER
 from app.services.rag.interfaces import RetrievedDocument, RetrieverProtocol
 from langchain_core.documents import Document
 
@@ -33,10 +33,6 @@ _COMPARISON_TOKEN_RE = re.compile(
 )
 
 
-def _keyword_score(query_lower: str, keywords: List[str]) -> int:
-    return sum(1 for keyword in keywords if keyword in query_lower)
-
-
 def _classify_query_protocol(
     query: str, detected_version: str | None = None
 ) -> tuple[bool, bool, bool]:
@@ -64,8 +60,9 @@ def _classify_query_protocol(
     if query_mentions_bisq2:
         return False, True, False
 
-    bisq1_score = _keyword_score(query_lower, BISQ1_STRONG_KEYWORDS)
-    bisq2_score = _keyword_score(query_lower, BISQ2_STRONG_KEYWORDS)
+    keyword_hits = BISQ_KEYWORD_MATCHER.scan(query_lower)
+    bisq1_score = keyword_hits.count("bisq1_strong")
+    bisq2_score = keyword_hits.count("bisq2_strong")
     if bisq1_score > bisq2_score and bisq1_score > 0:
         return True, False, False
     if bisq2_score > bisq1_score and bisq2_score > 0:
@@ -0,0 +1,55 @@
+"""Deterministic local hash embeddings.
+
+Feature-hashes unigrams and bigrams into a fixed number of signed buckets and
+L2-normalizes the result. Vectors depend only on the text and the dimension,
+so indexes built with this provider are reproducible across processes and
+machines without network access or model downloads. Used for offline
+retrieval benchmarks where the cost and ordering of the retrieval pipeline
+matter, not the semantic quality of the embedding model.
+"""
+
+import hashlib
+import re
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class HashEmbeddings(Embeddings):
+    """LangChain-compatible embeddings backed by signed feature hashing.
+
+    Args:
+        dimensions: Size of the produced vectors
+    """
+
+    def __init__(self, dimensions: int = 256):
+        if dimensions <= 0:
+            raise ValueError("dimensions must be positive")
+        self.dimensions = dimensions
+
+    def _features(self, text: str) -> List[str]:
+        tokens = _TOKEN_RE.findall(text.lower())
+        return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    def _embed(self, text: str) -> List[float]:
+        vector = np.zeros(self.dimensions, dtype=np.float64)
+        for feature in self._features(text):
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, byteorder="big")
+            sign = 1.0 if value & 1 else -1.0
+            vector[(value >> 1) % self.dimensions] += sign
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            # Cosine distance is undefined for the zero vector
+            vector[0] = 1.0
+            norm = 1.0
+        return (vector / norm).tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
@@ -0,0 +1,150 @@
+"""Compiled multi-pattern keyword matcher (Aho-Corasick).
+
+Detectors that ask "which of these keywords occur in the text?" share one
+automaton built from all keyword tables, so a single linear pass over the
+lowercased text answers every category at once instead of running one
+substring scan per keyword.
+
+Matching semantics are identical to ``keyword in text``: keywords match as
+substrings, overlapping matches are all reported, and each keyword counts
+once per text regardless of how often it occurs.
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+
+class KeywordHits:
+    """Keywords found in one text, grouped by category on demand.
+
+    ``count()`` is weighted: a keyword listed twice in a category table
+    counts twice, matching ``sum(1 for kw in table if kw in text)``.
+    """
+
+    __slots__ = ("_found", "_keywords", "_tags")
+
+    def __init__(
+        self,
+        found: FrozenSet[int],
+        keywords: List[str],
+        tags: List[Dict[str, Tuple[int, int]]],
+    ):
+        self._found = found
+        self._keywords = keywords
+        # keyword id -> {category: (first table position, weight)}
+        self._tags = tags
+
+    def _hits(self, category: str) -> List[Tuple[int, str, int]]:
+        hits = []
+        for kid in self._found:
+            tag = self._tags[kid].get(category)
+            if tag is not None:
+                hits.append((tag[0], self._keywords[kid], tag[1]))
+        hits.sort()
+        return hits
+
+    def count(self, category: str) -> int:
+        return sum(self._tags[kid].get(category, (0, 0))[1] for kid in self._found)
+
+    def has(self, category: str) -> bool:
+        return any(category in self._tags[kid] for kid in self._found)
+
+    def keywords(self, category: str) -> List[str]:
+        """Matched keywords of a category in table order."""
+        return [keyword for _, keyword, _ in self._hits(category)]
+
+    def first(self, category: str) -> Optional[str]:
+        """Matched keyword that appears earliest in the category table."""
+        hits = self._hits(category)
+        return hits[0][1] if hits else None
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over keyword tables tagged by category.
+
+    Args:
+        tables: Mapping of category name to its keyword list
+        cache_size: Number of recent texts whose hits are memoized
+    """
+
+    def __init__(self, tables: Mapping[str, Iterable[str]], cache_size: int = 512):
+        self._categories: Tuple[str, ...] = tuple(tables)
+
+        keyword_ids: Dict[str, int] = {}
+        tags: Dict[int, Dict[str, List[int]]] = {}
+        for category, keywords in tables.items():
+            for position, keyword in enumerate(keywords):
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                kid = keyword_ids.setdefault(keyword, len(keyword_ids))
+                entry = tags.setdefault(kid, {}).setdefault(category, [position, 0])
+                entry[1] += 1
+
+        self._keywords: List[str] = [""] * len(keyword_ids)
+        for keyword, kid in keyword_ids.items():
+            self._keywords[kid] = keyword
+        self._tags: List[Dict[str, Tuple[int, int]]] = [
+            {category: (entry[0], entry[1]) for category, entry in tags[kid].items()}
+            for kid in range(len(self._keywords))
+        ]
+
+        self._delta, self._outputs = self._compile(self._keywords)
+        self._scan_cached = lru_cache(maxsize=cache_size)(self._scan)
+
+    @property
+    def categories(self) -> Tuple[str, ...]:
+        return self._categories
+
+    @staticmethod
+    def _compile(
+        keywords: List[str],
+    ) -> Tuple[List[Dict[str, int]], List[FrozenSet[int]]]:
+        """Build the trie, failure links and a complete transition table."""
+        goto: List[Dict[str, int]] = [{}]
+        own_outputs: List[List[int]] = [[]]
+        for kid, keyword in enumerate(keywords):
+            node = 0
+            for ch in keyword:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    own_outputs.append([])
+                node = nxt
+            own_outputs[node].append(kid)
+
+        fail = [0] * len(goto)
+        outputs: List[FrozenSet[int]] = [frozenset()] * len(goto)
+        delta: List[Dict[str, int]] = [dict() for _ in goto]
+        delta[0] = dict(goto[0])
+        outputs[0] = frozenset(own_outputs[0])
+
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            outputs[node] = frozenset(own_outputs[node]) | outputs[fail[node]]
+            # Inherit the failure state's transitions, then overlay own edges.
+            delta[node] = {**delta[fail[node]], **goto[node]}
+            for ch, child in goto[node].items():
+                fail[child] = delta[fail[node]].get(ch, 0) if node else 0
+                queue.append(child)
+        return delta, outputs
+
+    def scan(self, text: str) -> KeywordHits:
+        """Return all keyword hits for ``text`` (lowercased internally)."""
+        return self._scan_cached((text or "").lower())
+
+    def _scan(self, text: str) -> KeywordHits:
+        delta = self._delta
+        outputs = self._outputs
+        found: set[int] = set()
+        node = 0
+        for ch in text:
+            node = delta[node].get(ch, 0)
+            if outputs[node]:
+                found.update(outputs[node])
+
+        return KeywordHits(frozenset(found), self._keywords, self._tags)
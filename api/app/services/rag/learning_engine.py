@@ -1,6 +1,8 @@
 """Learning Engine for adaptive threshold tuning based on admin feedback."""
 
+import hashlib
 import logging
+import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -18,9 +20,18 @@ from app.metrics.training_metrics import (
     learning_threshold_updates,
     update_learning_thresholds,
 )
+from app.services.rag.review_log import (
+    InMemoryReviewLog,
+    RepositoryReviewLog,
+    supports_review_log,
+)
+from app.services.rag.review_statistics import ReviewStatistics, review_epoch_seconds
 
 logger = logging.getLogger(__name__)
 
+# Threshold snapshots kept in memory and persisted
+MAX_THRESHOLD_HISTORY = 1000
+
 
 class LearningEngine:
     """
@@ -30,9 +41,17 @@ class LearningEngine:
     - Auto-send threshold (default 95%)
     - Queue threshold (default 70%)
     - Reject threshold (default 50%)
+
+    Reviews live in an append-only log keyed by review id; thresholds and
+    dashboard metrics are read from incrementally maintained statistics, so
+    recording a review does not rescan the history.
     """
 
-    def __init__(self, repository: Optional[Any] = None):
+    def __init__(
+        self,
+        repository: Optional[Any] = None,
+        review_half_life_days: Optional[float] = 90.0,
+    ):
         """Initialize learning engine with default thresholds.
 
         Default thresholds are sourced from central config constants:
@@ -44,6 +63,8 @@ class LearningEngine:
                         If provided, state is loaded on init and saved after
                         each threshold update. Should have save_learning_state()
                         and get_learning_state() methods.
+            review_half_life_days: Age at which a review weighs half as much
+                        in threshold updates; None weighs all reviews equally
         """
         # Store repository for auto-persistence
         self._repository = repository
@@ -57,9 +78,11 @@ class LearningEngine:
         self.learning_rate = 0.01
         self.min_samples_for_update = 50
         self.confidence_interval = 0.95
+        self.review_half_life_days = review_half_life_days
 
         # Historical data storage
-        self._review_history: List[Dict[str, Any]] = []
+        self._reviews: Any = InMemoryReviewLog()
+        self._stats = ReviewStatistics(half_life_days=review_half_life_days)
         self._threshold_history: List[Dict[str, Any]] = []
 
         # Load state from repository if provided
@@ -70,6 +93,11 @@ class LearningEngine:
         if not self._threshold_history:
             self._save_threshold_snapshot("initial")
 
+    @property
+    def _review_history(self) -> Any:
+        """Review log (sized, indexable and iterable in insertion order)."""
+        return self._reviews
+
     def _save_threshold_snapshot(self, reason: str) -> None:
         """Save current thresholds to history and persist to repository if available."""
         self._threshold_history.append(
@@ -81,6 +109,8 @@ class LearningEngine:
                 "reason": reason,
             }
         )
+        if len(self._threshold_history) > MAX_THRESHOLD_HISTORY:
+            del self._threshold_history[:-MAX_THRESHOLD_HISTORY]
 
         # Auto-persist to repository if available (skip for initial snapshot)
         if self._repository is not None and reason != "initial":
@@ -96,17 +126,56 @@ class LearningEngine:
             return
 
         try:
-            self._repository.save_learning_state(
-                auto_send_threshold=self.auto_send_threshold,
-                queue_high_threshold=self.queue_high_threshold,
-                reject_threshold=self.reject_threshold,
-                review_history=self._review_history,
-                threshold_history=self._threshold_history,
-            )
+            self._write_state(self._repository)
             logger.debug("LearningEngine state auto-persisted to repository")
         except Exception as e:
             logger.warning(f"Failed to auto-persist LearningEngine state: {e}")
 
+    def _write_state(self, repository: Any) -> None:
+        """Save thresholds and statistics; reviews go to the repository log.
+
+        Repositories without a review log still receive the full history.
+        """
+        if supports_review_log(repository):
+            self._attach_repository_log(repository)
+            review_history: List[Dict[str, Any]] = []
+        else:
+            review_history = list(self._reviews)
+
+        repository.save_learning_state(
+            auto_send_threshold=self.auto_send_threshold,
+            queue_high_threshold=self.queue_high_threshold,
+            reject_threshold=self.reject_threshold,
+            review_history=review_history,
+            threshold_history=self._threshold_history,
+            review_statistics=self._stats.to_dict(),
+        )
+
+    def _attach_repository_log(self, repository: Any) -> None:
+        """Switch to the repository's review log.
+
+        Reviews recorded in memory so far are copied into the repository log.
+        """
+        if (
+            isinstance(self._reviews, RepositoryReviewLog)
+            and self._reviews.repository is repository
+        ):
+            return
+        log = RepositoryReviewLog(repository)
+        stored = len(log)
+        for record in self._reviews:
+            log.upsert(record)
+        self._reviews = log
+        if stored:
+            self._stats = self._rebuild_statistics()
+
+    @staticmethod
+    def _review_id(question_id: str, metadata: Dict[str, Any]) -> str:
+        """Idempotent reviews are keyed by question, all others are unique."""
+        if metadata.get("idempotent"):
+            return str(question_id)
+        return f"review:{uuid.uuid4().hex}"
+
     def record_review(
         self,
         question_id: str,
@@ -129,6 +198,7 @@ class LearningEngine:
         normalized_action = self._normalize_admin_action(admin_action)
 
         review_record = {
+            "review_id": self._review_id(question_id, metadata_dict),
             "question_id": question_id,
             "confidence": confidence,
             "admin_action": normalized_action,
@@ -137,15 +207,11 @@ class LearningEngine:
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
-        replaced = False
-        if metadata_dict.get("idempotent"):
-            for i, existing in enumerate(self._review_history):
-                if existing.get("question_id") == question_id:
-                    self._review_history[i] = review_record
-                    replaced = True
-                    break
-        if not replaced:
-            self._review_history.append(review_record)
+        previous = self._reviews.upsert(review_record)
+        replaced = previous is not None
+        if replaced:
+            self._stats.remove(previous)
+        self._stats.add(review_record)
 
         # Record metrics for admin review
         learning_reviews_total.labels(admin_action=normalized_action).inc()
@@ -159,46 +225,26 @@ class LearningEngine:
         )
 
         # Check if we should update thresholds
-        if len(self._review_history) >= self.min_samples_for_update:
+        review_count = len(self._reviews)
+        if review_count >= self.min_samples_for_update:
             # Update every 10 new samples, or immediately on idempotent replacement
-            if replaced or len(self._review_history) % 10 == 0:
+            if replaced or review_count % 10 == 0:
                 self._update_thresholds()
 
     def _update_thresholds(self) -> None:
-        """Update thresholds based on review history."""
-        if len(self._review_history) < self.min_samples_for_update:
+        """Update thresholds based on review statistics."""
+        review_count = len(self._reviews)
+        if review_count < self.min_samples_for_update:
             logger.info(
-                f"Insufficient samples ({len(self._review_history)}) "
+                f"Insufficient samples ({review_count}) "
                 f"for threshold update, need {self.min_samples_for_update}"
             )
             return
 
-        # Analyze patterns
-        approved_confidences = [
-            r["confidence"]
-            for r in self._review_history
-            if r["admin_action"] == "approved"
-        ]
-        edited_confidences = [
-            r["confidence"]
-            for r in self._review_history
-            if r["admin_action"] == "edited"
-        ]
-        rejected_confidences = [
-            r["confidence"]
-            for r in self._review_history
-            if r["admin_action"] == "rejected"
-        ]
-
         # Calculate optimal thresholds
-        new_auto_send = self._calculate_auto_send_threshold(
-            approved_confidences, edited_confidences, rejected_confidences
-        )
-        new_queue_high = self._calculate_queue_threshold(
-            approved_confidences, edited_confidences, rejected_confidences
-        )
-        new_reject = self._calculate_reject_threshold(rejected_confidences)
-
+        new_auto_send = self._calculate_auto_send_threshold()
+        new_queue_high = self._calculate_queue_threshold()
+        new_reject = self._calculate_reject_threshold()
         # Apply gradual updates using learning rate
         if new_auto_send is not None:
             old_auto_send = self.auto_send_threshold
@@ -245,78 +291,54 @@ class LearningEngine:
 
         self._save_threshold_snapshot("auto_update")
 
-    def _calculate_auto_send_threshold(
-        self,
-        approved: List[float],
-        edited: List[float],
-        rejected: List[float],
-    ) -> Optional[float]:
+    def _calculate_auto_send_threshold(self) -> Optional[float]:
         """
         Calculate optimal auto-send threshold.
 
         Goal: Find confidence level where nearly all responses are approved without edit.
         """
-        if not approved:
-            return None
-
-        # Find the confidence percentile where 95% of approved (unedited) were good
-        approved_array = np.array(approved)
-
         # Calculate 5th percentile of approved responses
         # This means 95% of approved responses had confidence above this
-        threshold = float(np.percentile(approved_array, 5))
+        threshold = self._stats.quantile(["approved"], 0.05)
+        if threshold is None:
+            return None
 
         # Ensure threshold is reasonable (between 0.8 and 0.99)
-        threshold = max(0.80, min(0.99, threshold))
-
-        return threshold
+        return max(0.80, min(0.99, threshold))
 
-    def _calculate_queue_threshold(
-        self,
-        approved: List[float],
-        edited: List[float],
-        rejected: List[float],
-    ) -> Optional[float]:
+    def _calculate_queue_threshold(self) -> Optional[float]:
         """
         Calculate optimal queue threshold.
 
         Goal: Find confidence level that separates high-priority (likely good) from
         low-priority (likely needs attention).
         """
-        all_positive = approved + edited
-        if not all_positive:
-            return None
-
-        positive_array = np.array(all_positive)
-
         # Find the 25th percentile of positive outcomes
         # Responses above this are likely acceptable (maybe with minor edits)
-        threshold = float(np.percentile(positive_array, 25))
+        threshold = self._stats.quantile(["approved", "edited"], 0.25)
+        if threshold is None:
+            return None
 
         # Ensure threshold is reasonable (between 0.5 and 0.9)
-        threshold = max(0.50, min(0.90, threshold))
+        return max(0.50, min(0.90, threshold))
 
-        return threshold
-
-    def _calculate_reject_threshold(self, rejected: List[float]) -> Optional[float]:
+    def _calculate_reject_threshold(self) -> Optional[float]:
         """
         Calculate optimal reject threshold.
 
         Goal: Find confidence level below which responses are usually rejected.
         """
-        if not rejected or len(rejected) < 5:
+        if self._stats.action_count("rejected") < 5:
             return None
 
-        rejected_array = np.array(rejected)
-
         # Find the 75th percentile of rejected responses
         # Responses below this are likely to be rejected
-        threshold = float(np.percentile(rejected_array, 75))
+        threshold = self._stats.quantile(["rejected"], 0.75)
+        if threshold is None:
+            return None
 
         # Ensure threshold is reasonable (between 0.3 and 0.7)
-        threshold = max(0.30, min(0.70, threshold))
-
-        return threshold
+        return max(0.30, min(0.70, threshold))
 
     def get_current_thresholds(self) -> Dict[str, float]:
         """Get current threshold values."""
@@ -349,7 +371,8 @@ class LearningEngine:
 
         P5: Added error handling for edge cases (empty arrays, NaN values).
         """
-        if not self._review_history:
+        stats = self._stats
+        if stats.total == 0:
             return {
                 "total_reviews": 0,
                 "approval_rate": 0.0,
@@ -362,81 +385,29 @@ class LearningEngine:
                 "answer_quality_needs_work_rate": 0.0,
             }
 
-        faq_reviews = [
-            r
-            for r in self._review_history
-            if r.get("metadata", {}).get("review_kind") != "answer_quality"
-        ]
-        answer_quality_reviews = [
-            r
-            for r in self._review_history
-            if r.get("metadata", {}).get("review_kind") == "answer_quality"
-        ]
-
-        total = len(faq_reviews)
-        approved = sum(1 for r in faq_reviews if r["admin_action"] == "approved")
-        edited = sum(1 for r in faq_reviews if r["admin_action"] == "edited")
-        rejected = sum(1 for r in faq_reviews if r["admin_action"] == "rejected")
-        quality_total = len(answer_quality_reviews)
-        quality_good = sum(
-            1 for r in answer_quality_reviews if r["admin_action"] == "approved"
-        )
-        quality_needs_work = sum(
-            1 for r in answer_quality_reviews if r["admin_action"] == "rejected"
-        )
-
-        # Calculate confidence distribution stats with error handling (P5)
-        try:
-            confidences = [
-                r["confidence"]
-                for r in self._review_history
-                if r.get("confidence") is not None
-            ]
-
-            if confidences:
-                conf_array = np.array(confidences, dtype=float)
-                # Filter out any NaN values
-                conf_array = conf_array[~np.isnan(conf_array)]
-
-                if len(conf_array) > 0:
-                    avg_confidence = float(np.mean(conf_array))
-                    std_confidence = float(np.std(conf_array))
-                    min_confidence = float(np.min(conf_array))
-                    max_confidence = float(np.max(conf_array))
-                else:
-                    avg_confidence = None
-                    std_confidence = None
-                    min_confidence = None
-                    max_confidence = None
-            else:
-                avg_confidence = None
-                std_confidence = None
-                min_confidence = None
-                max_confidence = None
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Error calculating confidence stats: {e}")
-            avg_confidence = None
-            std_confidence = None
-            min_confidence = None
-            max_confidence = None
+        faq_counts = stats.counts["faq"]
+        quality_counts = stats.counts["answer_quality"]
+        total = sum(faq_counts.values())
+        quality_total = sum(quality_counts.values())
+        confidence = stats.confidence_summary()
 
         return {
-            "total_reviews": len(self._review_history),
-            "approval_rate": approved / total if total > 0 else 0.0,
-            "edit_rate": edited / total if total > 0 else 0.0,
-            "rejection_rate": rejected / total if total > 0 else 0.0,
+            "total_reviews": stats.total,
+            "approval_rate": faq_counts["approved"] / total if total > 0 else 0.0,
+            "edit_rate": faq_counts["edited"] / total if total > 0 else 0.0,
+            "rejection_rate": faq_counts["rejected"] / total if total > 0 else 0.0,
             "threshold_updates": len(self._threshold_history),
-            "avg_confidence": avg_confidence,
-            "std_confidence": std_confidence,
-            "min_confidence": min_confidence,
-            "max_confidence": max_confidence,
+            "avg_confidence": confidence["avg"],
+            "std_confidence": confidence["std"],
+            "min_confidence": confidence["min"],
+            "max_confidence": confidence["max"],
             "faq_reviews_total": total,
             "answer_quality_reviews_total": quality_total,
             "answer_quality_good_rate": (
-                quality_good / quality_total if quality_total > 0 else 0.0
+                quality_counts["approved"] / quality_total if quality_total > 0 else 0.0
             ),
             "answer_quality_needs_work_rate": (
-                quality_needs_work / quality_total if quality_total > 0 else 0.0
+                quality_counts["rejected"] / quality_total if quality_total > 0 else 0.0
             ),
         }
 
@@ -458,7 +429,8 @@ class LearningEngine:
 
     def reset_learning(self) -> None:
         """Reset learning data and restore default thresholds."""
-        self._review_history = []
+        self._reviews.clear()
+        self._stats = ReviewStatistics(half_life_days=self.review_half_life_days)
         self._threshold_history = []
         self.auto_send_threshold = PIPELINE_AUTO_APPROVE_THRESHOLD
         self.queue_high_threshold = PIPELINE_SPOT_CHECK_THRESHOLD
@@ -472,7 +444,7 @@ class LearningEngine:
             "current_thresholds": self.get_current_thresholds(),
             "learning_metrics": self.get_learning_metrics(),
             "threshold_history": self._threshold_history,
-            "review_count": len(self._review_history),
+            "review_count": len(self._reviews),
             "exported_at": datetime.now(timezone.utc).isoformat(),
         }
 
@@ -486,16 +458,10 @@ class LearningEngine:
             True if save succeeded, False otherwise (P5: error handling)
         """
         try:
-            repository.save_learning_state(
-                auto_send_threshold=self.auto_send_threshold,
-                queue_high_threshold=self.queue_high_threshold,
-                reject_threshold=self.reject_threshold,
-                review_history=self._review_history,
-                threshold_history=self._threshold_history,
-            )
+            self._write_state(repository)
             logger.info(
                 f"LearningEngine state saved: thresholds={self.get_current_thresholds()}, "
-                f"reviews={len(self._review_history)}"
+                f"reviews={len(self._reviews)}"
             )
             return True
         except Exception as e:
@@ -505,10 +471,17 @@ class LearningEngine:
     def load_state(self, repository: Any) -> None:
         """Load learning engine state from database via repository.
 
+        Reviews saved by older versions as a ``review_history`` blob are moved
+        into the repository's review log. Statistics are restored from their
+        snapshot, or rebuilt from the reviews if the snapshot is missing or
+        does not match the log (e.g. after an unclean shutdown).
+
         Args:
             repository: UnifiedFAQCandidateRepository with get_learning_state method
         """
         state = repository.get_learning_state()
+        if supports_review_log(repository):
+            self._attach_repository_log(repository)
         if state is None:
             logger.info("No saved learning state found, using defaults")
             return
@@ -523,14 +496,66 @@ class LearningEngine:
         self.reject_threshold = state.get("reject_threshold", self.reject_threshold)
 
         # Load history
-        self._review_history = state.get("review_history", [])
+        legacy_reviews = state.get("review_history") or []
+        if not isinstance(self._reviews, RepositoryReviewLog):
+            self._reviews = InMemoryReviewLog()
+        if legacy_reviews and isinstance(self._reviews, RepositoryReviewLog):
+            logger.info(
+                f"Migrating {len(legacy_reviews)} legacy reviews to the review log"
+            )
+        for record in legacy_reviews:
+            self._reviews.upsert(self._with_review_id(record))
         self._threshold_history = state.get("threshold_history", [])
 
+        snapshot = state.get("review_statistics")
+        stats = None
+        if isinstance(snapshot, dict):
+            try:
+                stats = ReviewStatistics.from_dict(
+                    snapshot, half_life_days=self.review_half_life_days
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Ignoring invalid review statistics snapshot: {e}")
+        if stats is None or stats.total != len(self._reviews):
+            stats = self._rebuild_statistics()
+        self._stats = stats
+        if legacy_reviews and isinstance(self._reviews, RepositoryReviewLog):
+            # Empty the legacy blob now instead of at the next clean shutdown
+            self._write_state(repository)
+
         logger.info(
             f"LearningEngine state loaded: thresholds={self.get_current_thresholds()}, "
-            f"reviews={len(self._review_history)}"
+            f"reviews={len(self._reviews)}"
         )
 
+    def _with_review_id(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Assign a review id to a legacy record that predates the review log.
+
+        Ids are derived from the record's content, so migrating the same
+        legacy record again replaces it instead of adding a duplicate.
+        """
+        if record.get("review_id"):
+            return record
+        metadata = record.get("metadata") or {}
+        question_id = record.get("question_id", "")
+        if metadata.get("idempotent"):
+            review_id = self._review_id(question_id, metadata)
+        else:
+            fingerprint = "|".join(
+                str(record.get(field, ""))
+                for field in ("question_id", "timestamp", "admin_action", "confidence")
+            )
+            digest = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:32]
+            review_id = f"review:legacy:{digest}"
+        return {**record, "review_id": review_id}
+
+    def _rebuild_statistics(self) -> ReviewStatistics:
+        """Recompute statistics from the review log in timestamp order."""
+        stats = ReviewStatistics(half_life_days=self.review_half_life_days)
+        for record in sorted(self._reviews, key=review_epoch_seconds):
+            stats.add(record)
+        return stats
+
 
 class LaunchReadinessChecker:
     """
@@ -0,0 +1,496 @@
+"""
+Local in-process vector index used as a fallback for Qdrant.
+
+The index is a snapshot of the Qdrant collection written to ``DATA_DIR`` at
+index time. Dense vectors are stored as a memory-mapped numpy matrix
+(float32, or int8 with a per-row scale) and the BM25 sparse vectors are
+stored as token-major posting lists, so both halves of hybrid search can be
+answered with plain numpy and no external services.
+
+Snapshot layout::
+
+    local_vector_index/
+        manifest.json       format version, dtype, dimensions, build stamp
+        ids.json            Qdrant point ids (same order as matrix rows)
+        payloads.jsonl      one payload per row (content + metadata)
+        dense.npy           (n, d) unit-normalized dense vectors
+        dense_scale.npy     (n,) per-row dequantization scale (int8 only)
+        sparse_tokens.npy   sorted unique BM25 token ids
+        sparse_offsets.npy  posting-list offsets into sparse_docs/values
+        sparse_docs.npy     row ids per posting
+        sparse_values.npy   BM25 weight per posting
+"""
+
+import json
+import logging
+import shutil
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from app.services.rag.bm25_tokenizer import BM25SparseTokenizer
+from app.services.rag.interfaces import RetrievedDocument, RetrieverProtocol
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+SUPPORTED_DTYPES = ("float32", "int8")
+
+_MANIFEST_FILE = "manifest.json"
+_IDS_FILE = "ids.json"
+_PAYLOADS_FILE = "payloads.jsonl"
+
+# int8 rows are dequantized this many at a time, so a query never copies the
+# whole matrix to float32
+_DENSE_BLOCK_ROWS = 4096
+# Per-(key, values) filter masks kept; each is one bool per row
+_MASK_CACHE_MAX_ENTRIES = 64
+
+
+@dataclass
+class LocalVectorIndex:
+    """Dense + sparse vector snapshot searchable with numpy.
+
+    Attributes:
+        ids: Point ids aligned with matrix rows
+        payloads: Point payloads aligned with matrix rows
+        dense: (n, d) unit-normalized dense matrix (float32 or int8)
+        dense_scale: Per-row scale for int8 matrices, None for float32
+        sparse_tokens: Sorted unique BM25 token ids
+        sparse_offsets: Offsets of each token's postings (len(tokens) + 1)
+        sparse_docs: Row ids of all postings, grouped by token
+        sparse_values: BM25 weights of all postings, grouped by token
+        build_stamp: ``last_build`` of the index metadata this snapshot mirrors
+    """
+
+    ids: List[str]
+    payloads: List[Dict[str, Any]]
+    dense: np.ndarray
+    dense_scale: Optional[np.ndarray]
+    sparse_tokens: np.ndarray
+    sparse_offsets: np.ndarray
+    sparse_docs: np.ndarray
+    sparse_values: np.ndarray
+    build_stamp: Optional[float] = None
+    _mask_cache: "OrderedDict[Tuple[str, Tuple[Any, ...]], np.ndarray]" = field(
+        default_factory=OrderedDict, repr=False
+    )
+    _mask_lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dimensions(self) -> int:
+        return int(self.dense.shape[1]) if self.dense.ndim == 2 else 0
+
+    @property
+    def dtype(self) -> str:
+        return "int8" if self.dense_scale is not None else "float32"
+
+    @classmethod
+    def from_vectors(
+        cls,
+        ids: Sequence[str],
+        dense_vectors: Sequence[Sequence[float]],
+        sparse_vectors: Sequence[Tuple[Sequence[int], Sequence[float]]],
+        payloads: Sequence[Dict[str, Any]],
+        dtype: str = "float32",
+        build_stamp: Optional[float] = None,
+    ) -> "LocalVectorIndex":
+        """Build an index from per-point dense and sparse vectors.
+
+        Args:
+            ids: Point ids
+            dense_vectors: Dense embedding per point
+            sparse_vectors: (indices, values) BM25 vector per point
+            payloads: Payload per point (must include ``content``)
+            dtype: Storage dtype for the dense matrix ("float32" or "int8")
+            build_stamp: Build stamp of the mirrored Qdrant index
+
+        Returns:
+            LocalVectorIndex ready for search
+        """
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(
+                f"Unsupported local index dtype '{dtype}' "
+                f"(expected one of {', '.join(SUPPORTED_DTYPES)})"
+            )
+        if not (len(ids) == len(dense_vectors) == len(sparse_vectors) == len(payloads)):
+            raise ValueError("ids, vectors and payloads must have the same length")
+
+        matrix = np.asarray(dense_vectors, dtype=np.float32)
+        if matrix.ndim != 2:
+            matrix = matrix.reshape(len(ids), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms
+
+        dense_scale: Optional[np.ndarray] = None
+        if dtype == "int8":
+            max_abs = np.abs(matrix).max(axis=1) if matrix.size else np.zeros(0)
+            dense_scale = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+            matrix = np.round(matrix / dense_scale[:, None]).astype(np.int8)
+
+        row_ids: List[int] = []
+        token_ids: List[int] = []
+        weights: List[float] = []
+        for row, (indices, values) in enumerate(sparse_vectors):
+            row_ids.extend([row] * len(indices))
+            token_ids.extend(int(i) for i in indices)
+            weights.extend(float(v) for v in values)
+
+        tokens_arr = np.asarray(token_ids, dtype=np.int64)
+        order = np.argsort(tokens_arr, kind="stable")
+        sorted_tokens = tokens_arr[order]
+        unique_tokens, starts = np.unique(sorted_tokens, return_index=True)
+        offsets = np.append(starts, len(sorted_tokens)).astype(np.int64)
+
+        return cls(
+            ids=[str(i) for i in ids],
+            payloads=[dict(p) for p in payloads],
+            dense=matrix,
+            dense_scale=dense_scale,
+            sparse_tokens=unique_tokens.astype(np.int64),
+            sparse_offsets=offsets,
+            sparse_docs=np.asarray(row_ids, dtype=np.int32)[order],
+            sparse_values=np.asarray(weights, dtype=np.float32)[order],
+            build_stamp=build_stamp,
+        )
+
+    def save(self, directory: Path) -> None:
+        """Write the snapshot atomically (staging directory + rename)."""
+        directory = Path(directory)
+        staging = directory.with_name(directory.name + ".tmp")
+        if staging.exists():
+            shutil.rmtree(staging)
+        staging.mkdir(parents=True)
+
+        np.save(staging / "dense.npy", np.ascontiguousarray(self.dense))
+        if self.dense_scale is not None:
+            np.save(staging / "dense_scale.npy", self.dense_scale)
+        np.save(staging / "sparse_tokens.npy", self.sparse_tokens)
+        np.save(staging / "sparse_offsets.npy", self.sparse_offsets)
+        np.save(staging / "sparse_docs.npy", self.sparse_docs)
+        np.save(staging / "sparse_values.npy", self.sparse_values)
+        (staging / _IDS_FILE).write_text(json.dumps(self.ids), encoding="utf-8")
+        with (staging / _PAYLOADS_FILE).open("w", encoding="utf-8") as handle:
+            for payload in self.payloads:
+                handle.write(json.dumps(payload, default=str))
+                handle.write("\n")
+        manifest = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "dtype": self.dtype,
+            "dimensions": self.dimensions,
+            "points": self.size,
+            "build_stamp": self.build_stamp,
+        }
+        (staging / _MANIFEST_FILE).write_text(
+            json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8"
+        )
+
+        if directory.exists():
+            shutil.rmtree(directory)
+        staging.rename(directory)
+
+    @classmethod
+    def load(cls, directory: Path) -> Optional["LocalVectorIndex"]:
+        """Load a snapshot with memory-mapped matrices.
+
+        Returns:
+            LocalVectorIndex, or None if no valid snapshot exists
+        """
+        directory = Path(directory)
+        manifest_path = directory / _MANIFEST_FILE
+        if not manifest_path.exists():
+            return None
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+                logger.info(
+                    "Ignoring local vector index with unsupported format version %s",
+                    manifest.get("format_version"),
+                )
+                return None
+
+            ids = json.loads((directory / _IDS_FILE).read_text(encoding="utf-8"))
+            payloads = [
+                json.loads(line)
+                for line in (directory / _PAYLOADS_FILE)
+                .read_text(encoding="utf-8")
+                .splitlines()
+                if line.strip()
+            ]
+            scale_path = directory / "dense_scale.npy"
+            index = cls(
+                ids=ids,
+                payloads=payloads,
+                dense=np.load(directory / "dense.npy", mmap_mode="r"),
+                dense_scale=(
+                    np.load(scale_path, mmap_mode="r") if scale_path.exists() else None
+                ),
+                sparse_tokens=np.load(directory / "sparse_tokens.npy"),
+                sparse_offsets=np.load(directory / "sparse_offsets.npy"),
+                sparse_docs=np.load(directory / "sparse_docs.npy", mmap_mode="r"),
+                sparse_values=np.load(directory / "sparse_values.npy", mmap_mode="r"),
+                build_stamp=manifest.get("build_stamp"),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load local vector index from {directory}: {e}")
+            return None
+
+        if not (len(index.ids) == len(index.payloads) == index.dense.shape[0]):
+            logger.warning(
+                f"Local vector index at {directory} is inconsistent; ignoring it"
+            )
+            return None
+        return index
+
+    def dense_scores(self, query_vector: Sequence[float]) -> np.ndarray:
+        """Cosine similarity of the query against every row."""
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0 or query.shape[0] != self.dimensions:
+            return np.zeros(self.size, dtype=np.float32)
+        query = query / norm
+        if self.dense_scale is None:
+            return np.asarray(self.dense @ query, dtype=np.float32)
+        scores = np.empty(self.size, dtype=np.float32)
+        for start in range(0, self.size, _DENSE_BLOCK_ROWS):
+            end = min(start + _DENSE_BLOCK_ROWS, self.size)
+            block = np.asarray(self.dense[start:end], dtype=np.float32)
+            np.matmul(block, query, out=scores[start:end])
+        scores *= self.dense_scale
+        return scores
+
+    def sparse_scores(
+        self, indices: Sequence[int], values: Sequence[float]
+    ) -> np.ndarray:
+        """Dot product of the BM25 query vector with every row."""
+        scores = np.zeros(self.size, dtype=np.float32)
+        if not len(indices) or not self.sparse_tokens.size:
+            return scores
+        tokens = np.asarray(indices, dtype=np.int64)
+        positions = np.searchsorted(self.sparse_tokens, tokens)
+        for token, position, weight in zip(tokens, positions, values, strict=True):
+            if (
+                position >= self.sparse_tokens.size
+                or self.sparse_tokens[position] != token
+            ):
+                continue
+            start = self.sparse_offsets[position]
+            end = self.sparse_offsets[position + 1]
+            # Rows are unique within one posting list, so fancy-index += is safe.
+            scores[self.sparse_docs[start:end]] += float(weight) * np.asarray(
+                self.sparse_values[start:end]
+            )
+        return scores
+
+    def filter_mask(
+        self, filter_dict: Optional[Dict[str, Any]]
+    ) -> Optional[np.ndarray]:
+        """Boolean row mask matching Qdrant MatchValue/MatchAny semantics."""
+        if not filter_dict:
+            return None
+        mask = np.ones(self.size, dtype=bool)
+        for key, value in filter_dict.items():
+            allowed = tuple(value) if isinstance(value, list) else (value,)
+            cache_key = (key, allowed)
+            with self._mask_lock:
+                key_mask = self._mask_cache.get(cache_key)
+                if key_mask is not None:
+                    self._mask_cache.move_to_end(cache_key)
+            if key_mask is None:
+                key_mask = np.fromiter(
+                    (
+                        _payload_matches(payload.get(key), allowed)
+                        for payload in self.payloads
+                    ),
+                    dtype=bool,
+                    count=self.size,
+                )
+                with self._mask_lock:
+                    self._mask_cache[cache_key] = key_mask
+                    while len(self._mask_cache) > _MASK_CACHE_MAX_ENTRIES:
+                        self._mask_cache.popitem(last=False)
+            mask &= key_mask
+        return mask
+
+    def to_document(self, row: int, score: float) -> RetrievedDocument:
+        payload = self.payloads[row]
+        return RetrievedDocument(
+            content=payload.get("content", payload.get("text", "")),
+            metadata={
+                key: val
+                for key, val in payload.items()
+                if key not in ("content", "text")
+            },
+            score=float(score),
+            id=self.ids[row],
+        )
+
+
+def _payload_matches(value: Any, allowed: Tuple[Any, ...]) -> bool:
+    if isinstance(value, list):
+        return any(item in allowed for item in value)
+    return value in allowed
+
+
+def _top_rows(
+    scores: np.ndarray, limit: int, mask: Optional[np.ndarray], positive_only: bool
+) -> np.ndarray:
+    """Row ids of the ``limit`` highest scores (descending), honoring the mask."""
+    eligible = np.ones(scores.shape[0], dtype=bool) if mask is None else mask.copy()
+    if positive_only:
+        eligible &= scores > 0
+    candidates = np.flatnonzero(eligible)
+    if candidates.size == 0 or limit <= 0:
+        return candidates[:0]
+    candidate_scores = scores[candidates]
+    if candidates.size > limit:
+        top = np.argpartition(-candidate_scores, limit - 1)[:limit]
+        candidates = candidates[top]
+        candidate_scores = candidate_scores[top]
+    order = np.argsort(-candidate_scores, kind="stable")
+    return candidates[order]
+
+
+def _normalize(rows: np.ndarray, scores: np.ndarray) -> Dict[int, float]:
+    """Min-max normalize the scores of ``rows`` (mirrors the Qdrant retriever)."""
+    if rows.size == 0:
+        return {}
+    values = scores[rows]
+    low = float(values.min())
+    high = float(values.max())
+    if high == low:
+        return {int(row): 1.0 for row in rows}
+    return {
+        int(row): (float(value) - low) / (high - low)
+        for row, value in zip(rows, values, strict=True)
+    }
+
+
+class LocalVectorRetriever(RetrieverProtocol):
+    """Retriever that searches a LocalVectorIndex in-process.
+
+    Scoring mirrors QdrantHybridRetriever: cosine similarity for dense search,
+    BM25 dot product for sparse search, and min-max normalized weighted fusion
+    for hybrid search. If the query embedding cannot be computed (e.g. the
+    embedding API is unreachable), dense search degrades to BM25-only.
+    """
+
+    def __init__(
+        self,
+        index: LocalVectorIndex,
+        embeddings: Any = None,
+        bm25_tokenizer: Optional[BM25SparseTokenizer] = None,
+        semantic_weight: float = 0.6,
+        keyword_weight: float = 0.4,
+    ):
+        """Initialize the local retriever.
+
+        Args:
+            index: Loaded local vector index
+            embeddings: Embedding model used for query vectors (optional)
+            bm25_tokenizer: Tokenizer sharing the index's BM25 vocabulary
+            semantic_weight: Dense weight for retrieve_with_scores()
+            keyword_weight: Sparse weight for retrieve_with_scores()
+        """
+        self.index = index
+        self._embeddings = embeddings
+        self._bm25_tokenizer = bm25_tokenizer or BM25SparseTokenizer()
+        self.semantic_weight = semantic_weight
+        self.keyword_weight = keyword_weight
+
+    @property
+    def size(self) -> int:
+        return self.index.size
+
+    def health_check(self) -> bool:
+        return self.index.size > 0
+
+    def retrieve(
+        self,
+        query: str,
+        k: int = 10,
+        filter_dict: Optional[Dict[str, Any]] = None,
+    ) -> List[RetrievedDocument]:
+        return self.retrieve_hybrid(
+            query=query,
+            k=k,
+            semantic_weight=1.0,
+            keyword_weight=0.0,
+            filter_dict=filter_dict,
+        )
+
+    def retrieve_with_scores(
+        self,
+        query: str,
+        k: int = 10,
+        filter_dict: Optional[Dict[str, Any]] = None,
+    ) -> List[RetrievedDocument]:
+        return self.retrieve_hybrid(
+            query=query,
+            k=k,
+            semantic_weight=self.semantic_weight,
+            keyword_weight=self.keyword_weight,
+            filter_dict=filter_dict,
+        )
+
+    def retrieve_hybrid(
+        self,
+        query: str,
+        k: int = 10,
+        semantic_weight: float = 0.7,
+        keyword_weight: float = 0.3,
+        filter_dict: Optional[Dict[str, Any]] = None,
+    ) -> List[RetrievedDocument]:
+        """Retrieve using weighted dense + sparse search over the local index."""
+        if self.index.size == 0 or k <= 0:
+            return []
+
+        mask = self.index.filter_mask(filter_dict)
+        dense = self._dense_scores(query) if semantic_weight > 0 else None
+        if dense is None and semantic_weight > 0:
+            # Embeddings unavailable: answer from BM25 alone.
+            semantic_weight, keyword_weight = 0.0, 1.0
+
+        if keyword_weight == 0 and dense is not None:
+            rows = _top_rows(dense, k, mask, positive_only=False)
+            return [self.index.to_document(int(r), dense[r]) for r in rows]
+
+        indices, values = self._bm25_tokenizer.tokenize_query(query)
+        sparse = self.index.sparse_scores(indices, values)
+        if semantic_weight == 0 or dense is None:
+            rows = _top_rows(sparse, k, mask, positive_only=True)
+            return [self.index.to_document(int(r), sparse[r]) for r in rows]
+
+        fetch_limit = k * 3
+        dense_norm = _normalize(
+            _top_rows(dense, fetch_limit, mask, positive_only=False), dense
+        )
+        sparse_norm = _normalize(
+            _top_rows(sparse, fetch_limit, mask, positive_only=True), sparse
+        )
+        combined = {
+            row: semantic_weight * dense_norm.get(row, 0.0)
+            + keyword_weight * sparse_norm.get(row, 0.0)
+            for row in set(dense_norm) | set(sparse_norm)
+        }
+        ranked = sorted(combined, key=lambda row: combined[row], reverse=True)[:k]
+        return [self.index.to_document(row, combined[row]) for row in ranked]
+
+    def _dense_scores(self, query: str) -> Optional[np.ndarray]:
+        if self._embeddings is None or self.index.dimensions == 0:
+            return None
+        try:
+            return self.index.dense_scores(self._embeddings.embed_query(query))
+        except Exception as e:
+            logger.warning(f"Local index query embedding failed, using BM25 only: {e}")
+            return None
@@ -48,6 +48,7 @@ class NLIValidator:
         enable_cache: bool = False,
         cache_size: int = 1000,
         cache_ttl_seconds: float = 3600.0,
+        eager: bool = True,
     ):
         """Initialize NLI pipeline with lightweight model.
 
@@ -55,8 +56,12 @@ class NLIValidator:
             enable_cache: Whether to enable result caching
             cache_size: Maximum cache entries
             cache_ttl_seconds: Time-to-live for cache entries
+            eager: Load the model now; otherwise neutral scores are returned
+                until load_model() is called (e.g. by a startup warm-up task)
         """
         self.nli_pipeline: Optional[Any] = None
+        self._load_lock = threading.Lock()
+        self._load_attempted = False
         self._cache_enabled = enable_cache
         self._cache_size = cache_size
         self._cache_ttl = cache_ttl_seconds
@@ -65,22 +70,45 @@ class NLIValidator:
         self._cache_hits = 0
         self._cache_misses = 0
 
-        if pipeline is not None:
-            try:
-                self.nli_pipeline = pipeline(
-                    "text-classification",
-                    model="cross-encoder/nli-deberta-v3-small",
-                    device=-1,  # CPU for compatibility
-                )
-            except Exception as e:
-                logger.error(f"Failed to initialize NLI pipeline: {e}")
-                self.nli_pipeline = None
+        if eager:
+            self.load_model()
 
         if enable_cache:
             logger.info(
                 f"NLI caching enabled: size={cache_size}, ttl={cache_ttl_seconds}s"
             )
 
+    def load_model(self) -> bool:
+        """Load the NLI pipeline once; returns whether it is available."""
+        with self._load_lock:
+            if self._load_attempted:
+                return self.nli_pipeline is not None
+            if pipeline is not None:
+                try:
+                    self.nli_pipeline = pipeline(
+                        "text-classification",
+                        model="cross-encoder/nli-deberta-v3-small",
+                        device=-1,  # CPU for compatibility
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to initialize NLI pipeline: {e}")
+                    self.nli_pipeline = None
+            self._load_attempted = True
+            return self.nli_pipeline is not None
+
+    def is_loaded(self) -> bool:
+        return self.nli_pipeline is not None
+
+    def _neutral_score(self, answer: str, source_text: str) -> float:
+        """Score used while no model is available.
+
+        Only cached once loading was attempted; before that the model may
+        still arrive and real scores must not be shadowed.
+        """
+        if self._load_attempted:
+            self._add_to_cache(answer, source_text, 0.5)
+        return 0.5
+
     def _get_cache_key(self, answer: str, source_text: str) -> str:
         """Generate cache key for answer/source pair."""
         combined = f"{answer}|||{source_text}"
@@ -154,10 +182,9 @@ class NLIValidator:
         if cached is not None:
             return cached
 
-        # Return and cache neutral score if pipeline not available
+        # Return neutral score if pipeline not available
         if self.nli_pipeline is None:
-            self._add_to_cache(answer, source_text, 0.5)
-            return 0.5
+            return self._neutral_score(answer, source_text)
 
         # Run inference
         score = self._run_inference(source_text, answer)
@@ -189,10 +216,9 @@ class NLIValidator:
         if cached is not None:
             return cached
 
-        # Return and cache neutral score if pipeline not available
+        # Return neutral score if pipeline not available
         if self.nli_pipeline is None:
-            self._add_to_cache(answer, context, 0.5)
-            return 0.5
+            return self._neutral_score(answer, context)
 
         # Run CPU-bound inference in thread pool to avoid blocking event loop
         score = await asyncio.to_thread(self._run_inference, context, answer)
@@ -270,9 +296,9 @@ class NLIValidator:
                 f"got {len(contexts)} and {len(answers)}"
             )
 
-        # Return and cache neutral scores if pipeline not available
+        # Return neutral scores if pipeline not available (cached once final)
         if self.nli_pipeline is None:
-            if cache_results:
+            if cache_results and self._load_attempted:
                 for context, answer in zip(contexts, answers, strict=True):
                     self._add_to_cache(answer, context, 0.5)
             return [0.5] * len(contexts)
@@ -14,7 +14,13 @@ import logging
 import re
 from typing import Any, Dict, List, Literal, Optional, Tuple, Union, overload
 
-from app.services.rag.bisq_entities import BISQ1_STRONG_KEYWORDS, BISQ2_STRONG_KEYWORDS
+from app.services.rag.bisq_entities import (
+    BISQ1_DOMAIN_CONTEXT_KEYWORDS,
+    BISQ1_STRONG_KEYWORDS,
+    BISQ2_DOMAIN_CONTEXT_KEYWORDS,
+    BISQ2_STRONG_KEYWORDS,
+    BISQ_KEYWORD_MATCHER,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -47,38 +53,8 @@ class ProtocolDetector:
     BISQ1_KEYWORDS = BISQ1_STRONG_KEYWORDS
 
     BISQ2_KEYWORDS = BISQ2_STRONG_KEYWORDS
-    BISQ1_DOMAIN_CONTEXT_KEYWORDS = (
-        "dao",
-        "bsq",
-        "arbitration",
-        "arbitrator",
-        "multisig",
-        "2-of-2",
-        "delayed payout",
-        "spv",
-        "signed account",
-        "account signing",
-        "account age witness",
-        "account info signed",
-        "account limits",
-        "deposit transaction",
-        "deposit txid",
-        "ctrl+o",
-        "ctrl + o",
-        "ctrl-o",
-    )
-    BISQ2_DOMAIN_CONTEXT_KEYWORDS = (
-        "bisq easy",
-        "reputation score",
-        "reputation system",
-        "bonded roles",
-        "multiple identities",
-        "600 usd",
-        "$600",
-        "offerbook",
-        "current offers",
-        "available offers",
-    )
+    BISQ1_DOMAIN_CONTEXT_KEYWORDS = BISQ1_DOMAIN_CONTEXT_KEYWORDS
+    BISQ2_DOMAIN_CONTEXT_KEYWORDS = BISQ2_DOMAIN_CONTEXT_KEYWORDS
     OPERATIONAL_SUPPORT_PATTERNS = (
         r"\bopen(?:\s+(?:a|the))?\s+mediation\b",
         r"\b(open|start|begin)\s+(?:a\s+)?dispute\b",
@@ -388,11 +364,11 @@ class ProtocolDetector:
                 return comparator_target
             return None
         if has_bisq1:
-            if self._has_domain_context(text, self.BISQ2_DOMAIN_CONTEXT_KEYWORDS):
+            if BISQ_KEYWORD_MATCHER.scan(text).has("bisq2_domain"):
                 return ("Unknown", 0.0)
             return ("Bisq 1", 0.95)
         if has_bisq2:
-            if self._has_domain_context(text, self.BISQ1_DOMAIN_CONTEXT_KEYWORDS):
+            if BISQ_KEYWORD_MATCHER.scan(text).has("bisq1_domain"):
                 return ("Unknown", 0.0)
             return ("Bisq 2", 0.95)
         return None
@@ -408,10 +384,6 @@ class ProtocolDetector:
     def _has_bisq2_mention(text: str) -> bool:
         return bool(re.search(r"\bbisq\s*2\b|\bbisq2\b", text))
 
-    @staticmethod
-    def _has_domain_context(text: str, keywords: Tuple[str, ...]) -> bool:
-        return any(keyword in text for keyword in keywords)
-
     def _target_from_comparator_phrase(self, text: str) -> Optional[Tuple[str, float]]:
         """Infer the target version when the other version is only a comparator."""
         comparator = r"(?:connects?|works?|runs?|opens?)"
@@ -432,8 +404,9 @@ class ProtocolDetector:
 
     def _check_keywords(self, text: str) -> Tuple[str, float]:
         """Score based on version-specific keywords."""
-        bisq1_score = sum(1 for kw in self.BISQ1_KEYWORDS if kw in text)
-        bisq2_score = sum(1 for kw in self.BISQ2_KEYWORDS if kw in text)
+        hits = BISQ_KEYWORD_MATCHER.scan(text)
+        bisq1_score = hits.count("bisq1_strong")
+        bisq2_score = hits.count("bisq2_strong")
 
         if bisq1_score > bisq2_score and bisq1_score > 0:
             confidence = min(0.7 + (bisq1_score * 0.1), 0.95)
@@ -501,8 +474,9 @@ class ProtocolDetector:
             return ("Bisq 2", 0.80)
 
         # Check for keyword patterns in history
-        bisq1_found = any(kw in content for kw in self.BISQ1_KEYWORDS[:5])
-        bisq2_found = any(kw in content for kw in self.BISQ2_KEYWORDS[:5])
+        hits = BISQ_KEYWORD_MATCHER.scan(content)
+        bisq1_found = hits.has("bisq1_history")
+        bisq2_found = hits.has("bisq2_history")
 
         if bisq1_found and bisq2_found:
             return None
@@ -520,22 +494,22 @@ class ProtocolDetector:
         1. Use context-aware defaults based on question keywords
         2. Fall back to generic version question if no context matches
         """
-        question_lower = question.lower()
+        hits = BISQ_KEYWORD_MATCHER.scan(question)
 
         # Context-aware clarifying questions
-        if any(kw in question_lower for kw in ["trade", "payment", "buy", "sell"]):
+        if hits.has("clarify_trade"):
             return "Are you using Bisq 1 trading or Bisq Easy (Bisq 2)?"
 
-        if any(kw in question_lower for kw in ["wallet", "bitcoin", "btc"]):
+        if hits.has("clarify_wallet"):
             return "Which Bisq version's wallet are you asking about?"
 
-        if any(kw in question_lower for kw in ["reputation", "profile"]):
+        if hits.has("clarify_reputation"):
             return "Are you asking about Bisq 2's reputation system, or transferring Bisq 1 reputation?"
 
-        if any(kw in question_lower for kw in ["dao", "bsq", "voting"]):
+        if hits.has("clarify_dao"):
             return "This sounds like a Bisq 1 DAO question. Is that correct, or are you asking about Bisq 2?"
 
-        if any(kw in question_lower for kw in ["mediator", "mediation", "dispute"]):
+        if hits.has("clarify_mediation"):
             return "Are you asking about mediation in Bisq 1, or Bisq Easy (Bisq 2)? Both versions have mediators."
 
         # Generic fallback
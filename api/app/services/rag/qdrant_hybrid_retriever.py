@@ -16,6 +16,7 @@ from typing import Any, Dict, List, Optional
 from app.core.config import Settings
 from app.services.rag.bm25_tokenizer import BM25SparseTokenizer
 from app.services.rag.interfaces import HybridRetrieverProtocol, RetrievedDocument
+from app.utils.request_trace import trace_span
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as rest
 from qdrant_client.http.exceptions import ResponseHandlingException
@@ -48,6 +49,7 @@ class QdrantHybridRetriever(HybridRetrieverProtocol):
         client: Optional[QdrantClient] = None,
         embeddings=None,
         bm25_tokenizer: Optional[BM25SparseTokenizer] = None,
+        raise_on_error: bool = False,
     ):
         """Initialize the Qdrant hybrid retriever.
 
@@ -56,6 +58,8 @@ class QdrantHybridRetriever(HybridRetrieverProtocol):
             client: Optional pre-configured QdrantClient (for testing)
             embeddings: Optional embedding model (defaults to OpenAI provider)
             bm25_tokenizer: Optional BM25 tokenizer (defaults to loading from file)
+            raise_on_error: Re-raise search errors instead of returning [] (used
+                when wrapped by ResilientRetriever so failures trigger fallback)
         """
         self.settings = settings
         self.collection_name = settings.QDRANT_COLLECTION
@@ -78,6 +82,7 @@ class QdrantHybridRetriever(HybridRetrieverProtocol):
         else:
             self._bm25_tokenizer = self._load_bm25_tokenizer()
 
+        self.raise_on_error = raise_on_error
         self._is_healthy: Optional[bool] = None
 
     def _create_client(self) -> QdrantClient:
@@ -93,7 +98,9 @@ class QdrantHybridRetriever(HybridRetrieverProtocol):
             host=self.settings.QDRANT_HOST,
             port=self.settings.QDRANT_PORT,
             prefer_grpc=False,  # Use HTTP for simpler deployment
-            timeout=30,
+            # Bounds how long a call abandoned by the latency budget keeps
+            # its ResilientRetriever worker
+            timeout=self.settings.QDRANT_SEARCH_TIMEOUT_SECONDS,
         )
 
     def _create_embeddings(self):
@@ -144,6 +151,11 @@ class QdrantHybridRetriever(HybridRetrieverProtocol):
         """Get the Qdrant client instance."""
         return self._client
 
+    @property
+    def bm25_tokenizer(self) -> BM25SparseTokenizer:
+        """Get the BM25 tokenizer used for query-side sparse vectors."""
+        return self._bm25_tokenizer
+
     def health_check(self) -> bool:
         """Check if Qdrant is healthy and accessible.
 
@@ -191,7 +203,8 @@ class QdrantHybridRetriever(HybridRetrieverProtocol):
         Returns:
             Embedding vector as list of floats
         """
-        return self._embeddings.embed_query(query)
+        with trace_span("retrieval.embed_query"):
+            return self._embeddings.embed_query(query)
 
     def _build_filter(
         self, filter_dict: Optional[Dict[str, Any]] = None
@@ -243,14 +256,15 @@ class QdrantHybridRetriever(HybridRetrieverProtocol):
         """
         if hasattr(self._client, "query_points"):
             try:
-                resp = self._client.query_points(
-                    collection_name=self.collection_name,
-                    query=query,
-                    using=using,
-                    limit=limit,
-                    query_filter=query_filter,
-                    with_payload=with_payload,
-                )
+                with trace_span(f"retrieval.qdrant.{using}", limit=limit):
+                    resp = self._client.query_points(
+                        collection_name=self.collection_name,
+                        query=query,
+                        using=using,
+                        limit=limit,
+                        query_filter=query_filter,
+                        with_payload=with_payload,
+                    )
                 if isinstance(resp, list):
                     return resp
 
@@ -324,13 +338,18 @@ class QdrantHybridRetriever(HybridRetrieverProtocol):
         Returns:
             List of RetrievedDocument objects with scores populated
         """
-        return self.retrieve_hybrid(
-            query=query,
-            k=k,
-            semantic_weight=self.settings.HYBRID_SEMANTIC_WEIGHT,
-            keyword_weight=self.settings.HYBRID_KEYWORD_WEIGHT,
-            filter_dict=filter_dict,
-        )
+        with trace_span(
+            "retrieval.search", k=k, protocol=(filter_dict or {}).get("protocol")
+        ) as span:
+            results = self.retrieve_hybrid(
+                query=query,
+                k=k,
+                semantic_weight=self.settings.HYBRID_SEMANTIC_WEIGHT,
+                keyword_weight=self.settings.HYBRID_KEYWORD_WEIGHT,
+                filter_dict=filter_dict,
+            )
+            span.set(documents=len(results))
+            return results
 
     def retrieve_hybrid(
         self,
@@ -397,6 +416,8 @@ class QdrantHybridRetriever(HybridRetrieverProtocol):
 
         except Exception as e:
             logger.error(f"Qdrant hybrid search failed: {e}", exc_info=True)
+            if self.raise_on_error:
+                raise
             return []
 
     def _weighted_hybrid_search(
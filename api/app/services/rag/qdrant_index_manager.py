@@ -9,6 +9,7 @@ from typing import Any, Dict, Iterable, List, Optional
 
 from app.core.config import Settings
 from app.services.rag.bm25_tokenizer import BM25SparseTokenizer
+from app.services.rag.local_vector_index import LocalVectorIndex
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from qdrant_client import QdrantClient
@@ -75,6 +76,10 @@ class QdrantIndexManager:
         self.vocab_path = self.data_dir / getattr(
             settings, "BM25_VOCABULARY_FILE", "bm25_vocabulary.json"
         )
+        self.local_index_path = self.data_dir / "local_vector_index"
+        self.local_index_enabled = bool(
+            getattr(settings, "ENABLE_LOCAL_FALLBACK_INDEX", False)
+        )
 
         self._client = client or QdrantClient(
             host=settings.QDRANT_HOST,
@@ -322,6 +327,11 @@ class QdrantIndexManager:
         total = len(documents)
         upserted = 0
         start = time.time()
+        # Vectors kept for the local fallback snapshot (written after success).
+        local_ids: List[str] = []
+        local_dense: List[List[float]] = []
+        local_sparse: List[Any] = []
+        local_payloads: List[Dict[str, Any]] = []
 
         for batch_docs in self._iter_batches(documents, embed_batch_size):
             batch_texts = [d.page_content or "" for d in batch_docs]
@@ -336,6 +346,13 @@ class QdrantIndexManager:
                 sparse_idx, sparse_val = tokenizer.vectorize_document_static(content)
                 point_id = _stable_int_id(self._build_doc_key(doc))
 
+                payload = {"content": content, **md}
+                if self.local_index_enabled:
+                    local_ids.append(str(point_id))
+                    local_dense.append(list(dense_vec))
+                    local_sparse.append((sparse_idx, sparse_val))
+                    local_payloads.append(payload)
+
                 points.append(
                     rest.PointStruct(
                         id=point_id,
@@ -345,10 +362,7 @@ class QdrantIndexManager:
                                 indices=sparse_idx, values=sparse_val
                             ),
                         },
-                        payload={
-                            "content": content,
-                            **md,
-                        },
+                        payload=payload,
                     )
                 )
 
@@ -381,6 +395,21 @@ class QdrantIndexManager:
         }
         self.save_metadata(meta)
 
+        if self.local_index_enabled:
+            try:
+                self._save_local_index(
+                    LocalVectorIndex.from_vectors(
+                        ids=local_ids,
+                        dense_vectors=local_dense,
+                        sparse_vectors=local_sparse,
+                        payloads=local_payloads,
+                        dtype=self._local_index_dtype(),
+                        build_stamp=meta.get("last_build"),
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Failed to write local fallback vector index: {e}")
+
         logger.info(
             f"Qdrant index rebuild complete in {duration:.2f}s (points={upserted})"
         )
@@ -391,3 +420,102 @@ class QdrantIndexManager:
             "points_upserted": upserted,
             "collection": info,
         }
+
+    def _local_index_dtype(self) -> str:
+        dtype = getattr(self.settings, "LOCAL_FALLBACK_INDEX_DTYPE", "float32")
+        return dtype if isinstance(dtype, str) else "float32"
+
+    def _save_local_index(self, index: LocalVectorIndex) -> None:
+        index.save(self.local_index_path)
+        logger.info(
+            f"Local fallback vector index saved to {self.local_index_path} "
+            f"(points={index.size}, dtype={index.dtype})"
+        )
+
+    def ensure_local_index(self) -> Optional[LocalVectorIndex]:
+        """Load the local fallback snapshot, exporting it from Qdrant if stale.
+
+        The snapshot is normally written by rebuild_index(). When the Qdrant
+        collection was built without one (or by an older build), the points
+        are scrolled out of Qdrant once and persisted.
+
+        Returns:
+            LocalVectorIndex, or None if disabled or unavailable
+        """
+        if not self.local_index_enabled:
+            return None
+
+        existing = LocalVectorIndex.load(self.local_index_path)
+        build_stamp = self.load_metadata().get("last_build")
+        if existing is not None and existing.build_stamp == build_stamp:
+            return existing
+
+        try:
+            exported = self.export_local_index(build_stamp=build_stamp)
+        except Exception as e:
+            logger.warning(f"Failed to export local fallback vector index: {e}")
+            return existing
+        if exported is None:
+            return existing
+        self._save_local_index(exported)
+        # Reload so matrices are served from the memory-mapped snapshot.
+        return LocalVectorIndex.load(self.local_index_path) or exported
+
+    def export_local_index(
+        self, build_stamp: Optional[float] = None, page_size: int = 256
+    ) -> Optional[LocalVectorIndex]:
+        """Scroll all points (with vectors) out of Qdrant into a local index."""
+        if not self.collection_exists():
+            return None
+
+        ids: List[str] = []
+        dense: List[List[float]] = []
+        sparse: List[Any] = []
+        payloads: List[Dict[str, Any]] = []
+        offset = None
+        while True:
+            points, offset = self._client.scroll(
+                collection_name=self.collection_name,
+                limit=page_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=True,
+            )
+            for point in points:
+                vectors = point.vector if isinstance(point.vector, dict) else {}
+                dense_vec = vectors.get("dense")
+                # Only plain dense vectors (not sparse or multi-vectors) can
+                # seed the local index
+                if not isinstance(dense_vec, list):
+                    continue
+                dense_values = [
+                    float(value)
+                    for value in dense_vec
+                    if isinstance(value, (int, float))
+                ]
+                if not dense_values or len(dense_values) != len(dense_vec):
+                    continue
+                sparse_vec = vectors.get("sparse")
+                ids.append(str(point.id))
+                dense.append(dense_values)
+                sparse.append(
+                    (
+                        list(getattr(sparse_vec, "indices", []) or []),
+                        list(getattr(sparse_vec, "values", []) or []),
+                    )
+                )
+                payloads.append(dict(point.payload or {}))
+            if offset is None:
+                break
+
+        if not ids:
+            return None
+        logger.info(f"Exported {len(ids)} points from Qdrant for local fallback index")
+        return LocalVectorIndex.from_vectors(
+            ids=ids,
+            dense_vectors=dense,
+            sparse_vectors=sparse,
+            payloads=payloads,
+            dtype=self._local_index_dtype(),
+            build_stamp=build_stamp,
+        )
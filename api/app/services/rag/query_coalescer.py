@@ -0,0 +1,156 @@
+"""
+In-flight coalescing of concurrent RAG queries.
+
+When a release breaks something, many users ask the same question within
+seconds, each starting a full pipeline run (translation, retrieval, LLM
+generation). ``QueryCoalescer`` is a keyed single-flight: the first query for
+a key becomes the leader and runs the pipeline, and queries arriving while it
+runs await the leader's result instead of starting their own. Each caller
+gets its own copy of the result, so channel delivery and personalization
+stay per user.
+
+Keys combine a scope (source channel, language hint, forced version) with
+the normalized question. Optionally, a question that is not an exact match
+joins an in-flight query of the same scope whose question embedding is at
+least ``similarity_threshold`` cosine-similar.
+"""
+
+import asyncio
+import copy
+import logging
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Hashable,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+from app.services.rag.answer_cache import normalize_question
+
+logger = logging.getLogger(__name__)
+
+Scope = Tuple[Hashable, ...]
+QueryResult = Dict[str, Any]
+
+
+@dataclass
+class _InFlightQuery:
+    key: Tuple[Scope, str]
+    task: "asyncio.Task[QueryResult]"
+    embedding: Optional[np.ndarray] = None
+    waiters: int = 0
+    followers: int = 0
+
+
+class QueryCoalescer:
+    """Single-flight execution of identical or near-identical queries."""
+
+    def __init__(
+        self,
+        *,
+        similarity_threshold: float = 0.0,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+    ) -> None:
+        self.similarity_threshold = similarity_threshold
+        self._embed = embed if similarity_threshold > 0 else None
+        self._inflight: Dict[Tuple[Scope, str], _InFlightQuery] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    async def run(
+        self,
+        scope: Scope,
+        question: str,
+        compute: Callable[[], Coroutine[Any, Any, QueryResult]],
+    ) -> Tuple[QueryResult, bool]:
+        """Run ``compute`` or join an equivalent in-flight query.
+
+        Returns the result and whether it was produced by another caller.
+        """
+        key = (scope, normalize_question(question))
+        flight = self._inflight.get(key)
+        embedding = None
+        if flight is None and self._embed is not None:
+            embedding = await self._embed_question(question)
+            flight = self._inflight.get(key) or self._similar_flight(scope, embedding)
+
+        if flight is not None:
+            self.followers += 1
+            flight.followers += 1
+            logger.info(
+                "Coalescing query with in-flight question (%d follower(s))",
+                flight.followers,
+            )
+            return await self._wait(flight), True
+
+        self.leaders += 1
+        task: asyncio.Task[QueryResult] = asyncio.create_task(
+            compute(), name="rag-coalesced-query"
+        )
+        flight = _InFlightQuery(key=key, task=task, embedding=embedding)
+        self._inflight[key] = flight
+        task.add_done_callback(lambda _: self._forget(flight))
+        return await self._wait(flight), False
+
+    async def _wait(self, flight: _InFlightQuery) -> QueryResult:
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller gave up; nobody needs the answer any more
+                flight.task.cancel()
+        return copy.deepcopy(result)
+
+    def _forget(self, flight: _InFlightQuery) -> None:
+        if self._inflight.get(flight.key) is flight:
+            del self._inflight[flight.key]
+
+    async def _embed_question(self, question: str) -> Optional[np.ndarray]:
+        try:
+            vector = np.asarray(
+                await asyncio.to_thread(self._embed, question), dtype=np.float32
+            ).reshape(-1)
+        except Exception as e:
+            logger.debug(f"Coalescing embedding failed: {e}")
+            return None
+        norm = float(np.linalg.norm(vector))
+        if vector.size == 0 or not np.isfinite(norm) or norm == 0.0:
+            return None
+        return vector / norm
+
+    def _similar_flight(
+        self, scope: Scope, embedding: Optional[np.ndarray]
+    ) -> Optional[_InFlightQuery]:
+        if embedding is None:
+            return None
+        best: Optional[_InFlightQuery] = None
+        best_similarity = self.similarity_threshold
+        for flight in self._inflight.values():
+            if flight.key[0] != scope or flight.embedding is None:
+                continue
+            if flight.embedding.shape != embedding.shape:
+                continue
+            similarity = float(flight.embedding @ embedding)
+            if similarity >= best_similarity:
+                best, best_similarity = flight, similarity
+        return best
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "leaders": self.leaders,
+            "followers": self.followers,
+            "similarity_threshold": self.similarity_threshold,
+        }
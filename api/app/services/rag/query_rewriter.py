@@ -20,6 +20,7 @@ from app.core.config import Settings
 from app.services.rag.bisq_entities import (
     BISQ1_ENTITY_MAP,
     BISQ2_ENTITY_MAP,
+    BISQ_KEYWORD_MATCHER,
     build_llm_entity_examples,
 )
 from app.services.rag.query_context import (
@@ -204,16 +205,18 @@ class QueryRewriter:
         rewritten = f"Regarding {topic}: {query}"
 
         # Apply entity substitution to the full rewritten query
-        for entity_map in (BISQ1_ENTITY_MAP, BISQ2_ENTITY_MAP):
-            for informal, canonical in entity_map.items():
-                if informal in rewritten.lower():
-                    rewritten = re.sub(
-                        re.escape(informal),
-                        canonical,
-                        rewritten,
-                        flags=re.IGNORECASE,
-                    )
-                    break
+        for category, entity_map in (
+            ("bisq1_entity", BISQ1_ENTITY_MAP),
+            ("bisq2_entity", BISQ2_ENTITY_MAP),
+        ):
+            informal = BISQ_KEYWORD_MATCHER.scan(rewritten).first(category)
+            if informal is not None:
+                rewritten = re.sub(
+                    re.escape(informal),
+                    entity_map[informal],
+                    rewritten,
+                    flags=re.IGNORECASE,
+                )
 
         return RewriteResult(
             rewritten_query=rewritten,
@@ -6,14 +6,21 @@ to a secondary retriever when the primary retriever fails.
 
 Features:
 - Automatic fallback on primary retriever failure
+- Optional latency budget: a primary call that exceeds it is abandoned and
+  answered from the fallback; while abandoned calls still occupy every
+  worker, new calls are answered by the fallback (without switching to it)
+  instead of queueing behind them
 - Health monitoring for both retrievers
 - Metrics and logging for fallback events
 - Manual reset to primary capability
 """
 
+import contextvars
 import logging
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any, Dict, List, Optional
 
 from app.services.rag.interfaces import (
@@ -25,6 +32,17 @@ from app.services.rag.interfaces import (
 logger = logging.getLogger(__name__)
 
 
+class RetrieverLatencyBudgetExceeded(TimeoutError):
+    """Raised when the primary retriever does not answer within its budget."""
+
+
+class RetrieverPrimarySaturated(RetrieverLatencyBudgetExceeded):
+    """Raised when abandoned calls occupy every primary worker."""
+
+
+PRIMARY_WORKERS = 4
+
+
 class ResilientRetriever(ResilientRetrieverProtocol):
     """Retriever with automatic fallback to secondary retriever.
 
@@ -37,6 +55,7 @@ class ResilientRetriever(ResilientRetrieverProtocol):
         fallback: Fallback retriever
         auto_reset: Whether to automatically try resetting to primary
         reset_interval: Seconds between reset attempts
+        latency_budget_seconds: Max seconds to wait for the primary (None = no limit)
     """
 
     def __init__(
@@ -45,6 +64,7 @@ class ResilientRetriever(ResilientRetrieverProtocol):
         fallback: RetrieverProtocol,
         auto_reset: bool = True,
         reset_interval: int = 300,  # 5 minutes
+        latency_budget_seconds: Optional[float] = None,
     ):
         """Initialize the resilient retriever.
 
@@ -53,6 +73,8 @@ class ResilientRetriever(ResilientRetrieverProtocol):
             fallback: Fallback retriever when primary fails
             auto_reset: If True, periodically try to reset to primary
             reset_interval: Seconds between auto-reset attempts
+            latency_budget_seconds: If set, primary calls slower than this are
+                treated as failures and served by the fallback
         """
         self._primary = primary
         self._fallback = fallback
@@ -63,6 +85,21 @@ class ResilientRetriever(ResilientRetrieverProtocol):
         self._fallback_count = 0
         self._primary_failures = 0
         self._lock = threading.Lock()  # Protects state mutations
+        self._latency_budget = latency_budget_seconds
+        self._latency_budget_exceeded = 0
+        self._primary_saturated = 0
+        # Primary calls run here so a hung backend cannot block the caller.
+        # Abandoned calls keep their worker until the backend's own client
+        # timeout ends them, so they are tracked separately from healthy ones.
+        self._primary_in_flight = 0
+        self._abandoned: set[Future[Any]] = set()
+        self._executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(
+                max_workers=PRIMARY_WORKERS, thread_name_prefix="retriever-primary"
+            )
+            if latency_budget_seconds is not None
+            else None
+        )
 
     @property
     def primary_retriever(self) -> RetrieverProtocol:
@@ -168,6 +205,67 @@ class ResilientRetriever(ResilientRetrieverProtocol):
 
         return primary_healthy or fallback_healthy
 
+    def _call(
+        self,
+        retriever: RetrieverProtocol,
+        method: str,
+        query: str,
+        k: int,
+        filter_dict: Optional[Dict[str, Any]],
+    ) -> List[RetrievedDocument]:
+        """Invoke a retriever method, enforcing the latency budget on the primary."""
+        func = getattr(retriever, method)
+        if self._executor is None or retriever is not self._primary:
+            return func(query, k, filter_dict)
+
+        with self._lock:
+            saturated = len(self._abandoned) >= PRIMARY_WORKERS
+            if saturated:
+                self._primary_saturated += 1
+            else:
+                self._primary_in_flight += 1
+        if saturated:
+            raise RetrieverPrimarySaturated(
+                "primary retriever workers are all busy with abandoned calls"
+            )
+
+        # Run in a copy of the caller's context so request trace spans follow
+        future = self._executor.submit(
+            contextvars.copy_context().run, func, query, k, filter_dict
+        )
+        future.add_done_callback(self._primary_call_done)
+        try:
+            return future.result(timeout=self._latency_budget)
+        except FutureTimeoutError:
+            with self._lock:
+                self._latency_budget_exceeded += 1
+                if not future.cancel() and not future.done():
+                    # Running: the worker stays busy until the call returns
+                    self._abandoned.add(future)
+            raise RetrieverLatencyBudgetExceeded(
+                f"primary retriever exceeded {self._latency_budget}s latency budget"
+            ) from None
+
+    def _primary_call_done(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._primary_in_flight -= 1
+            self._abandoned.discard(future)
+
+    def _from_fallback(
+        self,
+        method: str,
+        query: str,
+        k: int,
+        filter_dict: Optional[Dict[str, Any]],
+    ) -> List[RetrievedDocument]:
+        try:
+            return getattr(self._fallback, method)(query, k, filter_dict)
+        except Exception as fallback_error:
+            logger.error(
+                f"Both primary and fallback retrievers failed: {fallback_error}"
+            )
+            return []
+
     def retrieve(
         self,
         query: str,
@@ -187,23 +285,20 @@ class ResilientRetriever(ResilientRetrieverProtocol):
         retriever = self._get_active_retriever()
 
         try:
-            docs = retriever.retrieve(query, k, filter_dict)
+            docs = self._call(retriever, "retrieve", query, k, filter_dict)
             # If using primary and it succeeds, reset failure count
             with self._lock:
                 if not self._using_fallback:
                     self._primary_failures = 0
             return docs
+        except RetrieverPrimarySaturated:
+            # Earlier calls hung, not this one: serve it without switching
+            return self._from_fallback("retrieve", query, k, filter_dict)
         except Exception as e:
             if not self._using_fallback:
                 # Primary failed, switch to fallback
                 self._switch_to_fallback(e)
-                try:
-                    return self._fallback.retrieve(query, k, filter_dict)
-                except Exception as fallback_error:
-                    logger.error(
-                        f"Both primary and fallback retrievers failed: {fallback_error}"
-                    )
-                    return []
+                return self._from_fallback("retrieve", query, k, filter_dict)
             else:
                 # Already on fallback, log and return empty
                 logger.error(f"Fallback retriever failed: {e}")
@@ -228,21 +323,19 @@ class ResilientRetriever(ResilientRetrieverProtocol):
         retriever = self._get_active_retriever()
 
         try:
-            docs = retriever.retrieve_with_scores(query, k, filter_dict)
+            docs = self._call(retriever, "retrieve_with_scores", query, k, filter_dict)
             with self._lock:
                 if not self._using_fallback:
                     self._primary_failures = 0
             return docs
+        except RetrieverPrimarySaturated:
+            return self._from_fallback("retrieve_with_scores", query, k, filter_dict)
         except Exception as e:
             if not self._using_fallback:
                 self._switch_to_fallback(e)
-                try:
-                    return self._fallback.retrieve_with_scores(query, k, filter_dict)
-                except Exception as fallback_error:
-                    logger.error(
-                        f"Both primary and fallback retrievers failed: {fallback_error}"
-                    )
-                    return []
+                return self._from_fallback(
+                    "retrieve_with_scores", query, k, filter_dict
+                )
             else:
                 logger.error(f"Fallback retriever failed: {e}")
                 return []
@@ -274,4 +367,9 @@ class ResilientRetriever(ResilientRetrieverProtocol):
             "primary_failures": self._primary_failures,
             "auto_reset_enabled": self._auto_reset,
             "reset_interval_seconds": self._reset_interval,
+            "latency_budget_seconds": self._latency_budget,
+            "latency_budget_exceeded": self._latency_budget_exceeded,
+            "primary_in_flight": self._primary_in_flight,
+            "primary_abandoned": len(self._abandoned),
+            "primary_saturated": self._primary_saturated,
         }
@@ -0,0 +1,100 @@
+"""Append-only review logs for the LearningEngine.
+
+Reviews are keyed by ``review_id``: recording a review with an existing id
+replaces that review in place, anything else is appended. The in-memory log
+backs engines without persistence; the repository log writes each review as
+one row of the ``learning_reviews`` table, so persisting the engine never
+rewrites the review history.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional
+
+# Rows fetched per query when iterating the repository log
+PAGE_SIZE = 500
+
+
+class InMemoryReviewLog:
+    """Review records in insertion order with a review_id index."""
+
+    def __init__(self) -> None:
+        self._records: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+
+    def upsert(self, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Append ``record`` or replace the one with its review_id.
+
+        Returns:
+            The replaced record, or None if the record was appended
+        """
+        position = self._positions.get(record["review_id"])
+        if position is None:
+            self._positions[record["review_id"]] = len(self._records)
+            self._records.append(record)
+            return None
+        previous = self._records[position]
+        self._records[position] = record
+        return previous
+
+    def clear(self) -> None:
+        self._records = []
+        self._positions = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return self._records[index]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._records)
+
+
+class RepositoryReviewLog:
+    """Review log stored in the repository's ``learning_reviews`` table.
+
+    Args:
+        repository: UnifiedFAQCandidateRepository (or compatible) providing
+            upsert/count/get/clear_learning_review(s) methods
+    """
+
+    def __init__(self, repository: Any):
+        self.repository = repository
+        self._count = int(repository.count_learning_reviews())
+
+    def upsert(self, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        previous = self.repository.upsert_learning_review(record)
+        if previous is None:
+            self._count += 1
+        return previous
+
+    def clear(self) -> None:
+        self.repository.clear_learning_reviews()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        position = index + self._count if index < 0 else index
+        rows = (
+            self.repository.get_learning_reviews(limit=1, offset=position)
+            if 0 <= position < self._count
+            else []
+        )
+        if not rows:
+            raise IndexError("review log index out of range")
+        return rows[0]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        offset = 0
+        while True:
+            rows = self.repository.get_learning_reviews(limit=PAGE_SIZE, offset=offset)
+            yield from rows
+            if len(rows) < PAGE_SIZE:
+                return
+            offset += len(rows)
+
+
+def supports_review_log(repository: Any) -> bool:
+    """Whether ``repository`` can store reviews as an append-only log."""
+    return getattr(type(repository), "upsert_learning_review", None) is not None
@@ -0,0 +1,238 @@
+"""Incremental review statistics for the LearningEngine.
+
+Thresholds are quantiles of the confidence scores of reviewed answers. Instead
+of keeping every review in memory and re-sorting them, each admin action keeps
+a fixed-size histogram over [0, 1] whose weights decay exponentially with
+review age, so adding, replacing and querying reviews costs O(bins)
+independent of how many reviews were ever recorded. Exact all-time counters
+back the dashboard metrics.
+"""
+
+import math
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+ADMIN_ACTIONS = ("approved", "edited", "rejected")
+REVIEW_KINDS = ("faq", "answer_quality")
+DEFAULT_BINS = 1000
+
+
+def review_epoch_seconds(record: Dict[str, Any]) -> float:
+    """Review timestamp (ISO 8601) as epoch seconds; now if missing/invalid."""
+    value = record.get("timestamp")
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            parsed = None
+        if parsed is not None:
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.timestamp()
+    return datetime.now(timezone.utc).timestamp()
+
+
+def review_kind(record: Dict[str, Any]) -> str:
+    metadata = record.get("metadata") or {}
+    if metadata.get("review_kind") == "answer_quality":
+        return "answer_quality"
+    return "faq"
+
+
+def _finite_confidence(record: Dict[str, Any]) -> Optional[float]:
+    value = record.get("confidence")
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if not math.isfinite(value):
+        return None
+    return float(value)
+
+
+class ReviewStatistics:
+    """Streaming summary of admin reviews.
+
+    Args:
+        half_life_days: Age at which a review counts half as much towards the
+            threshold quantiles; None disables decay
+        bins: Histogram resolution over the [0, 1] confidence range
+    """
+
+    def __init__(
+        self,
+        half_life_days: Optional[float] = 90.0,
+        bins: int = DEFAULT_BINS,
+    ):
+        self.half_life_seconds = half_life_days * 86400.0 if half_life_days else None
+        self.bins = bins
+        # Decayed weights per admin action, all relative to reference_time
+        self._histograms = np.zeros((len(ADMIN_ACTIONS), bins), dtype=float)
+        self.reference_time: Optional[float] = None
+        # Exact all-time counts per (review kind, admin action)
+        self.counts: Dict[str, Dict[str, int]] = {
+            kind: {action: 0 for action in ADMIN_ACTIONS} for kind in REVIEW_KINDS
+        }
+        self.total = 0
+        # Confidence moments over reviews with a finite confidence
+        self.confidence_count = 0
+        self.confidence_sum = 0.0
+        self.confidence_sum_sq = 0.0
+        # All-time extremes (not shrunk when a review is replaced)
+        self.confidence_min: Optional[float] = None
+        self.confidence_max: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _bin(self, confidence: float) -> int:
+        clipped = min(1.0, max(0.0, confidence))
+        return min(self.bins - 1, int(clipped * self.bins))
+
+    def _decay_to(self, timestamp: float) -> None:
+        if self.reference_time is None:
+            self.reference_time = timestamp
+            return
+        if timestamp <= self.reference_time:
+            return
+        if self.half_life_seconds:
+            elapsed = timestamp - self.reference_time
+            self._histograms *= 0.5 ** (elapsed / self.half_life_seconds)
+        self.reference_time = timestamp
+
+    def _weight(self, timestamp: float) -> float:
+        if not self.half_life_seconds or self.reference_time is None:
+            return 1.0
+        age = max(0.0, self.reference_time - timestamp)
+        return 0.5 ** (age / self.half_life_seconds)
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Account for one review record."""
+        self._apply(record, 1)
+
+    def remove(self, record: Dict[str, Any]) -> None:
+        """Undo ``add`` for a record that is being replaced."""
+        self._apply(record, -1)
+
+    def _apply(self, record: Dict[str, Any], sign: int) -> None:
+        action = record.get("admin_action")
+        kind = review_kind(record)
+        if action in ADMIN_ACTIONS:
+            self.counts[kind][action] = max(0, self.counts[kind][action] + sign)
+        self.total = max(0, self.total + sign)
+
+        confidence = _finite_confidence(record)
+        if confidence is None:
+            return
+        self.confidence_count = max(0, self.confidence_count + sign)
+        self.confidence_sum += sign * confidence
+        self.confidence_sum_sq += sign * confidence * confidence
+        if sign > 0:
+            if self.confidence_min is None or confidence < self.confidence_min:
+                self.confidence_min = confidence
+            if self.confidence_max is None or confidence > self.confidence_max:
+                self.confidence_max = confidence
+        elif self.confidence_count == 0:
+            self.confidence_min = self.confidence_max = None
+            self.confidence_sum = self.confidence_sum_sq = 0.0
+
+        if action in ADMIN_ACTIONS:
+            timestamp = review_epoch_seconds(record)
+            if sign > 0:
+                self._decay_to(timestamp)
+            row = ADMIN_ACTIONS.index(action)
+            column = self._bin(confidence)
+            updated = self._histograms[row, column] + sign * self._weight(timestamp)
+            self._histograms[row, column] = max(0.0, updated)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def action_count(self, action: str) -> int:
+        """All-time number of reviews with this admin action (any kind)."""
+        return sum(self.counts[kind][action] for kind in REVIEW_KINDS)
+
+    def quantile(self, actions: List[str], q: float) -> Optional[float]:
+        """Decay-weighted quantile of confidences for the given actions.
+
+        Values are assumed uniform within a bin. Returns None without data.
+        """
+        rows = [ADMIN_ACTIONS.index(action) for action in actions]
+        weights = self._histograms[rows].sum(axis=0)
+        total = float(weights.sum())
+        if total <= 0:
+            return None
+        cumulative = np.cumsum(weights)
+        target = min(max(q, 0.0), 1.0) * total
+        index = int(np.searchsorted(cumulative, target, side="left"))
+        index = min(index, self.bins - 1)
+        before = float(cumulative[index - 1]) if index else 0.0
+        in_bin = float(weights[index])
+        fraction = (target - before) / in_bin if in_bin > 0 else 0.0
+        return (index + min(1.0, max(0.0, fraction))) / self.bins
+
+    def confidence_summary(self) -> Dict[str, Optional[float]]:
+        if self.confidence_count <= 0:
+            return {"avg": None, "std": None, "min": None, "max": None}
+        mean = self.confidence_sum / self.confidence_count
+        variance = max(0.0, self.confidence_sum_sq / self.confidence_count - mean**2)
+        return {
+            "avg": mean,
+            "std": math.sqrt(variance),
+            "min": self.confidence_min,
+            "max": self.confidence_max,
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable snapshot; histograms are stored sparsely."""
+        histograms = {}
+        for row, action in enumerate(ADMIN_ACTIONS):
+            nonzero = np.nonzero(self._histograms[row])[0]
+            histograms[action] = {
+                str(int(i)): float(self._histograms[row, i]) for i in nonzero
+            }
+        return {
+            "version": 1,
+            "bins": self.bins,
+            "half_life_seconds": self.half_life_seconds,
+            "reference_time": self.reference_time,
+            "histograms": histograms,
+            "counts": self.counts,
+            "total": self.total,
+            "confidence_count": self.confidence_count,
+            "confidence_sum": self.confidence_sum,
+            "confidence_sum_sq": self.confidence_sum_sq,
+            "confidence_min": self.confidence_min,
+            "confidence_max": self.confidence_max,
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        half_life_days: Optional[float] = 90.0,
+    ) -> "ReviewStatistics":
+        """Restore a snapshot; the configured half-life wins over the stored one."""
+        stats = cls(half_life_days=half_life_days, bins=int(data["bins"]))
+        stats.reference_time = data.get("reference_time")
+        for row, action in enumerate(ADMIN_ACTIONS):
+            for index, weight in (data.get("histograms", {}).get(action) or {}).items():
+                stats._histograms[row, int(index)] = float(weight)
+        for kind in REVIEW_KINDS:
+            for action in ADMIN_ACTIONS:
+                stats.counts[kind][action] = int(
+                    data.get("counts", {}).get(kind, {}).get(action, 0)
+                )
+        stats.total = int(data.get("total", 0))
+        stats.confidence_count = int(data.get("confidence_count", 0))
+        stats.confidence_sum = float(data.get("confidence_sum", 0.0))
+        stats.confidence_sum_sq = float(data.get("confidence_sum_sq", 0.0))
+        stats.confidence_min = data.get("confidence_min")
+        stats.confidence_max = data.get("confidence_max")
+        return stats
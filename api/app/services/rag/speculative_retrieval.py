@@ -0,0 +1,87 @@
+"""
+Speculative retrieval for the RAG query pipeline.
+
+Pre-retrieval analysis (language detection, translation, version detection,
+the answer-cache lookup) runs before the final query and protocol version
+are known. Most questions arrive in English without history, so the final
+query is usually the question as typed. ``SpeculativeRetrieval`` starts
+retrieval for that guess in a worker thread as soon as the request arrives;
+once analysis finishes, the result is used only when the final query and
+version are exactly the guessed ones. Otherwise it is discarded and
+retrieval runs normally, so speculation never changes which documents an
+answer is based on.
+
+Retrieval is started only after version detection and the answer-cache
+lookup for the question as typed; ``AsTypedAnalysis`` keeps those results so
+the main path reuses them instead of running them again.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+from app.services.rag.answer_cache import AnswerCacheHit
+
+logger = logging.getLogger(__name__)
+
+RetrievalResult = Tuple[List[Any], List[float]]
+
+
+class SpeculativeRetrieval:
+    """Retrieval started for a guessed query and version."""
+
+    def __init__(
+        self,
+        retrieve: Callable[[str, str], RetrievalResult],
+        query: str,
+        detected_version: str,
+    ) -> None:
+        self.query = query
+        self.detected_version = detected_version
+        self._task: asyncio.Task[RetrievalResult] = asyncio.create_task(
+            asyncio.to_thread(retrieve, query, detected_version),
+            name="rag-speculative-retrieval",
+        )
+
+    def matches(self, query: str, detected_version: str) -> bool:
+        return query == self.query and detected_version == self.detected_version
+
+    async def result(self) -> RetrievalResult:
+        return await self._task
+
+    def discard(self) -> None:
+        """Drop the speculation; the worker thread finishes on its own."""
+        if self._task.done():
+            self._consume(self._task)
+        else:
+            self._task.add_done_callback(self._consume)
+
+    @staticmethod
+    def _consume(task: "asyncio.Task[RetrievalResult]") -> None:
+        if task.cancelled():
+            return
+        error: Optional[BaseException] = task.exception()
+        if error is not None:
+            logger.debug("Discarded speculative retrieval failed: %s", error)
+
+
+@dataclass
+class AsTypedAnalysis:
+    """Pre-retrieval results for the question as typed.
+
+    Attributes:
+        question: The question as typed
+        version: ``detect_version`` result, None when the version was overridden
+        cache_scope: Answer-cache scope looked up, None when the cache is off
+        cache_hit: Answer-cache hit for ``cache_scope``
+        cache_embedding: Question embedding computed by the cache lookup
+        speculation: Retrieval started for the question, if any
+    """
+
+    question: str
+    version: Optional[Tuple[str, float, Optional[str]]] = None
+    cache_scope: Optional[tuple] = None
+    cache_hit: Optional[AnswerCacheHit] = None
+    cache_embedding: Optional[List[float]] = None
+    speculation: Optional[SpeculativeRetrieval] = None
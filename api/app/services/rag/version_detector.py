@@ -3,51 +3,21 @@
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
+from app.services.rag.bisq_entities import (
+    BISQ1_CORE_KEYWORDS,
+    BISQ2_CORE_KEYWORDS,
+    BISQ_KEYWORD_MATCHER,
+)
+
 logger = logging.getLogger(__name__)
 
 
 class VersionDetector:
     """Detect Bisq version from user questions and context."""
 
-    BISQ1_KEYWORDS = [
-        "dao",
-        "bsq",
-        "burningman",
-        "burning man",
-        "arbitration",
-        "arbitrator",
-        # Note: "mediator" removed - mediators exist in both Bisq 1 and Bisq Easy (Bisq 2)
-        "altcoin",
-        "security deposit",
-        "multisig",
-        "2-of-2",
-        "delayed payout",
-        "refund agent",
-        "dao voting",
-    ]
-
-    BISQ2_KEYWORDS = [
-        "bisq easy",
-        "reputation",
-        "bonded roles",
-        "trade protocol",
-        "multiple identities",
-        "600 usd",
-        "$600",
-        "novice bitcoin",
-        "bisq 2",
-        "bisq2",
-        # Live data keywords (MCP tools are Bisq 2 features)
-        "current price",
-        "market price",
-        "live price",
-        "btc price",
-        "bitcoin price",
-        "offerbook",
-        "current offers",
-        "available offers",
-        "active offers",
-    ]
+    BISQ1_KEYWORDS = BISQ1_CORE_KEYWORDS
+
+    BISQ2_KEYWORDS = BISQ2_CORE_KEYWORDS
 
     async def detect_version(
         self, question: str, chat_history: List[Dict[str, str]]
@@ -93,8 +63,9 @@ class VersionDetector:
 
     def _check_keywords(self, text: str) -> Tuple[str, float]:
         """Score based on version-specific keywords."""
-        bisq1_score = sum(1 for kw in self.BISQ1_KEYWORDS if kw in text)
-        bisq2_score = sum(1 for kw in self.BISQ2_KEYWORDS if kw in text)
+        hits = BISQ_KEYWORD_MATCHER.scan(text)
+        bisq1_score = hits.count("bisq1_core")
+        bisq2_score = hits.count("bisq2_core")
 
         if bisq1_score > bisq2_score and bisq1_score > 0:
             confidence = min(0.7 + (bisq1_score * 0.1), 0.95)
@@ -159,8 +130,9 @@ class VersionDetector:
         if has_bisq2:
             return ("Bisq 2", 0.80)
 
-        bisq1_found = any(kw in content for kw in self.BISQ1_KEYWORDS[:5])
-        bisq2_found = any(kw in content for kw in self.BISQ2_KEYWORDS[:5])
+        hits = BISQ_KEYWORD_MATCHER.scan(content)
+        bisq1_found = hits.has("bisq1_history")
+        bisq2_found = hits.has("bisq2_history")
         if bisq1_found and bisq2_found:
             return None
         if bisq1_found:
@@ -176,22 +148,22 @@ class VersionDetector:
         1. Use context-aware defaults based on question keywords
         2. Fall back to generic version question if no context matches
         """
-        question_lower = question.lower()
+        hits = BISQ_KEYWORD_MATCHER.scan(question)
 
         # Context-aware clarifying questions
-        if any(kw in question_lower for kw in ["trade", "payment", "buy", "sell"]):
+        if hits.has("clarify_trade"):
             return "Are you using Bisq 1 trading or Bisq Easy (Bisq 2)?"
 
-        if any(kw in question_lower for kw in ["wallet", "bitcoin", "btc"]):
+        if hits.has("clarify_wallet"):
             return "Which Bisq version's wallet are you asking about?"
 
-        if any(kw in question_lower for kw in ["reputation", "profile"]):
+        if hits.has("clarify_reputation"):
             return "Are you asking about Bisq 2's reputation system, or transferring Bisq 1 reputation?"
 
-        if any(kw in question_lower for kw in ["dao", "bsq", "voting"]):
+        if hits.has("clarify_dao"):
             return "This sounds like a Bisq 1 DAO question. Is that correct, or are you asking about Bisq 2?"
 
-        if any(kw in question_lower for kw in ["mediator", "mediation", "dispute"]):
+        if hits.has("clarify_mediation"):
             return "Are you asking about mediation in Bisq 1, or Bisq Easy (Bisq 2)? Both versions have mediators."
 
         # Generic fallback
@@ -13,6 +13,7 @@ File Naming Conventions:
 """
 
 import asyncio
+import hashlib
 import logging
 import re
 import time
@@ -23,6 +24,7 @@ from app.core.pii_utils import redact_for_logs
 from app.prompts import error_messages
 from app.services.bisq_mcp_service import Bisq2MCPService
 from app.services.faq.slug_manager import SlugManager
+from app.services.rag.answer_cache import AnswerCacheHit, SemanticAnswerCache
 from app.services.rag.auto_send_router import AutoSendRouter
 from app.services.rag.confidence_scorer import ConfidenceScorer
 from app.services.rag.conversation_state import ConversationStateManager
@@ -35,7 +37,12 @@ from app.services.rag.nli_validator import NLIValidator
 from app.services.rag.prompt_manager import PromptManager
 from app.services.rag.protocol_detector import ProtocolDetector
 from app.services.rag.qdrant_index_manager import QdrantIndexManager
+from app.services.rag.query_coalescer import QueryCoalescer
 from app.services.rag.routing_reason_generator import RoutingReasonGenerator
+from app.services.rag.speculative_retrieval import (
+    AsTypedAnalysis,
+    SpeculativeRetrieval,
+)
 from app.services.translation import TranslationService
 from app.services.translation.language_detector import SUPPORTED_LANGUAGES
 from app.utils.instrumentation import (
@@ -44,6 +51,7 @@ from app.utils.instrumentation import (
     track_tokens_and_cost,
     update_error_rate,
 )
+from app.utils.request_trace import request_trace, trace_span
 from app.utils.wiki_url_generator import generate_wiki_url
 from fastapi import Request
 
@@ -155,6 +163,7 @@ class SimplifiedRAGService:
         faq_service=None,
         bisq_mcp_service: Optional[Bisq2MCPService] = None,
         translation_service: Optional[TranslationService] = None,
+        defer_model_loading: bool = False,
     ):
         """Initialize the RAG service.
 
@@ -165,6 +174,9 @@ class SimplifiedRAGService:
             faq_service: Optional FAQService instance for FAQ operations
             bisq_mcp_service: Optional Bisq2MCPService for live data integration
             translation_service: Optional TranslationService for multilingual support
+            defer_model_loading: Leave the NLI and ColBERT model loads to
+                load_nli_model() / warm_up_colbert() instead of doing them
+                during construction and setup()
         """
         if settings is None:
             settings = get_settings()
@@ -175,6 +187,7 @@ class SimplifiedRAGService:
         self.llm_wiki_loader = LLMWikiLoader()
         self.bisq_mcp_service = bisq_mcp_service
         self.translation_service = translation_service
+        self.defer_model_loading = defer_model_loading
 
         # MCP is now handled via HTTP transport in LLM provider
         # The LLM wrapper connects to MCP server at mcp_url
@@ -219,12 +232,36 @@ class SimplifiedRAGService:
 
         # Optional reranking components
         self.colbert_reranker = None
+        # Chunk texts whose ColBERT token embeddings warm_up_colbert() encodes
+        self._colbert_pending_texts: Optional[List[str]] = None
 
         # Initialize lock for rebuild serialization to prevent concurrent rebuilds
         self._setup_lock = asyncio.Lock()
 
+        # Semantic cache of auto-sent answers; becomes active once setup() has
+        # stamped it with the index generation
+        self.answer_cache: Optional[SemanticAnswerCache] = None
+        if getattr(self.settings, "ENABLE_SEMANTIC_ANSWER_CACHE", False):
+            self.answer_cache = SemanticAnswerCache(
+                similarity_threshold=self.settings.SEMANTIC_ANSWER_CACHE_THRESHOLD,
+                max_entries=self.settings.SEMANTIC_ANSWER_CACHE_MAX_ENTRIES,
+                ttl_seconds=self.settings.SEMANTIC_ANSWER_CACHE_TTL_SECONDS,
+            )
+        self._index_build_stamp: Optional[str] = None
+        self._prompt_version = ""
+
+        # Concurrent standalone questions with the same key share one run
+        self.query_coalescer: Optional[QueryCoalescer] = None
+        if getattr(self.settings, "ENABLE_QUERY_COALESCING", False):
+            self.query_coalescer = QueryCoalescer(
+                similarity_threshold=getattr(
+                    self.settings, "QUERY_COALESCING_SIMILARITY_THRESHOLD", 0.0
+                ),
+                embed=lambda text: self.embeddings.embed_query(text),
+            )
+
         # Initialize confidence scoring components
-        self.nli_validator = NLIValidator()
+        self.nli_validator = NLIValidator(eager=not defer_model_loading)
         self.confidence_scorer = ConfidenceScorer(self.nli_validator)
         self.auto_send_router = AutoSendRouter()
         self.routing_reason_generator = RoutingReasonGenerator()
@@ -279,6 +316,8 @@ class SimplifiedRAGService:
             faq_id: ID of changed FAQ
             metadata: Additional context about the change
         """
+        if self.answer_cache is not None:
+            self.answer_cache.invalidate(reason=f"faq_{operation or 'update'}")
         if rebuild:
             logger.info("Immediate index rebuild requested by FAQ update")
             task = asyncio.create_task(self.setup(force_rebuild=True))
@@ -342,16 +381,19 @@ class SimplifiedRAGService:
         """Initialize the Qdrant retriever (single backend)."""
         from app.services.rag.qdrant_hybrid_retriever import QdrantHybridRetriever
 
-        self.retriever = QdrantHybridRetriever(
+        qdrant_retriever = QdrantHybridRetriever(
             settings=self.settings,
             embeddings=self.embeddings,
         )
 
-        if not self.retriever.health_check():
+        if not qdrant_retriever.health_check():
             raise RuntimeError("Qdrant retriever health check failed")
 
-        # Optional ColBERT reranker initialization (lazy loading).
-        if self.settings.ENABLE_COLBERT_RERANK:
+        self.retriever = self._wrap_with_local_fallback(qdrant_retriever)
+
+        # Optional ColBERT reranker initialization (lazy loading). Rebuilds keep
+        # the existing instance so a loaded model is not loaded again.
+        if self.settings.ENABLE_COLBERT_RERANK and self.colbert_reranker is None:
             try:
                 from app.services.rag.colbert_reranker import ColBERTReranker
 
@@ -361,6 +403,59 @@ class SimplifiedRAGService:
                 logger.warning(f"ColBERT reranker initialization failed: {e}")
                 self.colbert_reranker = None
 
+    def _wrap_with_local_fallback(self, qdrant_retriever: Any) -> Any:
+        """Pair the Qdrant retriever with the local in-process fallback index.
+
+        Returns the Qdrant retriever unchanged when the local index is disabled
+        or no snapshot can be loaded. Small corpora (see
+        LOCAL_INDEX_FAST_PATH_MAX_CHUNKS) are served from the local index first.
+        """
+        if not getattr(self.settings, "ENABLE_LOCAL_FALLBACK_INDEX", False):
+            return qdrant_retriever
+
+        from app.services.rag.local_vector_index import LocalVectorRetriever
+        from app.services.rag.resilient_retriever import ResilientRetriever
+
+        try:
+            local_index = self.index_manager.ensure_local_index()
+        except Exception as e:
+            logger.warning(f"Local fallback index unavailable: {e}")
+            local_index = None
+        if local_index is None or local_index.size == 0:
+            logger.info("Local fallback index not available; using Qdrant only")
+            return qdrant_retriever
+
+        local_retriever = LocalVectorRetriever(
+            index=local_index,
+            embeddings=self.embeddings,
+            bm25_tokenizer=qdrant_retriever.bm25_tokenizer,
+            semantic_weight=self.settings.HYBRID_SEMANTIC_WEIGHT,
+            keyword_weight=self.settings.HYBRID_KEYWORD_WEIGHT,
+        )
+        # Let Qdrant errors reach ResilientRetriever instead of returning [].
+        qdrant_retriever.raise_on_error = True
+
+        if local_index.size <= self.settings.LOCAL_INDEX_FAST_PATH_MAX_CHUNKS:
+            logger.info(
+                f"Serving retrieval from local index fast path ({local_index.size} chunks)"
+            )
+            return ResilientRetriever(
+                primary=local_retriever,
+                fallback=qdrant_retriever,
+                reset_interval=self.settings.RETRIEVER_FALLBACK_RESET_SECONDS,
+            )
+
+        logger.info(
+            f"Local fallback index ready ({local_index.size} chunks, "
+            f"dtype={local_index.dtype})"
+        )
+        return ResilientRetriever(
+            primary=qdrant_retriever,
+            fallback=local_retriever,
+            reset_interval=self.settings.RETRIEVER_FALLBACK_RESET_SECONDS,
+            latency_budget_seconds=self.settings.RETRIEVER_LATENCY_BUDGET_SECONDS,
+        )
+
     @instrument_stage("retrieval")
     def _retrieve_with_version_priority(
         self, query: str, detected_version: str | None = None
@@ -448,96 +543,135 @@ class SimplifiedRAGService:
                     return normalized
         return None
 
-    async def setup(self, force_rebuild: bool = False):
+    def _prepare_index(self, force_rebuild: bool) -> Optional[List[Document]]:
+        """Load sources, verify or rebuild the index and initialize retrieval.
+
+        Blocking; returns the indexed chunks, or None when no documents were
+        found.
+        """
+        # Load documents
+        logger.info("Loading documents...")
+
+        # Load wiki data from WikiService
+        wiki_docs = []
+        if self.wiki_service:
+            wiki_docs = self.wiki_service.load_wiki_data()
+        else:
+            logger.warning("WikiService not provided, skipping wiki data loading")
+
+        # Load FAQ data from FAQService
+        faq_docs = []
+        if self.faq_service:
+            faq_docs = self.faq_service.load_faq_data()
+        else:
+            logger.warning("FAQService not provided, skipping FAQ data loading")
+
+        llm_wiki_docs = self.llm_wiki_loader.load_documents(
+            self.settings.LLM_WIKI_DIR_PATH
+        )
+
+        # Combine all documents
+        all_docs = wiki_docs + faq_docs + llm_wiki_docs
+        logger.info(
+            "Loaded %d wiki documents, %d FAQ documents, and %d LLM Wiki pages",
+            len(wiki_docs),
+            len(faq_docs),
+            len(llm_wiki_docs),
+        )
+
+        if not all_docs:
+            logger.warning("No documents loaded. Check your data paths.")
+            return None
+
+        # Apply feedback-based improvements if we have a feedback service
+        if self.feedback_service:
+            logger.info("Applying feedback-based improvements...")
+            # Update source weights from feedback service
+            self.source_weights = self.feedback_service.get_source_weights()
+            logger.info(
+                f"Updated source weights from feedback service: {self.source_weights}"
+            )
+
+            # Update service weights
+            if self.wiki_service:
+                self.wiki_service.update_source_weights(self.source_weights)
+            if self.faq_service:
+                self.faq_service.update_source_weights(self.source_weights)
+            self.llm_wiki_loader.update_source_weights(self.source_weights)
+
+        # Split documents using document processor
+        splits = self.document_processor.split_documents(all_docs)
+
+        # Initialize embeddings
+        logger.info("Initializing embedding model...")
+        self.initialize_embeddings()
+
+        # Ensure Qdrant index exists and is up-to-date.
+        logger.info("Ensuring Qdrant index is up-to-date...")
+        index_result = self.index_manager.rebuild_index(
+            documents=splits,
+            embeddings=self.embeddings,
+            force=force_rebuild,
+        )
+        logger.info(f"Qdrant index ready: {index_result}")
+        build_stamp = self.index_manager.load_metadata().get("last_build")
+        # Without index metadata every setup counts as a new generation
+        self._index_build_stamp = str(build_stamp or time.time())
+
+        # Initialize retriever (Qdrant-only).
+        self._initialize_retriever()
+        return splits
+
+    async def setup(self, force_rebuild: bool = False, offload_blocking: bool = False):
         """Set up the complete system.
 
         Args:
             force_rebuild: If True, force rebuilding the Qdrant index from scratch.
                           Otherwise, reuse existing index if up-to-date.
+            offload_blocking: Run document loading and the index check/build in
+                a worker thread so the event loop keeps serving requests
+                (startup warm-up).
         """
         # Acquire lock to prevent concurrent rebuilds
         async with self._setup_lock:
             try:
                 logger.info("Starting simplified RAG service setup...")
-
-                # Load documents
-                logger.info("Loading documents...")
-
-                # Load wiki data from WikiService
-                wiki_docs = []
-                if self.wiki_service:
-                    wiki_docs = self.wiki_service.load_wiki_data()
-                else:
-                    logger.warning(
-                        "WikiService not provided, skipping wiki data loading"
-                    )
-
-                # Load FAQ data from FAQService
-                faq_docs = []
-                if self.faq_service:
-                    faq_docs = self.faq_service.load_faq_data()
+                if offload_blocking:
+                    splits = await asyncio.to_thread(self._prepare_index, force_rebuild)
                 else:
-                    logger.warning("FAQService not provided, skipping FAQ data loading")
-
-                llm_wiki_docs = self.llm_wiki_loader.load_documents(
-                    self.settings.LLM_WIKI_DIR_PATH
-                )
-
-                # Combine all documents
-                all_docs = wiki_docs + faq_docs + llm_wiki_docs
-                logger.info(
-                    "Loaded %d wiki documents, %d FAQ documents, and %d LLM Wiki pages",
-                    len(wiki_docs),
-                    len(faq_docs),
-                    len(llm_wiki_docs),
-                )
-
-                if not all_docs:
-                    logger.warning("No documents loaded. Check your data paths.")
+                    splits = self._prepare_index(force_rebuild)
+                if splits is None:
                     return False
 
-                # Apply feedback-based improvements if we have a feedback service
-                if self.feedback_service:
-                    logger.info("Applying feedback-based improvements...")
-                    # Update source weights from feedback service
-                    self.source_weights = self.feedback_service.get_source_weights()
-                    logger.info(
-                        f"Updated source weights from feedback service: {self.source_weights}"
-                    )
-
-                    # Update service weights
-                    if self.wiki_service:
-                        self.wiki_service.update_source_weights(self.source_weights)
-                    if self.faq_service:
-                        self.faq_service.update_source_weights(self.source_weights)
-                    self.llm_wiki_loader.update_source_weights(self.source_weights)
-
-                # Split documents using document processor
-                splits = self.document_processor.split_documents(all_docs)
-
-                # Initialize embeddings
-                logger.info("Initializing embedding model...")
-                self.initialize_embeddings()
-
-                # Ensure Qdrant index exists and is up-to-date.
-                logger.info("Ensuring Qdrant index is up-to-date...")
-                index_result = self.index_manager.rebuild_index(
-                    documents=splits,
-                    embeddings=self.embeddings,
-                    force=force_rebuild,
-                )
-                logger.info(f"Qdrant index ready: {index_result}")
-
-                # Initialize retriever (Qdrant-only).
-                self._initialize_retriever()
+                if self.colbert_reranker is not None:
+                    chunk_texts = [doc.page_content or "" for doc in splits]
+                    if (
+                        self.defer_model_loading
+                        and not self.colbert_reranker.is_loaded()
+                    ):
+                        # Encoded by warm_up_colbert() once the model is loaded
+                        self._colbert_pending_texts = chunk_texts
+                    else:
+                        # Encode chunk token embeddings now so queries only
+                        # encode the query text (unchanged chunks come from
+                        # the disk cache).
+                        try:
+                            self.colbert_reranker.precompute_document_embeddings(
+                                chunk_texts
+                            )
+                        except Exception as e:
+                            logger.warning(
+                                f"ColBERT token embedding precompute failed: {e}"
+                            )
 
                 # Initialize document retriever for protocol-aware retrieval
                 self.document_retriever = DocumentRetriever(retriever=self.retriever)
                 logger.info("Document retriever initialized (Qdrant-only)")
 
-                # Initialize language model
-                logger.info("Initializing language model...")
-                self.initialize_llm()
+                # Initialize language model (startup may have done it already)
+                if self.llm is None:
+                    logger.info("Initializing language model...")
+                    self.initialize_llm()
 
                 # Create RAG chain
                 logger.info("Creating RAG chain...")
@@ -549,6 +683,12 @@ class SimplifiedRAGService:
                     retrieve_func=self._retrieve_with_version_priority,
                     format_docs_func=self._format_docs,
                 )
+                # Cached answers are only reused under the same prompt
+                self._prompt_version = hashlib.sha256(
+                    str(self.prompt.format()).encode("utf-8")
+                ).hexdigest()[:12]
+                if self.answer_cache is not None:
+                    self.answer_cache.set_index_generation(self._index_build_stamp)
 
                 logger.info("Simplified RAG service setup complete")
                 return True
@@ -558,6 +698,24 @@ class SimplifiedRAGService:
                 )
                 raise
 
+    def load_nli_model(self) -> None:
+        """Load the NLI model deferred by ``defer_model_loading`` (blocking)."""
+        if not self.nli_validator.load_model():
+            raise RuntimeError("NLI model is not available")
+
+    def warm_up_colbert(self) -> int:
+        """Load the ColBERT model and encode the chunks deferred by setup().
+
+        Blocking. Returns the number of newly encoded chunks.
+        """
+        if self.colbert_reranker is None:
+            return 0
+        self.colbert_reranker.load_model()
+        texts, self._colbert_pending_texts = self._colbert_pending_texts, None
+        if not texts:
+            return 0
+        return self.colbert_reranker.precompute_document_embeddings(texts)
+
     async def cleanup(self):
         """Clean up resources."""
         logger.info("Cleaning up simplified RAG service resources...")
@@ -924,11 +1082,65 @@ class SimplifiedRAGService:
                 - response_time: Time taken to process the query
                 - error: Error message (if any)
         """
+        # Root trace for direct API calls; a span of the channel trace otherwise
+        with request_trace(
+            "rag.query",
+            detection_source=str(detection_source or ""),
+            question=redact_for_logs(str(question or ""))[:200],
+        ) as trace:
+            query_kwargs = {
+                "chat_history": chat_history,
+                "override_version": override_version,
+                "detection_source": detection_source,
+                "language_hint": language_hint,
+                "language_hint_confidence": language_hint_confidence,
+            }
+            if self.query_coalescer is not None and not chat_history:
+                result = await self._coalesced_query(question, **query_kwargs)
+            else:
+                result = await self._query(question, **query_kwargs)
+            trace.set(
+                detected_version=result.get("detected_version"),
+                routing_action=result.get("routing_action"),
+                answered_from=result.get("answered_from"),
+                error=result.get("error"),
+            )
+            return result
+
+    async def _coalesced_query(
+        self, question: str, **query_kwargs: Any
+    ) -> Dict[str, Any]:
+        """Run a standalone query, sharing the run with concurrent duplicates."""
+        start_time = time.time()
+        scope = (
+            str(query_kwargs.get("detection_source") or "").strip().lower(),
+            str(query_kwargs.get("language_hint") or "").strip().lower(),
+            query_kwargs.get("override_version"),
+        )
+        result, coalesced = await self.query_coalescer.run(
+            scope, question, lambda: self._query(question, **query_kwargs)
+        )
+        if coalesced:
+            result["coalesced"] = True
+            result["response_time"] = time.time() - start_time
+            result["localized_question"] = question.strip()
+        return result
+
+    async def _query(
+        self,
+        question: str,
+        chat_history: Optional[List[Dict[str, str]]] = None,
+        override_version: Optional[str] = None,
+        detection_source: Optional[str] = None,
+        language_hint: Optional[str] = None,
+        language_hint_confidence: Optional[float] = None,
+    ) -> Dict[str, Any]:
         start_time = time.time()
 
         # Track request rate
         RAG_REQUEST_RATE.inc()
         chat_history = self._normalize_chat_history(question, chat_history)
+        speculation: Optional[SpeculativeRetrieval] = None
 
         try:
             # Used for feedback entries created by this service when no upstream message_id exists.
@@ -950,6 +1162,17 @@ class SimplifiedRAGService:
             localized_question = question.strip()
             preprocessed_question = localized_question
 
+            # Retrieve for the question as typed while the analysis below runs
+            as_typed = await self._analyze_question_as_typed(
+                localized_question,
+                chat_history=chat_history,
+                override_version=override_version,
+                language_hint=language_hint,
+                detection_source=detection_source,
+            )
+            if as_typed is not None:
+                speculation = as_typed.speculation
+
             # Handle multilingual translation if service is available
             original_language = "en"
             was_translated = False
@@ -970,11 +1193,14 @@ class SimplifiedRAGService:
                                 chat_history
                             )
                         )
-                    translation_result = await self.translation_service.translate_query(
-                        preprocessed_question,
-                        source_lang=source_lang_hint,
-                        prior_language=prior_language,
-                    )
+                    with trace_span("translation.query"):
+                        translation_result = (
+                            await self.translation_service.translate_query(
+                                preprocessed_question,
+                                source_lang=source_lang_hint,
+                                prior_language=prior_language,
+                            )
+                        )
                     original_language = translation_result.get("source_lang", "en")
                     was_translated = not translation_result.get("skipped", True)
                     detection_backend = (
@@ -1020,10 +1246,11 @@ class SimplifiedRAGService:
                 and self.query_rewriter
             ):
                 try:
-                    rewrite_result = await self.query_rewriter.rewrite(
-                        query=preprocessed_question,
-                        chat_history=chat_history,
-                    )
+                    with trace_span("query_rewrite"):
+                        rewrite_result = await self.query_rewriter.rewrite(
+                            query=preprocessed_question,
+                            chat_history=chat_history,
+                        )
                     if rewrite_result.rewritten:
                         preprocessed_question = rewrite_result.rewritten_query
                         rewrite_metadata = {
@@ -1044,11 +1271,21 @@ class SimplifiedRAGService:
                     f"Using override version: {detected_version} (Shadow Mode confirmed)"
                 )
             else:
-                detected_version, version_confidence, clarifying_question = (
-                    await self.version_detector.detect_version(
-                        preprocessed_question, chat_history
+                if (
+                    as_typed is not None
+                    and as_typed.version is not None
+                    and as_typed.question == preprocessed_question
+                ):
+                    detected_version, version_confidence, clarifying_question = (
+                        as_typed.version
                     )
-                )
+                else:
+                    with trace_span("version_detection"):
+                        detected_version, version_confidence, clarifying_question = (
+                            await self.version_detector.detect_version(
+                                preprocessed_question, chat_history
+                            )
+                        )
                 logger.info(
                     f"Detected version: {detected_version} (confidence: {version_confidence:.2f})"
                 )
@@ -1121,11 +1358,62 @@ class SimplifiedRAGService:
                 version_confidence=version_confidence,
             )
 
+            # Standalone questions can be answered from the semantic cache
+            cache_scope = None
+            cache_embedding = None
+            if (
+                self.answer_cache is not None
+                and self.answer_cache.active
+                and not chat_history
+            ):
+                cache_scope = (
+                    detected_version,
+                    original_language,
+                    str(detection_source or "").strip().lower(),
+                    self._prompt_version,
+                )
+                if (
+                    as_typed is not None
+                    and as_typed.cache_scope == cache_scope
+                    and as_typed.question == canonical_question_en
+                ):
+                    cache_hit = as_typed.cache_hit
+                    cache_embedding = as_typed.cache_embedding
+                else:
+                    with trace_span("answer_cache.lookup") as span:
+                        cache_hit, cache_embedding = await self._lookup_cached_answer(
+                            cache_scope, canonical_question_en
+                        )
+                        span.set(hit=cache_hit is not None)
+                if cache_hit is not None:
+                    update_error_rate(is_error=False)
+                    return self._response_from_cache(
+                        cache_hit,
+                        start_time=start_time,
+                        localized_question=localized_question,
+                        canonical_question_en=canonical_question_en,
+                    )
+
             # Get relevant documents with version priority and similarity scores
             # Pass detected_version to ensure correct version-specific retrieval
-            docs, doc_scores = self.document_retriever.retrieve_with_scores(
-                preprocessed_question, detected_version
-            )
+            with trace_span("retrieval", detected_version=detected_version) as span:
+                speculative_result = None
+                if speculation is not None and speculation.matches(
+                    preprocessed_question, detected_version
+                ):
+                    try:
+                        speculative_result = await speculation.result()
+                    except Exception as e:
+                        logger.warning(f"Speculative retrieval failed, retrying: {e}")
+                if speculative_result is not None:
+                    docs, doc_scores = speculative_result
+                else:
+                    docs, doc_scores = self.document_retriever.retrieve_with_scores(
+                        preprocessed_question, detected_version
+                    )
+                span.set(
+                    documents=len(docs), speculative=speculative_result is not None
+                )
 
             logger.info(
                 f"Retrieved {len(docs)} relevant documents (for version: {detected_version})"
@@ -1258,10 +1546,18 @@ class SimplifiedRAGService:
                     # Invoke LLM with MCP tools via AISuite native HTTP transport
                     # The LLM autonomously decides when to call tools
                     # (no tools parameter - MCP config is baked into the wrapper)
-                    tool_result = self.llm.invoke_with_tools(
-                        prompt=full_prompt,
-                        max_turns=5,
-                    )
+                    with trace_span("generation.mcp") as span:
+                        tool_result = self.llm.invoke_with_tools(
+                            prompt=full_prompt,
+                            max_turns=5,
+                        )
+                        span.set(
+                            success=bool(tool_result.success),
+                            tools=[
+                                tc.get("tool")
+                                for tc in (tool_result.tool_calls_made or [])
+                            ],
+                        )
 
                     # Check if tool invocation actually succeeded
                     if not tool_result.success:
@@ -1418,19 +1714,21 @@ class SimplifiedRAGService:
             sources = self._deduplicate_sources(sources)
 
             # Calculate confidence score
-            confidence = await self.confidence_scorer.calculate_confidence(
-                answer=response_text,
-                sources=docs,
-                question=preprocessed_question,
-            )
+            with trace_span("confidence"):
+                confidence = await self.confidence_scorer.calculate_confidence(
+                    answer=response_text,
+                    sources=docs,
+                    question=preprocessed_question,
+                )
 
             # Get routing decision based on confidence
-            routing_action = await self.auto_send_router.route_response(
-                confidence=confidence,
-                question=preprocessed_question,
-                answer=response_text,
-                sources=docs,
-            )
+            with trace_span("routing"):
+                routing_action = await self.auto_send_router.route_response(
+                    confidence=confidence,
+                    question=preprocessed_question,
+                    answer=response_text,
+                    sources=docs,
+                )
 
             # Generate human-readable routing reason
             routing_reason = self.routing_reason_generator.generate(
@@ -1450,11 +1748,12 @@ class SimplifiedRAGService:
                 and original_language != "en"
             ):
                 try:
-                    response_translation = (
-                        await self.translation_service.translate_response(
-                            response_text, target_lang=original_language
+                    with trace_span("translation.response"):
+                        response_translation = (
+                            await self.translation_service.translate_response(
+                                response_text, target_lang=original_language
+                            )
                         )
-                    )
                     if not response_translation.get("error"):
                         final_response = response_translation["translated_text"]
                         logger.info(f"Translated response to {original_language}")
@@ -1509,7 +1808,7 @@ class SimplifiedRAGService:
             # Update error rate (success)
             update_error_rate(is_error=False)
 
-            return {
+            result = {
                 "answer": final_response,
                 "sources": sources,
                 "response_time": response_time,
@@ -1531,6 +1830,17 @@ class SimplifiedRAGService:
                 "localized_answer": final_response,
                 "query_rewrite": rewrite_metadata,
             }
+            if (
+                cache_scope is not None
+                and cache_embedding is not None
+                and routing_action.action == "auto_send"
+                and not mcp_tools_used
+            ):
+                # Live-data answers and answers held for review are not reused
+                self.answer_cache.store(
+                    cache_scope, canonical_question_en, cache_embedding, result
+                )
+            return result
 
         except Exception as e:
             error_time = time.time() - start_time
@@ -1547,6 +1857,108 @@ class SimplifiedRAGService:
                 "forwarded_to_human": False,
                 "feedback_created": False,
             }
+        finally:
+            if speculation is not None:
+                speculation.discard()
+
+    async def _analyze_question_as_typed(
+        self,
+        question: str,
+        *,
+        chat_history: List[Dict[str, str]],
+        override_version: Optional[str],
+        language_hint: Optional[str],
+        detection_source: Optional[str],
+    ) -> Optional[AsTypedAnalysis]:
+        """Detect the version and look up the answer cache for the question
+        as typed, then start retrieval for it speculatively.
+
+        Returns None when the query will almost certainly change before
+        retrieval: follow-ups (rewritten with history) and questions that are
+        not clearly English (translated). Retrieval is not started when the
+        question will be answered with a clarification or from the cache.
+        """
+        if not getattr(self.settings, "ENABLE_SPECULATIVE_RETRIEVAL", False):
+            return None
+        if chat_history or self.document_retriever is None:
+            return None
+        if str(language_hint or "").strip().lower() not in {"", "en"}:
+            return None
+        if self.translation_service is not None:
+            detector = getattr(self.translation_service, "detector", None)
+            is_likely_english = getattr(detector, "is_likely_english", None)
+            if not callable(is_likely_english) or not is_likely_english(question):
+                return None
+        analysis = AsTypedAnalysis(question)
+        version = override_version
+        if not version:
+            with trace_span("version_detection"):
+                analysis.version = await self.version_detector.detect_version(
+                    question, []
+                )
+            version, confidence, clarifying_question = analysis.version
+            if clarifying_question and confidence < 0.5:
+                return analysis
+        if self.answer_cache is not None and self.answer_cache.active:
+            analysis.cache_scope = (
+                version,
+                "en",
+                str(detection_source or "").strip().lower(),
+                self._prompt_version,
+            )
+            with trace_span("answer_cache.lookup") as span:
+                analysis.cache_hit, analysis.cache_embedding = (
+                    await self._lookup_cached_answer(analysis.cache_scope, question)
+                )
+                span.set(hit=analysis.cache_hit is not None)
+            if analysis.cache_hit is not None:
+                return analysis
+        analysis.speculation = SpeculativeRetrieval(
+            self.document_retriever.retrieve_with_scores, question, version
+        )
+        return analysis
+
+    async def _lookup_cached_answer(
+        self, scope: tuple, question: str
+    ) -> tuple[Optional[AnswerCacheHit], Optional[List[float]]]:
+        """Look up a cached answer; also returns the question embedding.
+
+        Repeated questions are served without embedding them. Cache errors
+        are treated as misses.
+        """
+        try:
+            hit = self.answer_cache.lookup_exact(scope, question)
+            if hit is not None or self.embeddings is None:
+                return hit, None
+            embedding = await asyncio.to_thread(self.embeddings.embed_query, question)
+            return self.answer_cache.lookup(scope, question, embedding), embedding
+        except Exception as e:
+            logger.warning(f"Answer cache lookup failed: {e}")
+            return None, None
+
+    @staticmethod
+    def _response_from_cache(
+        hit: AnswerCacheHit,
+        *,
+        start_time: float,
+        localized_question: str,
+        canonical_question_en: str,
+    ) -> Dict[str, Any]:
+        response = hit.response
+        response["response_time"] = time.time() - start_time
+        response["localized_question"] = localized_question
+        response["canonical_question_en"] = canonical_question_en
+        response["answer_cache"] = {
+            "hit": True,
+            "similarity": round(hit.similarity, 4),
+            "matched_question": hit.matched_question,
+        }
+        logger.info(
+            "Answered from semantic cache (similarity=%.4f) in %.3fs",
+            hit.similarity,
+            response["response_time"],
+        )
+        return response
 
     async def search_faq_similarity(
         self,
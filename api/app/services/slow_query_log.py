@@ -0,0 +1,154 @@
+"""Bounded SQLite log of slow requests with their stage waterfall."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional
+
+from app.utils.request_trace import RequestTrace
+
+logger = logging.getLogger(__name__)
+
+
+class SlowQueryLog:
+    """Keep the most recent request traces that exceeded a latency threshold.
+
+    Args:
+        db_path: SQLite database file
+        threshold_ms: Root traces at or above this duration are recorded
+        max_entries: Oldest entries beyond this count are pruned on insert
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        threshold_ms: float = 8000.0,
+        max_entries: int = 500,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold_ms = float(threshold_ms)
+        self.max_entries = max(1, int(max_entries))
+        self._write_lock = threading.Lock()
+        self._initialize()
+
+    @contextmanager
+    def connection(self) -> Generator[sqlite3.Connection, None, None]:
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _initialize(self) -> None:
+        with self.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS slow_queries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    trace_id TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    duration_ms REAL NOT NULL,
+                    started_at TEXT NOT NULL,
+                    attributes_json TEXT NOT NULL DEFAULT '{}',
+                    spans_json TEXT NOT NULL DEFAULT '[]'
+                )
+                """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_slow_queries_duration "
+                "ON slow_queries (duration_ms)"
+            )
+
+    def __call__(self, trace: RequestTrace) -> None:
+        """Trace sink: record ``trace`` if it was slow."""
+        if trace.duration_ms is not None and trace.duration_ms >= self.threshold_ms:
+            self.record(trace)
+
+    def record(self, trace: RequestTrace) -> None:
+        data = trace.to_dict()
+        if data["dropped_spans"]:
+            data["attributes"]["dropped_spans"] = data["dropped_spans"]
+        with self._write_lock, self.connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO slow_queries (
+                    trace_id,
+                    name,
+                    status,
+                    duration_ms,
+                    started_at,
+                    attributes_json,
+                    spans_json
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    data["trace_id"],
+                    data["name"],
+                    data["status"],
+                    data["duration_ms"] or 0.0,
+                    data["started_at"],
+                    json.dumps(data["attributes"], sort_keys=True, default=str),
+                    json.dumps(data["spans"], default=str),
+                ),
+            )
+            conn.execute(
+                """
+                DELETE FROM slow_queries WHERE id <= (
+                    SELECT id FROM slow_queries ORDER BY id DESC LIMIT 1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+        logger.info(
+            "Slow request recorded: %s took %.0fms (trace %s)",
+            data["name"],
+            data["duration_ms"] or 0.0,
+            data["trace_id"],
+        )
+
+    def list_entries(
+        self,
+        *,
+        limit: int = 50,
+        min_duration_ms: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Most recent slow requests first, each with its full waterfall."""
+        if min_duration_ms is not None:
+            query = """
+                SELECT * FROM slow_queries
+                WHERE duration_ms >= ?
+                ORDER BY id DESC
+                LIMIT ?
+            """
+            params: tuple[Any, ...] = (float(min_duration_ms), limit)
+        else:
+            query = "SELECT * FROM slow_queries ORDER BY id DESC LIMIT ?"
+            params = (limit,)
+        with self.connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._entry_from_row(row) for row in rows]
+
+    def count(self) -> int:
+        with self.connection() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM slow_queries").fetchone()[0])
+
+    @staticmethod
+    def _entry_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "trace_id": row["trace_id"],
+            "name": row["name"],
+            "status": row["status"],
+            "duration_ms": row["duration_ms"],
+            "started_at": row["started_at"],
+            "attributes": json.loads(row["attributes_json"] or "{}"),
+            "spans": json.loads(row["spans_json"] or "[]"),
+        }
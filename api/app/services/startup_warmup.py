@@ -0,0 +1,250 @@
+"""Tracked startup warm-up tasks.
+
+The API starts serving as soon as its cheap dependencies are wired. Expensive
+preparation (index verification or rebuild, model loads, cache warming) runs
+as named warm-up components whose state is reported by ``/health/ready``.
+Required components gate readiness; optional ones only mark the service as
+degraded while they are pending or after they failed. Components can retry
+with exponential backoff before they are marked failed.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+READY = "ready"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+WarmupFactory = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class WarmupComponent:
+    """State of one warm-up component."""
+
+    name: str
+    required: bool
+    status: str = PENDING
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return round(end - self.started_at, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "required": self.required,
+            "duration_seconds": self.duration_seconds,
+            "error": self.error,
+            "attempts": self.attempts,
+        }
+
+
+class StartupWarmup:
+    """Registry of warm-up components and the background tasks running them."""
+
+    def __init__(self) -> None:
+        self._components: Dict[str, WarmupComponent] = {}
+        self._finished: Dict[str, asyncio.Event] = {}
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+    def _register(self, name: str, required: bool) -> WarmupComponent:
+        if name in self._components:
+            raise ValueError(f"Warm-up component '{name}' is already registered")
+        component = WarmupComponent(name=name, required=required)
+        self._components[name] = component
+        self._finished[name] = asyncio.Event()
+        return component
+
+    async def _execute(
+        self,
+        component: WarmupComponent,
+        factory: WarmupFactory,
+        after: Tuple[str, ...],
+        retries: int = 0,
+        retry_delay: float = 0.0,
+    ) -> None:
+        for dependency in after:
+            if not await self.wait(dependency):
+                component.status = SKIPPED
+                component.error = f"dependency '{dependency}' is not ready"
+                logger.warning(
+                    "Warm-up '%s' skipped: %s", component.name, component.error
+                )
+                return
+
+        component.status = RUNNING
+        component.started_at = time.time()
+        logger.info("Warm-up '%s' started", component.name)
+        try:
+            while True:
+                component.attempts += 1
+                try:
+                    await factory()
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if component.attempts > retries:
+                        raise
+                    delay = retry_delay * 2 ** (component.attempts - 1)
+                    component.error = f"{type(e).__name__}: {e}"
+                    logger.warning(
+                        "Warm-up '%s' attempt %d failed (%s), retrying in %.1fs",
+                        component.name,
+                        component.attempts,
+                        component.error,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            component.status = FAILED
+            component.error = "cancelled"
+            raise
+        except Exception as e:
+            component.status = FAILED
+            component.error = f"{type(e).__name__}: {e}"
+            raise
+        else:
+            component.status = READY
+            component.error = None
+            logger.info(
+                "Warm-up '%s' ready after %.1fs",
+                component.name,
+                component.duration_seconds or 0.0,
+            )
+        finally:
+            component.finished_at = time.time()
+
+    async def run(
+        self,
+        name: str,
+        factory: WarmupFactory,
+        *,
+        required: bool = True,
+        after: Iterable[str] = (),
+        retries: int = 0,
+        retry_delay: float = 0.0,
+    ) -> None:
+        """Run a component inline; errors propagate to the caller."""
+        component = self._register(name, required)
+        try:
+            await self._execute(component, factory, tuple(after), retries, retry_delay)
+        finally:
+            self._finished[name].set()
+
+    def start(
+        self,
+        name: str,
+        factory: WarmupFactory,
+        *,
+        required: bool = True,
+        after: Iterable[str] = (),
+        retries: int = 0,
+        retry_delay: float = 0.0,
+    ) -> asyncio.Task[None]:
+        """Run a component in a background task.
+
+        Args:
+            name: Component name reported by ``snapshot()``
+            factory: Zero-argument callable returning the awaitable to run
+            required: Whether readiness waits for this component
+            after: Components that must be ready first; the component is
+                skipped if any of them fails
+            retries: Extra attempts after a failure before giving up
+            retry_delay: Seconds before the first retry, doubled per retry
+        """
+        component = self._register(name, required)
+        dependencies = tuple(after)
+
+        async def _runner() -> None:
+            try:
+                await self._execute(
+                    component, factory, dependencies, retries, retry_delay
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Warm-up '%s' failed", name)
+            finally:
+                self._finished[name].set()
+
+        task = asyncio.create_task(_runner(), name=f"warmup:{name}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def status_of(self, name: str) -> Optional[str]:
+        component = self._components.get(name)
+        return component.status if component is not None else None
+
+    def is_ready(self, name: str) -> bool:
+        return self.status_of(name) == READY
+
+    @property
+    def failed(self) -> bool:
+        """True once a required component failed or was skipped."""
+        return any(
+            c.required and c.status in (FAILED, SKIPPED)
+            for c in self._components.values()
+        )
+
+    async def wait(self, name: str, timeout: Optional[float] = None) -> bool:
+        """Wait for a component to finish; True if it became ready."""
+        event = self._finished.get(name)
+        if event is None:
+            return False
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.is_ready(name)
+
+    @property
+    def ready(self) -> bool:
+        """True once every required component is ready."""
+        return all(c.status == READY for c in self._components.values() if c.required)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Overall status plus per-component details.
+
+        ``status`` is "ready" when all components are ready, "degraded" when
+        only optional components are pending or failed, "failed" when a
+        required component failed and "warming" otherwise.
+        """
+        components = self._components.values()
+        if self.failed:
+            status = FAILED
+        elif not self.ready:
+            status = "warming"
+        elif all(c.status == READY for c in components):
+            status = READY
+        else:
+            status = "degraded"
+        return {
+            "status": status,
+            "ready": self.ready,
+            "components": {c.name: c.to_dict() for c in components},
+        }
+
+    async def shutdown(self) -> None:
+        """Cancel warm-up tasks that are still running."""
+        tasks = [task for task in self._tasks if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
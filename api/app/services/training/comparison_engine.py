@@ -6,10 +6,10 @@ import logging
 import random
 import re
 from dataclasses import dataclass
-from hashlib import sha256
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
+from app.services.training.embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +76,14 @@ Return JSON:
 }
 """
 
+# Scores every judge verdict must contain
+JUDGE_SCORE_KEYS = (
+    "factual_alignment",
+    "contradiction_score",
+    "completeness",
+    "hallucination_risk",
+)
+
 # Prompt injection patterns to filter
 INJECTION_PATTERNS = [
     r"ignore\s+(all\s+)?(previous|above|prior)",
@@ -197,6 +205,9 @@ class ComparisonResult:
 class AnswerComparisonEngine:
     """Compare generated answers with staff answers."""
 
+    # Texts per embedding request (provider input limits)
+    EMBEDDING_REQUEST_MAX_TEXTS = 512
+
     def __init__(
         self,
         ai_client: Any,
@@ -204,6 +215,10 @@ class AnswerComparisonEngine:
         judge_model: str = "openai:gpt-4o-mini",
         embedding_threshold: float = 0.5,
         calibration_samples_required: int = 100,
+        judge_batch_size: int = 4,
+        embedding_cache_size: int = 5000,
+        embedding_cache_path: Optional[str] = None,
+        embedding_cache_max_rows: int = 100_000,
     ):
         """
         Initialize comparison engine.
@@ -214,19 +229,29 @@ class AnswerComparisonEngine:
             judge_model: Model for LLM-as-Judge
             embedding_threshold: Min similarity for Tier 2 evaluation
             calibration_samples_required: Samples needed before auto-approve enabled
+            judge_batch_size: Max answer pairs judged in one LLM call by compare_batch
+            embedding_cache_size: Max embeddings kept in memory (LRU)
+            embedding_cache_path: Optional SQLite file persisting embeddings
+            embedding_cache_max_rows: Max embeddings kept in the SQLite file
         """
         self.ai_client = ai_client
         self.embeddings = embeddings_model
         self.judge_model = judge_model
         self.embedding_threshold = embedding_threshold
+        self.judge_batch_size = max(1, judge_batch_size)
 
         # Calibration mode
         self.calibration_samples_required = calibration_samples_required
         self.calibration_count = 0
         self.calibrated_thresholds: Optional[Dict[str, float]] = None
 
-        # Embedding cache for cost optimization
-        self._embedding_cache: Dict[str, List[float]] = {}
+        # Embedding cache for cost optimization, bounded for long training syncs
+        self._embedding_cache = EmbeddingCache(
+            model_id=self._embedding_model_id(embeddings_model),
+            max_entries=embedding_cache_size,
+            db_path=embedding_cache_path,
+            max_disk_entries=embedding_cache_max_rows,
+        )
 
         # Token usage tracking
         self.total_prompt_tokens = 0
@@ -247,25 +272,66 @@ class AnswerComparisonEngine:
             return 0.0
         return float(np.dot(a, b) / (norm_a * norm_b))
 
+    @staticmethod
+    def _embedding_model_id(embeddings_model: Any) -> str:
+        """Identify the embedding space (model and dimensions) for cache keys."""
+        model = getattr(embeddings_model, "model", None)
+        if not isinstance(model, str) or not model:
+            model = type(embeddings_model).__name__
+        dimensions = getattr(embeddings_model, "dimensions", None)
+        return f"{model}:{dimensions}" if isinstance(dimensions, int) else model
+
     async def _get_embedding_cached(self, text: str) -> List[float]:
         """
         Get embedding with caching.
 
         Staff answers are cached to avoid re-embedding for each comparison.
         """
-        cache_key = sha256(text.encode()).hexdigest()
-
-        if cache_key in self._embedding_cache:
-            return self._embedding_cache[cache_key]
+        return (await self._get_embeddings_cached([text]))[0]
+
+    async def _get_embeddings_cached(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for many texts, embedding all cache misses in one call."""
+        cache = self._embedding_cache
+        keys = [cache.key(text) for text in texts]
+        if cache.persistent:
+            vectors = await asyncio.to_thread(cache.get_many, keys)
+        else:
+            vectors = cache.get_many(keys)
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+
+        if missing:
+            if hasattr(self.embeddings, "embed_documents"):
+                embedded = []
+                pending = list(missing.values())
+                for start in range(0, len(pending), self.EMBEDDING_REQUEST_MAX_TEXTS):
+                    embedded.extend(
+                        await asyncio.to_thread(
+                            self.embeddings.embed_documents,
+                            pending[start : start + self.EMBEDDING_REQUEST_MAX_TEXTS],
+                        )
+                    )
+            else:
+                embedded = [
+                    await asyncio.to_thread(self.embeddings.embed_query, text)
+                    for text in missing.values()
+                ]
+            new_vectors = dict(zip(missing, embedded))
+            if cache.persistent:
+                await asyncio.to_thread(cache.set_many, new_vectors)
+            else:
+                cache.set_many(new_vectors)
+            vectors.update(new_vectors)
 
-        result = await asyncio.to_thread(self.embeddings.embed_query, text)
-        self._embedding_cache[cache_key] = result
-        return result
+        return [list(map(float, vectors[key])) for key in keys]
 
     async def _call_llm_with_retry(
         self,
         messages: List[Dict[str, str]],
         max_retries: int = 3,
+        max_tokens: int = 800,
     ) -> Any:
         """Call LLM with exponential backoff retry for rate limits."""
         for attempt in range(max_retries):
@@ -275,7 +341,7 @@ class AnswerComparisonEngine:
                     model=self.judge_model,
                     messages=messages,
                     temperature=0.0,  # Deterministic for consistency
-                    max_tokens=800,  # Increased for chain-of-thought
+                    max_tokens=max_tokens,  # 800 per answer pair for chain-of-thought
                 )
 
                 # Track token usage
@@ -383,57 +449,97 @@ Follow the evaluation rubric in your instructions."""
                 "reasoning": f"LLM evaluation failed: {e}",
             }
 
-    async def compare(
+    async def _llm_judge_batch(
         self,
-        question_event_id: str,
-        question_text: str,
-        staff_answer: str,
-        generated_answer: str,
-    ) -> ComparisonResult:
+        pairs: List[Tuple[str, str, str]],
+    ) -> List[Dict[str, Any]]:
+        """Judge several (question, staff, generated) pairs in one LLM call.
+
+        Pairs whose verdict is missing or incomplete in the batched response
+        are re-judged individually with ``_llm_judge``.
         """
-        Compare generated answer with staff answer using three-tier evaluation.
+        if len(pairs) == 1:
+            return [await self._llm_judge(*pairs[0])]
 
-        Tiers:
-        1. Fast embedding similarity check
-        2. LLM-as-Judge for candidates passing Tier 1
-        3. Hallucination detection for all Tier 2 candidates
+        blocks = []
+        for index, (question, staff_answer, generated_answer) in enumerate(pairs):
+            blocks.append(f"""### Pair {index}
 
-        Returns:
-            ComparisonResult with scores and routing decision
-        """
-        # Tier 1: Embedding similarity (with caching)
-        staff_emb, gen_emb = await asyncio.gather(
-            self._get_embedding_cached(staff_answer),
-            self._get_embedding_cached(generated_answer),
-        )
+**User Question**: {self._sanitize_for_prompt(question)}
 
-        embedding_sim = self._cosine_similarity(staff_emb, gen_emb)
+**Staff Answer**: {self._sanitize_for_prompt(staff_answer)}
 
-        # If embedding similarity is very low, skip Tier 2
-        if embedding_sim < self.embedding_threshold:
-            routing = ComparisonResult.determine_routing(
-                score=embedding_sim * 0.15,
-                is_calibration_mode=self.is_calibration_mode,
-                calibrated_thresholds=self.calibrated_thresholds,
+**Generated Answer**: {self._sanitize_for_prompt(generated_answer)}""")
+        prompt = (
+            f"Compare the two answers in each of these {len(pairs)} independent "
+            "pairs:\n\n"
+            + "\n\n".join(blocks)
+            + "\n\nFollow the evaluation rubric in your instructions for every "
+            'pair. Return JSON: {"results": [...]} with one rubric object per '
+            'pair, each with an added "index" field naming its pair number.'
+        )
+
+        verdicts: Dict[int, Dict[str, Any]] = {}
+        try:
+            response = await self._call_llm_with_retry(
+                [
+                    {"role": "system", "content": JUDGE_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt},
+                ],
+                max_tokens=800 * len(pairs),
             )
-            return ComparisonResult(
-                question_event_id=question_event_id,
-                embedding_similarity=embedding_sim,
-                factual_alignment=0.0,
-                contradiction_score=1.0,
-                completeness=0.0,
-                hallucination_risk=0.5,
-                llm_reasoning="Skipped Tier 2 due to low embedding similarity",
-                final_score=embedding_sim * 0.15,
-                routing=routing,
-                is_calibration=self.is_calibration_mode,
+            result = self._extract_json(response.choices[0].message.content or "{}")
+            for entry in result.get("results") or []:
+                if not isinstance(entry, dict):
+                    continue
+                index = entry.get("index")
+                if (
+                    isinstance(index, int)
+                    and 0 <= index < len(pairs)
+                    and all(
+                        isinstance(entry.get(key), (int, float))
+                        for key in JUDGE_SCORE_KEYS
+                    )
+                ):
+                    verdicts[index] = entry
+        except Exception as e:
+            logger.warning(f"Batched LLM judge failed, judging pairs one by one: {e}")
+
+        missing = [index for index in range(len(pairs)) if index not in verdicts]
+        if missing:
+            fallbacks = await asyncio.gather(
+                *(self._llm_judge(*pairs[index]) for index in missing)
             )
+            verdicts.update(zip(missing, fallbacks))
+        return [verdicts[index] for index in range(len(pairs))]
 
-        # Tier 2 + 3: LLM-as-Judge (includes hallucination detection)
-        judge_result = await self._llm_judge(
-            question_text, staff_answer, generated_answer
+    def _low_similarity_result(
+        self, question_event_id: str, embedding_sim: float
+    ) -> ComparisonResult:
+        routing = ComparisonResult.determine_routing(
+            score=embedding_sim * 0.15,
+            is_calibration_mode=self.is_calibration_mode,
+            calibrated_thresholds=self.calibrated_thresholds,
+        )
+        return ComparisonResult(
+            question_event_id=question_event_id,
+            embedding_similarity=embedding_sim,
+            factual_alignment=0.0,
+            contradiction_score=1.0,
+            completeness=0.0,
+            hallucination_risk=0.5,
+            llm_reasoning="Skipped Tier 2 due to low embedding similarity",
+            final_score=embedding_sim * 0.15,
+            routing=routing,
+            is_calibration=self.is_calibration_mode,
         )
 
+    def _judged_result(
+        self,
+        question_event_id: str,
+        embedding_sim: float,
+        judge_result: Dict[str, Any],
+    ) -> ComparisonResult:
         # Handle explicit failure - route to human review
         if judge_result.get("evaluation_status") == "failed":
             return ComparisonResult(
@@ -483,6 +589,107 @@ Follow the evaluation rubric in your instructions."""
             is_calibration=self.is_calibration_mode,
         )
 
+    async def compare(
+        self,
+        question_event_id: str,
+        question_text: str,
+        staff_answer: str,
+        generated_answer: str,
+    ) -> ComparisonResult:
+        """
+        Compare generated answer with staff answer using three-tier evaluation.
+
+        Tiers:
+        1. Fast embedding similarity check
+        2. LLM-as-Judge for candidates passing Tier 1
+        3. Hallucination detection for all Tier 2 candidates
+
+        Returns:
+            ComparisonResult with scores and routing decision
+        """
+        # Tier 1: Embedding similarity (with caching, both texts in one request)
+        staff_emb, gen_emb = await self._get_embeddings_cached(
+            [staff_answer, generated_answer]
+        )
+
+        embedding_sim = self._cosine_similarity(staff_emb, gen_emb)
+
+        # If embedding similarity is very low, skip Tier 2
+        if embedding_sim < self.embedding_threshold:
+            return self._low_similarity_result(question_event_id, embedding_sim)
+
+        # Tier 2 + 3: LLM-as-Judge (includes hallucination detection)
+        judge_result = await self._llm_judge(
+            question_text, staff_answer, generated_answer
+        )
+        return self._judged_result(question_event_id, embedding_sim, judge_result)
+
+    async def compare_batch(
+        self,
+        items: List[Tuple[str, str, str, str]],
+    ) -> List[ComparisonResult]:
+        """
+        Compare many answer pairs with batched embeddings and judge calls.
+
+        Same tiers as ``compare``, but all answers are embedded in one request,
+        similarities are computed in one vectorized pass, and pairs passing
+        Tier 1 are judged ``judge_batch_size`` at a time (groups run
+        concurrently).
+
+        Args:
+            items: (question_event_id, question_text, staff_answer,
+                generated_answer) tuples
+
+        Returns:
+            ComparisonResults in the order of ``items``
+        """
+        if not items:
+            return []
+
+        texts = [text for item in items for text in (item[2], item[3])]
+        vectors = np.asarray(await self._get_embeddings_cached(texts), dtype=float)
+        staff_vecs, gen_vecs = vectors[0::2], vectors[1::2]
+        norms = np.linalg.norm(staff_vecs, axis=1) * np.linalg.norm(gen_vecs, axis=1)
+        dots = np.einsum("ij,ij->i", staff_vecs, gen_vecs)
+        similarities = np.divide(
+            dots, norms, out=np.zeros_like(dots), where=norms != 0
+        ).tolist()
+
+        judged = [
+            index
+            for index, similarity in enumerate(similarities)
+            if similarity >= self.embedding_threshold
+        ]
+        groups = [
+            judged[start : start + self.judge_batch_size]
+            for start in range(0, len(judged), self.judge_batch_size)
+        ]
+        group_verdicts = await asyncio.gather(
+            *(
+                self._llm_judge_batch(
+                    [(q, staff, gen) for _, q, staff, gen in (items[i] for i in group)]
+                )
+                for group in groups
+            )
+        )
+        verdicts = {
+            index: verdict
+            for group, group_results in zip(groups, group_verdicts)
+            for index, verdict in zip(group, group_results)
+        }
+
+        results = []
+        for index, (event_id, _, _, _) in enumerate(items):
+            if index in verdicts:
+                results.append(
+                    self._judged_result(event_id, similarities[index], verdicts[index])
+                )
+            else:
+                results.append(
+                    self._low_similarity_result(event_id, similarities[index])
+                )
+        return results
+
     def compare_sync(
         self,
         question_event_id: str,
@@ -513,3 +720,7 @@ Follow the evaluation rubric in your instructions."""
     def clear_embedding_cache(self) -> None:
         """Clear the embedding cache to free memory."""
         self._embedding_cache.clear()
+
+    def get_embedding_cache_stats(self) -> Dict[str, Any]:
+        """Get embedding cache size and hit statistics."""
+        return self._embedding_cache.get_stats()
@@ -0,0 +1,221 @@
+"""Bounded embedding cache for answer comparison.
+
+Training syncs compare thousands of staff/generated answer pairs, and staff
+answers recur across runs. ``EmbeddingCache`` keeps the most recently used
+vectors in memory (LRU, float32) so memory stays flat during long imports,
+and can persist vectors in SQLite so a restart does not re-embed texts that
+were already seen. The SQLite file is capped at ``max_disk_entries`` rows;
+the oldest rows are pruned on write. Keys hash the embedding model together with the text, so
+switching models never serves vectors from a different embedding space.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def embedding_cache_key(model_id: str, text: str) -> str:
+    """Content hash of a text for a given embedding model."""
+    return sha256(f"{model_id}\0{text}".encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """LRU cache of embeddings with optional SQLite persistence."""
+
+    def __init__(
+        self,
+        model_id: str = "",
+        max_entries: int = 5000,
+        db_path: Optional[str] = None,
+        max_disk_entries: int = 100_000,
+    ):
+        """Initialize the cache.
+
+        Args:
+            model_id: Embedding model identity, part of every key
+            max_entries: Maximum vectors kept in memory
+            db_path: SQLite file for persistent vectors (None = memory only)
+            max_disk_entries: Maximum rows kept in the SQLite file
+        """
+        self.model_id = model_id
+        self.max_entries = max(1, max_entries)
+        self.db_path = db_path
+        self.max_disk_entries = max(1, max_disk_entries)
+        # get_many/set_many run in worker threads when the cache is persistent
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        if db_path:
+            self._init_db()
+
+    def _init_db(self) -> None:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    cache_key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    dimensions INTEGER NOT NULL,
+                    vector BLOB NOT NULL,
+                    created_at INTEGER NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embeddings_created_at "
+                "ON embeddings (created_at)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def key(self, text: str) -> str:
+        return embedding_cache_key(self.model_id, text)
+
+    @property
+    def persistent(self) -> bool:
+        """Whether lookups and writes touch the SQLite file."""
+        return bool(self.db_path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Return cached vectors for the keys that are known.
+
+        Memory misses are looked up on disk (one query) and promoted. Blocks
+        on SQLite when persistent, so async callers run it in a thread.
+        """
+        found: Dict[str, np.ndarray] = {}
+        missing: List[str] = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                vector = self._entries.get(key)
+                if vector is None:
+                    missing.append(key)
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = vector
+            self.hits += len(found)
+
+        if missing and self.db_path:
+            stored = self._load(missing)
+            with self._lock:
+                self.disk_hits += len(stored)
+                for key, vector in stored.items():
+                    self._remember(key, vector)
+            found.update(stored)
+            missing = [key for key in missing if key not in stored]
+        with self._lock:
+            self.misses += len(missing)
+        return found
+
+    def set_many(self, vectors: Dict[str, Sequence[float]]) -> None:
+        """Cache vectors in memory and, if configured, on disk."""
+        arrays = {
+            key: np.asarray(vector, dtype=np.float32).reshape(-1)
+            for key, vector in vectors.items()
+        }
+        with self._lock:
+            for key, vector in arrays.items():
+                self._remember(key, vector)
+        if arrays and self.db_path:
+            self._store(arrays)
+
+    def clear(self) -> None:
+        """Drop the in-memory vectors (persisted vectors are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        total = self.hits + self.disk_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits + self.disk_hits) / total if total > 0 else 0,
+            "persistent": bool(self.db_path),
+        }
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        stored: Dict[str, np.ndarray] = {}
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                # Stay below SQLite's bound-parameter limit
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start : start + 500]
+                    rows = conn.execute(
+                        "SELECT cache_key, vector FROM embeddings WHERE model = ? "
+                        f"AND cache_key IN ({','.join('?' * len(chunk))})",
+                        (self.model_id, *chunk),
+                    ).fetchall()
+                    for key, blob in rows:
+                        stored[key] = np.frombuffer(blob, dtype=np.float32).copy()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+        return stored
+
+    def _store(self, vectors: Dict[str, np.ndarray]) -> None:
+        now = int(time.time())
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO embeddings
+                    (cache_key, model, dimensions, vector, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (key, self.model_id, vector.size, vector.tobytes(), now)
+                        for key, vector in vectors.items()
+                    ],
+                )
+                self._prune(conn)
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Delete the oldest rows beyond ``max_disk_entries``."""
+        (count,) = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        excess = count - self.max_disk_entries
+        if excess <= 0:
+            return
+        conn.execute(
+            """
+            DELETE FROM embeddings WHERE cache_key IN (
+                SELECT cache_key FROM embeddings
+                ORDER BY created_at ASC, rowid ASC LIMIT ?
+            )
+            """,
+            (excess,),
+        )
+        logger.debug(f"Pruned {excess} persisted embeddings")
@@ -0,0 +1,114 @@
+"""Extraction planner - token-budgeted chunking of chat transcripts.
+
+Large message batches (e.g. a full Matrix history import) do not fit into a
+single extraction prompt. The planner splits normalized messages into
+consecutive chunks whose estimated transcript size stays within a token
+budget, preferring cut points that no reply/citation link crosses so that a
+question and the staff answer replying to it land in the same chunk.
+
+Messages keep their original order; every message belongs to exactly one
+chunk.
+"""
+
+from typing import Any, Dict, List, Optional
+
+# Approximate characters per token for chat text
+CHARS_PER_TOKEN = 4
+# Per-line overhead of "[Msg #N] [Staff_1] (ID: ...): " and reply markers
+LINE_OVERHEAD_CHARS = 64
+
+
+def estimate_message_tokens(message: Dict[str, Any]) -> int:
+    """Estimate the transcript tokens one normalized message contributes."""
+    chars = len(message.get("text") or "") + len(str(message.get("id") or ""))
+    if message.get("citation") or message.get("reply_to"):
+        chars += LINE_OVERHEAD_CHARS
+    return (chars + LINE_OVERHEAD_CHARS) // CHARS_PER_TOKEN + 1
+
+
+def resolve_reply_targets(messages: List[Dict[str, Any]]) -> List[Optional[int]]:
+    """Resolve each message's reply/citation to the index of an earlier message.
+
+    Matrix messages reference their parent by event ID (``reply_to``). Bisq 2
+    citations only carry the cited author and text, so they resolve to the
+    earliest preceding message by that author whose text contains the first
+    50 characters of the citation.
+
+    Returns:
+        One entry per message: the referenced index, or None if unresolved
+    """
+    id_to_index: Dict[str, int] = {}
+    for i, msg in enumerate(messages):
+        mid = msg.get("id", "")
+        if mid:
+            id_to_index[mid] = i
+
+    by_author: Dict[str, List[int]] = {}
+    targets: List[Optional[int]] = []
+    for i, msg in enumerate(messages):
+        target: Optional[int] = None
+        citation = msg.get("citation")
+        reply_to = msg.get("reply_to")
+        if citation:
+            cited_author = citation.get("author", "unknown")
+            cited_text = (citation.get("text") or "")[:50]
+            if cited_text:
+                for j in by_author.get(cited_author, []):
+                    if cited_text in messages[j].get("text", ""):
+                        target = j
+                        break
+        elif reply_to:
+            target = id_to_index.get(reply_to)
+        targets.append(target)
+
+        if msg.get("id", ""):
+            by_author.setdefault(msg.get("author"), []).append(i)
+    return targets
+
+
+def plan_extraction_chunks(
+    messages: List[Dict[str, Any]],
+    token_budget: int,
+) -> List[List[Dict[str, Any]]]:
+    """Split messages into consecutive chunks of at most ``token_budget`` tokens.
+
+    When the budget is reached the chunk is cut at the latest thread boundary
+    inside it, i.e. a position no reply link crosses. If the chunk contains no
+    such boundary (one long thread), it is cut at the budget. A single message
+    larger than the budget becomes a chunk of its own.
+
+    Args:
+        messages: Normalized messages in chronological order
+        token_budget: Maximum estimated transcript tokens per chunk
+
+    Returns:
+        List of chunks (lists of messages); empty for empty input
+    """
+    if not messages:
+        return []
+
+    targets = resolve_reply_targets(messages)
+    # A cut before index i is clean if no message at or after i replies to a
+    # message before i, i.e. the suffix minimum of reply targets is >= i.
+    clean_cut = [False] * (len(messages) + 1)
+    suffix_min = len(messages)
+    for i in range(len(messages) - 1, -1, -1):
+        target = targets[i]
+        if target is not None and target < i:
+            suffix_min = min(suffix_min, target)
+        clean_cut[i] = suffix_min >= i
+
+    sizes = [estimate_message_tokens(msg) for msg in messages]
+    chunks: List[List[Dict[str, Any]]] = []
+    start = 0
+    used = 0
+    for i, size in enumerate(sizes):
+        while i > start and used + size > token_budget:
+            clean = [j for j in range(start + 1, i + 1) if clean_cut[j]]
+            cut = clean[-1] if clean else i
+            chunks.append(messages[start:cut])
+            used -= sum(sizes[start:cut])
+            start = cut
+        used += size
+    chunks.append(messages[start:])
+    return chunks
@@ -1,7 +1,9 @@
 """Unified FAQ Extractor - Single LLM call for Q&A pair extraction.
 
 This module provides a simplified approach to FAQ extraction from support chat messages:
-- Single LLM call to extract all Q&A pairs from a batch of messages
+- Single LLM call per transcript chunk to extract all Q&A pairs; large batches
+  are split on thread boundaries into token-budgeted chunks that are extracted
+  concurrently (see extraction_planner)
 - LLM handles conversation grouping (topic-based, not time-based)
 - Correction detection (use final/corrected answer)
 - Privacy-preserving anonymization before LLM call
@@ -35,6 +37,10 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from app.core.config import Settings
+from app.services.training.extraction_planner import (
+    plan_extraction_chunks,
+    resolve_reply_targets,
+)
 
 try:
     import aisuite as ai  # type: ignore[import-untyped]
@@ -357,6 +363,9 @@ class FAQExtractionResult:
     extracted_count: int = 0
     processing_time_ms: int = 0
     error: Optional[str] = None
+    # Number of transcript chunks sent to the LLM and how many of them failed
+    chunk_count: int = 0
+    failed_chunks: int = 0
     # Normalized messages for staff_sender lookup by message ID
     _normalized_messages: List[Dict[str, Any]] = field(default_factory=list)
 
@@ -437,12 +446,19 @@ class FAQExtractionResult:
         return results
 
 
+# Defaults for chunked extraction (overridable via Settings)
+DEFAULT_CHUNK_TOKEN_BUDGET = 8000
+DEFAULT_MAX_CONCURRENCY = 4
+
+
 class UnifiedFAQExtractor:
     """Extracts FAQ Q&A pairs from support chat messages using single LLM call.
 
     This class provides a simplified alternative to the complex ConversationHandler
     approach. Instead of rule-based conversation grouping, it sends all messages
-    to the LLM and lets it identify Q&A pairs directly.
+    to the LLM and lets it identify Q&A pairs directly. Batches larger than the
+    chunk token budget are split into chunks that are extracted concurrently
+    and merged.
 
     Attributes:
         aisuite_client: AISuite client for LLM calls
@@ -530,21 +546,12 @@ class UnifiedFAQExtractor:
 
             # Without both user and staff messages, the LLM fabricates Q&A
             # pairs by using staff messages as both question and answer.
-            has_staff = False
-            has_user = False
-            for msg in normalized_messages:
-                if self._is_staff_author(msg.get("author", "")):
-                    has_staff = True
-                else:
-                    has_user = True
-                if has_staff and has_user:
-                    break
-
-            if not has_staff or not has_user:
+            missing = self._missing_role(normalized_messages)
+            if missing:
                 logger.info(
                     "Skipping batch: missing %s messages (%d total). "
                     "Need both user and staff messages for Q&A extraction.",
-                    "staff" if not has_staff else "user",
+                    missing,
                     len(normalized_messages),
                 )
                 return FAQExtractionResult(
@@ -555,15 +562,14 @@ class UnifiedFAQExtractor:
                     processing_time_ms=int((time.time() - start_time) * 1000),
                 )
 
-            anonymized_text, username_mapping = self._anonymize_messages(
-                normalized_messages
+            chunks = plan_extraction_chunks(
+                normalized_messages,
+                token_budget=self._int_setting(
+                    "LLM_EXTRACTION_CHUNK_TOKEN_BUDGET", DEFAULT_CHUNK_TOKEN_BUDGET
+                ),
             )
-
-            # Call LLM to extract Q&A pairs
-            llm_response = await self._call_llm(messages_text=anonymized_text)
-
-            # Parse and validate response
-            faqs = self._parse_llm_response(llm_response)
+            chunk_faqs, failed_chunks = await self._extract_chunks(chunks)
+            faqs = self._merge_chunk_faqs(chunk_faqs)
 
             processing_time_ms = int((time.time() - start_time) * 1000)
 
@@ -573,6 +579,8 @@ class UnifiedFAQExtractor:
                 total_messages=len(messages),
                 extracted_count=len(faqs),
                 processing_time_ms=processing_time_ms,
+                chunk_count=len(chunks),
+                failed_chunks=failed_chunks,
                 _normalized_messages=normalized_messages,
             )
 
@@ -592,6 +600,117 @@ class UnifiedFAQExtractor:
                 error=str(e),
             )
 
+    def _int_setting(self, name: str, default: int) -> int:
+        value = getattr(self.settings, name, default)
+        if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+            return value
+        return default
+
+    def _missing_role(self, messages: List[Dict[str, Any]]) -> Optional[str]:
+        """Return "staff" or "user" if messages lack that role, else None."""
+        has_staff = False
+        has_user = False
+        for msg in messages:
+            if self._is_staff_author(msg.get("author", "")):
+                has_staff = True
+            else:
+                has_user = True
+            if has_staff and has_user:
+                return None
+        return "staff" if not has_staff else "user"
+
+    async def _extract_chunk(
+        self,
+        messages: List[Dict[str, Any]],
+    ) -> List[ExtractedFAQ]:
+        """Run one LLM extraction over a chunk of normalized messages."""
+        if self._missing_role(messages):
+            return []
+
+        anonymized_text, _ = self._anonymize_messages(messages)
+        llm_response = await self._call_llm(messages_text=anonymized_text)
+        return self._parse_llm_response(llm_response)
+
+    async def _extract_chunks(
+        self,
+        chunks: List[List[Dict[str, Any]]],
+    ) -> tuple[List[List[ExtractedFAQ]], int]:
+        """Extract all chunks concurrently.
+
+        At most LLM_EXTRACTION_MAX_CONCURRENCY chunks are in flight at once.
+        Each chunk's LLM call already retries with backoff, so a chunk that
+        still fails contributes no FAQs; if every chunk fails, the last error
+        is raised.
+
+        Returns:
+            Tuple of (FAQs per chunk in chunk order, number of failed chunks)
+        """
+        semaphore = asyncio.Semaphore(
+            max(
+                1,
+                self._int_setting(
+                    "LLM_EXTRACTION_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY
+                ),
+            )
+        )
+
+        async def run(chunk: List[Dict[str, Any]]) -> List[ExtractedFAQ]:
+            async with semaphore:
+                return await self._extract_chunk(chunk)
+
+        outcomes = await asyncio.gather(
+            *(run(chunk) for chunk in chunks), return_exceptions=True
+        )
+        results: List[List[ExtractedFAQ]] = []
+        failed = 0
+        last_error: Optional[BaseException] = None
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, BaseException):
+                logger.warning(
+                    "Extraction chunk %d/%d failed: %s",
+                    index + 1,
+                    len(chunks),
+                    outcome,
+                )
+                last_error = outcome
+                failed += 1
+                results.append([])
+            else:
+                results.append(outcome)
+
+        if failed and failed == len(chunks) and last_error is not None:
+            raise last_error
+        if failed:
+            logger.error(
+                "FAQ extraction incomplete: %d of %d chunks failed",
+                failed,
+                len(chunks),
+            )
+        return results, failed
+
+    @staticmethod
+    def _merge_chunk_faqs(
+        chunk_faqs: List[List[ExtractedFAQ]],
+    ) -> List[ExtractedFAQ]:
+        """Merge per-chunk FAQs, keeping the most confident of duplicates.
+
+        Duplicates share the same question/answer message IDs, or the same
+        normalized question text when the IDs are missing.
+        """
+        merged: Dict[tuple, ExtractedFAQ] = {}
+        for faqs in chunk_faqs:
+            for faq in faqs:
+                if faq.question_msg_id or faq.answer_msg_id:
+                    key: tuple = ("ids", faq.question_msg_id, faq.answer_msg_id)
+                else:
+                    key = ("text", " ".join(faq.question_text.lower().split()))
+                existing = merged.get(key)
+                if existing is None or faq.confidence > existing.confidence:
+                    merged[key] = faq
+        return list(merged.values())
+
     def _normalize_messages(
         self,
         messages: List[Dict[str, Any]],
@@ -677,12 +796,7 @@ class UnifiedFAQExtractor:
             user_mapping[author] = anon
             return anon
 
-        # Build a lookup from message ID → message number for threading
-        id_to_msg_number: dict[str, int] = {}
-        for i, msg in enumerate(messages):
-            mid = msg.get("id", "")
-            if mid:
-                id_to_msg_number[mid] = i + 1
+        reply_targets = resolve_reply_targets(messages)
 
         # Build anonymized transcript
         lines = []
@@ -697,35 +811,21 @@ class UnifiedFAQExtractor:
             # Add citation/reply info with resolved message number
             citation = msg.get("citation")
             reply_to = msg.get("reply_to")
+            target = reply_targets[i]
 
             if citation:
                 cited_author = citation.get("author", "unknown")
                 cited_text = (citation.get("text") or "")[:50]
                 anon_cited = get_anon_name(cited_author)
-                cited_msg_num = None
-                if cited_text:
-                    for mid, num in id_to_msg_number.items():
-                        if num < i + 1:
-                            check_msg = messages[num - 1]
-                            if check_msg.get(
-                                "author"
-                            ) == cited_author and cited_text in check_msg.get(
-                                "text", ""
-                            ):
-                                cited_msg_num = num
-                                break
-                if cited_msg_num:
-                    line += f" ← IN REPLY TO [Msg #{cited_msg_num}] [{anon_cited}]"
+                if target is not None:
+                    line += f" ← IN REPLY TO [Msg #{target + 1}] [{anon_cited}]"
                 else:
                     line += f' (replying to {anon_cited}: "{cited_text}...")'
             elif reply_to:
-                replied_msg_num = id_to_msg_number.get(reply_to)
-                if replied_msg_num:
-                    replied_author = messages[replied_msg_num - 1].get(
-                        "author", "unknown"
-                    )
+                if target is not None:
+                    replied_author = messages[target].get("author", "unknown")
                     anon_replied = get_anon_name(replied_author)
-                    line += f" ← IN REPLY TO [Msg #{replied_msg_num}] [{anon_replied}]"
+                    line += f" ← IN REPLY TO [Msg #{target + 1}] [{anon_replied}]"
                 else:
                     line += f" (reply to: {reply_to})"
 
@@ -791,7 +891,8 @@ Return a JSON object with the extracted FAQ pairs. Only include high-quality Q&A
         if model_id.startswith("openai:"):
             extra_kwargs["response_format"] = _FAQ_EXTRACTION_JSON_SCHEMA
 
-        for attempt in range(self.MAX_RETRIES):
+        attempt = 0
+        while True:
             try:
                 loop = asyncio.get_running_loop()
                 response = await loop.run_in_executor(
@@ -836,19 +937,19 @@ Return a JSON object with the extracted FAQ pairs. Only include high-quality Q&A
                     f"Error during LLM API call on attempt {attempt + 1}: {e!s}",
                 )
 
-                if attempt < self.MAX_RETRIES - 1:
-                    # Exponential backoff with jitter
-                    jitter = random.uniform(0, 0.1 * (2**attempt))
-                    delay = self.BASE_DELAY * (2**attempt) + jitter
-                    # Use longer delays for rate limits
-                    if is_rate_limit:
-                        delay = max(delay, 5.0 * (attempt + 1))
-                    logger.info(f"Retrying in {delay:.2f} seconds...")
-                    await asyncio.sleep(delay)
-                else:
+                if attempt >= self.MAX_RETRIES - 1:
                     logger.exception("Max retries reached for LLM API call")
-
-        return {"faq_pairs": []}
+                    raise
+
+                # Exponential backoff with jitter
+                jitter = random.uniform(0, 0.1 * (2**attempt))
+                delay = self.BASE_DELAY * (2**attempt) + jitter
+                # Use longer delays for rate limits
+                if is_rate_limit:
+                    delay = max(delay, 5.0 * (attempt + 1))
+                logger.info(f"Retrying in {delay:.2f} seconds...")
+                await asyncio.sleep(delay)
+                attempt += 1
 
     def _parse_llm_response(
         self,
@@ -13,9 +13,11 @@ Architecture:
     - Creates verified FAQs with source preservation
 """
 
+import asyncio
 import json
 import logging
 import sqlite3
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Literal, Optional, cast
@@ -864,8 +866,6 @@ class UnifiedPipelineService:
         Returns:
             ComparisonResult with all comparison metrics
         """
-        import time
-
         start_time = time.time()
 
         try:
@@ -1717,48 +1717,18 @@ class UnifiedPipelineService:
         """
         return self.repository.is_calibration_mode()
 
-    async def _process_extracted_faq(
+    def _extracted_faq_skip_reason(
         self,
         question_text: str,
         staff_answer: str,
-        source: str,
         source_event_id: str,
-        staff_sender: str = "",
-        category: str = "General",
         original_user_question: Optional[str] = None,
         original_staff_answer: Optional[str] = None,
-    ) -> ProcessingResult:
-        """Process a single extracted FAQ through the pipeline.
-
-        This internal method handles FAQs extracted by UnifiedFAQExtractor,
-        running them through RAG comparison and creating candidates.
-
-        Args:
-            question_text: The user's question
-            staff_answer: The staff's answer (may be LLM-transformed for clarity)
-            source: Source identifier ("bisq2" or "matrix")
-            source_event_id: Unique event identifier
-            staff_sender: Staff member who answered
-            category: FAQ category (e.g., Trading, Wallet, Installation)
-            original_user_question: Original conversational user question before
-                                    LLM transformation (enables "View Original" UI)
-            original_staff_answer: Original conversational staff answer before
-                                   LLM transformation (enables "View Original" UI)
-
-        Returns:
-            ProcessingResult with candidate info and routing
-        """
+    ) -> Optional[str]:
+        """Return why an extracted FAQ should be skipped, or None to process it."""
         # Check for duplicates
         if self.repository.exists_by_event_id(source_event_id):
-            return ProcessingResult(
-                candidate_id=None,
-                source=source,
-                source_event_id=source_event_id,
-                routing="SKIPPED",
-                final_score=0.0,
-                is_calibration_sample=False,
-                skipped_reason="duplicate",
-            )
+            return "duplicate"
 
         # Skip if original question and answer are identical or near-identical
         # (LLM used same message for both — a known extraction bug)
@@ -1768,28 +1738,25 @@ class UnifiedPipelineService:
         else:
             q_norm = a_norm = None
         if q_norm and q_norm == a_norm:
-            return ProcessingResult(
-                candidate_id=None,
-                source=source,
-                source_event_id=source_event_id,
-                routing="SKIPPED",
-                final_score=0.0,
-                is_calibration_sample=False,
-                skipped_reason="identical_original_texts",
-            )
+            return "identical_original_texts"
 
         # Skip if question or answer is too short
         if len(question_text.strip()) < 10 or len(staff_answer.strip()) < 10:
-            return ProcessingResult(
-                candidate_id=None,
-                source=source,
-                source_event_id=source_event_id,
-                routing="SKIPPED",
-                final_score=0.0,
-                is_calibration_sample=False,
-                skipped_reason="too_short",
-            )
+            return "too_short"
+
+        return None
+
+    async def _generate_extracted_faq_answer(
+        self,
+        question_text: str,
+        staff_answer: str,
+        source: str,
+    ) -> tuple[str, Dict[str, Any]]:
+        """Detect the protocol of an extracted FAQ and generate the RAG answer.
 
+        Returns:
+            Tuple of (detected protocol, RAG response dict)
+        """
         # Detect protocol directly from question, with staff answer as fallback
         # Pass the source parameter to enable source-based defaults
         # Cast source to Source type (it should always be "bisq2" or "matrix")
@@ -1806,16 +1773,21 @@ class UnifiedPipelineService:
         rag_response = await self.rag_service.query(
             question_text, chat_history=[], override_version=override_version
         )
+        return detected_protocol, rag_response
+
+    def _store_extracted_candidate(
+        self,
+        faq_data: Dict[str, Any],
+        detected_protocol: str,
+        rag_response: Dict[str, Any],
+        comparison: ComparisonResult,
+    ) -> ProcessingResult:
+        """Route a compared extracted FAQ, persist it and record metrics."""
+        source = faq_data["source"]
+        source_event_id = faq_data["source_event_id"]
         generated_answer = rag_response.get("answer", "")
         sources = rag_response.get("sources", [])
         sources_json = json.dumps(sources) if sources else None
-        # Extract RAG's own confidence (distinct from comparison final_score)
-        generation_confidence = rag_response.get("confidence")
-
-        # Calculate comparison scores
-        comparison = await self._compare_answers(
-            source_event_id, question_text, staff_answer, generated_answer
-        )
 
         # Determine routing
         routing, is_calibration = self._determine_routing(
@@ -1828,10 +1800,10 @@ class UnifiedPipelineService:
             source=cast(Literal["bisq2", "matrix"], source),
             source_event_id=source_event_id,
             source_timestamp=source_timestamp,
-            question_text=question_text,
-            staff_answer=staff_answer,
+            question_text=faq_data["question_text"],
+            staff_answer=faq_data["staff_answer"],
             generated_answer=generated_answer,
-            staff_sender=staff_sender,  # Now passed from LLM extraction
+            staff_sender=faq_data.get("staff_sender", ""),
             embedding_similarity=comparison.embedding_similarity,
             factual_alignment=comparison.factual_alignment,
             contradiction_score=comparison.contradiction_score,
@@ -1841,12 +1813,13 @@ class UnifiedPipelineService:
             llm_reasoning=comparison.llm_reasoning,
             routing=routing,
             is_calibration_sample=is_calibration,
-            category=category,
+            category=faq_data.get("category", "General"),
             protocol=detected_protocol,
             generated_answer_sources=sources_json,
-            original_user_question=original_user_question,
-            original_staff_answer=original_staff_answer,
-            generation_confidence=generation_confidence,
+            original_user_question=faq_data.get("original_user_question"),
+            original_staff_answer=faq_data.get("original_staff_answer"),
+            # Extract RAG's own confidence (distinct from comparison final_score)
+            generation_confidence=rag_response.get("confidence"),
         )
 
         # Update calibration count and metrics if calibration sample
@@ -1872,17 +1845,257 @@ class UnifiedPipelineService:
             is_calibration_sample=is_calibration,
         )
 
+    async def _process_extracted_faq(
+        self,
+        question_text: str,
+        staff_answer: str,
+        source: str,
+        source_event_id: str,
+        staff_sender: str = "",
+        category: str = "General",
+        original_user_question: Optional[str] = None,
+        original_staff_answer: Optional[str] = None,
+    ) -> ProcessingResult:
+        """Process a single extracted FAQ through the pipeline.
+
+        This internal method handles FAQs extracted by UnifiedFAQExtractor,
+        running them through RAG comparison and creating candidates.
+
+        Args:
+            question_text: The user's question
+            staff_answer: The staff's answer (may be LLM-transformed for clarity)
+            source: Source identifier ("bisq2" or "matrix")
+            source_event_id: Unique event identifier
+            staff_sender: Staff member who answered
+            category: FAQ category (e.g., Trading, Wallet, Installation)
+            original_user_question: Original conversational user question before
+                                    LLM transformation (enables "View Original" UI)
+            original_staff_answer: Original conversational staff answer before
+                                   LLM transformation (enables "View Original" UI)
+
+        Returns:
+            ProcessingResult with candidate info and routing
+        """
+        skipped_reason = self._extracted_faq_skip_reason(
+            question_text,
+            staff_answer,
+            source_event_id,
+            original_user_question,
+            original_staff_answer,
+        )
+        if skipped_reason:
+            return ProcessingResult(
+                candidate_id=None,
+                source=source,
+                source_event_id=source_event_id,
+                routing="SKIPPED",
+                final_score=0.0,
+                is_calibration_sample=False,
+                skipped_reason=skipped_reason,
+            )
+
+        detected_protocol, rag_response = await self._generate_extracted_faq_answer(
+            question_text, staff_answer, source
+        )
+
+        # Calculate comparison scores
+        comparison = await self._compare_answers(
+            source_event_id,
+            question_text,
+            staff_answer,
+            rag_response.get("answer", ""),
+        )
+
+        return self._store_extracted_candidate(
+            {
+                "question_text": question_text,
+                "staff_answer": staff_answer,
+                "source": source,
+                "source_event_id": source_event_id,
+                "staff_sender": staff_sender,
+                "category": category,
+                "original_user_question": original_user_question,
+                "original_staff_answer": original_staff_answer,
+            },
+            detected_protocol,
+            rag_response,
+            comparison,
+        )
+
+    async def _process_extracted_faqs(
+        self,
+        faq_items: List[Dict[str, Any]],
+    ) -> List[ProcessingResult]:
+        """Process extracted FAQs (``to_pipeline_format`` dicts) as one stage.
+
+        Equivalent to calling ``_process_extracted_faq`` for each item, but RAG
+        answers are generated concurrently (at most AUTO_TRAINING_MAX_CONCURRENCY
+        at a time) and all answer comparisons go through one
+        ``AnswerComparisonEngine.compare_batch`` call. Candidates are stored
+        sequentially in input order. Items that fail are logged and omitted.
+
+        Returns:
+            ProcessingResult per processed or skipped item, in input order
+        """
+        results: List[Optional[ProcessingResult]] = [None] * len(faq_items)
+        pending: List[int] = []
+        seen_event_ids: set[str] = set()
+        for index, faq_data in enumerate(faq_items):
+            source_event_id = faq_data["source_event_id"]
+            skipped_reason = (
+                "duplicate"
+                if source_event_id in seen_event_ids
+                else self._extracted_faq_skip_reason(
+                    faq_data["question_text"],
+                    faq_data["staff_answer"],
+                    source_event_id,
+                    faq_data.get("original_user_question"),
+                    faq_data.get("original_staff_answer"),
+                )
+            )
+            seen_event_ids.add(source_event_id)
+            if skipped_reason:
+                results[index] = ProcessingResult(
+                    candidate_id=None,
+                    source=faq_data["source"],
+                    source_event_id=source_event_id,
+                    routing="SKIPPED",
+                    final_score=0.0,
+                    is_calibration_sample=False,
+                    skipped_reason=skipped_reason,
+                )
+            else:
+                pending.append(index)
+
+        max_concurrency = getattr(self.settings, "AUTO_TRAINING_MAX_CONCURRENCY", 4)
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            max_concurrency = 4
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate(faq_data: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
+            async with semaphore:
+                return await self._generate_extracted_faq_answer(
+                    faq_data["question_text"],
+                    faq_data["staff_answer"],
+                    faq_data["source"],
+                )
+
+        generated = await asyncio.gather(
+            *(generate(faq_items[index]) for index in pending),
+            return_exceptions=True,
+        )
+        answered: List[tuple[int, str, Dict[str, Any]]] = []
+        for index, outcome in zip(pending, generated):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    "Failed to process extracted FAQ %s",
+                    faq_items[index]["source_event_id"],
+                    exc_info=outcome,
+                )
+                continue
+            answered.append((index, outcome[0], outcome[1]))
+
+        comparisons = await self._compare_answers_batch(
+            [
+                (
+                    faq_items[index]["source_event_id"],
+                    faq_items[index]["question_text"],
+                    faq_items[index]["staff_answer"],
+                    rag_response.get("answer", ""),
+                )
+                for index, _, rag_response in answered
+            ]
+        )
+
+        for (index, detected_protocol, rag_response), comparison in zip(
+            answered, comparisons
+        ):
+            if comparison is None:
+                continue
+            try:
+                results[index] = self._store_extracted_candidate(
+                    faq_items[index], detected_protocol, rag_response, comparison
+                )
+            except Exception:
+                logger.exception("Failed to process extracted FAQ")
+
+        return [result for result in results if result is not None]
+
+    async def _compare_answers_batch(
+        self,
+        items: List[tuple[str, str, str, str]],
+    ) -> List[Optional[ComparisonResult]]:
+        """Compare many (event_id, question, staff, generated) answer tuples.
+
+        Uses the engine's ``compare_batch`` when it has one; otherwise
+        (or if the batch call fails) each item goes through ``_compare_answers``.
+        Entries are None for items whose comparison raised.
+        """
+        if not items:
+            return []
+
+        if hasattr(self.comparison_engine, "compare_batch"):
+            # Empty RAG answers are scored without the engine
+            engine_items = [item for item in items if item[3] and item[3].strip()]
+            start_time = time.time()
+            try:
+                engine_results = iter(
+                    await self.comparison_engine.compare_batch(engine_items)
+                )
+            except Exception:
+                logger.exception(
+                    "Batched answer comparison failed, comparing individually"
+                )
+            else:
+                per_item = (time.time() - start_time) / max(1, len(engine_items))
+                batch_results: List[Optional[ComparisonResult]] = []
+                for item in items:
+                    if item[3] and item[3].strip():
+                        result = next(engine_results)
+                        training_comparison_duration.observe(per_item)
+                        batch_results.append(
+                            ComparisonResult(
+                                embedding_similarity=result.embedding_similarity,
+                                factual_alignment=result.factual_alignment,
+                                contradiction_score=result.contradiction_score,
+                                completeness=result.completeness,
+                                hallucination_risk=result.hallucination_risk,
+                                final_score=result.final_score,
+                                llm_reasoning=result.llm_reasoning,
+                            )
+                        )
+                    else:
+                        batch_results.append(await self._compare_answers(*item))
+                return batch_results
+
+        outcomes = await asyncio.gather(
+            *(self._compare_answers(*item) for item in items),
+            return_exceptions=True,
+        )
+        results: List[Optional[ComparisonResult]] = []
+        for item, outcome in zip(items, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    "Answer comparison failed for %s", item[0], exc_info=outcome
+                )
+                results.append(None)
+            else:
+                results.append(outcome)
+        return results
+
     async def extract_faqs_batch(
         self,
         messages: List[Dict[str, Any]],
         source: str,
         staff_identifiers: Optional[List[str]] = None,
     ) -> List[ProcessingResult]:
-        """Extract FAQ candidates from a batch of messages using single LLM call.
+        """Extract FAQ candidates from a batch of messages using LLM extraction.
 
         This method provides a simplified alternative to processing individual Q&A pairs.
-        It uses UnifiedFAQExtractor for single-pass LLM extraction, then processes each
-        extracted FAQ through the standard pipeline for comparison and routing.
+        It uses UnifiedFAQExtractor for single-pass LLM extraction (one call per
+        token-budgeted chunk, run concurrently), then processes each extracted FAQ
+        through the standard pipeline for comparison and routing. If only some
+        chunks fail, the FAQs of the successful chunks are still processed.
 
         Args:
             messages: List of chat messages (Bisq 2 or Matrix format)
@@ -1901,7 +2114,7 @@ class UnifiedPipelineService:
             staff_identifiers=staff_identifiers,
         )
 
-        # Extract FAQs using single LLM call
+        # Extract FAQs (chunked, concurrent LLM calls)
         extraction_result = await extractor.extract_faqs(
             messages=messages,
             source=source,
@@ -1911,27 +2124,18 @@ class UnifiedPipelineService:
         if extraction_result.error:
             logger.error(f"FAQ extraction error: {extraction_result.error}")
             return []
+        if extraction_result.failed_chunks:
+            logger.warning(
+                f"FAQ extraction partially failed: "
+                f"{extraction_result.failed_chunks}/{extraction_result.chunk_count} "
+                f"chunks returned no result"
+            )
 
-        # Process each extracted FAQ through the pipeline
-        results: List[ProcessingResult] = []
-        pipeline_data = extraction_result.to_pipeline_format()
-
-        for faq_data in pipeline_data:
-            try:
-                result = await self._process_extracted_faq(
-                    question_text=faq_data["question_text"],
-                    staff_answer=faq_data["staff_answer"],
-                    source=faq_data["source"],
-                    source_event_id=faq_data["source_event_id"],
-                    staff_sender=faq_data.get("staff_sender", ""),
-                    category=faq_data.get("category", "General"),
-                    original_user_question=faq_data.get("original_user_question"),
-                    original_staff_answer=faq_data.get("original_staff_answer"),
-                )
-                results.append(result)
-            except Exception:
-                logger.exception("Failed to process extracted FAQ")
-                continue
+        # Process extracted FAQs through the pipeline (concurrent RAG answers,
+        # batched comparisons)
+        results = await self._process_extracted_faqs(
+            extraction_result.to_pipeline_format()
+        )
 
         logger.info(
             f"Batch extraction complete: {extraction_result.extracted_count} FAQs "
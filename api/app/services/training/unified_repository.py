@@ -17,7 +17,7 @@ import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Sequence
+from typing import Any, Dict, List, Literal, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -360,6 +360,23 @@ class UnifiedFAQCandidateRepository:
             VALUES (1, 0.90, 0.75, 0.50, '[]', '[]')
             """)
 
+        # Append-only LearningEngine review log, one row per review id
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS learning_reviews (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                review_id TEXT NOT NULL,
+                question_id TEXT NOT NULL,
+                confidence REAL,
+                admin_action TEXT NOT NULL,
+                routing_action TEXT,
+                metadata TEXT,
+                timestamp TEXT NOT NULL
+            )
+            """)
+        cursor.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_learning_reviews_review_id ON learning_reviews(review_id)"
+        )
+
         # Create conversation_threads table for multi-poll conversation handling
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS conversation_threads (
@@ -494,6 +511,12 @@ class UnifiedFAQCandidateRepository:
             )
             logger.info("Added 'rejection_note' column to unified_faq_candidates")
 
+        if "review_statistics" not in _table_columns(cursor, "learning_state"):
+            cursor.execute(
+                "ALTER TABLE learning_state ADD COLUMN review_statistics TEXT"
+            )
+            logger.info("Added 'review_statistics' column to learning_state")
+
         # Add correction_reason column to conversation_threads (Cycle 17)
         cursor.execute("PRAGMA table_info(conversation_threads)")
         thread_columns = {row[1] for row in cursor.fetchall()}
@@ -1468,6 +1491,11 @@ class UnifiedFAQCandidateRepository:
             "reject_threshold": row["reject_threshold"],
             "review_history": json.loads(row["review_history"] or "[]"),
             "threshold_history": json.loads(row["threshold_history"] or "[]"),
+            "review_statistics": (
+                json.loads(row["review_statistics"])
+                if row["review_statistics"]
+                else None
+            ),
             "last_updated": row["last_updated"],
         }
 
@@ -1478,6 +1506,7 @@ class UnifiedFAQCandidateRepository:
         reject_threshold: float,
         review_history: list,
         threshold_history: list,
+        review_statistics: Optional[Dict] = None,
     ) -> None:
         """Save learning engine state to database.
 
@@ -1485,8 +1514,10 @@ class UnifiedFAQCandidateRepository:
             auto_send_threshold: Current auto-send threshold
             queue_high_threshold: Current queue high threshold
             reject_threshold: Current reject threshold
-            review_history: List of review records
+            review_history: List of review records (legacy; empty when reviews
+                live in the learning_reviews log)
             threshold_history: List of threshold history records
+            review_statistics: Serialized incremental review statistics
         """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -1504,6 +1535,7 @@ class UnifiedFAQCandidateRepository:
                 reject_threshold = ?,
                 review_history = ?,
                 threshold_history = ?,
+                review_statistics = ?,
                 last_updated = ?
             WHERE id = 1
             """,
@@ -1513,6 +1545,11 @@ class UnifiedFAQCandidateRepository:
                 reject_threshold,
                 json.dumps(limited_review_history),
                 json.dumps(threshold_history),
+                (
+                    json.dumps(review_statistics)
+                    if review_statistics is not None
+                    else None
+                ),
                 datetime.now(timezone.utc).isoformat(),
             ),
         )
@@ -1521,6 +1558,98 @@ class UnifiedFAQCandidateRepository:
         conn.close()
         logger.info("Learning state saved to database")
 
+    @staticmethod
+    def _row_to_learning_review(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "review_id": row["review_id"],
+            "question_id": row["question_id"],
+            "confidence": row["confidence"],
+            "admin_action": row["admin_action"],
+            "routing_action": row["routing_action"],
+            "metadata": json.loads(row["metadata"] or "{}"),
+            "timestamp": row["timestamp"],
+        }
+
+    def upsert_learning_review(self, record: Dict[str, Any]) -> Optional[Dict]:
+        """Append a LearningEngine review, replacing one with the same review_id.
+
+        Args:
+            record: Review record with review_id, question_id, confidence,
+                admin_action, routing_action, metadata and timestamp
+
+        Returns:
+            The replaced review record, or None if the review was appended
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                row = conn.execute(
+                    "SELECT * FROM learning_reviews WHERE review_id = ?",
+                    (record["review_id"],),
+                ).fetchone()
+                conn.execute(
+                    """
+                    INSERT INTO learning_reviews (
+                        review_id, question_id, confidence, admin_action,
+                        routing_action, metadata, timestamp
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(review_id) DO UPDATE SET
+                        question_id = excluded.question_id,
+                        confidence = excluded.confidence,
+                        admin_action = excluded.admin_action,
+                        routing_action = excluded.routing_action,
+                        metadata = excluded.metadata,
+                        timestamp = excluded.timestamp
+                    """,
+                    (
+                        record["review_id"],
+                        record["question_id"],
+                        record.get("confidence"),
+                        record["admin_action"],
+                        record.get("routing_action"),
+                        json.dumps(record.get("metadata") or {}),
+                        record["timestamp"],
+                    ),
+                )
+        finally:
+            conn.close()
+        return self._row_to_learning_review(row) if row is not None else None
+
+    def count_learning_reviews(self) -> int:
+        """Number of reviews in the LearningEngine review log."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return int(
+                conn.execute("SELECT COUNT(*) FROM learning_reviews").fetchone()[0]
+            )
+        finally:
+            conn.close()
+
+    def get_learning_reviews(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Read reviews from the LearningEngine review log in insertion order."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(
+                "SELECT * FROM learning_reviews ORDER BY id LIMIT ? OFFSET ?",
+                (-1 if limit is None else limit, offset),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [self._row_to_learning_review(row) for row in rows]
+
+    def clear_learning_reviews(self) -> None:
+        """Delete all reviews from the LearningEngine review log."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.execute("DELETE FROM learning_reviews")
+        finally:
+            conn.close()
+
     # =========================================================================
     # Conversation Thread Management Methods
     # =========================================================================
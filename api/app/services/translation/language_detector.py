@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import inspect
 import logging
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Callable, ClassVar, Optional, Tuple
 
@@ -15,6 +17,10 @@ from app.metrics.translation_metrics import (
     language_detection_total,
     mixed_language_detection_total,
 )
+from app.services.translation.ngram_language_id import (
+    NgramLanguageIdentifier,
+    get_default_identifier,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -312,6 +318,12 @@ Language code:"""
 
     UNKNOWN_LANGUAGE_CODE: ClassVar[str] = "und"
 
+    # Backends that never pass a final result through the detection cache:
+    # they are cheap, or depend on an LLM tie-break that may succeed later.
+    UNCACHED_BACKENDS: ClassVar[frozenset[str]] = frozenset(
+        {"empty_input", "short_text_ambiguous", "default_fallback"}
+    )
+
     def __init__(
         self,
         llm_provider: Optional[Any] = None,
@@ -321,6 +333,7 @@ Language code:"""
         mixed_margin_threshold: float = 0.20,
         mixed_secondary_min: float = 0.25,
         enable_llm_tiebreaker: bool = True,
+        cache_size: int = 4096,
     ):
         self.llm = llm_provider
         self.local_backend = (local_backend or "none").strip().lower()
@@ -329,11 +342,28 @@ Language code:"""
         self.mixed_margin_threshold = max(0.0, min(1.0, mixed_margin_threshold))
         self.mixed_secondary_min = max(0.0, min(1.0, mixed_secondary_min))
         self.enable_llm_tiebreaker = bool(enable_llm_tiebreaker)
+        self.cache_size = max(0, int(cache_size))
 
         self._local_detect_langs: Optional[Callable[[str], list[Any]]] = None
+        self._ngram_identifier: Optional[NgramLanguageIdentifier] = None
+        # (normalized text, prior language) -> detection result
+        self._detection_cache: OrderedDict[
+            tuple[str, Optional[str]], LanguageDetectionDetails
+        ] = OrderedDict()
         self._init_local_backend()
 
     def _init_local_backend(self) -> None:
+        if self.local_backend == "ngram":
+            try:
+                self._ngram_identifier = get_default_identifier()
+                logger.info("Language detector local backend initialized: ngram")
+            except Exception:
+                self._ngram_identifier = None
+                logger.warning(
+                    "Local language detector backend 'ngram' unavailable; falling back to heuristics/LLM",
+                    exc_info=True,
+                )
+            return
         if self.local_backend != "langdetect":
             return
         try:
@@ -382,6 +412,18 @@ Language code:"""
         match_ratio = marker_matches / max(1, len(token_set))
         return marker_matches >= 2 and match_ratio >= 0.2
 
+    def is_likely_english(self, text: str) -> bool:
+        """Cheap English check using only the heuristics (no model or LLM)."""
+        text = (text or "").strip()
+        if not text or self._detect_non_english_hint(text) is not None:
+            return False
+        if (
+            len(text) <= self.short_text_chars
+            and self._detect_short_text_hint(text) is not None
+        ):
+            return False
+        return self._is_likely_english(text)
+
     def _detect_non_english_hint(self, text: str) -> Optional[Tuple[str, float]]:
         for pattern, language, confidence in self.SCRIPT_HINTS:
             if pattern.search(text):
@@ -481,10 +523,19 @@ Language code:"""
     async def _detect_with_local_model(
         self, text: str
     ) -> Optional[LanguageDetectionDetails]:
-        if self._local_detect_langs is None:
-            return None
         try:
-            raw = await asyncio.to_thread(self._local_detect_langs, text[:2000])
+            if self._ngram_identifier is not None:
+                # Microsecond-scale numpy scoring: run inline, no thread hop.
+                raw = self._ngram_identifier.detect(text[:2000])
+            elif self._local_detect_langs is not None:
+                raw = [
+                    (getattr(item, "lang", ""), getattr(item, "prob", 0.0))
+                    for item in await asyncio.to_thread(
+                        self._local_detect_langs, text[:2000]
+                    )
+                ]
+            else:
+                return None
         except Exception:
             logger.debug("Local LID model failed", exc_info=True)
             return None
@@ -493,9 +544,9 @@ Language code:"""
             return None
 
         parsed: list[tuple[str, float]] = []
-        for item in raw:
-            lang = self._normalize_lang_code(getattr(item, "lang", ""))
-            prob = float(getattr(item, "prob", 0.0))
+        for raw_lang, raw_prob in raw:
+            lang = self._normalize_lang_code(raw_lang)
+            prob = float(raw_prob)
             if lang is None:
                 continue
             parsed.append((lang, max(0.0, min(1.0, prob))))
@@ -556,6 +607,31 @@ Language code:"""
 
     async def detect_with_metadata(
         self, text: str, prior_language: Optional[str] = None
+    ) -> LanguageDetectionDetails:
+        """Detect the language of ``text``.
+
+        Results are cached per normalized text and conversation language hint,
+        so repeated messages skip the local model and any LLM tie-break.
+        """
+        cache_key = (
+            " ".join((text or "").split()).casefold(),
+            self._normalize_prior_language(prior_language),
+        )
+        cached = self._detection_cache.get(cache_key)
+        if cached is not None:
+            self._detection_cache.move_to_end(cache_key)
+            self._emit_metrics(cached)
+            return dataclasses.replace(cached, alternatives=list(cached.alternatives))
+
+        details = await self._detect_uncached(text, prior_language)
+        if self.cache_size and details.backend not in self.UNCACHED_BACKENDS:
+            self._detection_cache[cache_key] = details
+            if len(self._detection_cache) > self.cache_size:
+                self._detection_cache.popitem(last=False)
+        return dataclasses.replace(details, alternatives=list(details.alternatives))
+
+    async def _detect_uncached(
+        self, text: str, prior_language: Optional[str] = None
     ) -> LanguageDetectionDetails:
         text = (text or "").strip()
         if not text:
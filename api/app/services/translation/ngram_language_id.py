@@ -0,0 +1,150 @@
+"""Inline character n-gram language identifier.
+
+A naive-Bayes scorer over a precomputed profile of character 1-3 grams
+(``profiles/ngram_profiles.json.gz``, generated by
+``scripts/build_ngram_language_profiles.py``). Scoring is a single numpy
+gather and matrix-vector product, so it runs in microseconds on the event
+loop instead of a worker thread.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_PATH = (
+    Path(__file__).resolve().parent / "profiles" / "ngram_profiles.json.gz"
+)
+NGRAM_MAX = 3
+
+_NON_LETTER_RE = re.compile(r"[\W\d_]+")
+
+
+def extract_ngrams(
+    text: str,
+    ngram_max: int = NGRAM_MAX,
+    char_table: Optional[Dict[int, str]] = None,
+) -> List[str]:
+    """List the space-padded character n-grams of each word in ``text``.
+
+    Every n-gram contains at least one letter; repeated n-grams are repeated.
+    """
+    normalized = _NON_LETTER_RE.sub(" ", text.lower())
+    if char_table:
+        normalized = normalized.translate(char_table)
+    grams: List[str] = []
+    for word in normalized.split():
+        padded = f" {word} "
+        size = len(padded)
+        grams.extend(padded[i] for i in range(1, size - 1))
+        for length in range(2, ngram_max + 1):
+            grams.extend(padded[i : i + length] for i in range(size - length + 1))
+    return grams
+
+
+class NgramLanguageIdentifier:
+    """Score text against per-language character n-gram profiles."""
+
+    def __init__(
+        self,
+        languages: List[str],
+        vocabulary: Dict[str, int],
+        log_probs: np.ndarray,
+        ngram_max: int = NGRAM_MAX,
+        char_table: Optional[Dict[int, str]] = None,
+    ):
+        self.languages = languages
+        self.vocabulary = vocabulary
+        # (languages, vocabulary) log P(gram | language); pruned grams hold the floor
+        self.log_probs = log_probs
+        self.ngram_max = ngram_max
+        self.char_table = char_table or {}
+
+    @classmethod
+    def from_profiles(cls, profiles: dict) -> "NgramLanguageIdentifier":
+        ngram_max = int(profiles.get("ngram_max", NGRAM_MAX))
+        languages = sorted(profiles["languages"])
+        vocabulary: Dict[str, int] = {}
+        for code in languages:
+            for gram in profiles["languages"][code]["grams"]:
+                vocabulary.setdefault(gram, len(vocabulary))
+
+        gram_lengths = np.zeros(len(vocabulary), dtype=np.int64)
+        for gram, index in vocabulary.items():
+            gram_lengths[index] = len(gram) - 1
+
+        log_probs = np.empty((len(languages), len(vocabulary)), dtype=np.float32)
+        for row, code in enumerate(languages):
+            profile = profiles["languages"][code]
+            log_probs[row] = np.asarray(profile["floors"], dtype=np.float32)[
+                gram_lengths
+            ]
+            for gram, value in profile["grams"].items():
+                log_probs[row, vocabulary[gram]] = value
+
+        char_table: Dict[int, str] = {}
+        for first, last, replacement in profiles.get("char_runs", []):
+            for codepoint in range(first, last + 1):
+                char_table[codepoint] = replacement
+        return cls(
+            languages,
+            vocabulary,
+            log_probs,
+            ngram_max=ngram_max,
+            char_table=char_table,
+        )
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_PROFILE_PATH) -> "NgramLanguageIdentifier":
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            profiles = json.load(handle)
+        identifier = cls.from_profiles(profiles)
+        logger.info(
+            "Loaded n-gram language profiles: %d languages, %d n-grams",
+            len(identifier.languages),
+            len(identifier.vocabulary),
+        )
+        return identifier
+
+    def detect(self, text: str, top_k: int = 3) -> List[Tuple[str, float]]:
+        """Return up to ``top_k`` (language, probability) pairs, best first.
+
+        Returns an empty list when no n-gram of the text is in any profile.
+        """
+        lookup = self.vocabulary.get
+        indices = [
+            index
+            for index in map(
+                lookup, extract_ngrams(text, self.ngram_max, self.char_table)
+            )
+            if index is not None
+        ]
+        if not indices:
+            return []
+
+        scores = self.log_probs[:, indices].sum(axis=1, dtype=np.float64)
+        scores -= scores.max()
+        probs = np.exp(scores)
+        probs /= probs.sum()
+
+        order = np.argsort(-probs)[:top_k]
+        return [(self.languages[i], float(probs[i])) for i in order]
+
+
+_default_identifier: Optional[NgramLanguageIdentifier] = None
+
+
+def get_default_identifier() -> NgramLanguageIdentifier:
+    """Load the bundled profile once per process."""
+    global _default_identifier
+    if _default_identifier is None:
+        _default_identifier = NgramLanguageIdentifier.load()
+    return _default_identifier
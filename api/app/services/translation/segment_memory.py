@@ -0,0 +1,104 @@
+"""Segment-level translation memory helpers.
+
+RAG answers repeat a lot of material verbatim (disclaimers, wiki-derived
+steps, FAQ snippets). Splitting a response into markdown blocks and
+sentences lets the TranslationService cache and reuse translations per
+segment, so only segments it has never seen are sent to the LLM.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# Sentence boundary: terminal punctuation followed by whitespace and an
+# uppercase letter, digit, quote, bracket or markdown emphasis.
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])([ \t]+)(?=[A-Z0-9\"'(\[*_])")
+# Leading markdown structure that is kept verbatim (indent, bullets,
+# numbering, headings, block quotes).
+_BLOCK_PREFIX_RE = re.compile(r"^(\s*(?:[-*+]\s+|\d+[.)]\s+|#{1,6}\s+|>\s*)*)")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+_HAS_LETTER_RE = re.compile(r"[^\W\d_]")
+_URL_ONLY_RE = re.compile(r"^\s*<?https?://\S+>?\s*$")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_BATCH_MARKER_RE = re.compile(
+    r"<<<(\d+)>>>[ \t]*\n?(.*?)(?=\n?<<<\d+>>>|\Z)", re.DOTALL
+)
+
+
+@dataclass
+class TextSegment:
+    """One piece of a response.
+
+    ``translatable`` is False for verbatim pieces (whitespace, markdown
+    prefixes, code fences, URLs, punctuation-only text).
+    """
+
+    text: str
+    translatable: bool
+
+
+def split_segments(text: str) -> List[TextSegment]:
+    """Split text into sentences and verbatim markdown scaffolding.
+
+    Joining the ``text`` of all segments reproduces the input exactly.
+    """
+    segments: List[TextSegment] = []
+    in_fence = False
+    for line in text.splitlines(keepends=True):
+        body = line.rstrip("\r\n")
+        newline = line[len(body) :]
+
+        if _FENCE_RE.match(body) or in_fence:
+            if _FENCE_RE.match(body):
+                in_fence = not in_fence
+            segments.append(TextSegment(line, False))
+            continue
+
+        prefix = _BLOCK_PREFIX_RE.match(body).group(1)
+        if prefix:
+            segments.append(TextSegment(prefix, False))
+        _append_sentences(body[len(prefix) :], segments)
+        if newline:
+            segments.append(TextSegment(newline, False))
+    return segments
+
+
+def _append_sentences(body: str, segments: List[TextSegment]) -> None:
+    stripped = body.rstrip()
+    trailing = body[len(stripped) :]
+    position = 0
+    for match in _SENTENCE_BOUNDARY_RE.finditer(stripped):
+        _append_piece(stripped[position : match.start()], segments)
+        segments.append(TextSegment(match.group(1), False))
+        position = match.end()
+    _append_piece(stripped[position:], segments)
+    if trailing:
+        segments.append(TextSegment(trailing, False))
+
+
+def _append_piece(piece: str, segments: List[TextSegment]) -> None:
+    if not piece:
+        return
+    translatable = bool(_HAS_LETTER_RE.search(piece)) and not _URL_ONLY_RE.match(piece)
+    segments.append(TextSegment(piece, translatable))
+
+
+def normalize_segment(text: str) -> str:
+    """Normalized lookup form: trimmed with internal whitespace collapsed."""
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def format_batch(texts: List[str]) -> str:
+    """Number segments with ``<<<n>>>`` markers for one batched LLM request."""
+    return "\n".join(f"<<<{index}>>>\n{text}" for index, text in enumerate(texts))
+
+
+def parse_batch(response: str, expected: int) -> Optional[List[str]]:
+    """Parse a batched translation; None unless every marker came back."""
+    parsed: Dict[int, str] = {}
+    for match in _BATCH_MARKER_RE.finditer(response or ""):
+        parsed[int(match.group(1))] = match.group(2).strip()
+    if sorted(parsed) != list(range(expected)) or not all(parsed.values()):
+        return None
+    return [parsed[index] for index in range(expected)]
@@ -9,7 +9,7 @@ import hashlib
 import inspect
 import logging
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.metrics.translation_metrics import (
     translation_errors_total,
@@ -23,6 +23,12 @@ from app.services.translation.language_detector import (
     LanguageDetectionDetails,
     LanguageDetector,
 )
+from app.services.translation.segment_memory import (
+    format_batch,
+    normalize_segment,
+    parse_batch,
+    split_segments,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +60,17 @@ Text to translate:
 
 Translation:"""
 
+    SEGMENT_TRANSLATION_PROMPT = """Translate each numbered segment below from {source_lang} to {target_lang}.
+Preserve any terms enclosed in __BISQ_TERM_X__ placeholders exactly as they are.
+Keep every <<<N>>> marker line exactly as given and put the translation of that
+segment directly after its marker. Translate each segment on its own; do not merge,
+split, reorder, or add segments, and do not add explanations.
+
+Segments:
+{segments}
+
+Translations:"""
+
     UNKNOWN_LANGUAGE_CODES: frozenset[str] = frozenset({"und", "unknown"})
     SHORT_BISQ_ENTITY_ALLOWLIST: frozenset[str] = frozenset(
         {
@@ -85,6 +102,7 @@ Translation:"""
         lid_mixed_margin_threshold: float = 0.20,
         lid_mixed_secondary_min: float = 0.25,
         lid_enable_llm_tiebreaker: bool = True,
+        segment_memory_enabled: bool = True,
     ):
         """Initialize the TranslationService.
 
@@ -104,6 +122,8 @@ Translation:"""
             lid_mixed_margin_threshold: Margin threshold for mixed-language detection.
             lid_mixed_secondary_min: Secondary confidence threshold for mixed-language detection.
             lid_enable_llm_tiebreaker: Enable LLM tie-break for uncertain LID results.
+            segment_memory_enabled: Cache response translations per sentence/markdown
+                block and only send unseen segments to the LLM.
         """
         self.llm = llm_provider
         self.translation_skip_en_confidence = max(
@@ -126,6 +146,7 @@ Translation:"""
         self.cache = cache_backend or TieredCache(
             l1_size=cache_l1_size, db_path=cache_db_path
         )
+        self.segment_memory_enabled = segment_memory_enabled
 
         # Statistics
         self.stats = {
@@ -136,6 +157,8 @@ Translation:"""
             "translations_performed": 0,
             "translation_errors": 0,
             "english_passthrough": 0,
+            "segment_cache_hits": 0,
+            "segment_cache_misses": 0,
         }
 
     def _make_cache_key(self, text: str, source_lang: str, target_lang: str) -> str:
@@ -207,6 +230,94 @@ Translation:"""
         self.stats["translations_performed"] += 1
         return response.strip()
 
+    def _segment_cache_keys(
+        self, segment: str, source_lang: str, target_lang: str
+    ) -> Tuple[str, str]:
+        """Exact and whitespace-normalized cache keys for one segment."""
+        return (
+            self._make_cache_key(f"segment:{segment}", source_lang, target_lang),
+            self._make_cache_key(
+                f"segment-norm:{normalize_segment(segment)}", source_lang, target_lang
+            ),
+        )
+
+    async def _translate_segments(
+        self, texts: List[str], source_lang: str, target_lang: str
+    ) -> Optional[List[str]]:
+        """Translate several segments in one LLM request.
+
+        Returns None when the response does not contain every segment marker.
+        """
+        if len(texts) == 1:
+            return [await self._translate(texts[0], source_lang, target_lang)]
+        if self.llm is None:
+            raise ValueError("No LLM provider configured for translation")
+
+        prompt = self.SEGMENT_TRANSLATION_PROMPT.format(
+            source_lang=SUPPORTED_LANGUAGES.get(source_lang, source_lang),
+            target_lang=SUPPORTED_LANGUAGES.get(target_lang, target_lang),
+            segments=format_batch(texts),
+        )
+        response = await self._llm_text(prompt)
+        self.stats["translations_performed"] += 1
+        return parse_batch(response, len(texts))
+
+    async def _translate_with_segment_memory(
+        self, text: str, source_lang: str, target_lang: str
+    ) -> Optional[Tuple[str, int, int]]:
+        """Translate ``text`` reusing cached per-segment translations.
+
+        Returns:
+            (translated_text, segments_reused, segments_translated), or None when
+            the text has fewer than two segments or the batched response could
+            not be parsed; the caller then translates the text as a whole.
+        """
+        segments = split_segments(text)
+        translatable = [segment.text for segment in segments if segment.translatable]
+        if len(translatable) < 2:
+            return None
+
+        translations: Dict[str, str] = {}
+        missing: List[str] = []
+        for segment in dict.fromkeys(translatable):
+            for key in self._segment_cache_keys(segment, source_lang, target_lang):
+                cached = await self.cache.get(key)
+                if cached is not None:
+                    translations[segment] = cached
+                    break
+            else:
+                missing.append(segment)
+
+        if missing:
+            protected = [self.glossary.protect_terms(segment) for segment in missing]
+            translated = await self._translate_segments(
+                [protected_text for protected_text, _ in protected],
+                source_lang,
+                target_lang,
+            )
+            if translated is None:
+                logger.warning(
+                    "Batched segment translation could not be parsed; "
+                    "translating response as a whole"
+                )
+                return None
+            for segment, (_, placeholder_map), result in zip(
+                missing, protected, translated
+            ):
+                final_segment = self.glossary.restore_terms(result, placeholder_map)
+                translations[segment] = final_segment
+                for key in self._segment_cache_keys(segment, source_lang, target_lang):
+                    await self.cache.set(key, final_segment)
+
+        reused = len(translations) - len(missing)
+        self.stats["segment_cache_hits"] += reused
+        self.stats["segment_cache_misses"] += len(missing)
+        assembled = "".join(
+            translations[segment.text] if segment.translatable else segment.text
+            for segment in segments
+        )
+        return assembled, reused, len(missing)
+
     @staticmethod
     def _record_query_decision(decision: str, source_lang: str) -> None:
         translation_query_decisions_total.labels(
@@ -516,17 +627,29 @@ Translation:"""
 
         self.stats["cache_misses"] += 1
 
-        # Protect Bisq terms before translation
-        protected_response, placeholder_map = self.glossary.protect_terms(response)
-
         try:
-            # Translate
-            translated = await self._translate(
-                protected_response, source_lang, normalized_target_lang
-            )
+            segmented = None
+            if self.segment_memory_enabled:
+                segmented = await self._translate_with_segment_memory(
+                    response, source_lang, normalized_target_lang
+                )
 
-            # Restore Bisq terms
-            final_text = self.glossary.restore_terms(translated, placeholder_map)
+            if segmented is not None:
+                final_text, segments_reused, segments_translated = segmented
+            else:
+                # Protect Bisq terms before translation
+                protected_response, placeholder_map = self.glossary.protect_terms(
+                    response
+                )
+
+                # Translate
+                translated = await self._translate(
+                    protected_response, source_lang, normalized_target_lang
+                )
+
+                # Restore Bisq terms
+                final_text = self.glossary.restore_terms(translated, placeholder_map)
+                segments_reused, segments_translated = 0, 0
 
             # Cache the result
             await self.cache.set(cache_key, final_text)
@@ -535,7 +658,9 @@ Translation:"""
                 "translated_text": final_text,
                 "target_lang": normalized_target_lang,
                 "skipped": False,
-                "cached": False,
+                "cached": segmented is not None and segments_translated == 0,
+                "segments_reused": segments_reused,
+                "segments_translated": segments_translated,
             }
             translation_operation_duration_seconds.labels(direction="response").observe(
                 max(0.0, time.perf_counter() - start_time)
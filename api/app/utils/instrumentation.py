@@ -16,6 +16,7 @@ import threading
 import time
 from typing import Callable
 
+from app.utils.request_trace import trace_span
 from prometheus_client import Counter, Gauge, Histogram
 
 logger = logging.getLogger(__name__)
@@ -130,7 +131,8 @@ def instrument_stage(stage_name: str):
 
             try:
                 # Execute the wrapped function
-                result = await func(*args, **kwargs)
+                with trace_span(stage_name):
+                    result = await func(*args, **kwargs)
 
                 # Record success latency
                 latency = time.time() - start_time
@@ -156,7 +158,8 @@ def instrument_stage(stage_name: str):
 
             try:
                 # Execute the wrapped function
-                result = func(*args, **kwargs)
+                with trace_span(stage_name):
+                    result = func(*args, **kwargs)
 
                 # Record success latency
                 latency = time.time() - start_time
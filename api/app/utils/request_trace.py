@@ -0,0 +1,209 @@
+"""
+Per-request stage tracing.
+
+A request trace records a waterfall of named spans (start offset, duration,
+status and attributes) for one question as it moves through the channel
+orchestrator, the gateway and the RAG pipeline. The trace lives in a
+ContextVar, so nested code only needs ``trace_span`` and tasks spawned while
+a trace is active inherit it. Code running without an active trace pays for a
+single ContextVar lookup.
+
+Finished root traces are handed to the configured sink (the slow-query log),
+which decides whether to keep them.
+"""
+
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Spans beyond this are counted but not stored, to bound trace size
+MAX_SPANS_PER_TRACE = 200
+
+TraceSink = Callable[["RequestTrace"], None]
+
+_current_trace: ContextVar[Optional["RequestTrace"]] = ContextVar(
+    "request_trace", default=None
+)
+_span_depth: ContextVar[int] = ContextVar("request_trace_span_depth", default=0)
+_trace_sink: Optional[TraceSink] = None
+
+
+@dataclass
+class Span:
+    """One timed stage of a request."""
+
+    name: str
+    start_ms: float
+    depth: int
+    duration_ms: Optional[float] = None
+    status: str = "ok"
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "start_ms": round(self.start_ms, 3),
+            "duration_ms": (
+                round(self.duration_ms, 3) if self.duration_ms is not None else None
+            ),
+            "depth": self.depth,
+            "status": self.status,
+            "attributes": dict(self.attributes),
+        }
+
+
+class _NullSpan:
+    """Stand-in yielded by ``trace_span`` when no trace is active."""
+
+    def set(self, **attributes: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class RequestTrace:
+    """Span waterfall of a single request."""
+
+    def __init__(self, name: str, **attributes: Any):
+        self.trace_id = uuid.uuid4().hex
+        self.name = name
+        self.attributes: Dict[str, Any] = dict(attributes)
+        self.started_at = datetime.now(timezone.utc)
+        self.status = "ok"
+        self.duration_ms: Optional[float] = None
+        self.spans: List[Span] = []
+        self.dropped_spans = 0
+        self._t0 = time.perf_counter()
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._t0) * 1000
+
+    def annotate(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    # Same interface as Span, for callers of request_trace()
+    set = annotate
+
+    def _open_span(self, name: str, depth: int, attributes: Dict[str, Any]):
+        if self.duration_ms is not None:
+            # Work that outlives the request (background tasks) is not recorded
+            return None
+        if len(self.spans) >= MAX_SPANS_PER_TRACE:
+            self.dropped_spans += 1
+            return None
+        span = Span(name=name, start_ms=self.elapsed_ms(), depth=depth)
+        span.attributes.update(attributes)
+        self.spans.append(span)
+        return span
+
+    def finish(self) -> float:
+        if self.duration_ms is None:
+            self.duration_ms = self.elapsed_ms()
+        return self.duration_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": (
+                round(self.duration_ms, 3) if self.duration_ms is not None else None
+            ),
+            "status": self.status,
+            "attributes": dict(self.attributes),
+            "spans": [span.to_dict() for span in self.spans],
+            "dropped_spans": self.dropped_spans,
+        }
+
+
+def set_trace_sink(sink: Optional[TraceSink]) -> None:
+    """Set the callable that receives every finished root trace."""
+    global _trace_sink
+    _trace_sink = sink
+
+
+def current_trace() -> Optional[RequestTrace]:
+    return _current_trace.get()
+
+
+def annotate_trace(**attributes: Any) -> None:
+    """Attach attributes to the active trace, if any."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.annotate(**attributes)
+
+
+@contextmanager
+def trace_span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Time the enclosed block as a span of the active trace.
+
+    Yields the span (or a no-op stand-in without an active trace) so callers
+    can attach attributes known only after the work ran.
+    """
+    trace = _current_trace.get()
+    span = (
+        trace._open_span(name, _span_depth.get(), attributes)
+        if trace is not None
+        else None
+    )
+    if span is None:
+        yield _NULL_SPAN
+        return
+
+    depth_token = _span_depth.set(span.depth + 1)
+    try:
+        yield span
+    except BaseException as e:
+        span.status = "error"
+        span.attributes.setdefault("error_type", type(e).__name__)
+        raise
+    finally:
+        span.duration_ms = trace.elapsed_ms() - span.start_ms
+        _span_depth.reset(depth_token)
+
+
+@contextmanager
+def request_trace(name: str, **attributes: Any) -> Iterator[Any]:
+    """Trace a request, or record a span if a request trace is already active.
+
+    The outermost caller owns the trace: it is finished and passed to the
+    configured sink when the block exits. Nested callers (e.g. the RAG service
+    called from the channel orchestrator) become spans of that trace.
+    """
+    active = _current_trace.get()
+    # A finished trace can still be visible from tasks that outlived it
+    if active is not None and active.duration_ms is None:
+        with trace_span(name, **attributes) as span:
+            yield span
+        return
+
+    trace = RequestTrace(name, **attributes)
+    trace_token = _current_trace.set(trace)
+    depth_token = _span_depth.set(0)
+    try:
+        yield trace
+    except BaseException as e:
+        trace.status = "error"
+        trace.attributes.setdefault("error_type", type(e).__name__)
+        raise
+    finally:
+        trace.finish()
+        _span_depth.reset(depth_token)
+        _current_trace.reset(trace_token)
+        sink = _trace_sink
+        if sink is not None:
+            try:
+                sink(trace)
+            except Exception:
+                logger.exception("Request trace sink failed")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Build the compact character n-gram profile used for inline language ID.
+
+The profile is derived from the n-gram frequency tables shipped with the
+``langdetect`` package (Apache-2.0). Only the most frequent n-grams of each
+length are kept, stored as log-probabilities, together with a per-language
+floor used for n-grams that were pruned.
+
+Usage:
+    python scripts/build_ngram_language_profiles.py [--top 400]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import math
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# Allow running as standalone script.
+API_ROOT = Path(__file__).resolve().parents[1]
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+from app.services.translation.language_detector import (  # noqa: E402
+    SUPPORTED_LANGUAGES,
+)
+from app.services.translation.ngram_language_id import (  # noqa: E402
+    DEFAULT_PROFILE_PATH,
+    NGRAM_MAX,
+)
+
+# langdetect profile name -> ISO code used by the detector
+PROFILE_ALIASES = {"zh-cn": "zh"}
+SKIPPED_PROFILES = {"zh-tw"}
+
+
+def _load_langdetect_profiles() -> Path:
+    import langdetect  # type: ignore[import-not-found]
+
+    return Path(langdetect.__file__).resolve().parent / "profiles"
+
+
+def build_char_runs() -> list[list]:
+    """Character normalization used by langdetect when its profiles were built.
+
+    Kana, Hangul and CJK ideographs are folded onto representative characters;
+    storing the same folding as [first, last, replacement] code point runs
+    lets the inline identifier reproduce it without importing langdetect.
+    """
+    from langdetect.utils.ngram import NGram  # type: ignore[import-not-found]
+
+    runs: list[list] = []
+    for codepoint in range(0x80, 0x10000):
+        char = chr(codepoint)
+        replacement = NGram.normalize(char)
+        if replacement == char or not replacement.strip():
+            continue
+        last = runs[-1] if runs else None
+        if last and last[1] == codepoint - 1 and last[2] == replacement:
+            last[1] = codepoint
+        else:
+            runs.append([codepoint, codepoint, replacement])
+    return runs
+
+
+def build_profiles(top: int) -> dict:
+    languages: dict[str, dict] = {}
+    for path in sorted(_load_langdetect_profiles().iterdir()):
+        if path.name in SKIPPED_PROFILES:
+            continue
+        code = PROFILE_ALIASES.get(path.name, path.name)
+        if code not in SUPPORTED_LANGUAGES:
+            continue
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        n_words = raw["n_words"]
+
+        by_length: dict[int, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for gram, count in raw["freq"].items():
+            gram = gram.lower()  # may change length, e.g. for dotted capitals
+            if 1 <= len(gram) <= NGRAM_MAX and gram.strip():
+                by_length[len(gram)][gram] += count
+
+        grams: dict[str, float] = {}
+        floors: list[float] = []
+        for length in range(1, NGRAM_MAX + 1):
+            total = max(1, n_words[length - 1])
+            ranked = sorted(by_length[length].items(), key=lambda kv: (-kv[1], kv[0]))
+            kept = ranked[:top]
+            for gram, count in kept:
+                grams[gram] = round(math.log(count / total), 3)
+            # Pruned n-grams are at most as frequent as the rarest kept one.
+            rarest = kept[-1][1] if kept else 1
+            floors.append(round(math.log(rarest / total) - math.log(2), 3))
+        languages[code] = {"floors": floors, "grams": grams}
+
+    return {
+        "version": 1,
+        "ngram_max": NGRAM_MAX,
+        "char_runs": build_char_runs(),
+        "languages": languages,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=400,
+        help="Number of n-grams kept per length and language",
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_PROFILE_PATH)
+    args = parser.parse_args()
+
+    profiles = build_profiles(args.top)
+    payload = json.dumps(profiles, ensure_ascii=False, separators=(",", ":"))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    # mtime=0 keeps the output byte-identical across rebuilds.
+    with gzip.GzipFile(args.output, "wb", mtime=0) as handle:
+        handle.write(payload.encode("utf-8"))
+    print(
+        f"Wrote {len(profiles['languages'])} language profiles to {args.output} "
+        f"({args.output.stat().st_size} bytes)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -158,6 +158,7 @@ async def test_on_message_records_trust_event_even_when_generation_disabled() ->
     channel = MagicMock()
     channel.handle_incoming = AsyncMock()
     trust_monitor_service = MagicMock()
+    trust_monitor_service.record_events.return_value = ([None], [])
 
     handler = MatrixMessageHandler(
         client=client,
@@ -172,7 +173,7 @@ async def test_on_message_records_trust_event_even_when_generation_disabled() ->
     room, event = _matrix_event()
     await handler._on_message(room, event)
 
-    trust_monitor_service.ingest_event.assert_called_once()
+    trust_monitor_service.record_events.assert_called_once()
     channel.handle_incoming.assert_not_called()
 
 
@@ -305,6 +306,7 @@ async def test_record_trust_event_uses_reply_target_message_id() -> None:
     connection_manager = MagicMock()
     connection_manager.sync_forever = AsyncMock()
     trust_monitor_service = MagicMock()
+    trust_monitor_service.record_events.return_value = ([None], [])
     handler = MatrixMessageHandler(
         client=client,
         connection_manager=connection_manager,
@@ -324,7 +326,7 @@ async def test_record_trust_event_uses_reply_target_message_id() -> None:
         room=room,
     )
 
-    forwarded = trust_monitor_service.ingest_event.call_args.args[0]
+    forwarded = trust_monitor_service.record_events.call_args.args[0][0]
     assert forwarded.event_type.value == "message_replied"
     assert forwarded.target_message_id == "$original:server"
 
@@ -22,6 +22,7 @@ async def test_member_event_is_forwarded_to_service(monkeypatch) -> None:
         DummyMemberEvent,
     )
     service = MagicMock()
+    service.record_events.return_value = ([None], [])
     client = MagicMock()
     connection_manager = MagicMock()
     connection_manager.sync_forever = MagicMock()
@@ -42,8 +43,8 @@ async def test_member_event_is_forwarded_to_service(monkeypatch) -> None:
 
     await handler._on_member_event(room, event)
 
-    service.ingest_event.assert_called_once()
-    forwarded = service.ingest_event.call_args.args[0]
+    service.record_events.assert_called_once()
+    forwarded = service.record_events.call_args.args[0][0]
     assert forwarded.event_type.value == "member_joined"
     assert forwarded.actor_display_name == "Alice Support"
 
@@ -55,6 +56,7 @@ async def test_member_event_ignores_non_join_memberships(monkeypatch) -> None:
         DummyMemberEvent,
     )
     service = MagicMock()
+    service.record_events.return_value = ([None], [])
     client = MagicMock()
     handler = MatrixTrustMonitorHandler(
         client=client,
@@ -72,7 +74,7 @@ async def test_member_event_ignores_non_join_memberships(monkeypatch) -> None:
 
     await handler._on_member_event(room, event)
 
-    service.ingest_event.assert_not_called()
+    service.record_events.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -82,6 +84,7 @@ async def test_receipts_ignore_staff_room(monkeypatch) -> None:
         DummyReceiptEvent,
     )
     service = MagicMock()
+    service.record_events.return_value = ([None], [])
     client = MagicMock()
     handler = MatrixTrustMonitorHandler(
         client=client,
@@ -106,7 +109,7 @@ async def test_receipts_ignore_staff_room(monkeypatch) -> None:
 
     await handler._on_receipt_event(room, event)
 
-    service.ingest_event.assert_not_called()
+    service.record_events.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -116,6 +119,7 @@ async def test_receipts_emit_message_read_events(monkeypatch) -> None:
         DummyReceiptEvent,
     )
     service = MagicMock()
+    service.record_events.return_value = ([None], [])
     client = MagicMock()
     handler = MatrixTrustMonitorHandler(
         client=client,
@@ -140,7 +144,7 @@ async def test_receipts_emit_message_read_events(monkeypatch) -> None:
 
     await handler._on_receipt_event(room, event)
 
-    assert service.ingest_event.call_count == 1
-    forwarded = service.ingest_event.call_args.args[0]
+    assert service.record_events.call_count == 1
+    forwarded = service.record_events.call_args.args[0][0]
     assert forwarded.event_type.value == "message_read"
     assert forwarded.target_message_id == "$message-1"
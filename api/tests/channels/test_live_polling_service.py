@@ -1,3 +1,4 @@
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -54,3 +55,88 @@ async def test_run_once_polls_and_dispatches_when_generation_enabled():
     assert processed == 1
     channel.poll_conversations.assert_awaited_once()
     orchestrator.process_incoming.assert_awaited_once_with(incoming)
+
+
+def _threaded(message_id: str, thread_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        message_id=message_id,
+        channel_metadata={"thread_id": thread_id},
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_once_processes_unrelated_threads_concurrently_in_order():
+    messages = [
+        _threaded("a1", "thread-a"),
+        _threaded("b1", "thread-b"),
+        _threaded("a2", "thread-a"),
+        _threaded("b2", "thread-b"),
+    ]
+    channel = MagicMock()
+    channel.channel_id = "bisq2"
+    channel.poll_conversations = AsyncMock(return_value=messages)
+
+    order: list[str] = []
+    in_flight = 0
+    peak = 0
+
+    async def _process(incoming):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        order.append(incoming.message_id)
+        in_flight -= 1
+        return True
+
+    orchestrator = AsyncMock()
+    orchestrator.process_incoming = AsyncMock(side_effect=_process)
+    service = LivePollingService(
+        channel=channel,
+        channel_id="bisq2",
+        orchestrator=orchestrator,
+        max_concurrency=4,
+    )
+
+    with patch(
+        "app.channels.services.live_polling_service.is_generation_enabled",
+        return_value=True,
+    ):
+        processed = await service.run_once()
+
+    assert processed == 4
+    assert peak == 2
+    assert order.index("a1") < order.index("a2")
+    assert order.index("b1") < order.index("b2")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_once_isolates_failures_per_message():
+    messages = [_threaded("a1", "thread-a"), _threaded("b1", "thread-b")]
+    channel = MagicMock()
+    channel.channel_id = "bisq2"
+    channel.poll_conversations = AsyncMock(return_value=messages)
+
+    async def _process(incoming):
+        if incoming.message_id == "a1":
+            raise RuntimeError("boom")
+        return True
+
+    orchestrator = AsyncMock()
+    orchestrator.process_incoming = AsyncMock(side_effect=_process)
+    service = LivePollingService(
+        channel=channel,
+        channel_id="bisq2",
+        orchestrator=orchestrator,
+    )
+
+    with patch(
+        "app.channels.services.live_polling_service.is_generation_enabled",
+        return_value=True,
+    ):
+        processed = await service.run_once()
+
+    assert processed == 1
+    assert orchestrator.process_incoming.await_count == 2
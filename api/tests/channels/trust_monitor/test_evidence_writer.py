@@ -0,0 +1,239 @@
+"""Tests for batched trust-monitor evidence ingestion."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+from app.channels.staff import StaffResolver
+from app.channels.trust_monitor.events import TrustEvent
+from app.channels.trust_monitor.evidence_writer import (
+    TrustEvidenceWriter,
+    submit_trust_event,
+)
+from app.channels.trust_monitor.models import TrustEventType
+from app.channels.trust_monitor.publisher import (
+    CompositeTrustAlertPublisher,
+    InMemoryTrustAlertPublisher,
+)
+from app.channels.trust_monitor.service import TrustMonitorService
+from app.services.trust_monitor_policy_service import TrustMonitorPolicyService
+
+
+def _service(
+    tmp_path, *, alert_surface: str = "admin_ui", publisher=None
+) -> tuple[TrustMonitorService, InMemoryTrustAlertPublisher]:
+    settings = SimpleNamespace(
+        TRUST_MONITOR_ENABLED=True,
+        TRUST_MONITOR_NAME_COLLISION_ENABLED=True,
+        TRUST_MONITOR_SILENT_OBSERVER_ENABLED=True,
+        TRUST_MONITOR_ALERT_SURFACE=alert_surface,
+        TRUST_MONITOR_MATRIX_PUBLIC_ROOMS=["!support:matrix.org"],
+        TRUST_MONITOR_MATRIX_STAFF_ROOM="!staff:matrix.org",
+        TRUST_MONITOR_SILENT_OBSERVER_WINDOW_DAYS=14,
+        TRUST_MONITOR_EARLY_READ_WINDOW_SECONDS=30,
+        TRUST_MONITOR_MINIMUM_OBSERVATIONS=3,
+        TRUST_MONITOR_MINIMUM_EARLY_READ_HITS=2,
+        TRUST_MONITOR_READ_TO_REPLY_RATIO_THRESHOLD=3.0,
+        TRUST_MONITOR_EVIDENCE_TTL_DAYS=7,
+        TRUST_MONITOR_AGGREGATE_TTL_DAYS=30,
+        TRUST_MONITOR_FINDING_TTL_DAYS=30,
+        TRUST_MONITOR_ACTOR_KEY_SECRET="secret-key",
+    )
+    publisher = publisher or InMemoryTrustAlertPublisher()
+    service = TrustMonitorService(
+        db_path=str(tmp_path / "feedback.db"),
+        settings=settings,
+        policy_service=TrustMonitorPolicyService(
+            db_path=str(tmp_path / "feedback.db"), settings=settings
+        ),
+        publisher=publisher,
+        staff_resolver=StaffResolver(
+            trusted_staff_ids=["@alice:matrix.org"],
+            display_names=["Alice Support"],
+        ),
+    )
+    return service, publisher
+
+
+def _join(index: int, display_name: str = "") -> TrustEvent:
+    return TrustEvent(
+        channel_id="matrix",
+        space_id="!support:matrix.org",
+        actor_id=f"@user{index}:matrix.org",
+        actor_display_name=display_name or f"User {index}",
+        event_type=TrustEventType.MEMBER_JOINED,
+        occurred_at=datetime.now(UTC),
+        external_event_id=f"$join-{index}",
+    )
+
+
+def _early_read_events() -> list[TrustEvent]:
+    now = datetime.now(UTC)
+    events = []
+    for index in range(3):
+        message_id = f"$message-{index}"
+        events.append(
+            TrustEvent(
+                channel_id="matrix",
+                space_id="!support:matrix.org",
+                actor_id=f"@asker{index}:matrix.org",
+                actor_display_name=f"Asker {index}",
+                event_type=TrustEventType.MESSAGE_SENT,
+                occurred_at=now + timedelta(minutes=index),
+                external_event_id=message_id,
+                target_message_id=message_id,
+            )
+        )
+        events.append(
+            TrustEvent(
+                channel_id="matrix",
+                space_id="!support:matrix.org",
+                actor_id="@lurker:matrix.org",
+                actor_display_name="Quiet Reader",
+                event_type=TrustEventType.MESSAGE_READ,
+                occurred_at=now + timedelta(minutes=index, seconds=10),
+                external_event_id=f"$receipt-{index}",
+                target_message_id=message_id,
+            )
+        )
+    return events
+
+
+def test_batch_sees_its_own_writes_and_publishes_after_commit(tmp_path) -> None:
+    service, publisher = _service(tmp_path)
+    published_visible = []
+    original_publish = publisher.publish
+
+    def publish(finding):
+        # The finding must already be committed when the alert goes out
+        published_visible.append(service.store.get_finding(finding.id) is not None)
+        original_publish(finding)
+
+    publisher.publish = publish
+
+    results = service.ingest_events(_early_read_events() + [_join(1, "Alice Support")])
+
+    assert len(results) == 7
+    assert results[-1] is not None
+    assert results[-1].detector_key == "staff_name_collision"
+    assert results[-2] is not None
+    assert results[-2].detector_key == "silent_early_observer"
+    assert len(service.list_evidence(limit=50)) == 7
+    assert published_visible == [True, True]
+
+
+def test_failing_event_is_rolled_back_without_losing_the_batch(
+    tmp_path, monkeypatch
+) -> None:
+    service, _ = _service(tmp_path)
+    evaluate = service._name_collision.evaluate
+
+    def flaky(event, *, actor_key):
+        if event.actor_id == "@user2:matrix.org":
+            raise RuntimeError("detector bug")
+        return evaluate(event, actor_key=actor_key)
+
+    monkeypatch.setattr(service._name_collision, "evaluate", flaky)
+
+    results = service.ingest_events([_join(1), _join(2), _join(3)])
+
+    assert results == [None, None, None]
+    stored = {record.actor_id for record in service.list_evidence(limit=10)}
+    assert stored == {"@user1:matrix.org", "@user3:matrix.org"}
+
+
+async def test_writer_flushes_on_batch_size_and_interval() -> None:
+    batches: list[int] = []
+    service = SimpleNamespace(
+        record_events=lambda events: batches.append(len(events)) or ([], []),
+        publish_findings=lambda findings: None,
+    )
+    writer = TrustEvidenceWriter(
+        service, max_batch_size=4, flush_interval_seconds=0.05, max_queue_size=100
+    )
+    writer.start()
+
+    for index in range(6):
+        await writer.submit(_join(index))
+    await writer.flush()
+
+    assert batches == [4, 2]
+    await writer.stop()
+    assert writer.running is False
+
+
+async def test_full_queue_applies_backpressure() -> None:
+    release = threading.Event()
+    written: list[int] = []
+
+    def record_events(events):
+        release.wait(timeout=5)
+        written.extend(range(len(events)))
+        return [None] * len(events), []
+
+    writer = TrustEvidenceWriter(
+        SimpleNamespace(
+            record_events=record_events, publish_findings=lambda findings: None
+        ),
+        max_batch_size=1,
+        flush_interval_seconds=0,
+        max_queue_size=2,
+    )
+    writer.start()
+
+    await writer.submit(_join(0))
+    await asyncio.sleep(0.01)  # first event is being written
+    await writer.submit(_join(1))
+    await writer.submit(_join(2))
+    blocked = asyncio.create_task(writer.submit(_join(3)))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await asyncio.wait_for(blocked, timeout=5)
+    await writer.stop()
+    assert len(written) == 4
+
+
+async def test_submit_uses_writer_when_running(tmp_path) -> None:
+    service, _ = _service(tmp_path)
+
+    await submit_trust_event(service, _join(1))
+    assert len(service.list_evidence()) == 1
+
+    service.evidence_writer = TrustEvidenceWriter(service, flush_interval_seconds=0)
+    service.evidence_writer.start()
+    await submit_trust_event(service, _join(2))
+    await service.evidence_writer.stop()
+
+    assert len(service.list_evidence()) == 2
+
+
+async def test_staff_room_alerts_are_sent_from_batches_and_fallback(tmp_path) -> None:
+    notified: list[str] = []
+
+    async def notifier(finding) -> None:
+        notified.append(finding.suspect_actor_id)
+
+    service, _ = _service(
+        tmp_path,
+        alert_surface="staff_room",
+        publisher=CompositeTrustAlertPublisher(matrix_notifier=notifier),
+    )
+
+    # Fallback path (no writer running)
+    await submit_trust_event(service, _join(1, "Alice Support"))
+    await asyncio.sleep(0)
+    assert notified == ["@user1:matrix.org"]
+
+    # Batched path through the background writer
+    service.evidence_writer = TrustEvidenceWriter(service, flush_interval_seconds=0)
+    service.evidence_writer.start()
+    await submit_trust_event(service, _join(2, "Alice Support"))
+    await service.evidence_writer.stop()
+    await asyncio.sleep(0)
+
+    assert notified == ["@user1:matrix.org", "@user2:matrix.org"]
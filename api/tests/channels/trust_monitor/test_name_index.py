@@ -0,0 +1,103 @@
+"""Tests for the look-alike aware staff name index."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from app.channels.trust_monitor.detectors.staff_name_collision import (
+    StaffNameCollisionDetector,
+)
+from app.channels.trust_monitor.events import TrustEvent
+from app.channels.trust_monitor.models import TrustEventType
+from app.channels.trust_monitor.name_index import (
+    StaffNameIndex,
+    confusable_skeleton,
+    levenshtein,
+)
+
+STAFF = ["suddenwhipvapor", "Pazza", "Bisq Support Agent"]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("Раzzа", "pazza"),  # Cyrillic Р and а
+        ("5udd3nwh1pvap0r", "suddenwhlpvapor"),
+        ("ＰＡＺＺＡ", "pazza"),  # fullwidth forms
+        ("p.a-z_z​a", "pazza"),  # punctuation and zero-width space
+        ("Pázzà", "pazza"),
+        ("Modern", "modem"),
+    ],
+)
+def test_confusable_skeleton_folds_look_alikes(value: str, expected: str) -> None:
+    assert confusable_skeleton(value) == expected
+
+
+def test_levenshtein_distances() -> None:
+    assert levenshtein("pazza", "pazza") == 0
+    assert levenshtein("pazza", "pazzza") == 1
+    assert levenshtein("kitten", "sitting") == 3
+
+
+@pytest.mark.parametrize(
+    ("display_name", "staff_name", "kind", "distance"),
+    [
+        ("Suddenwhipvapor", "suddenwhipvapor", "exact", 0),
+        ("suddenwh1pvap0r", "suddenwhipvapor", "confusable", 0),
+        ("Раzzа", "Pazza", "confusable", 0),
+        ("suddenwhipvapour", "suddenwhipvapor", "edit_distance", 1),
+        ("suddenwhipvapur", "suddenwhipvapor", "edit_distance", 1),
+        ("Pazzaa", "Pazza", "edit_distance", 1),
+        ("bisq-support-agent (official)", "Bisq Support Agent", "contains", 0),
+    ],
+)
+def test_index_matches_look_alikes(
+    display_name: str, staff_name: str, kind: str, distance: int
+) -> None:
+    match = StaffNameIndex(STAFF).match(display_name)
+
+    assert match is not None
+    assert (match.staff_name, match.kind, match.distance) == (
+        staff_name,
+        kind,
+        distance,
+    )
+
+
+@pytest.mark.parametrize("display_name", ["Alice", "Pizza!!", "vapor", "Support", ""])
+def test_index_ignores_unrelated_names(display_name: str) -> None:
+    assert StaffNameIndex(STAFF).match(display_name) is None
+
+
+def test_short_staff_names_require_confusable_match() -> None:
+    index = StaffNameIndex(["Bob"])
+
+    assert index.match("B0b").kind == "confusable"
+    assert index.match("Rob") is None
+    assert index.match("Bobby") is None
+
+
+def test_detector_flags_homoglyph_display_names() -> None:
+    resolver = SimpleNamespace(
+        get_display_names=lambda: {"Pazza"},
+        is_staff=lambda actor_id: actor_id == "@pazza:matrix.org",
+    )
+    detector = StaffNameCollisionDetector(resolver)
+    event = TrustEvent(
+        channel_id="matrix",
+        space_id="!room:matrix.org",
+        thread_id=None,
+        actor_id="@fake:matrix.org",
+        actor_display_name="Раzzа",
+        event_type=TrustEventType.MEMBER_JOINED,
+        occurred_at=datetime.now(UTC),
+    )
+
+    result = detector.evaluate(event, actor_key="actor-key")
+
+    assert result is not None
+    assert result.score == 0.95
+    assert result.evidence_summary["match_kind"] == "confusable"
+    assert result.evidence_summary["matched_staff_name"] == "Pazza"
@@ -8,15 +8,18 @@ operator policy.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
+from urllib.parse import quote
 
 import pytest
 from app.channels.trust_monitor.detectors.base import DetectorResult
 from app.channels.trust_monitor.models import TrustAlertSurface
 from app.channels.trust_monitor.proactive_scanner import (
     ProactiveImpersonationScanner,
+    _RequestPacer,
 )
 
 
@@ -50,6 +53,7 @@ async def test_scanner_never_posts_into_monitored_public_rooms() -> None:
     )
     scanner._scan_user_directory = AsyncMock(return_value=[_make_result()])  # type: ignore[method-assign]
     scanner._scan_public_rooms = AsyncMock(return_value=[])  # type: ignore[method-assign]
+    scanner._scan_room_members = AsyncMock(return_value=[])  # type: ignore[method-assign]
 
     await scanner._run_scans()
 
@@ -71,7 +75,109 @@ async def test_scanner_forwards_findings_via_on_finding_callback() -> None:
     result = _make_result()
     scanner._scan_user_directory = AsyncMock(return_value=[result])  # type: ignore[method-assign]
     scanner._scan_public_rooms = AsyncMock(return_value=[])  # type: ignore[method-assign]
+    scanner._scan_room_members = AsyncMock(return_value=[])  # type: ignore[method-assign]
 
     await scanner._run_scans()
 
     assert captured == [result]
+
+
+def _member_event(user_id: str, display_name: str, event_id: str) -> dict:
+    return {
+        "type": "m.room.member",
+        "state_key": user_id,
+        "event_id": event_id,
+        "content": {"membership": "join", "displayname": display_name},
+    }
+
+
+def _members_session(rooms: dict[str, list[dict]]) -> SimpleNamespace:
+    async def get(url, **_kwargs):
+        room_id = next(r for r in rooms if quote(r, safe="") in url)
+        return SimpleNamespace(
+            status=200, json=AsyncMock(return_value={"chunk": rooms[room_id]})
+        )
+
+    return SimpleNamespace(get=AsyncMock(side_effect=get))
+
+
+def _member_scanner(room_ids: set[str]) -> ProactiveImpersonationScanner:
+    scanner = ProactiveImpersonationScanner(
+        homeserver_url="https://matrix.org",
+        access_token="syt_test",
+        staff_resolver=SimpleNamespace(get_display_names=lambda: {"Pazza"}),
+        trusted_staff_ids={"@pazza:matrix.org"},
+        monitored_room_ids=room_ids,
+        requests_per_second=1000.0,
+    )
+    scanner._get_avatar_url = AsyncMock(return_value=None)  # type: ignore[method-assign]
+    return scanner
+
+
+@pytest.mark.asyncio
+async def test_member_scan_screens_only_new_or_changed_members() -> None:
+    scanner = _member_scanner({"!room:matrix.org"})
+    members = [
+        _member_event("@pazza:matrix.org", "Pazza", "$1"),
+        _member_event("@alice:matrix.org", "Alice", "$2"),
+    ]
+    session = _members_session({"!room:matrix.org": members})
+
+    assert await scanner._scan_room_members(session) == []  # type: ignore[arg-type]
+    snapshot = scanner._room_snapshots["!room:matrix.org"]
+    assert snapshot.member_events == {
+        "@pazza:matrix.org": "$1",
+        "@alice:matrix.org": "$2",
+    }
+
+    # Alice renames herself to a homoglyph of the staff name; Bob joins
+    members[1] = _member_event("@alice:matrix.org", "Раzzа", "$3")
+    members.append(_member_event("@bob:matrix.org", "Bob", "$4"))
+    scanner._match_members = MagicMock(  # type: ignore[method-assign]
+        wraps=scanner._match_members
+    )
+
+    findings = await scanner._scan_room_members(session)  # type: ignore[arg-type]
+
+    assert [f.suspect_actor_id for f in findings] == ["@alice:matrix.org"]
+    assert findings[0].evidence_summary["room_id"] == "!room:matrix.org"
+    assert findings[0].evidence_summary["match_kind"] == "confusable"
+    screened = list(scanner._match_members.call_args.args[0])
+    assert [member[0] for member in screened] == [
+        "@alice:matrix.org",
+        "@bob:matrix.org",
+    ]
+
+    # Nothing changed: no member is screened again
+    scanner._match_members.reset_mock()
+    assert await scanner._scan_room_members(session) == []  # type: ignore[arg-type]
+    scanner._match_members.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_member_lists_are_fetched_concurrently_within_limit() -> None:
+    rooms = {f"!room{i}:matrix.org": [] for i in range(6)}
+    scanner = _member_scanner(set(rooms))
+    scanner._pacer = _RequestPacer(max_concurrency=3, requests_per_second=1000.0)
+    in_flight = 0
+    peak = 0
+
+    async def get(url, **_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        impersonator = _member_event("@fake:evil.org", "Pazza", "$x")
+        return SimpleNamespace(
+            status=200, json=AsyncMock(return_value={"chunk": [impersonator]})
+        )
+
+    session = SimpleNamespace(get=AsyncMock(side_effect=get))
+
+    findings = await scanner._scan_room_members(session)  # type: ignore[arg-type]
+
+    assert peak == 3
+    assert session.get.await_count == 6
+    # The same account in several rooms is reported once
+    assert [f.suspect_actor_id for f in findings] == ["@fake:evil.org"]
@@ -24,6 +24,11 @@ os.environ.setdefault("USE_TORCH", "0")
 os.environ.setdefault("USE_TF", "0")
 os.environ.setdefault("USE_FLAX", "0")
 
+# Route modules build services from get_settings() at import time; keep their
+# databases out of the cwd-relative default DATA_DIR.
+_IMPORT_DATA_DIR = tempfile.mkdtemp(prefix="bisq_test_import_")
+os.environ.setdefault("DATA_DIR", _IMPORT_DATA_DIR)
+
 from app.core.config import Settings, get_settings  # noqa: E402
 from app.db.run_migrations import run_migrations  # noqa: E402
 from app.services.faq_service import FAQService  # noqa: E402
@@ -34,6 +39,10 @@ if TYPE_CHECKING:
     from app.services.simplified_rag_service import SimplifiedRAGService
 
 
+def pytest_unconfigure(config):
+    shutil.rmtree(_IMPORT_DATA_DIR, ignore_errors=True)
+
+
 @pytest.fixture(autouse=True)
 def clear_settings_cache():
     """Clear settings cache before and after each test.
@@ -17,3 +17,44 @@ class TestHealthRoute:
         assert response.status_code == 200
         payload = response.json()
         assert payload["services"]["bisq2_api"]["status"] == "degraded"
+
+    def test_readiness_reports_warmup_components(self, test_client):
+        from app.services.startup_warmup import StartupWarmup
+
+        warmup = StartupWarmup()
+        warmup._register("rag_index", required=True)
+        warmup._register("nli_model", required=False)
+        test_client.app.state.startup_warmup = warmup
+        test_client.app.state.rag_service = object()
+        try:
+            response = test_client.get("/health/ready")
+            assert response.status_code == 503
+            assert response.json()["status"] == "warming"
+            assert test_client.get("/health").json()["status"] == "initializing"
+
+            warmup._components["rag_index"].status = "ready"
+            response = test_client.get("/health/ready")
+            assert response.status_code == 200
+            payload = response.json()
+            assert payload["status"] == "degraded"
+            assert payload["components"]["nli_model"]["status"] == "pending"
+            assert test_client.get("/health").json()["status"] == "healthy"
+        finally:
+            del test_client.app.state.startup_warmup
+
+    def test_health_fails_when_required_warmup_failed(self, test_client):
+        from app.services.startup_warmup import StartupWarmup
+
+        warmup = StartupWarmup()
+        warmup._register("rag_index", required=True)
+        warmup._components["rag_index"].status = "failed"
+        test_client.app.state.startup_warmup = warmup
+        test_client.app.state.rag_service = object()
+        try:
+            response = test_client.get("/health")
+            assert response.status_code == 503
+            payload = response.json()
+            assert payload["status"] == "unhealthy"
+            assert payload["services"]["rag"] == "failed"
+        finally:
+            del test_client.app.state.startup_warmup
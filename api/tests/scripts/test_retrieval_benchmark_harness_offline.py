@@ -0,0 +1,140 @@
+import json
+from pathlib import Path
+
+from app.scripts.retrieval_benchmark_harness import (
+    _load_offline_queries,
+    _score_ranking,
+    build_parser,
+    run_offline_benchmark,
+)
+from app.services.rag.hash_embeddings import HashEmbeddings
+
+PAGES = [
+    ("Tor connection", "bisq1", "Bisq uses Tor hidden services to connect peers."),
+    ("Trade fees", "bisq2", "Bisq Easy charges no trade fee to the buyer."),
+    ("Seed restore", "general", "Restore a wallet from the seed words backup."),
+    ("Arbitration", "bisq1", "Arbitrators decide disputes after mediation fails."),
+]
+
+
+def _write_wiki(wiki_dir: Path) -> None:
+    wiki_dir.mkdir(parents=True, exist_ok=True)
+    with open(wiki_dir / "processed_wiki.jsonl", "w") as f:
+        for title, category, content in PAGES:
+            entry = {
+                "title": title,
+                "category": category,
+                "content": f"{title}. {content}",
+            }
+            f.write(json.dumps(entry) + "\n")
+
+
+def test_hash_embeddings_are_deterministic_and_normalized() -> None:
+    embeddings = HashEmbeddings(dimensions=64)
+
+    first = embeddings.embed_query("How do I restore my seed?")
+    second = HashEmbeddings(dimensions=64).embed_documents(
+        ["How do I restore my seed?"]
+    )[0]
+
+    assert first == second
+    assert len(first) == 64
+    assert abs(sum(v * v for v in first) - 1.0) < 1e-9
+    assert sum(v * v for v in embeddings.embed_query("")) == 1.0
+
+
+def test_score_ranking_uses_distinct_titles() -> None:
+    recall, rr = _score_ranking(["A", "A", "B", "C"], ["C"], k=3)
+    assert (recall, rr) == (1.0, 1.0 / 3)
+
+    recall, rr = _score_ranking(["A", "B", "C"], ["C", "D"], k=2)
+    assert (recall, rr) == (0.0, 0.0)
+
+
+def test_samples_without_labels_are_skipped(tmp_path: Path) -> None:
+    samples = tmp_path / "samples.json"
+    samples.write_text(
+        json.dumps(
+            [
+                {"question": "unlabelled", "metadata": {}},
+                {
+                    "question": "How are disputes settled?",
+                    "metadata": {
+                        "protocol": "multisig_v1",
+                        "relevant_titles": ["Arbitration"],
+                    },
+                },
+            ]
+        )
+    )
+
+    queries = _load_offline_queries(str(samples), [], None)
+
+    assert queries == [
+        {
+            "question": "How are disputes settled?",
+            "relevant_titles": ["Arbitration"],
+            "detected_version": "Bisq 1",
+        }
+    ]
+
+
+def test_offline_benchmark_reports_stages_and_quality(tmp_path: Path) -> None:
+    wiki_dir = tmp_path / "wiki"
+    _write_wiki(wiki_dir)
+    output = tmp_path / "offline.json"
+    args = build_parser().parse_args(
+        [
+            "offline",
+            "--wiki-dir",
+            str(wiki_dir),
+            "--output",
+            str(output),
+            "--k",
+            "3",
+            "--repeats",
+            "2",
+            "--dimensions",
+            "64",
+        ]
+    )
+
+    assert run_offline_benchmark(args) == 0
+
+    summary = json.loads(output.read_text())
+    assert summary["corpus"] == {"chunks": 4, "queries": 4}
+    assert summary["stages"]["hybrid"]["count"] == 8
+    assert set(summary["stages"]) == {
+        "embed_query",
+        "dense",
+        "sparse",
+        "hybrid",
+        "document_retriever",
+    }
+    # Known-item title queries over a tiny corpus always find their page
+    assert summary["retrieval"]["sparse"] == {"recall_at_3": 1.0, "mrr": 1.0}
+    assert summary["retrieval"]["hybrid"]["recall_at_3"] == 1.0
+    assert summary["build"]["index_build_ms"] > 0
+    assert not (Path(summary["config"]["wiki_dir"]) / "bm25_vocabulary.json").exists()
+
+
+def test_offline_benchmark_is_reproducible(tmp_path: Path) -> None:
+    wiki_dir = tmp_path / "wiki"
+    _write_wiki(wiki_dir)
+    results = []
+    for name in ("a.json", "b.json"):
+        args = build_parser().parse_args(
+            [
+                "offline",
+                "--wiki-dir",
+                str(wiki_dir),
+                "--output",
+                str(tmp_path / name),
+                "--repeats",
+                "1",
+            ]
+        )
+        run_offline_benchmark(args)
+        results.append(json.loads((tmp_path / name).read_text())["retrieval"])
+
+    assert results[0] == results[1]
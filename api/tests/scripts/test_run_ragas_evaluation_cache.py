@@ -0,0 +1,129 @@
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+from app.scripts import run_ragas_evaluation as ragas_eval
+
+
+@pytest.fixture
+def harness(monkeypatch, tmp_path: Path):
+    samples = [
+        {"question": f"Question {i}?", "ground_truth": f"Answer {i}", "metadata": {}}
+        for i in range(4)
+    ]
+    samples_path = tmp_path / "samples.json"
+    samples_path.write_text(json.dumps(samples))
+    state = {"queries": [], "scored": [], "in_flight": 0, "max_in_flight": 0}
+
+    async def fake_query(client, question, **kwargs):
+        state["queries"].append(question)
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return {"answer": f"answer to {question}", "sources": [{"content": "ctx"}]}
+
+    def fake_scores(questions, ground_truths, answers, contexts, **kwargs):
+        state["scored"].append(list(questions))
+        rows = [{"faithfulness": float(len(q)) / 100} for q in questions]
+        mean = sum(r["faithfulness"] for r in rows) / len(rows)
+        return {"faithfulness": mean}, rows
+
+    real_client = httpx.AsyncClient
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"status": "healthy"})
+    )
+    monkeypatch.setattr(ragas_eval, "query_rag_system", fake_query)
+    monkeypatch.setattr(ragas_eval, "compute_ragas_metrics_detailed", fake_scores)
+    monkeypatch.setattr(
+        ragas_eval.httpx, "AsyncClient", lambda: real_client(transport=transport)
+    )
+    monkeypatch.setattr(ragas_eval.asyncio, "sleep", _no_pause(asyncio.sleep))
+
+    async def run(**kwargs):
+        options = {
+            "metric_names": ["faithfulness"],
+            "cache_path": str(tmp_path / "cache.json"),
+            "index_generation": "gen-1",
+            "prompt_version": "p1",
+            "model": "m1",
+        }
+        options.update(kwargs)
+        return await ragas_eval.run_evaluation(
+            str(samples_path), str(tmp_path / "out.json"), "qdrant", **options
+        )
+
+    return run, state, samples_path, samples
+
+
+def _no_pause(real_sleep):
+    async def sleep(delay):
+        # Keep the fake queries' overlap but skip the per-worker pacing
+        await real_sleep(delay if delay < 0.5 else 0)
+
+    return sleep
+
+
+async def test_queries_run_concurrently_in_sample_order(harness):
+    run, state, _, samples = harness
+
+    results = await run(concurrency=3, cache_path=None)
+
+    assert state["max_in_flight"] == 3
+    assert [r["question"] for r in results["individual_results"]] == [
+        s["question"] for s in samples
+    ]
+    assert "cache" not in results
+
+
+async def test_incremental_run_reuses_unchanged_samples(harness):
+    run, state, samples_path, samples = harness
+    first = await run()
+    assert len(state["queries"]) == 4
+
+    samples[1]["question"] = "Question 1, reworded?"
+    samples_path.write_text(json.dumps(samples))
+    state["queries"].clear()
+    state["scored"].clear()
+
+    second = await run(incremental=True)
+
+    assert state["queries"] == ["Question 1, reworded?"]
+    assert state["scored"] == [["Question 1, reworded?"]]
+    assert second["cache"]["queried_samples"] == 1
+    assert [r["cached"] for r in second["individual_results"]] == [
+        True,
+        False,
+        True,
+        True,
+    ]
+    rows = [r["ragas"]["faithfulness"] for r in second["individual_results"]]
+    assert second["metrics"]["faithfulness"] == pytest.approx(sum(rows) / 4)
+    assert first["individual_results"][0]["ragas"] == (
+        second["individual_results"][0]["ragas"]
+    )
+
+
+async def test_new_index_generation_invalidates_cache(harness):
+    run, state, _, _ = harness
+    await run()
+    state["queries"].clear()
+
+    await run(incremental=True, index_generation="gen-2")
+    assert len(state["queries"]) == 4
+
+    state["queries"].clear()
+    await run(incremental=True, index_generation="gen-2")
+    assert state["queries"] == []
+
+
+async def test_non_incremental_run_refreshes_cache(harness):
+    run, state, _, _ = harness
+    await run()
+    state["queries"].clear()
+
+    await run()
+
+    assert len(state["queries"]) == 4
@@ -0,0 +1,108 @@
+"""Tests for the semantic full-answer cache."""
+
+import numpy as np
+from app.services.rag.answer_cache import SemanticAnswerCache, normalize_question
+
+SCOPE = ("bisq2", "en", "web", "prompt-v1")
+
+
+def _cache(**kwargs) -> SemanticAnswerCache:
+    cache = SemanticAnswerCache(**kwargs)
+    cache.set_index_generation("build-1")
+    return cache
+
+
+def _vec(*values: float) -> list[float]:
+    return list(values)
+
+
+def test_normalize_question_ignores_case_spacing_and_trailing_punctuation():
+    assert normalize_question("  How do I   restore my wallet?? ") == (
+        "how do i restore my wallet"
+    )
+
+
+def test_inactive_until_index_generation_is_set():
+    cache = SemanticAnswerCache()
+    assert cache.active is False
+    assert cache.store(SCOPE, "q", _vec(1, 0), {"answer": "a"}) is False
+    assert cache.lookup(SCOPE, "q", _vec(1, 0)) is None
+
+
+def test_paraphrase_above_threshold_hits_and_returns_copy():
+    cache = _cache(similarity_threshold=0.95)
+    cache.store(SCOPE, "How do I restore my wallet?", _vec(1, 0.1), {"answer": "a"})
+
+    hit = cache.lookup(SCOPE, "wallet restore?", _vec(1, 0.12))
+
+    assert hit is not None
+    assert hit.similarity > 0.95
+    assert hit.matched_question == "how do i restore my wallet"
+    hit.response["answer"] = "mutated"
+    again = cache.lookup_exact(SCOPE, "how do i restore my wallet")
+    assert again is not None and again.response["answer"] == "a"
+
+
+def test_dissimilar_question_misses():
+    cache = _cache(similarity_threshold=0.95)
+    cache.store(SCOPE, "restore wallet", _vec(1, 0), {"answer": "a"})
+
+    assert cache.lookup(SCOPE, "trade limits", _vec(0.6, 0.8)) is None
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_scopes_are_isolated():
+    cache = _cache()
+    cache.store(SCOPE, "restore wallet", _vec(1, 0), {"answer": "a"})
+
+    other = ("multisig_v1", "en", "web", "prompt-v1")
+    assert cache.lookup(other, "restore wallet", _vec(1, 0)) is None
+    assert cache.lookup_exact(other, "restore wallet") is None
+
+
+def test_new_index_generation_and_faq_update_drop_entries():
+    cache = _cache()
+    cache.store(SCOPE, "restore wallet", _vec(1, 0), {"answer": "a"})
+
+    cache.set_index_generation("build-1")
+    assert cache.lookup_exact(SCOPE, "restore wallet") is not None
+
+    cache.invalidate(reason="faq_update")
+    assert cache.lookup(SCOPE, "restore wallet", _vec(1, 0)) is None
+
+    cache.store(SCOPE, "restore wallet", _vec(1, 0), {"answer": "b"})
+    cache.set_index_generation("build-2")
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_lru_eviction_keeps_recently_used_entries():
+    cache = _cache(max_entries=2)
+    cache.store(SCOPE, "first", _vec(1, 0, 0), {"answer": "1"})
+    cache.store(SCOPE, "second", _vec(0, 1, 0), {"answer": "2"})
+    assert cache.lookup_exact(SCOPE, "first") is not None
+
+    cache.store(SCOPE, "third", _vec(0, 0, 1), {"answer": "3"})
+
+    assert cache.lookup_exact(SCOPE, "second") is None
+    assert cache.lookup(SCOPE, "first?", _vec(1, 0, 0)) is not None
+    assert cache.lookup(SCOPE, "third?", _vec(0, 0, 1)) is not None
+
+
+def test_expired_entries_are_not_served(monkeypatch):
+    cache = _cache(ttl_seconds=60)
+    now = [1000.0]
+    monkeypatch.setattr("app.services.rag.answer_cache.time.time", lambda: now[0])
+    cache.store(SCOPE, "restore wallet", _vec(1, 0), {"answer": "a"})
+
+    now[0] += 61
+
+    assert cache.lookup(SCOPE, "restore wallet?", np.array([1.0, 0.0])) is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_unusable_embeddings_are_rejected():
+    cache = _cache()
+    assert cache.store(SCOPE, "q", _vec(0, 0), {"answer": "a"}) is False
+    assert cache.store(SCOPE, "q", [], {"answer": "a"}) is False
+    cache.store(SCOPE, "q", _vec(1, 0), {"answer": "a"})
+    assert cache.lookup(SCOPE, "other", _vec(1, 0, 0)) is None
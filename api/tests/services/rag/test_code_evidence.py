@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -183,6 +184,125 @@ def test_staff_retriever_scores_query_terms(tmp_path: Path) -> None:
     assert docs[0].score > 0
 
 
+def _counting_retriever(
+    source: Path, monkeypatch: pytest.MonkeyPatch
+) -> tuple[StaffCodeEvidenceRetriever, list[int]]:
+    loader = CodeEvidenceLoader(source)
+    load_calls = [0]
+    original_load = loader.load
+
+    def _counting_load():
+        load_calls[0] += 1
+        return original_load()
+
+    monkeypatch.setattr(loader, "load", _counting_load)
+    return StaffCodeEvidenceRetriever(loader, refresh_interval_seconds=0.0), load_calls
+
+
+def test_staff_retriever_rebuilds_index_when_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "code_knowledge" / "code_evidence.jsonl"
+    _write_jsonl(source, [_valid_record(id="first", claim="Sell offer limits.")])
+    retriever, load_calls = _counting_retriever(source, monkeypatch)
+
+    assert [doc.id for doc in retriever.retrieve("sell offer")] == ["first"]
+    assert [doc.id for doc in retriever.retrieve("sell offer")] == ["first"]
+    assert load_calls == [1]
+
+    _write_jsonl(
+        source,
+        [_valid_record(id="second", claim="Sell offer limits changed again.")],
+    )
+
+    assert [doc.id for doc in retriever.retrieve("sell offer")] == ["second"]
+    assert load_calls == [2]
+
+
+def test_staff_retriever_detects_same_size_rewrite_by_mtime(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "code_knowledge" / "code_evidence.jsonl"
+    _write_jsonl(source, [_valid_record(id="aaaaa", claim="Sell offer limits.")])
+    retriever, load_calls = _counting_retriever(source, monkeypatch)
+    assert [doc.id for doc in retriever.retrieve("sell offer")] == ["aaaaa"]
+    before = source.stat()
+
+    _write_jsonl(source, [_valid_record(id="bbbbb", claim="Sell offer limits.")])
+    os.utime(source, ns=(before.st_atime_ns, before.st_mtime_ns + 1_000_000_000))
+
+    assert source.stat().st_size == before.st_size
+    assert [doc.id for doc in retriever.retrieve("sell offer")] == ["bbbbb"]
+    assert load_calls == [2]
+
+
+def test_staff_retriever_detects_replaced_file_by_inode(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "code_knowledge" / "code_evidence.jsonl"
+    _write_jsonl(source, [_valid_record(id="aaaaa", claim="Sell offer limits.")])
+    retriever, load_calls = _counting_retriever(source, monkeypatch)
+    assert [doc.id for doc in retriever.retrieve("sell offer")] == ["aaaaa"]
+    before = source.stat()
+
+    # Atomic replace with identical size and mtime, as deploy tooling does
+    replacement = source.with_suffix(".tmp")
+    _write_jsonl(replacement, [_valid_record(id="bbbbb", claim="Sell offer limits.")])
+    os.utime(replacement, ns=(before.st_atime_ns, before.st_mtime_ns))
+    os.replace(replacement, source)
+
+    assert source.stat().st_ino != before.st_ino
+    assert [doc.id for doc in retriever.retrieve("sell offer")] == ["bbbbb"]
+    assert load_calls == [2]
+
+
+def test_staff_retriever_matches_query_terms_inside_identifiers(
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "code_knowledge" / "code_evidence.jsonl"
+    _write_jsonl(source, [_valid_record(id="limits", claim="Caps apply.")])
+
+    retriever = StaffCodeEvidenceRetriever(CodeEvidenceLoader(source))
+
+    docs = retriever.retrieve("amount limits", min_score=1.0)
+
+    assert [doc.id for doc in docs] == ["limits"]
+    assert docs[0].score == 1.0
+
+
+def test_index_lookup_matches_substring_scan_and_evicts_lru(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.services.rag import code_evidence
+
+    records = [
+        CodeEvidenceRecord.from_dict(
+            _valid_record(id=f"r{i}", claim=claim, symbol=f"Sym{i}", path=f"p{i}")
+        )
+        for i, claim in enumerate(
+            ["Reputation score gates sell offers.", "Trade amount limits apply."]
+        )
+    ]
+    index = code_evidence._CodeEvidenceIndex(records)
+
+    for term in ["putat", "offer", "amount", "limits", "xyz", "sym1", "tion"]:
+        expected = {
+            position
+            for position, record in enumerate(index.records)
+            if term in code_evidence._record_haystack(record)
+        }
+        assert index.lookup(term) == expected, term
+
+    monkeypatch.setattr(code_evidence, "_TERM_CACHE_MAX_ENTRIES", 2)
+    index._term_cache.clear()
+    index.lookup("offer")
+    index.lookup("amount")
+    index.lookup("offer")
+    index.lookup("limits")
+
+    assert list(index._term_cache) == ["offer", "limits"]
+
+
 def test_code_source_refs_reject_branch_or_tag_like_revisions() -> None:
     assert (
         parse_code_source_ref(
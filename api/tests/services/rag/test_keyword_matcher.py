@@ -0,0 +1,69 @@
+"""Tests for the compiled multi-pattern keyword matcher."""
+
+import pytest
+from app.services.rag.bisq_entities import (
+    BISQ1_DOMAIN_CONTEXT_KEYWORDS,
+    BISQ1_STRONG_KEYWORDS,
+    BISQ2_DOMAIN_CONTEXT_KEYWORDS,
+    BISQ2_STRONG_KEYWORDS,
+    BISQ_KEYWORD_MATCHER,
+)
+from app.services.rag.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    def test_reports_overlapping_and_nested_matches(self):
+        matcher = KeywordMatcher({"a": ["he", "she", "his", "hers"]})
+
+        hits = matcher.scan("ushers")
+
+        assert hits.keywords("a") == ["he", "she", "hers"]
+        assert hits.count("a") == 3
+
+    def test_counts_each_keyword_once_per_text(self):
+        matcher = KeywordMatcher({"a": ["dao"]})
+
+        assert matcher.scan("dao dao dao").count("a") == 1
+
+    def test_duplicate_table_entries_are_weighted(self):
+        matcher = KeywordMatcher({"a": ["dao", "bsq", "dao"]})
+
+        assert matcher.scan("the dao").count("a") == 2
+
+    def test_categories_share_keywords(self):
+        matcher = KeywordMatcher({"x": ["dao", "bsq"], "y": ["bsq"]})
+
+        hits = matcher.scan("buy BSQ")
+
+        assert hits.has("x") and hits.has("y")
+        assert hits.count("x") == 1
+        assert not matcher.scan("nothing here").has("x")
+        assert hits.count("unknown") == 0
+
+    def test_first_follows_table_order(self):
+        matcher = KeywordMatcher({"a": ["zeta", "alpha"]})
+
+        assert matcher.scan("alpha and zeta").first("a") == "zeta"
+        assert matcher.scan("none").first("a") is None
+
+
+class TestSharedBisqMatcher:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "how do i open a dispute about my delayed payout in the dao?",
+            "bisq easy reputation score for 600 usd trades on bisq 2",
+            "ctrl + o shows the deposit txid, version 1.9.9 old bisq",
+            "",
+        ],
+    )
+    def test_matches_substring_semantics(self, text):
+        hits = BISQ_KEYWORD_MATCHER.scan(text)
+
+        for category, keywords in (
+            ("bisq1_strong", BISQ1_STRONG_KEYWORDS),
+            ("bisq2_strong", BISQ2_STRONG_KEYWORDS),
+            ("bisq1_domain", BISQ1_DOMAIN_CONTEXT_KEYWORDS),
+            ("bisq2_domain", BISQ2_DOMAIN_CONTEXT_KEYWORDS),
+        ):
+            assert hits.count(category) == sum(1 for kw in keywords if kw in text)
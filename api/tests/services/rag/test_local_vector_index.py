@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from app.services.rag.local_vector_index import LocalVectorIndex, LocalVectorRetriever
+
+
+def _index(dtype: str = "float32") -> LocalVectorIndex:
+    return LocalVectorIndex.from_vectors(
+        ids=["1", "2", "3"],
+        dense_vectors=[[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]],
+        sparse_vectors=[([1, 2], [1.0, 0.5]), ([3], [2.0]), ([2], [1.5])],
+        payloads=[
+            {"content": "bisq easy trade", "protocol": "bisq_easy"},
+            {"content": "multisig arbitration", "protocol": "multisig_v1"},
+            {"content": "general wallet", "protocol": "all"},
+        ],
+        dtype=dtype,
+        build_stamp=123.0,
+    )
+
+
+def _tokenizer(indices: list[int], values: list[float]) -> MagicMock:
+    tokenizer = MagicMock()
+    tokenizer.tokenize_query.return_value = (indices, values)
+    return tokenizer
+
+
+@pytest.mark.parametrize("dtype", ["float32", "int8"])
+def test_snapshot_roundtrip_is_memory_mapped(tmp_path: Path, dtype: str) -> None:
+    _index(dtype).save(tmp_path / "local_vector_index")
+
+    loaded = LocalVectorIndex.load(tmp_path / "local_vector_index")
+
+    assert loaded is not None
+    assert loaded.size == 3
+    assert loaded.dtype == dtype
+    assert loaded.build_stamp == 123.0
+    assert isinstance(loaded.dense, np.memmap)
+    scores = loaded.dense_scores([1.0, 0.0])
+    assert int(np.argmax(scores)) == 0
+    assert scores[0] == pytest.approx(1.0, abs=0.01)
+
+
+def test_load_returns_none_without_snapshot(tmp_path: Path) -> None:
+    assert LocalVectorIndex.load(tmp_path / "missing") is None
+
+
+def test_dense_retrieve_honours_protocol_filter() -> None:
+    embeddings = MagicMock()
+    embeddings.embed_query.return_value = [1.0, 0.0]
+    retriever = LocalVectorRetriever(
+        _index(), embeddings=embeddings, bm25_tokenizer=_tokenizer([], [])
+    )
+
+    docs = retriever.retrieve("trade", k=2, filter_dict={"protocol": ["all"]})
+
+    assert [doc.id for doc in docs] == ["3"]
+    assert docs[0].content == "general wallet"
+    assert docs[0].metadata == {"protocol": "all"}
+
+
+def test_hybrid_retrieve_combines_normalized_scores() -> None:
+    embeddings = MagicMock()
+    embeddings.embed_query.return_value = [0.0, 1.0]
+    retriever = LocalVectorRetriever(
+        _index(),
+        embeddings=embeddings,
+        bm25_tokenizer=_tokenizer([2], [1.0]),
+        semantic_weight=0.5,
+        keyword_weight=0.5,
+    )
+
+    docs = retriever.retrieve_with_scores("query", k=3)
+
+    assert [doc.id for doc in docs][0] == "3"
+    assert all(0.0 <= doc.score <= 1.0 for doc in docs)
+
+
+def test_falls_back_to_bm25_when_embeddings_fail() -> None:
+    embeddings = MagicMock()
+    embeddings.embed_query.side_effect = RuntimeError("embedding API down")
+    retriever = LocalVectorRetriever(
+        _index(), embeddings=embeddings, bm25_tokenizer=_tokenizer([3], [1.0])
+    )
+
+    docs = retriever.retrieve_with_scores("arbitration", k=3)
+
+    assert [doc.id for doc in docs] == ["2"]
+    assert docs[0].score == pytest.approx(2.0)
+
+
+def test_int8_dense_scores_are_computed_in_row_blocks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from app.services.rag import local_vector_index
+
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(7, 4)).tolist()
+    index = LocalVectorIndex.from_vectors(
+        ids=[str(i) for i in range(7)],
+        dense_vectors=vectors,
+        sparse_vectors=[([], [])] * 7,
+        payloads=[{"content": str(i)} for i in range(7)],
+        dtype="int8",
+    )
+    index.save(tmp_path / "local_vector_index")
+    loaded = LocalVectorIndex.load(tmp_path / "local_vector_index")
+    assert loaded is not None
+    query = [0.5, -1.0, 0.25, 2.0]
+    expected = (
+        np.asarray(loaded.dense, dtype=np.float32)
+        @ (np.asarray(query, dtype=np.float32) / np.linalg.norm(query))
+    ) * loaded.dense_scale
+
+    monkeypatch.setattr(local_vector_index, "_DENSE_BLOCK_ROWS", 3)
+
+    np.testing.assert_allclose(loaded.dense_scores(query), expected, rtol=1e-6)
+
+
+def test_filter_mask_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.services.rag import local_vector_index
+
+    monkeypatch.setattr(local_vector_index, "_MASK_CACHE_MAX_ENTRIES", 2)
+    index = _index()
+
+    index.filter_mask({"protocol": "bisq_easy"})
+    index.filter_mask({"protocol": "multisig_v1"})
+    index.filter_mask({"protocol": "bisq_easy"})
+    mask = index.filter_mask({"protocol": "all"})
+
+    assert mask is not None and mask.tolist() == [False, False, True]
+    assert list(index._mask_cache) == [
+        ("protocol", ("bisq_easy",)),
+        ("protocol", ("all",)),
+    ]
@@ -4,6 +4,7 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
+from app.services.rag.local_vector_index import LocalVectorIndex
 from app.services.rag.qdrant_index_manager import QdrantIndexManager
 from langchain_core.documents import Document
 
@@ -49,3 +50,34 @@ def test_rebuild_index_preserves_existing_bm25_vocab_when_embedding_probe_fails(
         )
 
     assert vocab_path.read_text(encoding="utf-8") == "existing-vocabulary"
+
+
+def test_rebuild_index_writes_local_fallback_snapshot(tmp_path: Path) -> None:
+    settings = _settings(tmp_path)
+    settings.ENABLE_LOCAL_FALLBACK_INDEX = True
+    settings.LOCAL_FALLBACK_INDEX_DTYPE = "int8"
+    embeddings = MagicMock()
+    embeddings.embed_query.return_value = [0.1, 0.2, 0.3]
+    embeddings.embed_documents.side_effect = lambda texts: [
+        [0.1, 0.2, 0.3] for _ in texts
+    ]
+
+    manager = QdrantIndexManager(
+        settings=settings,
+        client=_client_without_collection(),
+    )
+    manager.rebuild_index(
+        [
+            Document(page_content="Bisq Easy trade limits", metadata={"id": "a"}),
+            Document(page_content="Multisig arbitration", metadata={"id": "b"}),
+        ],
+        embeddings=embeddings,
+        force=True,
+    )
+
+    index = LocalVectorIndex.load(manager.local_index_path)
+    assert index is not None
+    assert index.size == 2
+    assert index.dtype == "int8"
+    assert index.build_stamp == manager.load_metadata()["last_build"]
+    assert index.payloads[0]["content"] == "Bisq Easy trade limits"
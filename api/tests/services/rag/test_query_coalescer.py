@@ -0,0 +1,134 @@
+"""Tests for in-flight query coalescing."""
+
+import asyncio
+
+import pytest
+from app.services.rag.query_coalescer import QueryCoalescer
+
+SCOPE = ("matrix", "", None)
+
+
+def _slow_query(calls: list, release: asyncio.Event, answer: str = "a"):
+    async def compute():
+        calls.append(answer)
+        await release.wait()
+        return {"answer": answer, "sources": []}
+
+    return compute
+
+
+@pytest.mark.asyncio
+async def test_burst_of_identical_questions_runs_once():
+    coalescer = QueryCoalescer()
+    calls: list = []
+    release = asyncio.Event()
+    questions = ["Trade stuck?", "trade  stuck", "TRADE STUCK!"]
+
+    tasks = [
+        asyncio.create_task(coalescer.run(SCOPE, question, _slow_query(calls, release)))
+        for question in questions
+    ]
+    await asyncio.sleep(0)
+    assert coalescer.in_flight == 1
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == ["a"]
+    assert [coalesced for _, coalesced in results] == [False, True, True]
+    results[1][0]["answer"] = "changed"
+    assert results[2][0]["answer"] == "a"
+    assert coalescer.in_flight == 0
+    assert coalescer.get_stats()["followers"] == 2
+
+
+@pytest.mark.asyncio
+async def test_different_scope_or_finished_query_is_not_shared():
+    coalescer = QueryCoalescer()
+    calls: list = []
+    release = asyncio.Event()
+    release.set()
+
+    await coalescer.run(SCOPE, "q", _slow_query(calls, release))
+    await coalescer.run(SCOPE, "q", _slow_query(calls, release))
+    await coalescer.run(("bisq2", "", None), "q", _slow_query(calls, release))
+
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_similar_question_joins_within_similarity_window():
+    vectors = {
+        "how do i restore my wallet": [1.0, 0.1],
+        "wallet restore help": [1.0, 0.12],
+        "what are the trade limits": [0.1, 1.0],
+    }
+    coalescer = QueryCoalescer(
+        similarity_threshold=0.95, embed=lambda text: vectors[text]
+    )
+    calls: list = []
+    release = asyncio.Event()
+
+    leader = asyncio.create_task(
+        coalescer.run(SCOPE, "how do i restore my wallet", _slow_query(calls, release))
+    )
+    await asyncio.sleep(0.05)
+    similar = asyncio.create_task(
+        coalescer.run(SCOPE, "wallet restore help", _slow_query(calls, release, "b"))
+    )
+    other = asyncio.create_task(
+        coalescer.run(
+            SCOPE, "what are the trade limits", _slow_query(calls, release, "c")
+        )
+    )
+    await asyncio.sleep(0.05)
+    release.set()
+
+    assert (await similar)[1] is True
+    assert (await other)[0]["answer"] == "c"
+    assert (await leader)[0]["answer"] == "a"
+    assert sorted(calls) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_leader_cancellation_does_not_fail_followers():
+    coalescer = QueryCoalescer()
+    calls: list = []
+    release = asyncio.Event()
+
+    leader = asyncio.create_task(coalescer.run(SCOPE, "q", _slow_query(calls, release)))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(
+        coalescer.run(SCOPE, "q", _slow_query(calls, release))
+    )
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    result, coalesced = await follower
+    assert result["answer"] == "a" and coalesced is True
+    assert leader.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_run_is_cancelled_when_every_caller_gives_up():
+    coalescer = QueryCoalescer()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def compute():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return {}
+
+    caller = asyncio.create_task(coalescer.run(SCOPE, "q", compute))
+    await started.wait()
+    caller.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert coalescer.in_flight == 0
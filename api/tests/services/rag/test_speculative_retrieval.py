@@ -0,0 +1,42 @@
+"""Tests for speculative retrieval."""
+
+import asyncio
+import threading
+
+import pytest
+from app.services.rag.speculative_retrieval import SpeculativeRetrieval
+
+
+@pytest.mark.asyncio
+async def test_result_runs_retrieval_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    calls = []
+
+    def retrieve(query, version):
+        calls.append((query, version, threading.get_ident() != loop_thread))
+        return ["doc"], [0.9]
+
+    speculation = SpeculativeRetrieval(retrieve, "restore wallet", "Bisq 2")
+
+    assert speculation.matches("restore wallet", "Bisq 2")
+    assert not speculation.matches("restore wallet", "Bisq 1")
+    assert not speculation.matches("restore my wallet", "Bisq 2")
+    assert await speculation.result() == (["doc"], [0.9])
+    assert calls == [("restore wallet", "Bisq 2", True)]
+
+
+@pytest.mark.asyncio
+async def test_discarded_failure_is_consumed(caplog):
+    release = threading.Event()
+
+    def retrieve(query, version):
+        release.wait(timeout=5)
+        raise RuntimeError("qdrant down")
+
+    speculation = SpeculativeRetrieval(retrieve, "q", "Bisq 2")
+    speculation.discard()
+    release.set()
+    await asyncio.wait([speculation._task], timeout=5)
+
+    assert speculation._task.done()
+    assert "Task exception was never retrieved" not in caplog.text
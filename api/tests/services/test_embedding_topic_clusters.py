@@ -0,0 +1,146 @@
+"""Tests for incremental embedding-based knowledge update clustering."""
+
+from typing import List
+
+import numpy as np
+from app.services.knowledge_updates.embedding_clusters import EmbeddingTopicClusterer
+from app.services.knowledge_updates.topic_clusters import build_knowledge_review_items
+from app.services.training.unified_repository import UnifiedFAQCandidate
+from tests.services.test_knowledge_update_service import _candidate
+
+# Paraphrases map to the same concept axis; unrelated questions get their own
+CONCEPTS = {
+    "fee": 0,
+    "cost": 0,
+    "charge": 0,
+    "seed": 1,
+    "restore": 1,
+    "recover": 1,
+    "tor": 2,
+    "connect": 2,
+}
+
+
+class FakeEmbedder:
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+
+    def __call__(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        vectors = []
+        for text in texts:
+            vector = np.full(4, 0.05)
+            for word in text.lower().replace("?", "").split():
+                axis = CONCEPTS.get(word)
+                if axis is not None:
+                    vector[axis] += 1.0
+            vectors.append(vector.tolist())
+        return vectors
+
+
+def _q(candidate_id: int, question: str, **overrides) -> UnifiedFAQCandidate:
+    return _candidate(id=candidate_id, question_text=question, **overrides)
+
+
+def _partition(candidate: UnifiedFAQCandidate) -> str:
+    return f"{candidate.protocol}|{candidate.category}"
+
+
+def _member_ids(groups) -> List[List[int]]:
+    return [[c.id for c in group.candidates] for group in groups]
+
+
+def test_paraphrases_cluster_together_in_one_batch() -> None:
+    embedder = FakeEmbedder()
+    clusterer = EmbeddingTopicClusterer(embedder, similarity_threshold=0.9)
+    candidates = [
+        _q(1, "What is the fee?"),
+        _q(2, "How do I restore my seed?"),
+        _q(3, "What does a trade cost?"),
+        _q(4, "Is there a charge per trade?"),
+    ]
+
+    groups = clusterer.cluster(candidates, _partition)
+
+    assert _member_ids(groups) == [[1, 3, 4], [2]]
+    assert len(embedder.calls) == 1
+
+
+def test_new_candidates_join_existing_centroids_incrementally() -> None:
+    embedder = FakeEmbedder()
+    clusterer = EmbeddingTopicClusterer(embedder, similarity_threshold=0.9)
+    first = [_q(1, "What is the fee?"), _q(2, "How do I restore my seed?")]
+    clusterer.cluster(first, _partition)
+    key_before = clusterer.cluster(first, _partition)[0].key
+
+    groups = clusterer.cluster(
+        first + [_q(3, "How can I recover my seed?"), _q(4, "Tor cannot connect")],
+        _partition,
+    )
+
+    assert _member_ids(groups) == [[1], [2, 3], [4]]
+    assert groups[0].key == key_before
+    # Only the two new questions were embedded after the first call
+    assert [len(call) for call in embedder.calls] == [2, 2]
+
+
+def test_partitions_are_never_mixed() -> None:
+    clusterer = EmbeddingTopicClusterer(FakeEmbedder(), similarity_threshold=0.9)
+    candidates = [
+        _q(1, "What is the fee?"),
+        _q(2, "What is the fee?", protocol="multisig_v1"),
+    ]
+
+    groups = clusterer.cluster(candidates, _partition)
+
+    assert _member_ids(groups) == [[1], [2]]
+
+
+def test_removed_and_edited_candidates_leave_their_clusters() -> None:
+    clusterer = EmbeddingTopicClusterer(FakeEmbedder(), similarity_threshold=0.9)
+    candidates = [
+        _q(1, "What is the fee?"),
+        _q(2, "What does it cost?"),
+        _q(3, "Is there a charge?"),
+    ]
+    clusterer.cluster(candidates, _partition)
+
+    edited = _q(2, "How do I restore my seed?")
+    groups = clusterer.cluster([candidates[0], edited], _partition)
+
+    assert _member_ids(groups) == [[1], [2]]
+    assert clusterer.stats()["candidates"] == 2
+
+
+def test_review_items_use_semantic_groups_and_fall_back_on_errors() -> None:
+    candidates = [
+        _q(1, "What is the fee?"),
+        _q(2, "What does it cost?"),
+        _q(3, "Is there a charge?"),
+    ]
+    clusterer = EmbeddingTopicClusterer(FakeEmbedder(), similarity_threshold=0.9)
+
+    items = build_knowledge_review_items(
+        candidates,
+        lambda candidate: True,
+        cluster_key=lambda candidate: f"key-{candidate.id}",
+        topic_clusterer=clusterer,
+        partition_key=_partition,
+    )
+
+    assert len(items) == 1
+    assert items[0].cluster is not None
+    assert items[0].cluster.candidate_ids == [1, 2, 3]
+
+    def broken(texts: List[str]) -> List[List[float]]:
+        raise RuntimeError("embedding service down")
+
+    fallback = build_knowledge_review_items(
+        candidates,
+        lambda candidate: True,
+        cluster_key=lambda candidate: f"key-{candidate.id}",
+        topic_clusterer=EmbeddingTopicClusterer(broken),
+        partition_key=_partition,
+    )
+
+    assert [item.cluster for item in fallback] == [None, None, None]
@@ -1160,3 +1160,55 @@ def test_candidate_reviewability_accepts_durable_candidate(tmp_path: Path) -> No
 
     assert service.candidate_reviewability_issues(_candidate()) == []
     assert service.is_candidate_reviewable(_candidate())
+
+
+def test_target_matching_scores_only_pages_sharing_tokens(tmp_path: Path) -> None:
+    page = _write_page(tmp_path)
+    for i in range(50):
+        (page.parent / f"filler-{i:02d}.md").write_text(
+            f"---\nid: filler-{i:02d}\ntitle: Unrelated mediation topic {i}\n"
+            "status: reviewed\nprotocol: bisq_easy\n---\n## Canonical Support Answer\n\n"
+            "Arbitration payout timing.\n",
+            encoding="utf-8",
+        )
+    settings = Settings(DATA_DIR=str(tmp_path))
+    service = KnowledgeUpdateService(
+        settings=settings,
+        db_path=str(tmp_path / "unified_training.db"),
+    )
+    candidate = _candidate(generated_answer_sources='[{"type":"wiki","title":"X"}]')
+
+    index = service._load_page_index()
+    shared = index.sharing_tokens({"reputation", "seller"})
+    target = service._match_target_page(candidate, service._load_pages())
+
+    assert len(service._load_pages()) == 51
+    assert [entry.page.page_id for entry in shared] == ["bisq2-reputation-basics"]
+    assert target is not None and target.page_id == "bisq2-reputation-basics"
+
+
+def test_approving_new_page_updates_index_in_place(tmp_path: Path) -> None:
+    _write_page(tmp_path)
+    settings = Settings(DATA_DIR=str(tmp_path))
+    service = KnowledgeUpdateService(
+        settings=settings,
+        db_path=str(tmp_path / "unified_training.db"),
+    )
+    candidate = _candidate(
+        id=41,
+        category="payment methods",
+        question_text="Which payment methods does Bisq Easy support for fiat?",
+        staff_answer=(
+            "Bisq Easy supports many national bank transfer and online payment "
+            "methods; the offer lists the payment methods both peers accept."
+        ),
+        generated_answer_sources='[{"type":"wiki","title":"Payment methods"}]',
+    )
+    index = service._load_page_index()
+
+    proposal = service.approve(candidate=candidate, reviewer="admin")
+
+    assert proposal.proposal_kind == "create_new"
+    assert service._load_page_index() is index
+    assert service._load_page_by_id(proposal.target_page_id) is not None
+    assert len(service._load_pages()) == 2
@@ -0,0 +1,133 @@
+"""Tests for tracked startup warm-up components."""
+
+import asyncio
+
+import pytest
+from app.services.startup_warmup import StartupWarmup
+
+
+async def _noop() -> None:
+    await asyncio.sleep(0)
+
+
+async def test_required_components_gate_readiness() -> None:
+    warmup = StartupWarmup()
+    release = asyncio.Event()
+
+    warmup.start("rag_index", release.wait)
+    warmup.start("faq_cache", _noop, required=False)
+    await asyncio.sleep(0)
+
+    snapshot = warmup.snapshot()
+    assert snapshot["status"] == "warming"
+    assert snapshot["ready"] is False
+    assert snapshot["components"]["rag_index"]["status"] == "running"
+
+    release.set()
+    assert await warmup.wait("rag_index", timeout=1.0) is True
+    assert await warmup.wait("faq_cache", timeout=1.0) is True
+    assert warmup.snapshot()["status"] == "ready"
+
+
+async def test_optional_failure_degrades_and_skips_dependents() -> None:
+    warmup = StartupWarmup()
+
+    async def broken() -> None:
+        raise RuntimeError("model download failed")
+
+    async def encode() -> None:
+        raise AssertionError("must not run after a failed dependency")
+
+    warmup.start("rag_index", _noop, required=True)
+    warmup.start("colbert_load", broken, required=False)
+    warmup.start("colbert_encode", encode, required=False, after=("colbert_load",))
+    await warmup.wait("colbert_encode", timeout=1.0)
+    await warmup.wait("rag_index", timeout=1.0)
+
+    snapshot = warmup.snapshot()
+    assert snapshot["status"] == "degraded"
+    assert snapshot["ready"] is True
+    components = snapshot["components"]
+    assert components["colbert_load"]["status"] == "failed"
+    assert "model download failed" in components["colbert_load"]["error"]
+    assert components["colbert_encode"]["status"] == "skipped"
+
+
+async def test_required_failure_marks_service_failed() -> None:
+    warmup = StartupWarmup()
+
+    async def broken() -> None:
+        raise RuntimeError("qdrant unreachable")
+
+    warmup.start("rag_index", broken)
+    await warmup.wait("rag_index", timeout=1.0)
+
+    assert warmup.snapshot()["status"] == "failed"
+    assert warmup.ready is False
+
+
+async def test_inline_run_propagates_errors_and_duplicates_are_rejected() -> None:
+    warmup = StartupWarmup()
+
+    async def broken() -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await warmup.run("rag_index", broken)
+    assert warmup.status_of("rag_index") == "failed"
+
+    with pytest.raises(ValueError):
+        warmup.start("rag_index", broken)
+
+
+async def test_shutdown_cancels_pending_components() -> None:
+    warmup = StartupWarmup()
+    warmup.start("nli_model", asyncio.Event().wait, required=False)
+    await asyncio.sleep(0)
+
+    await warmup.shutdown()
+
+    assert warmup.status_of("nli_model") == "failed"
+    assert warmup.snapshot()["components"]["nli_model"]["error"] == "cancelled"
+
+
+async def test_failed_component_retries_with_backoff(monkeypatch) -> None:
+    warmup = StartupWarmup()
+    delays = []
+    attempts = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    async def flaky() -> None:
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("qdrant not up yet")
+
+    monkeypatch.setattr("app.services.startup_warmup.asyncio.sleep", fake_sleep)
+    warmup.start("rag_index", flaky, retries=3, retry_delay=2.0)
+
+    assert await warmup.wait("rag_index", timeout=1.0) is True
+    assert delays == [2.0, 4.0]
+    component = warmup.snapshot()["components"]["rag_index"]
+    assert component["attempts"] == 3
+    assert component["error"] is None
+
+
+async def test_component_fails_after_retries_are_exhausted(monkeypatch) -> None:
+    warmup = StartupWarmup()
+
+    async def fake_sleep(delay: float) -> None:
+        return None
+
+    async def broken() -> None:
+        raise ConnectionError("qdrant unreachable")
+
+    monkeypatch.setattr("app.services.startup_warmup.asyncio.sleep", fake_sleep)
+    warmup.start("rag_index", broken, retries=2, retry_delay=1.0)
+
+    assert await warmup.wait("rag_index", timeout=1.0) is False
+    assert warmup.failed is True
+    component = warmup.snapshot()["components"]["rag_index"]
+    assert component["status"] == "failed"
+    assert component["attempts"] == 3
@@ -0,0 +1,223 @@
+"""Tests for token-budgeted chunking and concurrent chunked FAQ extraction."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+from app.services.training.extraction_planner import (
+    estimate_message_tokens,
+    plan_extraction_chunks,
+    resolve_reply_targets,
+)
+from app.services.training.unified_faq_extractor import (
+    ExtractedFAQ,
+    UnifiedFAQExtractor,
+)
+
+
+def _msg(mid: str, author: str, text: str, **extra: Any) -> Dict[str, Any]:
+    return {"id": mid, "author": author, "text": text, **extra}
+
+
+def _ids(chunks: List[List[Dict[str, Any]]]) -> List[List[str]]:
+    return [[m["id"] for m in chunk] for chunk in chunks]
+
+
+class TestResolveReplyTargets:
+    def test_matrix_reply_and_bisq2_citation(self) -> None:
+        messages = [
+            _msg("a", "user1", "What are the fees for Bisq Easy?"),
+            _msg("b", "staff1", "Unrelated."),
+            _msg("c", "staff1", "No trade fees.", reply_to="a"),
+            _msg(
+                "d",
+                "staff1",
+                "See the wiki.",
+                citation={"author": "user1", "text": "What are the fees"},
+            ),
+            _msg("e", "staff1", "Hm", reply_to="$missing"),
+        ]
+
+        assert resolve_reply_targets(messages) == [None, None, 0, 0, None]
+
+
+class TestPlanExtractionChunks:
+    def test_small_batch_is_one_chunk(self) -> None:
+        messages = [_msg(str(i), "u", "hello") for i in range(5)]
+
+        assert _ids(plan_extraction_chunks(messages, token_budget=10_000)) == [
+            ["0", "1", "2", "3", "4"]
+        ]
+        assert plan_extraction_chunks([], token_budget=100) == []
+
+    def test_chunks_respect_budget_and_keep_order(self) -> None:
+        messages = [_msg(str(i), "u", "x" * 200) for i in range(20)]
+        budget = estimate_message_tokens(messages[0]) * 3
+
+        chunks = plan_extraction_chunks(messages, token_budget=budget)
+
+        assert [m for chunk in chunks for m in chunk] == messages
+        assert all(
+            sum(estimate_message_tokens(m) for m in chunk) <= budget for chunk in chunks
+        )
+        assert len(chunks) == 7
+
+    def test_cuts_on_thread_boundary(self) -> None:
+        messages = [
+            _msg("q1", "user1", "x" * 200),
+            _msg("q2", "user2", "x" * 200),
+            _msg("a2", "staff1", "x" * 200, reply_to="q2"),
+            _msg("a1", "staff1", "x" * 200, reply_to="q1"),
+            _msg("q3", "user3", "x" * 200),
+            _msg("a3", "staff1", "x" * 200, reply_to="q3"),
+        ]
+        budget = estimate_message_tokens(messages[3]) * 5
+
+        chunks = plan_extraction_chunks(messages, token_budget=budget)
+
+        # The only cut no reply crosses is before q3.
+        assert _ids(chunks) == [["q1", "q2", "a2", "a1"], ["q3", "a3"]]
+
+    def test_oversized_message_gets_own_chunk(self) -> None:
+        messages = [
+            _msg("a", "u", "short"),
+            _msg("b", "u", "x" * 4000),
+            _msg("c", "u", "short"),
+        ]
+
+        assert _ids(plan_extraction_chunks(messages, token_budget=100)) == [
+            ["a"],
+            ["b"],
+            ["c"],
+        ]
+
+
+def _make_extractor(**overrides: Any) -> UnifiedFAQExtractor:
+    values = {
+        "LLM_EXTRACTION_MODEL": "test",
+        "LLM_EXTRACTION_TEMPERATURE": 0.0,
+        "LLM_EXTRACTION_MAX_TOKENS": 4000,
+        "LLM_EXTRACTION_CHUNK_TOKEN_BUDGET": 300,
+        "LLM_EXTRACTION_MAX_CONCURRENCY": 2,
+    }
+    settings = SimpleNamespace(**{**values, **overrides})
+    return UnifiedFAQExtractor(
+        aisuite_client=None,
+        settings=settings,  # type: ignore[arg-type]
+        staff_identifiers=["staff1"],
+    )
+
+
+def _threads(count: int) -> List[Dict[str, Any]]:
+    """Bisq 2 messages: one user question and one cited staff answer per thread."""
+    messages = []
+    for i in range(count):
+        question = f"Question number {i} " + "x" * 600
+        messages.append(
+            {"messageId": f"q{i}", "author": f"user{i}", "message": question}
+        )
+        messages.append(
+            {
+                "messageId": f"a{i}",
+                "author": "staff1",
+                "message": f"Answer number {i}",
+                "citation": {"author": f"user{i}", "text": question},
+            }
+        )
+    return messages
+
+
+def _faq_response(transcript: str) -> Dict[str, Any]:
+    pairs = []
+    for line in transcript.splitlines():
+        if "(ID: a" in line:
+            n = line.split("(ID: a")[1].split(")")[0]
+            pairs.append(
+                {
+                    "question_text": f"Question {n}?",
+                    "answer_text": f"Answer {n}.",
+                    "question_msg_id": f"q{n}",
+                    "answer_msg_id": f"a{n}",
+                    "confidence": 0.9,
+                }
+            )
+    return {"faq_pairs": pairs}
+
+
+class TestChunkedExtraction:
+    @pytest.mark.asyncio
+    async def test_chunks_run_concurrently_under_limit(self) -> None:
+        extractor = _make_extractor()
+        in_flight = 0
+        peak = 0
+
+        async def fake_call_llm(messages_text: str) -> Dict[str, Any]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _faq_response(messages_text)
+
+        with patch.object(extractor, "_call_llm", side_effect=fake_call_llm):
+            result = await extractor.extract_faqs(messages=_threads(6), source="bisq2")
+
+        assert result.chunk_count == 6
+        assert result.failed_chunks == 0
+        assert peak == 2
+        assert [faq.answer_msg_id for faq in result.faqs] == [f"a{i}" for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_failed_chunks_are_not_retried_on_top_of_llm_retries(
+        self,
+    ) -> None:
+        extractor = _make_extractor()
+        calls: List[str] = []
+
+        async def failing_call_llm(messages_text: str) -> Dict[str, Any]:
+            calls.append(messages_text)
+            if "(ID: a1)" in messages_text:
+                raise RuntimeError("rate limit")
+            return _faq_response(messages_text)
+
+        with patch.object(extractor, "_call_llm", side_effect=failing_call_llm):
+            result = await extractor.extract_faqs(messages=_threads(3), source="bisq2")
+
+        assert len(calls) == 3
+        assert result.failed_chunks == 1
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_keeps_successful_chunks(self) -> None:
+        extractor = _make_extractor()
+
+        async def failing_call_llm(messages_text: str) -> Dict[str, Any]:
+            if "(ID: a2)" in messages_text:
+                raise RuntimeError("boom")
+            return _faq_response(messages_text)
+
+        with patch.object(extractor, "_call_llm", side_effect=failing_call_llm):
+            result = await extractor.extract_faqs(messages=_threads(3), source="bisq2")
+
+        assert result.error is None
+        assert result.failed_chunks == 1
+        assert sorted(faq.answer_msg_id for faq in result.faqs) == ["a0", "a1"]
+
+    def test_merge_dedupes_keeping_highest_confidence(self) -> None:
+        extractor = _make_extractor()
+        base = dict(
+            question_text="Q?",
+            answer_text="A.",
+            question_msg_id="q1",
+            answer_msg_id="a1",
+        )
+        low = ExtractedFAQ(confidence=0.75, **base)
+        high = ExtractedFAQ(confidence=0.95, **base)
+        other = ExtractedFAQ(**{**base, "answer_msg_id": "a2"}, confidence=0.8)
+
+        merged = extractor._merge_chunk_faqs([[low, other], [high]])
+
+        assert merged == [high, other]
@@ -5,9 +5,11 @@ Tests the reranking functionality with mocked RAGatouille model.
 """
 
 import sys
+from types import SimpleNamespace
 from typing import List
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from app.services.rag.colbert_reranker import ColBERTReranker
 from app.services.rag.interfaces import RetrievedDocument
@@ -18,6 +20,26 @@ mock_ragatouille.RAGPretrainedModel = MagicMock()
 sys.modules["ragatouille"] = mock_ragatouille
 
 
+class _FakeCheckpoint:
+    """Deterministic ColBERT checkpoint: one 2-D token vector per keyword."""
+
+    _VOCAB = {"bisq": [1.0, 0.0], "easy": [0.0, 1.0]}
+
+    def __init__(self):
+        self.doc_calls: List[List[str]] = []
+
+    def _encode(self, text: str) -> np.ndarray:
+        rows = [self._VOCAB.get(word.lower(), [0.1, 0.1]) for word in text.split()]
+        return np.asarray(rows, dtype=np.float32)
+
+    def queryFromText(self, queries, bsize=None):
+        return [self._encode(q) for q in queries]
+
+    def docFromText(self, docs, bsize=None, keep_dims=True, to_cpu=False):
+        self.doc_calls.append(list(docs))
+        return ([self._encode(d) for d in docs],)
+
+
 class TestColBERTReranker:
     """Test suite for ColBERTReranker."""
 
@@ -269,3 +291,88 @@ class TestColBERTReranker:
 
         # Model should only be loaded once
         mock_ragatouille.RAGPretrainedModel.from_pretrained.assert_called_once()
+
+    def test_precomputed_maxsim_rerank_encodes_only_query(
+        self, mock_settings, sample_documents, tmp_path
+    ):
+        """Test cached token embeddings are reused and scored by stable index."""
+        checkpoint = _FakeCheckpoint()
+        mock_ragatouille.RAGPretrainedModel.from_pretrained.return_value = (
+            SimpleNamespace(model=SimpleNamespace(inference_ckpt=checkpoint))
+        )
+        reranker = ColBERTReranker(mock_settings, cache_dir=tmp_path / "cache")
+
+        encoded = reranker.precompute_document_embeddings(
+            [doc.content for doc in sample_documents]
+        )
+        result = reranker.rerank("bisq easy", sample_documents, top_n=2)
+
+        assert encoded == 5
+        assert len(checkpoint.doc_calls) == 1
+        assert [doc.id for doc in result] == ["doc1", "doc2"]
+        assert result[0].score == pytest.approx(2.0)
+        assert result[0].metadata == sample_documents[0].metadata
+
+        # A fresh reranker loads the persisted cache instead of re-encoding.
+        reloaded = ColBERTReranker(mock_settings, cache_dir=tmp_path / "cache")
+        reloaded.load_model()
+        reloaded_checkpoint = _FakeCheckpoint()
+        reloaded._model = SimpleNamespace(
+            model=SimpleNamespace(inference_ckpt=reloaded_checkpoint)
+        )
+        assert reloaded.rerank("bisq easy", sample_documents, top_n=1)[0].id == "doc1"
+        assert reloaded_checkpoint.doc_calls == []
+
+    def test_transient_precomputed_failure_does_not_disable_scoring(
+        self, mock_settings, sample_documents
+    ):
+        """Test only capability errors switch off precomputed scoring."""
+        checkpoint = _FakeCheckpoint()
+        model = MagicMock()
+        model.model = SimpleNamespace(inference_ckpt=checkpoint)
+        model.rerank.return_value = []
+        mock_ragatouille.RAGPretrainedModel.from_pretrained.return_value = model
+        reranker = ColBERTReranker(mock_settings, cache_dir=None)
+        original_query = checkpoint.queryFromText
+        calls = []
+
+        def flaky_query(queries, bsize=None):
+            calls.append(queries)
+            if len(calls) == 1:
+                raise RuntimeError("CUDA out of memory")
+            return original_query(queries, bsize)
+
+        checkpoint.queryFromText = flaky_query
+
+        reranker.rerank("bisq easy", sample_documents, top_n=2)
+        assert model.rerank.call_count == 1
+        assert reranker.get_model_info()["precomputed_scoring"] is True
+
+        result = reranker.rerank("bisq easy", sample_documents, top_n=2)
+        assert [doc.id for doc in result] == ["doc1", "doc2"]
+        assert model.rerank.call_count == 1
+
+        model.model = SimpleNamespace(inference_ckpt=None)
+        reranker.rerank("bisq easy", sample_documents, top_n=2)
+        assert reranker.get_model_info()["precomputed_scoring"] is False
+
+    def test_on_demand_encodings_are_bounded_lru(self, mock_settings, sample_documents):
+        """Test candidates outside the corpus do not grow the cache unbounded."""
+        checkpoint = _FakeCheckpoint()
+        mock_ragatouille.RAGPretrainedModel.from_pretrained.return_value = (
+            SimpleNamespace(model=SimpleNamespace(inference_ckpt=checkpoint))
+        )
+        reranker = ColBERTReranker(mock_settings, cache_dir=None)
+        reranker.precompute_document_embeddings([sample_documents[0].content])
+        reranker._on_demand_max_entries = 2
+
+        reranker.rerank("bisq", sample_documents[:3], top_n=3)
+        reranker.rerank("bisq", sample_documents[3:], top_n=2)
+
+        info = reranker.get_model_info()
+        assert info["cached_chunks"] == 1
+        assert info["on_demand_cached_chunks"] == 2
+        assert checkpoint.doc_calls[-1] == [
+            sample_documents[3].content,
+            sample_documents[4].content,
+        ]
@@ -1,5 +1,9 @@
 """Tests for answer comparison engine."""
 
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
 from app.services.training.comparison_engine import (
     AnswerComparisonEngine,
@@ -529,8 +533,225 @@ class TestAnswerComparisonEngine:
         )
 
         # Add something to cache
-        engine._embedding_cache["test_key"] = [1.0, 2.0, 3.0]
+        engine._embedding_cache.set_many({"test_key": [1.0, 2.0, 3.0]})
         assert len(engine._embedding_cache) == 1
 
         engine.clear_embedding_cache()
         assert len(engine._embedding_cache) == 0
+
+
+class TestCompareBatch:
+    """Test cases for batched comparison."""
+
+    class FakeEmbeddings:
+        def __init__(self):
+            self.document_calls = []
+
+        def embed_documents(self, texts):
+            self.document_calls.append(list(texts))
+            return [[1.0, 0.0] if "good" in text else [0.0, 1.0] for text in texts]
+
+        def embed_query(self, text):
+            raise AssertionError("compare_batch should embed in one batch")
+
+    @staticmethod
+    def _client(content):
+        client = MagicMock()
+        client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=None,
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_batches_embeddings_and_judge_calls(self):
+        """All answers are embedded once and judged in a single LLM call."""
+        verdict = {
+            "factual_alignment": 0.9,
+            "contradiction_score": 0.0,
+            "completeness": 0.9,
+            "hallucination_risk": 0.0,
+            "reasoning": "ok",
+        }
+        client = self._client(
+            json.dumps({"results": [{"index": 1, **verdict}, {"index": 0, **verdict}]})
+        )
+        embeddings = self.FakeEmbeddings()
+        engine = AnswerComparisonEngine(
+            ai_client=client, embeddings_model=embeddings, judge_batch_size=4
+        )
+
+        results = await engine.compare_batch(
+            [
+                ("e1", "q1", "good staff", "good generated"),
+                ("e2", "q2", "good staff", "bad generated"),
+                ("e3", "q3", "good staff two", "good generated two"),
+            ]
+        )
+
+        assert len(embeddings.document_calls) == 1
+        assert client.chat.completions.create.call_count == 1
+        assert [r.question_event_id for r in results] == ["e1", "e2", "e3"]
+        assert results[1].llm_reasoning.startswith("Skipped Tier 2")
+        assert results[0].factual_alignment == pytest.approx(0.9)
+        assert results[2].embedding_similarity == pytest.approx(1.0)
+        assert engine.calibration_count == 2
+
+    @pytest.mark.asyncio
+    async def test_incomplete_batch_verdicts_fall_back_to_single_judging(self):
+        """Pairs missing from the batched verdict are judged individually."""
+        engine = AnswerComparisonEngine(
+            ai_client=self._client("not json"),
+            embeddings_model=self.FakeEmbeddings(),
+        )
+
+        results = await engine.compare_batch(
+            [
+                ("e1", "q1", "good a", "good b"),
+                ("e2", "q2", "good c", "good d"),
+            ]
+        )
+
+        # 1 batched call + 2 individual fallbacks, both unparseable
+        assert engine.ai_client.chat.completions.create.call_count == 3
+        assert all(r.evaluation_status == "failed" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_compare_embeds_both_answers_in_one_request(self):
+        embeddings = self.FakeEmbeddings()
+        engine = AnswerComparisonEngine(
+            ai_client=self._client("{}"), embeddings_model=embeddings
+        )
+
+        result = await engine.compare("e1", "q", "good staff", "bad generated")
+
+        assert embeddings.document_calls == [["good staff", "bad generated"]]
+        assert result.llm_reasoning.startswith("Skipped Tier 2")
+
+
+class TestEmbeddingCache:
+    """Test the bounded, optionally persistent embedding cache."""
+
+    class CountingEmbeddings:
+        model = "text-embedding-3-small"
+
+        def __init__(self):
+            self.embedded = []
+
+        def embed_documents(self, texts):
+            self.embedded.extend(texts)
+            return [[float(len(text)), 1.0] for text in texts]
+
+    @pytest.mark.asyncio
+    async def test_memory_is_bounded_and_least_recently_used_evicted(self):
+        embeddings = self.CountingEmbeddings()
+        engine = AnswerComparisonEngine(
+            ai_client=MagicMock(),
+            embeddings_model=embeddings,
+            embedding_cache_size=2,
+        )
+
+        await engine._get_embeddings_cached(["a", "bb"])
+        await engine._get_embeddings_cached(["a"])  # refresh "a"
+        await engine._get_embeddings_cached(["ccc"])
+        await engine._get_embeddings_cached(["a", "bb"])
+
+        assert embeddings.embedded == ["a", "bb", "ccc", "bb"]
+        assert len(engine._embedding_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_in_a_batch_are_embedded_once(self):
+        embeddings = self.CountingEmbeddings()
+        engine = AnswerComparisonEngine(
+            ai_client=MagicMock(), embeddings_model=embeddings
+        )
+
+        vectors = await engine._get_embeddings_cached(["same", "other", "same"])
+
+        assert embeddings.embedded == ["same", "other"]
+        assert vectors[0] == vectors[2] == [4.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_persisted_vectors_survive_restart_for_same_model_only(
+        self, tmp_path
+    ):
+        db_path = str(tmp_path / "embeddings.db")
+        first = self.CountingEmbeddings()
+        engine = AnswerComparisonEngine(
+            ai_client=MagicMock(),
+            embeddings_model=first,
+            embedding_cache_path=db_path,
+        )
+        await engine._get_embeddings_cached(["staff answer"])
+
+        second = self.CountingEmbeddings()
+        restarted = AnswerComparisonEngine(
+            ai_client=MagicMock(),
+            embeddings_model=second,
+            embedding_cache_path=db_path,
+        )
+        assert await restarted._get_embeddings_cached(["staff answer"]) == [[12.0, 1.0]]
+        assert second.embedded == []
+        assert restarted.get_embedding_cache_stats()["disk_hits"] == 1
+
+        other_model = self.CountingEmbeddings()
+        other_model.model = "text-embedding-3-large"
+        switched = AnswerComparisonEngine(
+            ai_client=MagicMock(),
+            embeddings_model=other_model,
+            embedding_cache_path=db_path,
+        )
+        await switched._get_embeddings_cached(["staff answer"])
+        assert other_model.embedded == ["staff answer"]
+
+    @pytest.mark.asyncio
+    async def test_persisted_rows_are_capped_oldest_first(self, tmp_path, monkeypatch):
+        import sqlite3
+
+        db_path = str(tmp_path / "embeddings.db")
+        engine = AnswerComparisonEngine(
+            ai_client=MagicMock(),
+            embeddings_model=self.CountingEmbeddings(),
+            embedding_cache_path=db_path,
+            embedding_cache_max_rows=2,
+        )
+        now = [1000]
+        monkeypatch.setattr(
+            "app.services.training.embedding_cache.time.time", lambda: now[0]
+        )
+        for text in ["a", "bb", "ccc"]:
+            await engine._get_embeddings_cached([text])
+            now[0] += 1
+
+        conn = sqlite3.connect(db_path)
+        try:
+            keys = {row[0] for row in conn.execute("SELECT cache_key FROM embeddings")}
+        finally:
+            conn.close()
+        cache = engine._embedding_cache
+        assert keys == {cache.key("bb"), cache.key("ccc")}
+
+    @pytest.mark.asyncio
+    async def test_persistent_cache_io_runs_off_the_event_loop(self, tmp_path):
+        import threading
+
+        engine = AnswerComparisonEngine(
+            ai_client=MagicMock(),
+            embeddings_model=self.CountingEmbeddings(),
+            embedding_cache_path=str(tmp_path / "embeddings.db"),
+        )
+        cache = engine._embedding_cache
+        threads = []
+        for name in ("get_many", "set_many"):
+            original = getattr(cache, name)
+
+            def recording(*args, _original=original):
+                threads.append(threading.current_thread())
+                return _original(*args)
+
+            setattr(cache, name, recording)
+
+        await engine._get_embeddings_cached(["staff answer"])
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
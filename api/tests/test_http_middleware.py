@@ -0,0 +1,123 @@
+"""Tests for the pure ASGI cache-control and Tor detection middleware."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from app.middleware.cache_control import CacheControlMiddleware
+from app.middleware.tor_detection import TorDetectionMiddleware
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return JSONResponse({"ok": True}, headers={"Cache-Control": "max-age=60"})
+
+    return app
+
+
+def _tor_middleware(app, onion: str = "abcdef.onion:80") -> TorDetectionMiddleware:
+    with patch(
+        "app.middleware.tor_detection.get_settings",
+        return_value=SimpleNamespace(TOR_HIDDEN_SERVICE=onion),
+    ):
+        return TorDetectionMiddleware(app)
+
+
+def test_cache_headers_replace_route_headers() -> None:
+    app = _build_app()
+    app.add_middleware(CacheControlMiddleware)
+
+    response = TestClient(app).get("/ping")
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    assert response.headers["cache-control"] == (
+        "no-store, no-cache, must-revalidate, private"
+    )
+    assert response.headers.get_list("cache-control") == [
+        "no-store, no-cache, must-revalidate, private"
+    ]
+    assert response.headers["pragma"] == "no-cache"
+    assert response.headers["expires"] == "0"
+
+
+async def test_streamed_body_chunks_are_forwarded_without_buffering() -> None:
+    sent = []
+
+    async def streaming_app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/event-stream")],
+            }
+        )
+        for index in range(3):
+            # Each chunk reaches the client before the next one is produced
+            assert len(sent) == index + 1
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": f"data: {index}\n\n".encode(),
+                    "more_body": index < 2,
+                }
+            )
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = CacheControlMiddleware(_tor_middleware(streaming_app))
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/escalations/stream",
+        "headers": [(b"host", b"localhost")],
+    }
+    await middleware(scope, None, send)
+
+    assert [m["type"] for m in sent] == [
+        "http.response.start",
+        "http.response.body",
+        "http.response.body",
+        "http.response.body",
+    ]
+    headers = dict(sent[0]["headers"])
+    assert headers[b"cache-control"] == b"no-store, no-cache, must-revalidate, private"
+    assert headers[b"content-type"] == b"text/event-stream"
+
+
+def test_onion_requests_are_recorded_once_per_response() -> None:
+    app = _build_app()
+    monitor = MagicMock()
+    app.state.tor_monitoring_service = monitor
+    wrapped = _tor_middleware(app)
+
+    with patch("app.middleware.tor_detection.record_tor_request") as record:
+        client = TestClient(wrapped)
+        client.get("/ping", headers={"host": "abcdef.onion:8080"})
+        client.get("/ping", headers={"host": "example.org"})
+
+    record.assert_called_once()
+    kwargs = record.call_args.kwargs
+    assert kwargs["method"] == "GET"
+    assert kwargs["endpoint"] == "/ping"
+    assert kwargs["status"] == 200
+    assert kwargs["duration"] >= 0
+    monitor.record_onion_request.assert_called_once()
+
+
+def test_metric_failures_do_not_break_requests() -> None:
+    wrapped = _tor_middleware(_build_app(), onion="abcdef.onion")
+
+    with patch(
+        "app.middleware.tor_detection.record_tor_request",
+        side_effect=RuntimeError("registry broken"),
+    ):
+        response = TestClient(wrapped).get("/ping", headers={"host": "abcdef.onion"})
+
+    assert response.status_code == 200
@@ -43,3 +43,92 @@ async def test_detect_with_metadata_short_english_question_uses_english_heuristi
 
     assert details.language_code == "en"
     assert details.backend == "english_heuristic"
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Mein Handel hängt seit zwei Tagen, der Verkäufer antwortet nicht.", "de"),
+        ("Mon échange est bloqué depuis hier, que dois-je faire", "fr"),
+        ("Olá, como faço para comprar bitcoin no Bisq sem reputação?", "pt"),
+        ("My trade is stuck, the seller is not responding.", "en"),
+        ("Как купить биткоин через Bisq Easy?", "ru"),
+    ],
+)
+def test_ngram_identifier_detects_common_languages(text, expected):
+    from app.services.translation.ngram_language_id import get_default_identifier
+
+    ranked = get_default_identifier().detect(text)
+
+    assert ranked[0][0] == expected
+    assert ranked[0][1] >= 0.9
+
+
+def test_ngram_identifier_returns_nothing_without_letters():
+    from app.services.translation.ngram_language_id import get_default_identifier
+
+    assert get_default_identifier().detect("12345 !!! ???") == []
+
+
+@pytest.mark.asyncio
+async def test_detect_with_metadata_ngram_backend_runs_inline(monkeypatch):
+    import asyncio
+
+    async def _no_thread(*args, **kwargs):
+        raise AssertionError("ngram backend must not use a worker thread")
+
+    monkeypatch.setattr(asyncio, "to_thread", _no_thread)
+    detector = LanguageDetector(local_backend="ngram", enable_llm_tiebreaker=False)
+
+    details = await detector.detect_with_metadata(
+        "Il mio scambio è bloccato da due giorni, il venditore non risponde."
+    )
+
+    assert details.language_code == "it"
+    assert details.backend == "local_model"
+
+
+@pytest.mark.asyncio
+async def test_detect_with_metadata_caches_llm_tiebreak_per_text_and_prior():
+    from unittest.mock import AsyncMock, MagicMock
+
+    llm = MagicMock()
+    llm.generate = AsyncMock(return_value="de")
+    detector = LanguageDetector(llm_provider=llm, local_backend="none")
+
+    first = await detector.detect_with_metadata("Wie kaufe ich BTC?")
+    second = await detector.detect_with_metadata("  wie kaufe ich  BTC? ")
+    with_prior = await detector.detect_with_metadata(
+        "Wie kaufe ich BTC?", prior_language="es"
+    )
+
+    assert first.language_code == second.language_code == "de"
+    assert first.llm_tiebreak_used and second.llm_tiebreak_used
+    assert llm.generate.await_count == 1
+    assert with_prior.backend == "context_prior_short_text"
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("What is the current BTC price in EUR?", True),
+        ("Wie ist der aktuell BTC Preis in Euro?", False),
+        ("Как купить биткоин через Bisq Easy?", False),
+        ("bisq", False),
+    ],
+)
+def test_is_likely_english_uses_heuristics_only(text, expected):
+    detector = LanguageDetector(
+        local_backend="none",
+        enable_llm_tiebreaker=False,
+    )
+
+    assert detector.is_likely_english(text) is expected
+
+
+def test_langdetect_is_the_default_backend():
+    """Detection thresholds are calibrated for langdetect; ngram is opt-in."""
+    from app.core.config import Settings
+
+    assert Settings.model_fields["MULTILINGUAL_LID_BACKEND"].default == "langdetect"
+    assert LanguageDetector(enable_llm_tiebreaker=False).local_backend == "langdetect"
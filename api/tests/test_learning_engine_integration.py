@@ -501,3 +501,49 @@ class TestLaunchReadinessChecker:
 
         assert result["is_ready"] is False
         assert result["criteria"]["sufficient_data"]["passed"] is False
+
+
+class TestLegacyReviewMigration:
+    """Legacy review_history blobs are migrated into the review log once."""
+
+    def test_loading_twice_does_not_duplicate_legacy_reviews(self, tmp_path):
+        from app.services.training.unified_repository import (
+            UnifiedFAQCandidateRepository,
+        )
+
+        repo = UnifiedFAQCandidateRepository(str(tmp_path / "training.db"))
+        legacy = [
+            {
+                "question_id": f"q{index}",
+                "confidence": 0.8,
+                "admin_action": "approved",
+                "routing_action": "SPOT_CHECK",
+                "metadata": {},
+                "timestamp": f"2025-01-0{index + 1}T00:00:00+00:00",
+            }
+            for index in range(5)
+        ]
+        repo.save_learning_state(
+            auto_send_threshold=0.9,
+            queue_high_threshold=0.75,
+            reject_threshold=0.5,
+            review_history=legacy,
+            threshold_history=[],
+        )
+
+        LearningEngine().load_state(repo)
+        assert repo.count_learning_reviews() == 5
+        assert repo.get_learning_state()["review_history"] == []
+
+        # A crash before the blob was emptied must not duplicate reviews either
+        repo.save_learning_state(
+            auto_send_threshold=0.9,
+            queue_high_threshold=0.75,
+            reject_threshold=0.5,
+            review_history=legacy,
+            threshold_history=[],
+        )
+        engine = LearningEngine()
+        engine.load_state(repo)
+        assert repo.count_learning_reviews() == 5
+        assert engine.get_learning_metrics()["total_reviews"] == 5
@@ -713,6 +713,106 @@ class TestTranslationService:
         mock_llm_provider.generate.assert_awaited_once()
 
 
+class TestSegmentTranslationMemory:
+    """Tests for segment-level reuse in translate_response."""
+
+    @pytest.fixture
+    def translation_service(self, mock_llm_provider, tmp_path):
+        from app.services.translation.cache import TieredCache
+        from app.services.translation.translation_service import TranslationService
+
+        return TranslationService(
+            llm_provider=mock_llm_provider,
+            cache_backend=TieredCache(l1_size=100, db_path=str(tmp_path / "c.db")),
+        )
+
+    def test_split_segments_roundtrips_markdown(self):
+        from app.services.translation.segment_memory import split_segments
+
+        text = (
+            "Open the app. Then click Buy.\n\n"
+            "1. Select an offer.\n"
+            "- https://bisq.wiki/Bisq_Easy\n"
+            "```\nbisq --help\n```\n"
+        )
+        segments = split_segments(text)
+
+        assert "".join(segment.text for segment in segments) == text
+        assert [s.text for s in segments if s.translatable] == [
+            "Open the app.",
+            "Then click Buy.",
+            "Select an offer.",
+        ]
+
+    def test_parse_batch_requires_every_marker(self):
+        from app.services.translation.segment_memory import format_batch, parse_batch
+
+        batch = format_batch(["One.", "Two."])
+
+        assert parse_batch(batch, 2) == ["One.", "Two."]
+        assert parse_batch("<<<0>>>\nEins.", 2) is None
+        assert parse_batch("Eins. Zwei.", 2) is None
+
+    @pytest.mark.asyncio
+    async def test_only_unseen_segments_are_sent_to_llm(
+        self, translation_service, mock_llm_provider
+    ):
+        mock_llm_provider.generate = AsyncMock(
+            side_effect=[
+                "<<<0>>>\nÖffne die App.\n<<<1>>>\nKlicke auf Kaufen.",
+                "Warte auf den Verkäufer.",
+            ]
+        )
+
+        first = await translation_service.translate_response(
+            "Open the app. Click buy.", target_lang="de"
+        )
+        second = await translation_service.translate_response(
+            "Open the app.  Wait for the seller.", target_lang="de"
+        )
+
+        assert first["translated_text"] == "Öffne die App. Klicke auf Kaufen."
+        assert second["translated_text"] == "Öffne die App.  Warte auf den Verkäufer."
+        assert second["segments_reused"] == 1
+        assert second["segments_translated"] == 1
+        last_prompt = mock_llm_provider.generate.await_args.args[0]
+        assert "Wait for the seller." in last_prompt
+        assert "Open the app." not in last_prompt
+
+    @pytest.mark.asyncio
+    async def test_fully_cached_segments_skip_llm(
+        self, translation_service, mock_llm_provider
+    ):
+        mock_llm_provider.generate = AsyncMock(
+            return_value="<<<0>>>\nHallo.\n<<<1>>>\nTschüss."
+        )
+        await translation_service.translate_response("Hello. Bye.", target_lang="de")
+
+        result = await translation_service.translate_response(
+            "Bye.\n\nHello.", target_lang="de"
+        )
+
+        assert result["translated_text"] == "Tschüss.\n\nHallo."
+        assert result["cached"] is True
+        assert mock_llm_provider.generate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unparseable_batch_falls_back_to_whole_text(
+        self, translation_service, mock_llm_provider
+    ):
+        mock_llm_provider.generate = AsyncMock(
+            side_effect=["Hallo. Tschüss.", "Hallo. Tschüss."]
+        )
+
+        result = await translation_service.translate_response(
+            "Hello. Bye.", target_lang="de"
+        )
+
+        assert result["translated_text"] == "Hallo. Tschüss."
+        assert result["segments_translated"] == 0
+        assert mock_llm_provider.generate.await_count == 2
+
+
 # =============================================================================
 # TASK 10.6: BGE-M3 EMBEDDINGS TESTS
 # =============================================================================
@@ -179,3 +179,31 @@ class TestNLIValidator:
 
         assert isinstance(score, float)
         assert 0.0 <= score <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_deferred_model_returns_uncached_neutral_until_loaded(self):
+        """Deferred loading serves neutral scores without shadowing real ones."""
+        from app.services.rag.nli_validator import NLIValidator
+
+        with patch("app.services.rag.nli_validator.pipeline") as factory:
+            model = MagicMock(
+                return_value=[
+                    {"label": "ENTAILMENT", "score": 0.9},
+                    {"label": "CONTRADICTION", "score": 0.1},
+                ]
+            )
+            factory.return_value = model
+            validator = NLIValidator(enable_cache=True, eager=False)
+
+            assert not factory.called
+            assert not validator.is_loaded()
+            assert await validator.validate_answer_async("ctx", "answer") == 0.5
+
+            assert validator.load_model() is True
+            assert validator.load_model() is True
+            assert factory.call_count == 1
+
+            score = await validator.validate_answer_async("ctx", "answer")
+
+        assert score == pytest.approx(0.95)
+        model.assert_called_once()
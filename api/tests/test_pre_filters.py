@@ -4,6 +4,8 @@ import pytest
 from app.services.llm_extraction.pre_filters import (
     MessagePreFilter,
     SafeRegexMatcher,
+    is_backtracking_safe,
+    is_combinable,
     validate_message_input,
 )
 
@@ -274,3 +276,95 @@ class TestSafeRegexMatcher:
         matched, reason = matcher.safe_match("valid")
         assert matched is True
         assert reason == "valid"
+
+    def test_first_listed_pattern_wins(self):
+        """Reason follows list order even when a later pattern matches first."""
+        patterns = [
+            (r"room", "unanchored_first"),
+            (r"^hello", "anchored_second"),
+            (r"hello", "unanchored_third"),
+        ]
+        matcher = SafeRegexMatcher(patterns)
+
+        assert matcher.safe_match("hello room") == (True, "unanchored_first")
+        assert matcher.safe_match("hello there") == (True, "anchored_second")
+        assert matcher.safe_match("say hello") == (True, "unanchored_third")
+
+    @pytest.mark.parametrize(
+        "pattern", [r"(a+)+$", r"^(\w*\s?)*$", r"(?:x|y+)*z", r"((ab)*c+)*"]
+    )
+    def test_nested_quantifiers_are_rejected(self, pattern):
+        """Patterns prone to catastrophic backtracking are skipped."""
+        assert is_backtracking_safe(pattern) is False
+
+        matcher = SafeRegexMatcher([(pattern, "unsafe"), (r"^valid$", "valid")])
+        assert matcher.safe_match("a" * 40 + "!") == (False, "")
+        assert matcher.safe_match("valid") == (True, "valid")
+
+    def test_builtin_patterns_are_backtracking_safe(self):
+        """Every built-in exclusion pattern survives load-time validation."""
+        for pattern, _ in MessagePreFilter.EXCLUDE_PATTERNS:
+            assert is_backtracking_safe(pattern), pattern
+            assert is_combinable(pattern), pattern
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [r"^foo|bar", r"(a)\1", r"(a)(?(1)b|c)", r"(?P<word>\w+)!", r"(?s)a.b"],
+    )
+    def test_patterns_that_change_meaning_when_merged_are_rejected(self, pattern):
+        """Partly anchored '|', group references and global flags are skipped."""
+        assert is_combinable(pattern) is False
+
+        matcher = SafeRegexMatcher([(pattern, "unmergeable"), (r"^valid$", "valid")])
+        assert matcher.safe_match("xx bar") == (False, "")
+        assert matcher.safe_match("valid") == (True, "valid")
+
+    @pytest.mark.parametrize(
+        "pattern", [r"^(?:foo|bar)", r"foo|^bar", r"^foo|^foobar", r"a(?i:b)c"]
+    )
+    def test_mergeable_alternations_and_scoped_flags_are_kept(self, pattern):
+        """Alternations anchored as a whole and scoped flags stay allowed."""
+        assert is_combinable(pattern) is True
+
+
+class TestBatchFiltering:
+    """Batch filtering runs without signals, so it works off the main thread."""
+
+    def test_filter_messages_in_worker_thread(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        pre_filter = MessagePreFilter()
+        messages = [
+            {"body": "hi"},
+            {"body": "How do I open a dispute?"},
+            {"body": "thanks!"},
+            {"body": "My trade is stuck since yesterday, what now?"},
+            {"body": "https://bisq.network"},
+            {"body": "ok"},
+            {"body": "Where can I see my reputation score?"},
+        ]
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            passed, filtered = executor.submit(
+                pre_filter.filter_messages, messages
+            ).result()
+
+        assert passed == pre_filter.filter_messages(messages)[0]
+        assert [m["body"] for m in passed] == [
+            "How do I open a dispute?",
+            "My trade is stuck since yesterday, what now?",
+            "Where can I see my reputation score?",
+        ]
+        assert [reason for _, reason in filtered] == [
+            "greeting",
+            "acknowledgment",
+            "url_only",
+            "acknowledgment",
+        ]
+
+    def test_pre_filter_is_picklable_for_process_pools(self):
+        import pickle
+
+        restored = pickle.loads(pickle.dumps(MessagePreFilter()))
+
+        assert restored.should_filter({"body": "gm"}) == (True, "greeting")
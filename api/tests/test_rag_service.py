@@ -10,6 +10,7 @@ Tests cover:
 - Error handling and fallback mechanisms
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -43,6 +44,33 @@ class TestRAGServiceInitialization:
         assert rag_service.llm_provider is not None
         assert rag_service.llm_provider.embeddings is not None
 
+    @pytest.mark.asyncio
+    async def test_deferred_setup_leaves_model_loading_to_warm_up(self, test_settings):
+        """Background warm-up: setup skips model work, warm_up_colbert does it."""
+        service = SimplifiedRAGService(settings=test_settings, defer_model_loading=True)
+        reranker = MagicMock()
+        reranker.is_loaded.return_value = False
+        reranker.precompute_document_embeddings.return_value = 2
+        service.colbert_reranker = reranker
+        chunks = [MagicMock(page_content="a"), MagicMock(page_content="b")]
+
+        with (
+            patch.object(service, "_prepare_index", return_value=chunks) as prepare,
+            patch.object(service, "initialize_llm"),
+            patch.object(service.prompt_manager, "create_rag_prompt"),
+            patch.object(service.prompt_manager, "create_rag_chain"),
+        ):
+            assert await service.setup(offload_blocking=True) is True
+
+        prepare.assert_called_once_with(False)
+        reranker.load_model.assert_not_called()
+        reranker.precompute_document_embeddings.assert_not_called()
+
+        assert service.warm_up_colbert() == 2
+        reranker.load_model.assert_called_once()
+        reranker.precompute_document_embeddings.assert_called_once_with(["a", "b"])
+        assert service.warm_up_colbert() == 0
+
 
 class TestRAGQueryProcessing:
     """Test RAG query processing and response generation."""
@@ -822,3 +850,220 @@ class TestRAGServiceErrorMessages:
             )
 
         assert response["answer"] == error_messages.QUERY_ERROR
+
+
+class TestSemanticAnswerCache:
+    """Test that standalone questions are served from the answer cache."""
+
+    @pytest.mark.asyncio
+    async def test_cached_answer_skips_generation(self, rag_service):
+        cache = rag_service.answer_cache
+        cache.set_index_generation("build-1")
+        cache.store(
+            ("bisq_easy", "en", "", ""),
+            "How do I restore my wallet?",
+            [1.0, 0.0],
+            {"answer": "Use your seed words.", "routing_action": "auto_send"},
+        )
+
+        with patch.object(
+            rag_service.confidence_scorer, "calculate_confidence"
+        ) as score:
+            response = await rag_service.query(
+                "how do I restore my wallet",
+                chat_history=[],
+                override_version="bisq_easy",
+            )
+
+        score.assert_not_called()
+        assert response["answer"] == "Use your seed words."
+        assert response["answer_cache"]["hit"] is True
+        assert response["localized_question"] == "how do I restore my wallet"
+
+    @pytest.mark.asyncio
+    async def test_faq_update_invalidates_cache(self, rag_service):
+        cache = rag_service.answer_cache
+        cache.set_index_generation("build-1")
+        cache.store(("bisq_easy", "en", "", ""), "q", [1.0], {"answer": "a"})
+
+        rag_service._handle_faq_update(rebuild=False, operation="update", faq_id="1")
+
+        assert cache.get_stats()["entries"] == 0
+
+
+class TestSpeculativeRetrieval:
+    """Test retrieval started before translation and version detection finish."""
+
+    @pytest.mark.asyncio
+    async def test_speculative_result_is_used_for_unchanged_query(self, rag_service):
+        with patch.object(
+            rag_service.document_retriever,
+            "retrieve_with_scores",
+            return_value=([], []),
+        ) as retrieve:
+            response = await rag_service.query(
+                "What is the meaning of life?",
+                chat_history=[],
+                override_version="bisq_easy",
+            )
+
+        assert response["answer"] == error_messages.INSUFFICIENT_INFO
+        retrieve.assert_called_once_with("What is the meaning of life?", "bisq_easy")
+
+    @pytest.mark.asyncio
+    async def test_non_english_question_is_not_speculated(self, rag_service):
+        rag_service.translation_service = MagicMock()
+        rag_service.translation_service.detector.is_likely_english.return_value = False
+        rag_service.translation_service.translate_query = AsyncMock(
+            return_value={
+                "translated_text": "What is the meaning of life?",
+                "source_lang": "de",
+                "skipped": False,
+            }
+        )
+        rag_service.translation_service.translate_response = AsyncMock(
+            return_value={
+                "translated_text": "Keine Informationen.",
+                "target_lang": "de",
+            }
+        )
+
+        with patch.object(
+            rag_service.document_retriever,
+            "retrieve_with_scores",
+            return_value=([], []),
+        ) as retrieve:
+            await rag_service.query(
+                "Was ist der Sinn des Lebens?",
+                chat_history=[],
+                override_version="bisq_easy",
+            )
+
+        retrieve.assert_called_once_with("What is the meaning of life?", "bisq_easy")
+
+    @pytest.mark.asyncio
+    async def test_no_speculation_for_follow_ups_or_unclear_version(self, rag_service):
+        history = [{"role": "user", "content": "hi"}]
+        assert (
+            await rag_service._analyze_question_as_typed(
+                "and then?",
+                chat_history=history,
+                override_version=None,
+                language_hint=None,
+                detection_source=None,
+            )
+            is None
+        )
+        assert (
+            await rag_service._analyze_question_as_typed(
+                "Wie handle ich in Bisq 2?",
+                chat_history=[],
+                override_version=None,
+                language_hint="de",
+                detection_source=None,
+            )
+            is None
+        )
+        unclear = await rag_service._analyze_question_as_typed(
+            "how do I trade?",
+            chat_history=[],
+            override_version=None,
+            language_hint=None,
+            detection_source=None,
+        )
+        assert unclear is not None and unclear.speculation is None
+        assert unclear.version is not None and unclear.version[1] < 0.5
+
+    @pytest.mark.asyncio
+    async def test_speculates_when_version_is_confident_enough(self, rag_service):
+        rag_service.version_detector.detect_version = AsyncMock(
+            return_value=("Bisq 2", 0.6, "Bisq 1 or Bisq 2?")
+        )
+
+        analysis = await rag_service._analyze_question_as_typed(
+            "how do I trade?",
+            chat_history=[],
+            override_version=None,
+            language_hint=None,
+            detection_source=None,
+        )
+
+        assert analysis is not None and analysis.speculation is not None
+        analysis.speculation.discard()
+
+    @pytest.mark.asyncio
+    async def test_version_is_detected_once_for_unchanged_query(self, rag_service):
+        rag_service.version_detector.detect_version = AsyncMock(
+            return_value=("Bisq 2", 0.9, None)
+        )
+        with patch.object(
+            rag_service.document_retriever,
+            "retrieve_with_scores",
+            return_value=([], []),
+        ) as retrieve:
+            await rag_service.query("How do I trade on Bisq 2?", chat_history=[])
+
+        rag_service.version_detector.detect_version.assert_awaited_once()
+        retrieve.assert_called_once_with("How do I trade on Bisq 2?", "Bisq 2")
+
+    @pytest.mark.asyncio
+    async def test_no_speculation_for_semantic_cache_hits(self, rag_service):
+        rag_service.embeddings = MagicMock()
+        rag_service.embeddings.embed_query.return_value = [1.0, 0.0]
+        cache = rag_service.answer_cache
+        cache.set_index_generation("build-1")
+        scope = ("bisq_easy", "en", "web", rag_service._prompt_version)
+        cache.store(scope, "How can I restore a wallet?", [1.0, 0.0], {"answer": "a"})
+
+        with patch.object(
+            rag_service.document_retriever, "retrieve_with_scores"
+        ) as retrieve:
+            response = await rag_service.query(
+                "how do I restore my wallet",
+                chat_history=[],
+                override_version="bisq_easy",
+                detection_source="web",
+            )
+
+        assert response["answer_cache"]["hit"] is True
+        retrieve.assert_not_called()
+        rag_service.embeddings.embed_query.assert_called_once()
+        assert cache.get_stats()["hits"] == 1
+
+
+class TestQueryCoalescing:
+    """Test that concurrent standalone questions share one pipeline run."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_questions_share_one_run(self, rag_service):
+        release = asyncio.Event()
+        calls = []
+
+        async def fake_query(question, **kwargs):
+            calls.append(question)
+            await release.wait()
+            return {"answer": "Restart the app.", "localized_question": question}
+
+        rag_service._query = fake_query
+        tasks = [
+            asyncio.create_task(rag_service.query(q, detection_source="matrix"))
+            for q in ("Trade stuck?", "trade stuck", "Trade stuck?")
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == ["Trade stuck?"]
+        assert [r.get("coalesced", False) for r in results] == [False, True, True]
+        assert results[1]["localized_question"] == "trade stuck"
+
+    @pytest.mark.asyncio
+    async def test_follow_ups_are_not_coalesced(self, rag_service):
+        rag_service._query = AsyncMock(return_value={"answer": "a"})
+        history = [{"role": "user", "content": "Trade stuck?"}]
+
+        await rag_service.query("and now?", chat_history=history)
+        await rag_service.query("and now?", chat_history=history)
+
+        assert rag_service._query.await_count == 2
+        assert rag_service.query_coalescer.in_flight == 0
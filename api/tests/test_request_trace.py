@@ -0,0 +1,169 @@
+"""Tests for per-request stage traces and the slow-query log."""
+
+import asyncio
+
+import pytest
+from app.services.slow_query_log import SlowQueryLog
+from app.utils import request_trace as rt
+from app.utils.instrumentation import instrument_stage
+from app.utils.request_trace import (
+    RequestTrace,
+    current_trace,
+    request_trace,
+    set_trace_sink,
+    trace_span,
+)
+
+
+@pytest.fixture
+def collected():
+    traces = []
+    set_trace_sink(traces.append)
+    yield traces
+    set_trace_sink(None)
+
+
+def test_spans_nest_and_root_trace_reaches_sink(collected):
+    with request_trace("rag.query", channel="web") as trace:
+        with trace_span("retrieval", k=5) as span:
+            with trace_span("retrieval.embed_query"):
+                pass
+            span.set(documents=3)
+        trace.set(answered_from="rag")
+
+    assert current_trace() is None
+    assert collected == [trace]
+    data = trace.to_dict()
+    assert data["attributes"] == {"channel": "web", "answered_from": "rag"}
+    assert [(s["name"], s["depth"]) for s in data["spans"]] == [
+        ("retrieval", 0),
+        ("retrieval.embed_query", 1),
+    ]
+    assert data["spans"][0]["attributes"] == {"k": 5, "documents": 3}
+    assert all(s["duration_ms"] is not None for s in data["spans"])
+    assert data["duration_ms"] >= data["spans"][0]["duration_ms"]
+
+
+def test_errors_mark_span_and_trace(collected):
+    with pytest.raises(ValueError):
+        with request_trace("rag.query") as trace:
+            with trace_span("generation"):
+                raise ValueError("boom")
+
+    assert trace.status == "error"
+    assert trace.spans[0].status == "error"
+    assert trace.spans[0].attributes["error_type"] == "ValueError"
+    assert collected == [trace]
+
+
+def test_nested_request_trace_becomes_span(collected):
+    with request_trace("channel.inbound") as outer:
+        with request_trace("rag.query", question="q") as inner:
+            inner.set(routing_action="auto_send")
+
+    assert collected == [outer]
+    assert outer.spans[0].name == "rag.query"
+    assert outer.spans[0].attributes == {
+        "question": "q",
+        "routing_action": "auto_send",
+    }
+
+
+def test_no_active_trace_is_a_no_op():
+    with trace_span("retrieval") as span:
+        span.set(documents=1)
+    assert current_trace() is None
+
+
+async def test_instrumented_stages_and_tasks_join_the_trace(collected):
+    @instrument_stage("retrieval")
+    async def retrieve():
+        await asyncio.sleep(0)
+        return ["doc"]
+
+    async def background():
+        with trace_span("background"):
+            await asyncio.sleep(0)
+
+    with request_trace("rag.query") as trace:
+        assert await retrieve() == ["doc"]
+        await asyncio.gather(background())
+
+    assert [span.name for span in trace.spans] == ["retrieval", "background"]
+
+
+async def test_work_outliving_the_trace_is_not_recorded(collected):
+    release = asyncio.Event()
+
+    async def straggler():
+        await release.wait()
+        with trace_span("late"):
+            pass
+        with request_trace("late.request"):
+            pass
+
+    with request_trace("rag.query") as trace:
+        task = asyncio.create_task(straggler())
+    release.set()
+    await task
+
+    assert trace.spans == []
+    assert [t.name for t in collected] == ["rag.query", "late.request"]
+
+
+def test_span_count_is_bounded(monkeypatch, collected):
+    monkeypatch.setattr(rt, "MAX_SPANS_PER_TRACE", 3)
+    with request_trace("rag.query") as trace:
+        for _ in range(5):
+            with trace_span("stage"):
+                pass
+
+    assert len(trace.spans) == 3
+    assert trace.dropped_spans == 2
+
+
+def test_failing_sink_does_not_break_the_request():
+    def broken(trace):
+        raise RuntimeError("disk full")
+
+    set_trace_sink(broken)
+    try:
+        with request_trace("rag.query") as trace:
+            pass
+    finally:
+        set_trace_sink(None)
+    assert trace.duration_ms is not None
+
+
+def _finished_trace(name: str, duration_ms: float) -> RequestTrace:
+    trace = RequestTrace(name, question="q")
+    span = trace._open_span("retrieval", 0, {"k": 5})
+    span.duration_ms = duration_ms / 2
+    trace.duration_ms = duration_ms
+    return trace
+
+
+def test_slow_query_log_records_only_slow_traces(tmp_path):
+    log = SlowQueryLog(str(tmp_path / "slow.db"), threshold_ms=100.0)
+
+    log(_finished_trace("fast", 99.0))
+    log(_finished_trace("slow", 250.0))
+
+    entries = log.list_entries()
+    assert [entry["name"] for entry in entries] == ["slow"]
+    assert entries[0]["duration_ms"] == 250.0
+    assert entries[0]["attributes"] == {"question": "q"}
+    assert entries[0]["spans"][0]["name"] == "retrieval"
+    assert entries[0]["spans"][0]["attributes"] == {"k": 5}
+
+
+def test_slow_query_log_prunes_and_filters(tmp_path):
+    log = SlowQueryLog(str(tmp_path / "slow.db"), threshold_ms=0.0, max_entries=3)
+
+    for index, duration in enumerate([10.0, 500.0, 20.0, 300.0, 40.0]):
+        log(_finished_trace(f"q{index}", duration))
+
+    assert log.count() == 3
+    assert [e["name"] for e in log.list_entries()] == ["q4", "q3", "q2"]
+    assert [e["name"] for e in log.list_entries(min_duration_ms=100.0)] == ["q3"]
+    assert [e["name"] for e in log.list_entries(limit=1)] == ["q4"]
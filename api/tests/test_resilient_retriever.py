@@ -4,6 +4,8 @@ Tests for Resilient Retriever with fallback capability.
 Tests automatic fallback from primary to secondary retriever on failure.
 """
 
+import time
+
 import pytest
 from app.services.rag.interfaces import RetrievedDocument, RetrieverProtocol
 from app.services.rag.resilient_retriever import ResilientRetriever
@@ -291,3 +293,106 @@ class TestResilientRetriever:
         resilient.retrieve("query", k=5, filter_dict={"category": "faq"})
 
         assert primary_retriever.retrieve_calls == 1
+
+    def test_latency_budget_serves_fallback_and_switches(
+        self, primary_retriever, fallback_retriever
+    ):
+        """Test a primary slower than the latency budget is answered by fallback."""
+        original_retrieve = primary_retriever.retrieve
+
+        def slow_retrieve(query, k=10, filter_dict=None):
+            time.sleep(0.2)
+            return original_retrieve(query, k, filter_dict)
+
+        primary_retriever.retrieve = slow_retrieve
+        resilient = ResilientRetriever(
+            primary_retriever,
+            fallback_retriever,
+            auto_reset=False,
+            latency_budget_seconds=0.01,
+        )
+
+        docs = resilient.retrieve("query")
+
+        assert docs[0].metadata["source"] == "fallback"
+        assert resilient.using_fallback is True
+        assert resilient.get_status()["latency_budget_exceeded"] == 1
+
+    def test_busy_primary_workers_fail_fast_to_fallback(
+        self, primary_retriever, fallback_retriever
+    ):
+        """Test hung primary calls do not queue new calls behind them."""
+        import threading
+
+        from app.services.rag.resilient_retriever import PRIMARY_WORKERS
+
+        release = threading.Event()
+        original_retrieve = primary_retriever.retrieve
+
+        def hung_retrieve(query, k=10, filter_dict=None):
+            release.wait(timeout=5)
+            return original_retrieve(query, k, filter_dict)
+
+        primary_retriever.retrieve = hung_retrieve
+        resilient = ResilientRetriever(
+            primary_retriever,
+            fallback_retriever,
+            auto_reset=False,
+            latency_budget_seconds=0.01,
+        )
+        for _ in range(PRIMARY_WORKERS):
+            with pytest.raises(TimeoutError):
+                resilient._call(primary_retriever, "retrieve", "q", 10, None)
+        assert resilient.get_status()["primary_abandoned"] == PRIMARY_WORKERS
+
+        started = time.monotonic()
+        with pytest.raises(TimeoutError, match="busy"):
+            resilient._call(primary_retriever, "retrieve", "q", 10, None)
+        assert time.monotonic() - started < 0.01 * 5
+
+        # The saturated call is answered by the fallback without switching to it
+        docs = resilient.retrieve("q")
+        assert docs[0].metadata["source"] == "fallback"
+        assert resilient.using_fallback is False
+        assert resilient.get_status()["primary_saturated"] == 2
+
+        release.set()
+        deadline = time.monotonic() + 5
+        while resilient.get_status()["primary_in_flight"] and (
+            time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        assert resilient.get_status()["primary_in_flight"] == 0
+        assert resilient.get_status()["primary_abandoned"] == 0
+        assert resilient.retrieve("q")[0].metadata["source"] == "primary"
+
+    def test_concurrent_healthy_primary_calls_stay_on_primary(
+        self, primary_retriever, fallback_retriever
+    ):
+        """Test slow but healthy calls beyond the worker count are not saturation."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from app.services.rag.resilient_retriever import PRIMARY_WORKERS
+
+        original_retrieve = primary_retriever.retrieve
+
+        def slow_retrieve(query, k=10, filter_dict=None):
+            time.sleep(0.3)
+            return original_retrieve(query, k, filter_dict)
+
+        primary_retriever.retrieve = slow_retrieve
+        resilient = ResilientRetriever(
+            primary_retriever,
+            fallback_retriever,
+            auto_reset=False,
+            latency_budget_seconds=2.0,
+        )
+        calls = PRIMARY_WORKERS + 2
+        with ThreadPoolExecutor(max_workers=calls) as pool:
+            results = list(
+                pool.map(lambda _: resilient.retrieve_with_scores("q"), range(calls))
+            )
+
+        assert [docs[0].metadata["source"] for docs in results] == ["primary"] * calls
+        assert resilient.using_fallback is False
+        assert resilient.get_status()["primary_saturated"] == 0
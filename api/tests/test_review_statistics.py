@@ -0,0 +1,158 @@
+"""Tests for incremental review statistics and the append-only review log."""
+
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+from app.services.rag.learning_engine import LearningEngine
+from app.services.rag.review_statistics import ReviewStatistics
+
+
+def _review(confidence, action, days_ago=0.0, kind=None):
+    timestamp = datetime(2026, 1, 1, tzinfo=timezone.utc) - timedelta(days=days_ago)
+    return {
+        "confidence": confidence,
+        "admin_action": action,
+        "metadata": {"review_kind": kind} if kind else {},
+        "timestamp": timestamp.isoformat(),
+    }
+
+
+class TestReviewStatistics:
+    def test_quantile_matches_percentile_without_decay(self):
+        rng = np.random.default_rng(7)
+        values = rng.uniform(0.4, 1.0, size=500)
+        stats = ReviewStatistics(half_life_days=None)
+        for value in values:
+            stats.add(_review(float(value), "approved"))
+
+        for q in (0.05, 0.25, 0.75):
+            expected = float(np.percentile(values, q * 100))
+            assert stats.quantile(["approved"], q) == pytest.approx(expected, abs=0.01)
+
+    def test_quantile_combines_actions_and_handles_empty(self):
+        stats = ReviewStatistics(half_life_days=None)
+        assert stats.quantile(["approved"], 0.5) is None
+
+        for _ in range(10):
+            stats.add(_review(0.9, "approved"))
+            stats.add(_review(0.5, "edited"))
+
+        assert stats.quantile(["approved"], 0.25) == pytest.approx(0.9, abs=0.002)
+        assert stats.quantile(["approved", "edited"], 0.25) == pytest.approx(
+            0.5, abs=0.002
+        )
+
+    def test_old_reviews_decay(self):
+        stats = ReviewStatistics(half_life_days=30)
+        for _ in range(10):
+            stats.add(_review(0.3, "approved", days_ago=365))
+        for _ in range(10):
+            stats.add(_review(0.9, "approved", days_ago=0))
+
+        # A year-old review weighs ~2^-12, so recent reviews dominate
+        assert stats.quantile(["approved"], 0.05) == pytest.approx(0.9, abs=0.002)
+        assert stats.action_count("approved") == 20
+
+    def test_remove_undoes_add(self):
+        stats = ReviewStatistics()
+        old = _review(0.2, "rejected", days_ago=10)
+        stats.add(old)
+        stats.add(_review(0.8, "approved"))
+        stats.remove(old)
+        stats.add(_review(0.6, "approved", days_ago=10))
+
+        assert stats.total == 2
+        assert stats.action_count("rejected") == 0
+        assert stats.quantile(["rejected"], 0.5) is None
+        assert stats.confidence_summary()["avg"] == pytest.approx(0.7)
+
+    def test_counts_by_kind_and_round_trip(self):
+        stats = ReviewStatistics()
+        stats.add(_review(0.9, "approved"))
+        stats.add(_review(0.7, "rejected", kind="answer_quality"))
+        stats.add(_review(float("nan"), "edited"))
+
+        restored = ReviewStatistics.from_dict(stats.to_dict())
+
+        assert restored.counts == stats.counts
+        assert restored.counts["answer_quality"]["rejected"] == 1
+        assert restored.confidence_summary() == stats.confidence_summary()
+        assert restored.quantile(["approved", "rejected"], 0.5) == stats.quantile(
+            ["approved", "rejected"], 0.5
+        )
+
+
+class TestRepositoryReviewLog:
+    @pytest.fixture
+    def repo(self):
+        from app.services.training.unified_repository import (
+            UnifiedFAQCandidateRepository,
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield UnifiedFAQCandidateRepository(str(Path(tmpdir) / "unified.db"))
+
+    def test_reviews_are_appended_not_rewritten(self, repo):
+        engine = LearningEngine(repository=repo)
+        engine.min_samples_for_update = 99999
+        for i in range(3):
+            engine.record_review(f"q{i}", 0.8, "approved", "SPOT_CHECK")
+        engine.record_review(
+            "rating:1",
+            0.6,
+            "approved",
+            "SPOT_CHECK",
+            metadata={"idempotent": True},
+        )
+        engine.record_review(
+            "rating:1",
+            0.6,
+            "rejected",
+            "SPOT_CHECK",
+            metadata={"idempotent": True},
+        )
+
+        assert repo.count_learning_reviews() == 4
+        assert engine._review_history[-1]["admin_action"] == "rejected"
+        assert engine.save_state(repo)
+        assert repo.get_learning_state()["review_history"] == []
+
+        restored = LearningEngine(repository=repo)
+        metrics = restored.get_learning_metrics()
+        assert metrics["total_reviews"] == 4
+        assert metrics["rejection_rate"] == pytest.approx(0.25)
+
+    def test_legacy_review_history_is_migrated(self, repo):
+        legacy = [
+            {
+                "question_id": f"q{i}",
+                "confidence": 0.9,
+                "admin_action": "approved",
+                "routing_action": "AUTO_APPROVE",
+                "metadata": {},
+                "timestamp": "2025-06-01T00:00:00+00:00",
+            }
+            for i in range(3)
+        ]
+        repo.save_learning_state(0.91, 0.76, 0.5, legacy, [])
+
+        engine = LearningEngine(repository=repo)
+
+        assert repo.count_learning_reviews() == 3
+        assert engine.get_learning_metrics()["total_reviews"] == 3
+        assert engine.auto_send_threshold == 0.91
+
+    def test_stale_statistics_are_rebuilt_from_log(self, repo):
+        engine = LearningEngine(repository=repo)
+        engine.record_review("q1", 0.8, "approved", "SPOT_CHECK")
+        engine.save_state(repo)
+        # Reviews recorded after the last save (e.g. before a crash)
+        engine.record_review("q2", 0.4, "rejected", "FULL_REVIEW")
+
+        restored = LearningEngine(repository=repo)
+
+        assert restored.get_learning_metrics()["total_reviews"] == 2
+        assert restored.get_learning_metrics()["rejection_rate"] == 0.5
@@ -7,6 +7,7 @@ These tests follow the RED-GREEN-REFACTOR cycle from the plan:
 Phase 2: Unified Pipeline Service Tests
 """
 
+import asyncio
 import tempfile
 from pathlib import Path
 from typing import Any, Dict
@@ -2635,3 +2636,119 @@ class TestLearningEngineStatePersistence:
 
         # Should complete without error
         assert len(engine._review_history) == 55
+
+
+# =============================================================================
+# Concurrent processing of extracted FAQs
+# =============================================================================
+
+
+def _extracted_faq(event_id: str, question: str) -> Dict[str, Any]:
+    return {
+        "question_text": question,
+        "staff_answer": "Open the Trade Wizard and follow the steps.",
+        "source": "bisq2",
+        "source_event_id": event_id,
+        "staff_sender": "suddenwhipvapor",
+        "category": "Trading",
+    }
+
+
+class TestConcurrentExtractedFAQProcessing:
+    """_process_extracted_faqs runs RAG answers concurrently and compares in batch."""
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_and_input_order(
+        self, temp_db_path, mock_settings, mock_faq_service
+    ):
+        mock_settings.AUTO_TRAINING_MAX_CONCURRENCY = 2
+        in_flight = 0
+        peak = 0
+
+        async def query(question, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if "broken" in question:
+                raise RuntimeError("RAG failure")
+            return {"answer": f"Answer to {question}", "sources": []}
+
+        rag = MagicMock()
+        rag.query = AsyncMock(side_effect=query)
+        service = UnifiedPipelineService(
+            settings=mock_settings,
+            rag_service=rag,
+            faq_service=mock_faq_service,
+            db_path=str(temp_db_path),
+        )
+
+        results = await service._process_extracted_faqs(
+            [
+                _extracted_faq("e1", "How do I start a trade?"),
+                _extracted_faq("e2", "How do I cancel a trade?"),
+                _extracted_faq("e1", "How do I start a trade?"),
+                _extracted_faq("e3", "This question is broken?"),
+                _extracted_faq("e4", "Where are my wallet funds?"),
+            ]
+        )
+
+        assert peak == 2
+        assert [(r.source_event_id, r.routing == "SKIPPED") for r in results] == [
+            ("e1", False),
+            ("e2", False),
+            ("e1", True),
+            ("e4", False),
+        ]
+        assert results[2].skipped_reason == "duplicate"
+        assert service.repository.exists_by_event_id("e4")
+        assert not service.repository.exists_by_event_id("e3")
+
+    @pytest.mark.asyncio
+    async def test_uses_batched_comparison_engine(
+        self, temp_db_path, mock_settings, mock_rag_service, mock_faq_service
+    ):
+        from app.services.training.comparison_engine import ComparisonResult
+
+        # Any engine exposing compare_batch is batched, not just the default one
+        engine = MagicMock(spec=["compare", "compare_batch"])
+        engine.compare = AsyncMock()
+        engine.compare_batch = AsyncMock(
+            side_effect=lambda items: [
+                ComparisonResult(
+                    question_event_id=item[0],
+                    embedding_similarity=0.8,
+                    factual_alignment=0.8,
+                    contradiction_score=0.1,
+                    completeness=0.8,
+                    hallucination_risk=0.1,
+                    llm_reasoning="batched",
+                    final_score=0.8,
+                    routing="SPOT_CHECK",
+                    is_calibration=False,
+                )
+                for item in items
+            ]
+        )
+        service = UnifiedPipelineService(
+            settings=mock_settings,
+            rag_service=mock_rag_service,
+            faq_service=mock_faq_service,
+            db_path=str(temp_db_path),
+            comparison_engine=engine,
+        )
+
+        results = await service._process_extracted_faqs(
+            [
+                _extracted_faq("b1", "How do I start a trade?"),
+                _extracted_faq("b2", "How do I cancel a trade?"),
+            ]
+        )
+
+        engine.compare_batch.assert_awaited_once()
+        engine.compare.assert_not_awaited()
+        assert len(engine.compare_batch.await_args.args[0]) == 2
+        assert [r.final_score for r in results] == [0.8, 0.8]
+        candidate = service.repository.get_by_id(results[0].candidate_id)
+        assert candidate.llm_reasoning == "batched"